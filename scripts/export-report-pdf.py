@@ -0,0 +1,365 @@
+"""Export SDC Lab Dashboard reports to PDF (server-side, reportlab)
+
+Usage:
+  python scripts/export-report-pdf.py <report_id> [<report_id> ...]
+  python scripts/export-report-pdf.py --from 2026-01-01 --to 2026-03-31 [--workers 4]
+
+Env: NEXT_PUBLIC_SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY (.env.local 값 사용)
+
+브라우저 인쇄(print-layout.tsx)는 큰 보고서에서 탭이 멈추고 브라우저마다 결과가 달랐다.
+이 스크립트는 보고서를 행 단위로 캔버스에 바로 그리고 페이지가 차면 넘긴다.
+전체 story를 메모리에 쌓는 SimpleDocTemplate 대신 행 하나만 들고 있으므로 메모리가 행 크기로 제한된다.
+출력은 (보고서, 수정 시각, 양식 수정 시각, 렌더러 버전) 단위로 캐시되어 바뀌지 않은 보고서는 다시 그리지 않는다.
+"""
+import sys
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import argparse
+import hashlib
+import json
+import os
+import urllib.parse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import cm
+from reportlab.platypus import Paragraph, Table, TableStyle
+from reportlab.pdfgen.canvas import Canvas
+from reportlab.lib import colors
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.lib.enums import TA_CENTER
+
+RENDERER_VERSION = "1"
+OUTPUT_DIR = os.environ.get("REPORT_PDF_DIR", "report-pdfs")
+FONT_PATH = os.environ.get("REPORT_PDF_FONT", "C:/Windows/Fonts/malgun.ttf")
+PAGE_SIZE = 200  # PostgREST 한 번에 가져오는 보고서 수 (배치 모드)
+
+SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
+SERVICE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+
+# Register Korean font
+pdfmetrics.registerFont(TTFont('Korean', FONT_PATH))
+korean_font = 'Korean'
+
+# Styles
+styles = getSampleStyleSheet()
+
+title_style = ParagraphStyle('ReportTitle', parent=styles['Title'], fontName=korean_font,
+    fontSize=16, spaceAfter=6, alignment=TA_CENTER, textColor=colors.HexColor('#1e293b'))
+
+meta_style = ParagraphStyle('ReportMeta', parent=styles['Normal'], fontName=korean_font,
+    fontSize=10, alignment=TA_CENTER, textColor=colors.HexColor('#64748b'), spaceAfter=4)
+
+heading_style = ParagraphStyle('ReportHeading', parent=styles['Heading2'], fontName=korean_font,
+    fontSize=13, spaceBefore=10, spaceAfter=6, textColor=colors.HexColor('#334155'))
+
+cell_style = ParagraphStyle('ReportCell', parent=styles['Normal'], fontName=korean_font,
+    fontSize=9, leading=12)
+
+header_cell_style = ParagraphStyle('ReportHeaderCell', parent=cell_style, textColor=colors.white)
+
+row_style = TableStyle([
+    ('FONTNAME', (0, 0), (-1, -1), korean_font),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#cbd5e1')),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+])
+
+header_row_style = TableStyle([('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#10b981'))])
+
+MARGIN_X = 2 * cm
+MARGIN_TOP = 1.8 * cm
+MARGIN_BOTTOM = 2.2 * cm
+CONTENT_WIDTH = A4[0] - 2 * MARGIN_X
+
+
+# ===== Supabase (PostgREST) =====
+
+def rest_get(table, params, range_from=None, range_to=None):
+    url = f"{SUPABASE_URL}/rest/v1/{table}?{urllib.parse.urlencode(params)}"
+    req = urllib.request.Request(url, headers={
+        "apikey": SERVICE_KEY,
+        "Authorization": f"Bearer {SERVICE_KEY}",
+        "Accept": "application/json",
+    })
+    if range_from is not None:
+        req.add_header("Range", f"{range_from}-{range_to}")
+    with urllib.request.urlopen(req) as res:
+        return json.loads(res.read().decode('utf-8'))
+
+REPORT_SELECT = ("id,title,period_start,period_end,content,updated_at,project_id,"
+    "template:report_templates(sections,header_config,updated_at),"
+    "project:projects(name,short_name)")
+
+def fetch_report(report_id):
+    rows = rest_get("reports", {"select": REPORT_SELECT, "id": f"eq.{report_id}"})
+    if not rows:
+        raise LookupError(f"Report not found: {report_id}")
+    return rows[0]
+
+def iter_report_ids(period_from, period_to):
+    """기간에 걸친 보고서 id를 PAGE_SIZE씩 끊어서 가져온다."""
+    offset = 0
+    while True:
+        rows = rest_get("reports", {
+            "select": "id",
+            "period_start": f"lte.{period_to}",
+            "period_end": f"gte.{period_from}",
+            "order": "period_start,id",
+        }, offset, offset + PAGE_SIZE - 1)
+        for row in rows:
+            yield row["id"]
+        if len(rows) < PAGE_SIZE:
+            return
+        offset += PAGE_SIZE
+
+def fetch_sub_projects(project_id):
+    if not project_id:
+        return []
+    return rest_get("sub_projects", {
+        "select": "id,name,sort_order",
+        "project_id": f"eq.{project_id}",
+        "order": "sort_order",
+    })
+
+
+# ===== Cache =====
+
+def cache_path(report):
+    template = report.get("template") or {}
+    key = "|".join([report["id"], report["updated_at"], template.get("updated_at", ""), RENDERER_VERSION])
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(OUTPUT_DIR, f"{report['id']}-{digest}.pdf")
+
+def remove_stale(report_id, keep_path):
+    for name in os.listdir(OUTPUT_DIR):
+        path = os.path.join(OUTPUT_DIR, name)
+        if name.startswith(f"{report_id}-") and path != keep_path:
+            os.remove(path)
+
+
+# ===== Rendering =====
+
+def escape(text):
+    return (text or "").replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+def entries_paragraph(entries):
+    if not entries:
+        return Paragraph('<font color="#94a3b8">-</font>', cell_style)
+    return Paragraph("<br/>".join(f"• {escape(e.get('text'))}" for e in entries), cell_style)
+
+def matrix_widths(columns):
+    first = CONTENT_WIDTH * 0.2
+    return [first] + [(CONTENT_WIDTH - first) / max(len(columns), 1)] * len(columns)
+
+def iter_section_rows(section, content, sub_projects):
+    """섹션 내용을 한 행씩 만든다: (셀 목록, 열 너비)."""
+    kind = section.get("type")
+    data = content.get(section["id"]) or {}
+    if kind == "progress_matrix":
+        columns = section.get("columns") or []
+        widths = matrix_widths(columns)
+        for sp in sub_projects:
+            cell = data.get(sp["id"]) or {}
+            yield [Paragraph(escape(sp["name"]), cell_style)] + \
+                [entries_paragraph(cell.get(col["key"])) for col in columns], widths
+    elif kind == "list":
+        for entry in data.get("items") or []:
+            yield [Paragraph(f"• {escape(entry.get('text'))}", cell_style)], [CONTENT_WIDTH]
+    elif kind == "text":
+        text = (data.get("text") or "").strip()
+        if text:
+            yield [Paragraph(escape(text).replace("\n", "<br/>"), cell_style)], [CONTENT_WIDTH]
+
+def section_header(section):
+    if section.get("type") != "progress_matrix":
+        return None
+    columns = section.get("columns") or []
+    widths = matrix_widths(columns)
+    cells = [Paragraph("업무구분", header_cell_style)] + \
+        [Paragraph(escape(col["label"]), header_cell_style) for col in columns]
+    return cells, widths
+
+class PageWriter:
+    """캔버스에 위에서 아래로 흐름 요소를 그리고, 자리가 없으면 다음 페이지로 넘긴다."""
+
+    def __init__(self, path):
+        self.canvas = Canvas(path, pagesize=A4, pageCompression=1)
+        self.page = 1
+        self.y = A4[1] - MARGIN_TOP
+        self.page_top = self.y
+        self.repeat_header = None
+
+    def available(self):
+        return self.y - MARGIN_BOTTOM
+
+    def page_available(self):
+        """새 페이지에서 (반복 헤더를 그린 뒤) 쓸 수 있는 높이"""
+        height = A4[1] - MARGIN_TOP - MARGIN_BOTTOM
+        if self.repeat_header:
+            table = self.row_table(*self.repeat_header, header=True)
+            height -= table.wrapOn(self.canvas, CONTENT_WIDTH, height)[1]
+        return height
+
+    def new_page(self):
+        self.draw_page_number()
+        self.canvas.showPage()
+        self.page += 1
+        self.y = A4[1] - MARGIN_TOP
+        if self.repeat_header:
+            self.draw_table(*self.repeat_header, header=True)
+        self.page_top = self.y
+
+    def draw_page_number(self):
+        self.canvas.setFont(korean_font, 9)
+        self.canvas.setFillColor(colors.gray)
+        self.canvas.drawCentredString(A4[0] / 2, 1.5 * cm, f"- {self.page} -")
+
+    def draw_flowable(self, flowable):
+        _, height = flowable.wrapOn(self.canvas, CONTENT_WIDTH, self.available())
+        if height > self.available():
+            self.new_page()
+            _, height = flowable.wrapOn(self.canvas, CONTENT_WIDTH, self.available())
+        space = flowable.getSpaceBefore() if self.y < A4[1] - MARGIN_TOP else 0
+        self.y -= space
+        flowable.drawOn(self.canvas, MARGIN_X, self.y - height)
+        self.y -= height + flowable.getSpaceAfter()
+
+    def row_table(self, cells, widths, header=False):
+        table = Table([cells], colWidths=widths, splitInRow=1)
+        table.setStyle(row_style)
+        if header:
+            table.setStyle(header_row_style)
+        return table
+
+    def draw_table(self, cells, widths, header=False):
+        table = self.row_table(cells, widths, header)
+        _, height = table.wrapOn(self.canvas, CONTENT_WIDTH, self.available())
+        if height > self.available() and (header or height <= self.page_available()):
+            # 새 페이지에 들어가는 행은 나누지 않고 통째로 넘긴다
+            self.new_page()
+        self.draw_split(table)
+
+    def draw_split(self, table):
+        """남은 높이만큼 그리고 나머지는 다음 페이지로 (한 페이지보다 긴 행만 여기서 나뉜다)"""
+        pending = [table]
+        while pending:
+            part = pending.pop(0)
+            _, height = part.wrapOn(self.canvas, CONTENT_WIDTH, self.available())
+            if height > self.available():
+                parts = part.split(CONTENT_WIDTH, self.available())
+                if len(parts) >= 2:
+                    part, pending = parts[0], parts[1:] + pending
+                    _, height = part.wrapOn(self.canvas, CONTENT_WIDTH, self.available())
+                elif self.y < self.page_top:
+                    # 이 페이지에는 한 줄도 안 들어감 → 다음 페이지에서 다시 나눈다
+                    pending.insert(0, part)
+                    self.new_page()
+                    continue
+                # 빈 페이지에서도 나눌 수 없는 조각(한 줄짜리 셀)은 그대로 그린다
+            part.drawOn(self.canvas, MARGIN_X, self.y - height)
+            self.y -= height
+            if pending:
+                self.new_page()
+
+    def save(self):
+        self.draw_page_number()
+        self.canvas.save()
+
+def render_report(report, sub_projects, path):
+    template = report.get("template") or {}
+    header_config = template.get("header_config") or {}
+    content = report.get("content") or {}
+    writer = PageWriter(path)
+
+    if header_config.get("org_name"):
+        writer.draw_flowable(Paragraph(escape(header_config["org_name"]), meta_style))
+    writer.draw_flowable(Paragraph(escape(report["title"]), title_style))
+    writer.draw_flowable(Paragraph(f"보고기간: {report['period_start']} ~ {report['period_end']}", meta_style))
+    project = report.get("project")
+    if project:
+        writer.draw_flowable(Paragraph(f"프로젝트: {escape(project.get('short_name') or project['name'])}", meta_style))
+
+    for section in template.get("sections") or []:
+        writer.repeat_header = None
+        writer.draw_flowable(Paragraph(escape(section["title"]), heading_style))
+        header = section_header(section)
+        if header:
+            writer.draw_table(*header, header=True)
+            writer.repeat_header = header
+        for cells, widths in iter_section_rows(section, content, sub_projects):
+            writer.draw_table(cells, widths)
+
+    writer.save()
+
+
+# ===== Export =====
+
+def export_report(report_id, force=False):
+    report = fetch_report(report_id)
+    path = cache_path(report)
+    if os.path.exists(path) and not force:
+        return path, True
+
+    sub_projects = fetch_sub_projects(report.get("project_id"))
+    tmp_path = f"{path}.tmp"
+    render_report(report, sub_projects, tmp_path)
+    os.replace(tmp_path, path)
+    remove_stale(report_id, path)
+    return path, False
+
+def main():
+    parser = argparse.ArgumentParser(description="Export reports to PDF")
+    parser.add_argument("report_ids", nargs="*")
+    parser.add_argument("--from", dest="period_from", help="배치: 보고기간 시작 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="period_to", help="배치: 보고기간 끝 (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--force", action="store_true", help="캐시를 무시하고 다시 그리기")
+    args = parser.parse_args()
+
+    if not SUPABASE_URL or not SERVICE_KEY:
+        print("Missing SUPABASE environment variables")
+        print("Set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY from .env.local")
+        sys.exit(1)
+
+    report_ids = list(args.report_ids)
+    if args.period_from and args.period_to:
+        report_ids.extend(iter_report_ids(args.period_from, args.period_to))
+    if not report_ids:
+        parser.error("report id or --from/--to is required")
+
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+
+    if len(report_ids) == 1:
+        try:
+            path, cached = export_report(report_ids[0], args.force)
+        except LookupError as e:
+            print(e)
+            sys.exit(1)
+        print(f"{'Cached' if cached else 'PDF created'}: {path}")
+        return
+
+    # 보고서마다 독립적으로 그리므로 프로세스 단위로 병렬 처리
+    failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {pool.submit(export_report, rid, args.force): rid for rid in report_ids}
+        for future in as_completed(futures):
+            rid = futures[future]
+            try:
+                path, cached = future.result()
+                print(f"{'Cached' if cached else 'PDF created'}: {path}")
+            except Exception as e:
+                failed += 1
+                print(f"Failed: {rid} ({e})")
+    print(f"Done: {len(report_ids) - failed}/{len(report_ids)}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Generate thumbnails for uploaded attachments (local worker)
+
+Usage:
+  python scripts/generate-file-derivatives.py            # 대기열 한 번 처리
+  python scripts/generate-file-derivatives.py --watch 30 # 30초마다 대기열 확인
+  python scripts/generate-file-derivatives.py --retry    # failed/processing을 다시 대기열로
+
+Env: NEXT_PUBLIC_SUPABASE_URL, SUPABASE_SERVICE_ROLE_KEY (.env.local 값 사용)
+Requires: pip install pillow pypdfium2
+
+연구노트/멘토링 첨부 중 이미지와 PDF(첫 페이지)를 DERIVATIVE_WIDTHS 너비의 WebP로 줄여
+원본과 같은 버킷의 고정 키 derivatives/{file_id}/w{width}.webp 에 올리고
+files에 parent_file_id 행으로 기록한다 (00041_add_file_derivatives.sql).
+모든 너비를 올린 뒤에 원본을 ready로 바꾸므로 화면은 키를 계산해 바로 요청한다.
+키가 고정이라 다시 실행해도 같은 객체/행을 덮어쓴다.
+"""
+import sys
+import io
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
+
+import argparse
+import json
+import os
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+
+from PIL import Image, ImageOps
+import pypdfium2 as pdfium
+
+# src/lib/storage/derivatives.ts의 DERIVATIVE_WIDTHS와 같아야 한다
+DERIVATIVE_WIDTHS = (160, 480, 960)
+MAX_ASPECT = 2        # 세로로 긴 이미지는 너비의 2배 높이까지만
+WEBP_QUALITY = 80
+BATCH_SIZE = 20
+
+# files.entity_type → 버킷 (업로드 액션의 *_FILES_BUCKET)
+ENTITY_BUCKETS = {
+    "research_note": "research-notes",
+    "mentoring": "mentoring-files",
+    "mentoring_post": "mentoring-files",
+}
+
+SUPABASE_URL = os.environ.get("NEXT_PUBLIC_SUPABASE_URL")
+SERVICE_KEY = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
+
+
+def _headers(extra=None):
+    headers = {
+        "apikey": SERVICE_KEY,
+        "Authorization": f"Bearer {SERVICE_KEY}",
+    }
+    headers.update(extra or {})
+    return headers
+
+
+def rest(method, table, params, body=None, prefer=None):
+    url = f"{SUPABASE_URL}/rest/v1/{table}?{urllib.parse.urlencode(params)}"
+    headers = _headers({"Accept": "application/json", "Content-Type": "application/json"})
+    if prefer:
+        headers["Prefer"] = prefer
+    data = json.dumps(body).encode('utf-8') if body is not None else None
+    req = urllib.request.Request(url, data=data, method=method, headers=headers)
+    with urllib.request.urlopen(req) as res:
+        raw = res.read().decode('utf-8')
+        return json.loads(raw) if raw else None
+
+
+def storage_download(bucket, path):
+    url = f"{SUPABASE_URL}/storage/v1/object/{bucket}/{urllib.parse.quote(path)}"
+    with urllib.request.urlopen(urllib.request.Request(url, headers=_headers())) as res:
+        return res.read()
+
+
+def storage_upload(bucket, path, content):
+    url = f"{SUPABASE_URL}/storage/v1/object/{bucket}/{urllib.parse.quote(path)}"
+    req = urllib.request.Request(url, data=content, method="POST", headers=_headers({
+        "Content-Type": "image/webp",
+        "x-upsert": "true",
+        # 원본이 바뀌지 않는 한 같은 키의 내용도 같다
+        "cache-control": "max-age=31536000",
+    }))
+    with urllib.request.urlopen(req) as res:
+        res.read()
+
+
+def derivative_path(file_id, width):
+    return f"derivatives/{file_id}/w{width}.webp"
+
+
+def source_path(row):
+    # 연구노트는 file_path, 멘토링은 storage_path에 저장된다
+    return row.get("file_path") or row.get("storage_path")
+
+
+def set_status(file_id, status, only_if=None):
+    params = {"id": f"eq.{file_id}"}
+    if only_if:
+        params["derivatives_status"] = f"eq.{only_if}"
+    return rest("PATCH", "files", params, {"derivatives_status": status}, prefer="return=representation")
+
+
+def claim_batch(limit):
+    """pending을 processing으로 바꾸며 가져온다 (다른 워커가 먼저 가져간 행은 빈 결과)"""
+    pending = rest("GET", "files", {
+        "select": "id",
+        "derivatives_status": "eq.pending",
+        "order": "created_at.asc",
+        "limit": str(limit),
+    })
+    claimed = []
+    for row in pending:
+        rows = set_status(row["id"], "processing", only_if="pending")
+        if rows:
+            claimed.append(rows[0])
+    return claimed
+
+
+def load_image(content, mime_type):
+    """가장 큰 파생본 너비로 원본을 한 번 디코딩/렌더링"""
+    largest = max(DERIVATIVE_WIDTHS)
+    if mime_type == "application/pdf":
+        pdf = pdfium.PdfDocument(content)
+        try:
+            page = pdf[0]
+            # PDF 단위(pt)를 가장 큰 너비에 맞춰 렌더링
+            scale = largest / page.get_width()
+            image = page.render(scale=scale).to_pil()
+        finally:
+            pdf.close()
+    else:
+        image = Image.open(io.BytesIO(content))
+        # JPEG는 디코딩 단계에서 줄인다 (회전 전이라 가로/세로 어느 쪽이든 충분하게)
+        image.draft("RGB", (largest * MAX_ASPECT, largest * MAX_ASPECT))
+        image = ImageOps.exif_transpose(image)
+
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    return image.convert("RGBA" if has_alpha else "RGB")
+
+
+def encode_webp(image, width):
+    thumb = image.copy()
+    thumb.thumbnail((width, width * MAX_ASPECT), Image.LANCZOS)  # 확대하지 않음
+    out = io.BytesIO()
+    thumb.save(out, "WEBP", quality=WEBP_QUALITY, method=6)
+    return out.getvalue()
+
+
+def derivative_row(parent, width, path, size):
+    """원본 행을 복사해 경로/크기/형식만 바꾼다 (files 스키마의 컬럼 이름 차이를 그대로 따름)"""
+    row = {k: v for k, v in parent.items() if k not in ("id", "created_at")}
+    for key in ("file_path", "storage_path", "filename", "name"):
+        if key in row:
+            row[key] = path
+    for key in ("file_size", "size"):
+        if key in row:
+            row[key] = size
+    row.update({
+        "mime_type": "image/webp",
+        "parent_file_id": parent["id"],
+        "derivative_width": width,
+        "derivatives_status": None,
+    })
+    return row
+
+
+def process(row):
+    bucket = ENTITY_BUCKETS.get(row["entity_type"])
+    path = source_path(row)
+    if not bucket or not path:
+        # 썸네일 대상이 아닌 버킷: 상태를 비워 대기열에서 뺀다
+        set_status(row["id"], None)
+        return "skipped"
+
+    image = load_image(storage_download(bucket, path), row["mime_type"])
+    rows = []
+    for width in DERIVATIVE_WIDTHS:
+        content = encode_webp(image, width)
+        key = derivative_path(row["id"], width)
+        storage_upload(bucket, key, content)
+        rows.append(derivative_row(row, width, key, len(content)))
+
+    rest("POST", "files", {"on_conflict": "parent_file_id,derivative_width"}, rows,
+         prefer="resolution=merge-duplicates,return=minimal")
+    set_status(row["id"], "ready")
+    return "ready"
+
+
+def run_once(batch_size):
+    done = failed = 0
+    while True:
+        batch = claim_batch(batch_size)
+        if not batch:
+            break
+        for row in batch:
+            try:
+                result = process(row)
+                done += 1
+                print(f"{result}: {row['id']} ({source_path(row)})")
+            except Exception as e:
+                failed += 1
+                print(f"Failed: {row['id']} ({e})")
+                try:
+                    set_status(row["id"], "failed")
+                except urllib.error.URLError as status_error:
+                    print(f"  status update failed: {status_error}")
+    return done, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate attachment thumbnails")
+    parser.add_argument("--watch", type=int, metavar="SECONDS", help="주기적으로 대기열 확인")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE)
+    parser.add_argument("--retry", action="store_true",
+                        help="failed/processing(중단된 워커)을 pending으로 되돌린 뒤 처리")
+    args = parser.parse_args()
+
+    if not SUPABASE_URL or not SERVICE_KEY:
+        print("Missing SUPABASE environment variables")
+        print("Set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY from .env.local")
+        sys.exit(1)
+
+    if args.retry:
+        rest("PATCH", "files", {"derivatives_status": "in.(failed,processing)"},
+             {"derivatives_status": "pending"})
+
+    while True:
+        done, failed = run_once(args.batch)
+        if done or failed:
+            print(f"Done: {done}, failed: {failed}")
+        if not args.watch:
+            sys.exit(1 if failed else 0)
+        time.sleep(args.watch)
+
+
+if __name__ == "__main__":
+    main()
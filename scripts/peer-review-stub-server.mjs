@@ -0,0 +1,151 @@
+// SDC Lab - AI Peer Review 로컬 stub 모델 서버
+// Anthropic Messages API의 스트리밍 응답(SSE)을 흉내 내어 API 키/비용 없이
+// /api/peer-review의 스트리밍·중간 저장·백그라운드 모드를 확인한다.
+//
+// 사용법:
+//   node scripts/peer-review-stub-server.mjs [--port 8787] [--delay 40] [--fail-after 0]
+//   .env.local: ANTHROPIC_BASE_URL=http://localhost:8787, ANTHROPIC_API_KEY=stub
+//
+//   --delay       토큰 사이 지연(ms). 중간 저장(2초 간격)을 보려면 기본값 유지
+//   --fail-after  N번째 토큰 이후 연결을 끊어 오류 처리(부분 결과 보존)를 확인
+import { createServer } from "http";
+
+function readOption(name, fallback) {
+  const index = process.argv.indexOf(`--${name}`);
+  if (index === -1 || index + 1 >= process.argv.length) return fallback;
+  return Number(process.argv[index + 1]);
+}
+
+const port = readOption("port", 8787);
+const delayMs = readOption("delay", 40);
+const failAfter = readOption("fail-after", 0);
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+function buildReview(title) {
+  const sections = [
+    `# 동료 심사 결과: ${title}`,
+    "## 1. 종합 평가\n\n**권고사항**: Minor Revision\n\n로컬 stub 서버가 생성한 테스트용 리뷰입니다.",
+    "## 2. 주요 코멘트\n\n**[M1]** 연구 방법론의 재현가능성을 보완해 주세요.\n\n**[M2]** 효과 크기와 신뢰구간을 함께 보고해 주세요.",
+    "## 3. 부수적 코멘트\n\n**[m1]** 그림 캡션을 더 구체적으로 작성해 주세요.",
+    "## 4. 최종 의견\n\n연구의 방향이 명확하며, 위 사항을 보완하면 좋은 논문이 될 것입니다.",
+  ];
+  return sections.join("\n\n");
+}
+
+// 한글도 자연스럽게 끊기도록 공백/문장 단위로 나눈다.
+function tokenize(text) {
+  return text.match(/\S+\s*|\s+/g) ?? [];
+}
+
+function send(res, event, data) {
+  res.write(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`);
+}
+
+function readTitle(body) {
+  const userMessage = body.messages?.at(-1)?.content;
+  const match = /제목: (.*)/.exec(typeof userMessage === "string" ? userMessage : "");
+  return match?.[1] ?? "제목 없음";
+}
+
+async function streamMessage(res, body) {
+  const tokens = tokenize(buildReview(readTitle(body)));
+  const id = `msg_stub_${Date.now()}`;
+
+  let aborted = false;
+  res.on("close", () => {
+    aborted = !res.writableEnded;
+  });
+
+  res.writeHead(200, {
+    "Content-Type": "text/event-stream",
+    "Cache-Control": "no-cache",
+    Connection: "keep-alive",
+    "request-id": id,
+  });
+
+  send(res, "message_start", {
+    type: "message_start",
+    message: {
+      id,
+      type: "message",
+      role: "assistant",
+      model: body.model,
+      content: [],
+      stop_reason: null,
+      stop_sequence: null,
+      usage: { input_tokens: 0, output_tokens: 0 },
+    },
+  });
+  send(res, "content_block_start", {
+    type: "content_block_start",
+    index: 0,
+    content_block: { type: "text", text: "" },
+  });
+
+  for (let i = 0; i < tokens.length; i++) {
+    if (aborted) return;
+    if (failAfter > 0 && i >= failAfter) {
+      console.log(`  ${failAfter}번째 토큰 이후 연결 종료 (--fail-after)`);
+      res.destroy();
+      return;
+    }
+    send(res, "content_block_delta", {
+      type: "content_block_delta",
+      index: 0,
+      delta: { type: "text_delta", text: tokens[i] },
+    });
+    await sleep(delayMs);
+  }
+
+  send(res, "content_block_stop", { type: "content_block_stop", index: 0 });
+  send(res, "message_delta", {
+    type: "message_delta",
+    delta: { stop_reason: "end_turn", stop_sequence: null },
+    usage: { output_tokens: tokens.length },
+  });
+  send(res, "message_stop", { type: "message_stop" });
+  res.end();
+}
+
+const server = createServer((req, res) => {
+  if (req.method !== "POST" || !req.url?.startsWith("/v1/messages")) {
+    res.writeHead(404, { "Content-Type": "application/json" });
+    res.end(JSON.stringify({ type: "error", error: { type: "not_found_error", message: "Not found" } }));
+    return;
+  }
+
+  let raw = "";
+  req.on("data", (chunk) => {
+    raw += chunk;
+  });
+  req.on("end", async () => {
+    const body = JSON.parse(raw || "{}");
+    console.log(`POST /v1/messages (stream: ${Boolean(body.stream)}, model: ${body.model})`);
+
+    if (!body.stream) {
+      const text = buildReview(readTitle(body));
+      res.writeHead(200, { "Content-Type": "application/json" });
+      res.end(
+        JSON.stringify({
+          id: `msg_stub_${Date.now()}`,
+          type: "message",
+          role: "assistant",
+          model: body.model,
+          content: [{ type: "text", text }],
+          stop_reason: "end_turn",
+          stop_sequence: null,
+          usage: { input_tokens: 0, output_tokens: tokenize(text).length },
+        })
+      );
+      return;
+    }
+
+    await streamMessage(res, body);
+  });
+});
+
+server.listen(port, () => {
+  console.log(`Peer review stub 서버 실행 중: http://localhost:${port}`);
+  console.log(`토큰 지연 ${delayMs}ms${failAfter > 0 ? `, ${failAfter}토큰 후 실패` : ""}`);
+});
@@ -55,7 +55,7 @@ async function setupBucket() {
 
       const { data: createData, error: createError } = await supabase.storage.createBucket('research-notes', {
         public: true,
-        fileSizeLimit: 10485760 // 10MB
+        fileSizeLimit: 52428800 // 50MB
       });
 
       if (createError) {
@@ -1,4 +1,5 @@
 import { createClient } from "@/lib/supabase/server";
+import { getCachedAnnouncements } from "@/lib/cache/lab-data";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Megaphone, Pin, AlertTriangle, AlertCircle, Plus } from "lucide-react";
@@ -51,28 +52,8 @@ export default async function AnnouncementsPage() {
     isProfessor = member?.position === "professor";
   }
 
-  // 공지사항 조회 (만료되지 않은 것만)
-  const now = new Date().toISOString();
-  const { data: announcements } = await supabase
-    .from("announcements")
-    .select(`
-      id,
-      title,
-      content,
-      priority,
-      is_pinned,
-      author_id,
-      expires_at,
-      created_at,
-      updated_at,
-      author:members (
-        id,
-        name
-      )
-    `)
-    .or(`expires_at.is.null,expires_at.gt.${now}`)
-    .order("is_pinned", { ascending: false })
-    .order("created_at", { ascending: false });
+  // 공지사항 조회 (만료되지 않은 것만, 연구실 공유 캐시)
+  const announcements = await getCachedAnnouncements();
 
   const announcementList = (announcements || []) as Array<{
     id: string;
@@ -1,41 +1,9 @@
-import { createClient } from "@/lib/supabase/server";
-import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
-import { CalendarView } from "@/components/features/calendar";
+import { CalendarFeedButton, CalendarView } from "@/components/features/calendar";
 import { CALENDAR_CATEGORY_CONFIG } from "@/lib/constants";
-import { Plus } from "lucide-react";
-import type { CalendarCategory } from "@/types/database.types";
-
-// ISR: 60초마다 재검증 (캐시 활용으로 TTFB 감소)
-export const revalidate = 60;
-
-export default async function CalendarPage() {
-  const supabase = await createClient();
-
-  // 날짜 범위 제한: 3개월 전 ~ 12개월 후 (payload 무한 증가 방지)
-  const rangeStart = new Date();
-  rangeStart.setMonth(rangeStart.getMonth() - 3);
-  const rangeEnd = new Date();
-  rangeEnd.setMonth(rangeEnd.getMonth() + 12);
-
-  const { data: events } = await supabase
-    .from("calendar_events")
-    .select("id, title, description, start_date, end_date, all_day, category, is_public")
-    .gte("start_date", rangeStart.toISOString().split("T")[0])
-    .lte("start_date", rangeEnd.toISOString().split("T")[0])
-    .order("start_date", { ascending: true });
-
-  const eventList = (events || []) as Array<{
-    id: string;
-    title: string;
-    description: string | null;
-    start_date: string;
-    end_date: string | null;
-    all_day: boolean;
-    category: CalendarCategory;
-    is_public: boolean;
-  }>;
 
+// 일정은 클라이언트에서 보이는 월 단위로 조회한다 (use-calendar-events)
+export default function CalendarPage() {
   return (
     <div className="space-y-4 md:space-y-6">
       {/* Header */}
@@ -46,6 +14,7 @@ export default async function CalendarPage() {
             연구실 일정을 확인하고 관리하세요.
           </p>
         </div>
+        <CalendarFeedButton />
       </div>
 
       {/* Category Legend */}
@@ -66,7 +35,7 @@ export default async function CalendarPage() {
       </div>
 
       {/* Calendar */}
-      <CalendarView events={eventList} />
+      <CalendarView />
 
       {/* Usage Hint */}
       <p className="text-xs md:text-sm text-muted-foreground text-center px-2">
@@ -3,7 +3,13 @@ import { createClient } from "@/lib/supabase/server";
 // ISR: 60초마다 재검증 (페이지 캐시로 TTFB 대폭 감소)
 export const revalidate = 60;
 
-import type { SubmissionStatus, CalendarCategory } from "@/types/database.types";
+import type { CalendarCategory } from "@/types/database.types";
+import { getDashboardSnapshot } from "@/lib/actions/dashboard";
+import {
+  getCachedAnnouncements,
+  getCachedUpcomingPublicCalendarEvents,
+  queryUpcomingCalendarEvents,
+} from "@/lib/cache/lab-data";
 import { SubmittedProjectsCard } from "@/components/features/SubmittedProjectsCard";
 import { UnifiedDeadlineView, type UnifiedDeadlineItem } from "@/components/features/dashboard/unified-deadline-view";
 import { AnnouncementsSection } from "@/components/features/dashboard/announcements-section";
@@ -17,105 +23,32 @@ export default async function DashboardPage() {
   const thirtyDaysAgo = new Date();
   thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30);
   const thirtyDaysAgoStr = thirtyDaysAgo.toISOString().split("T")[0];
-  const now = new Date().toISOString();
 
-  // 캘린더 이벤트 날짜 범위 제한: 3개월 전 ~ 12개월 후
-  const calRangeStart = new Date();
-  calRangeStart.setMonth(calRangeStart.getMonth() - 3);
-  const calRangeEnd = new Date();
-  calRangeEnd.setMonth(calRangeEnd.getMonth() + 12);
+  // 캘린더 위젯은 보이는 월만 클라이언트에서 조회한다.
+  // 여기서는 "다가오는 마감일"에 들어갈 가까운 일정만 읽는다 (목록 최대 20개).
+  const UPCOMING_EVENT_LIMIT = 20;
+  // 마감일 목록에 올릴 주간 목표 수
+  const GOAL_DEADLINE_LIMIT = 50;
 
-  // 4개 쿼리를 병렬 실행 (순차 → 병렬로 ~50% 속도 개선)
-  const [projectsResult, eventsResult, goalsResult, announcementsResult] = await Promise.all([
-    supabase
-      .from("research_projects")
-      .select("id, title, status, overall_progress, updated_at, submission_status, target_journal, is_archived")
-      .order("updated_at", { ascending: false }),
+  // 연구실 공용 데이터(스냅샷, 공지, 공개 일정)는 공유 캐시에서 읽고
+  // 사용자별 RLS가 적용되는 개인 일정만 사용자 클라이언트로 조회
+  const [snapshot, announcements, publicEvents, privateEventsResult] = await Promise.all([
+    getDashboardSnapshot(),
 
-    supabase
-      .from("calendar_events")
-      .select("id, title, start_date, end_date, category, all_day, member_id")
-      .gte("start_date", calRangeStart.toISOString().split("T")[0])
-      .lte("start_date", calRangeEnd.toISOString().split("T")[0])
-      .order("start_date", { ascending: true }),
+    getCachedAnnouncements(10),
 
-    supabase
-      .from("weekly_goals")
-      .select(`
-        id,
-        content,
-        deadline,
-        linked_stage,
-        project_id,
-        is_completed,
-        research_projects!inner (
-          id,
-          title,
-          project_members (
-            role,
-            member_id,
-            members (
-              id,
-              name,
-              avatar_url
-            )
-          )
-        )
-      `)
-      .gte("deadline", thirtyDaysAgoStr)
-      .order("deadline", { ascending: true })
-      .limit(50),
+    getCachedUpcomingPublicCalendarEvents(todayStr, UPCOMING_EVENT_LIMIT),
 
-    supabase
-      .from("announcements")
-      .select(`
-        id,
-        title,
-        content,
-        priority,
-        is_pinned,
-        author_id,
-        expires_at,
-        created_at,
-        updated_at,
-        author:members (
-          id,
-          name
-        )
-      `)
-      .or(`expires_at.is.null,expires_at.gt.${now}`)
-      .order("is_pinned", { ascending: false })
-      .order("created_at", { ascending: false })
-      .limit(10),
+    queryUpcomingCalendarEvents(supabase, todayStr, UPCOMING_EVENT_LIMIT, false),
   ]);
 
-  const projects = projectsResult.data;
-  const upcomingEvents = eventsResult.data;
-  const memberGoals = goalsResult.data;
-
-  if (eventsResult.error) {
-    console.error("Calendar events fetch error:", eventsResult.error);
+  if (privateEventsResult.error) {
+    console.error("Calendar events fetch error:", privateEventsResult.error);
   }
 
-  type AnnouncementRow = {
-    id: string;
-    title: string;
-    content: string;
-    priority: AnnouncementPriority;
-    is_pinned: boolean;
-    author_id: string | null;
-    expires_at: string | null;
-    created_at: string;
-    updated_at: string;
-    author: { id: string; name: string } | null;
-  };
-
-  let announcements: AnnouncementRow[] = [];
-  if (announcementsResult.error) {
-    console.error("Announcements fetch error:", announcementsResult.error);
-  } else {
-    announcements = (announcementsResult.data || []) as AnnouncementRow[];
-  }
+  const upcomingEvents = [...publicEvents, ...privateEventsResult.data]
+    .sort((a, b) => new Date(a.start_date).getTime() - new Date(b.start_date).getTime())
+    .slice(0, UPCOMING_EVENT_LIMIT);
 
   // 멤버 정보를 별도로 조회 (이벤트 결과에 의존하므로 후속 쿼리)
   const memberIds = (upcomingEvents || [])
@@ -133,22 +66,8 @@ export default async function DashboardPage() {
     (eventMembers || []).map((m: { id: string; name: string; avatar_url: string | null }) => [m.id, m])
   );
 
-  const projectList = (projects || []) as Array<{
-    id: string;
-    title: string;
-    status: string;
-    overall_progress: number;
-    updated_at: string;
-    submission_status: SubmissionStatus;
-    target_journal: string | null;
-    is_archived: boolean;
-  }>;
-
-  // 투고 중인 연구 (투고 후)
-  const allSubmittedProjects = projectList.filter(
-    (p) => p.submission_status &&
-           p.submission_status !== "not_submitted"
-  );
+  // 투고 중인 연구 (투고 후) - 스냅샷에 submission_status <> not_submitted 만 저장됨
+  const allSubmittedProjects = snapshot.submitted_projects;
 
   // 활성 프로젝트 (아카이브되지 않은 것)
   const activeProjects = allSubmittedProjects.filter((p) => !p.is_archived);
@@ -183,43 +102,22 @@ export default async function DashboardPage() {
   }>;
 
   // 목표를 통합 마감일 형식으로 변환
-  const goalDeadlines: UnifiedDeadlineItem[] = (memberGoals || []).map((goal: {
-    id: string;
-    content: string;
-    deadline: string;
-    linked_stage: string | null;
-    project_id: string;
-    is_completed: boolean;
-    research_projects: {
-      id: string;
-      title: string;
-      project_members: Array<{
-        role: string;
-        member_id: string;
-        members: {
-          id: string;
-          name: string;
-          avatar_url: string | null;
-        } | null;
-      }>;
-    };
-  }) => {
-    const project = goal.research_projects;
-    const firstAuthor = project?.project_members?.find((pm) => pm.role === "first_author");
-    const member = firstAuthor?.members || project?.project_members?.[0]?.members;
-
-    return {
+  // 스냅샷은 일일 cron 사이에 날짜가 바뀔 수 있으므로 30일 기준을 한 번 더 적용하고,
+  // 그 뒤에 마감일 순 상한을 둔다 (스냅샷은 창 안의 목표를 모두 저장)
+  const goalDeadlines: UnifiedDeadlineItem[] = snapshot.goal_deadlines
+    .filter((goal) => goal.deadline >= thirtyDaysAgoStr)
+    .slice(0, GOAL_DEADLINE_LIMIT)
+    .map((goal) => ({
       id: goal.id,
       type: "goal" as const,
       title: goal.content,
       date: goal.deadline,
-      memberName: member?.name || "미지정",
-      memberAvatarUrl: member?.avatar_url,
-      projectId: project?.id,
-      projectTitle: project?.title,
+      memberName: goal.member_name || "미지정",
+      memberAvatarUrl: goal.member_avatar_url,
+      projectId: goal.project_id,
+      projectTitle: goal.project_title,
       isCompleted: goal.is_completed,
-    };
-  });
+    }));
 
   // 캘린더 이벤트를 통합 마감일 형식으로 변환 (미래 일정만)
   const today = new Date();
@@ -301,7 +199,7 @@ export default async function DashboardPage() {
         - mb-4 md:mb-6: 하위 "다가오는 마감일" 섹션과 충분한 간격 확보
       */}
       <div className="mb-4 md:mb-6">
-        <DashboardCalendar events={eventList} className="min-h-[500px] md:min-h-[600px]" />
+        <DashboardCalendar className="min-h-[500px] md:min-h-[600px]" />
       </div>
 
       {/*
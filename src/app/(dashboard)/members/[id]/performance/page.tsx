@@ -1,5 +1,5 @@
 import { notFound } from "next/navigation";
-import { createClient } from "@/lib/supabase/server";
+import { getMemberPerformance, getPerformanceRanking } from "@/lib/actions/performance";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
@@ -10,7 +10,6 @@ import {
   getInitials,
   getPositionLabel,
   getMilestoneStageLabel,
-  formatDate,
   formatRelativeTime,
 } from "@/lib/utils";
 import {
@@ -23,349 +22,63 @@ import {
   Calendar,
   MessageSquare,
 } from "lucide-react";
-import type { Database } from "@/types/database.types";
-
-type Member = Database["public"]["Tables"]["members"]["Row"];
 
 interface PerformancePageProps {
   params: Promise<{ id: string }>;
 }
 
-// 마일스톤 진행률 계산 (체크리스트 기반)
-function calculateMilestoneProgress(
-  checklistItems: Array<{ is_completed: boolean }>
-): number {
-  if (checklistItems.length === 0) return 0;
-  const completed = checklistItems.filter((item) => item.is_completed).length;
-  return Math.round((completed / checklistItems.length) * 100);
-}
-
-// 일정 준수율 계산
-function calculateScheduleAdherence(
-  milestones: Array<{
-    end_date: string | null;
-    completed_at: string | null;
-    progress: number;
-  }>
-): { rate: number; onTime: number; delayed: number; total: number } {
-  const completedMilestones = milestones.filter((m) => m.progress === 100);
-  if (completedMilestones.length === 0) {
-    return { rate: 100, onTime: 0, delayed: 0, total: 0 };
-  }
-
-  let onTime = 0;
-  let delayed = 0;
-
-  completedMilestones.forEach((m) => {
-    if (!m.end_date || !m.completed_at) {
-      onTime++; // 기한이 없으면 정상 완료로 간주
-      return;
-    }
-
-    const endDate = new Date(m.end_date);
-    const completedDate = new Date(m.completed_at);
-
-    if (completedDate <= endDate) {
-      onTime++;
-    } else {
-      delayed++;
-    }
-  });
-
-  const total = onTime + delayed;
-  const rate = total > 0 ? Math.round((onTime / total) * 100) : 100;
-
-  return { rate, onTime, delayed, total };
-}
-
 export default async function MemberPerformancePage({
   params,
 }: PerformancePageProps) {
   const { id } = await params;
-  const supabase = await createClient();
 
-  // 멤버 정보 조회
-  const { data: memberData } = await supabase
-    .from("members")
-    .select("*")
-    .eq("id", id)
-    .single();
+  // 멤버 정보, 지표, 프로젝트/마일스톤, 최근 활동을 한 번에 조회
+  // 지표는 member_performance_stats에 트리거로 미리 계산되어 있음 (00028)
+  // 연구실 내 순위도 같은 지표 테이블에서 함께 조회
+  const [{ data: performance }, { data: ranking }] = await Promise.all([
+    getMemberPerformance(id),
+    getPerformanceRanking("avg_progress", 100),
+  ]);
 
-  if (!memberData) {
+  if (!performance?.member) {
     notFound();
   }
 
-  const member = memberData as Member;
-
-  // 타입 정의
-  type ProjectMemberWithDetails = {
-    role: string;
-    research_projects: {
-      id: string;
-      title: string;
-      status: string;
-      overall_progress: number;
-      deadline: string | null;
-      created_at: string;
-      milestones: Array<{
-        id: string;
-        stage: string;
-        weight: number;
-        start_date: string | null;
-        end_date: string | null;
-        completed_at: string | null;
-        sort_order: number | null;
-        checklist_items: Array<{
-          id: string;
-          content: string;
-          is_completed: boolean;
-          completed_at: string | null;
-        }>;
-      }>;
-    } | null;
-  };
-
-  type MentoringPost = {
-    id: string;
-    content: string;
-    created_at: string;
-  };
-
-  type MentoringComment = {
-    id: string;
-    content: string;
-    created_at: string;
+  const member = performance.member;
+  const projects = performance.projects;
+
+  // 종합 통계
+  const totalProjects = performance.stats?.total_projects ?? 0;
+  const avgProgress = performance.stats?.avg_progress ?? 0;
+  const completedMilestones = performance.stats?.completed_milestones ?? 0;
+  const totalMilestones = performance.stats?.total_milestones ?? 0;
+
+  // 평균 진행률 기준 연구실 순위 (활동 중인 멤버 대상)
+  const progressRankIndex = ranking?.findIndex((entry) => entry.member_id === id) ?? -1;
+  const progressRank =
+    ranking && progressRankIndex >= 0
+      ? { rank: progressRankIndex + 1, total: ranking.length }
+      : null;
+
+  const scheduleStats = {
+    rate: performance.stats?.schedule_adherence ?? 100,
+    onTime: performance.stats?.on_time_milestones ?? 0,
+    delayed: performance.stats?.delayed_milestones ?? 0,
+    total:
+      (performance.stats?.on_time_milestones ?? 0) +
+      (performance.stats?.delayed_milestones ?? 0),
   };
 
-  // 참여 프로젝트 조회 방법 1: project_members 테이블
-  const { data: projectMembers } = await supabase
-    .from("project_members")
-    .select(
-      `
-      role,
-      research_projects (
-        id,
-        title,
-        status,
-        overall_progress,
-        deadline,
-        created_at,
-        milestones (
-          id,
-          stage,
-          weight,
-          start_date,
-          end_date,
-          completed_at,
-          sort_order,
-          checklist_items (
-            id,
-            content,
-            is_completed,
-            completed_at
-          )
-        )
-      )
-    `
-    )
-    .eq("member_id", id) as { data: ProjectMemberWithDetails[] | null };
-
-  // 참여 프로젝트 조회 방법 2: project_authors 테이블 (이름 기반)
-  type ProjectAuthorWithProject = {
-    role: string;
-    research_projects: {
-      id: string;
-      title: string;
-      status: string;
-      overall_progress: number;
-      deadline: string | null;
-      created_at: string;
-      milestones: Array<{
-        id: string;
-        stage: string;
-        weight: number;
-        start_date: string | null;
-        end_date: string | null;
-        completed_at: string | null;
-        sort_order: number | null;
-        checklist_items: Array<{
-          id: string;
-          content: string;
-          is_completed: boolean;
-          completed_at: string | null;
-        }>;
-      }>;
-    } | null;
-  };
-
-  const { data: projectAuthors } = await supabase
-    .from("project_authors")
-    .select(
-      `
-      role,
-      research_projects (
-        id,
-        title,
-        status,
-        overall_progress,
-        deadline,
-        created_at,
-        milestones (
-          id,
-          stage,
-          weight,
-          start_date,
-          end_date,
-          completed_at,
-          sort_order,
-          checklist_items (
-            id,
-            content,
-            is_completed,
-            completed_at
-          )
-        )
-      )
-    `
-    )
-    .eq("name", member.name) as { data: ProjectAuthorWithProject[] | null };
-
-  // 두 소스의 프로젝트 병합 (중복 제거)
-  const allProjectData = [
-    ...(projectMembers || []),
-    ...(projectAuthors || []),
-  ];
-
-  // 최근 체크리스트 완료 활동 조회 (최근 30일)
-  const thirtyDaysAgo = new Date();
-  thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30);
-
-  // 멘토링 활동 조회
-  const { data: mentoringPosts } = (await supabase
-    .from("mentoring_posts")
-    .select("id, content, created_at")
-    .or(`author_id.eq.${id},target_member_id.eq.${id}`)
-    .order("created_at", { ascending: false })
-    .limit(10)) as { data: MentoringPost[] | null };
-
-  const { data: mentoringComments } = (await supabase
-    .from("mentoring_comments")
-    .select("id, content, created_at")
-    .eq("author_id", id)
-    .order("created_at", { ascending: false })
-    .limit(10)) as { data: MentoringComment[] | null };
-
-  // 데이터 정리 (중복 프로젝트 제거)
-  const seenProjectIds = new Set<string>();
-  const projects = allProjectData
-    .map((pm) => {
-      const project = pm.research_projects;
-      if (!project) return null;
-
-      // 중복 프로젝트 제거
-      if (seenProjectIds.has(project.id)) return null;
-      seenProjectIds.add(project.id);
-
-      return {
-        ...project,
-        role: pm.role,
-        milestones: (project.milestones || []).sort(
-          (a, b) => (a.sort_order || 0) - (b.sort_order || 0)
-        ),
-      };
-    })
-    .filter((p): p is NonNullable<typeof p> => p !== null);
-
-  // 종합 통계 계산
-  const totalProjects = projects.length;
-  const avgProgress =
-    totalProjects > 0
-      ? Math.round(
-          projects.reduce((sum, p) => sum + p.overall_progress, 0) /
-            totalProjects
-        )
-      : 0;
-
-  const allMilestones = projects.flatMap((p) =>
-    p.milestones.map((m) => ({
-      ...m,
-      progress: calculateMilestoneProgress(m.checklist_items),
-    }))
-  );
-  const completedMilestones = allMilestones.filter((m) => m.progress === 100);
-  const totalMilestones = allMilestones.length;
-
-  const scheduleStats = calculateScheduleAdherence(
-    allMilestones.map((m) => ({
-      end_date: m.end_date,
-      completed_at: m.completed_at,
-      progress: m.progress,
-    }))
-  );
-
-  // 최근 활동 수집
-  const recentActivities: Array<{
-    type: "checklist" | "milestone" | "mentoring" | "comment";
-    description: string;
-    date: string;
-    projectTitle?: string;
-  }> = [];
-
-  // 체크리스트 완료 활동
-  projects.forEach((project) => {
-    project.milestones.forEach((milestone) => {
-      milestone.checklist_items
-        .filter((item) => item.is_completed && item.completed_at)
-        .forEach((item) => {
-          recentActivities.push({
-            type: "checklist",
-            description: item.content,
-            date: item.completed_at!,
-            projectTitle: project.title,
-          });
-        });
-
-      // 마일스톤 완료
-      if (milestone.completed_at) {
-        recentActivities.push({
-          type: "milestone",
-          description: `"${getMilestoneStageLabel(milestone.stage)}" 단계 완료`,
-          date: milestone.completed_at,
-          projectTitle: project.title,
-        });
-      }
-    });
-  });
-
-  // 멘토링 활동
-  (mentoringPosts || []).forEach((post) => {
-    recentActivities.push({
-      type: "mentoring",
-      description:
-        post.content.length > 50
-          ? post.content.substring(0, 50) + "..."
-          : post.content,
-      date: post.created_at,
-    });
-  });
-
-  // 댓글 활동
-  (mentoringComments || []).forEach((comment) => {
-    recentActivities.push({
-      type: "comment",
-      description:
-        comment.content.length > 50
-          ? comment.content.substring(0, 50) + "..."
-          : comment.content,
-      date: comment.created_at,
-    });
-  });
-
-  // 최근 순으로 정렬 및 상위 15개만
-  recentActivities.sort(
-    (a, b) => new Date(b.date).getTime() - new Date(a.date).getTime()
-  );
-  const displayActivities = recentActivities.slice(0, 15);
+  // 최근 활동 (RPC에서 최신순 15개로 제한됨)
+  const displayActivities = performance.recent_activities.map((activity) => ({
+    type: activity.type,
+    description:
+      activity.type === "milestone"
+        ? `"${getMilestoneStageLabel(activity.description)}" 단계 완료`
+        : activity.description,
+    date: activity.date,
+    projectTitle: activity.project_title ?? undefined,
+  }));
 
   // 역할 라벨
   function getRoleLabel(role: string) {
@@ -447,6 +160,11 @@ export default async function MemberPerformancePage({
               <div>
                 <p className="text-sm text-muted-foreground">평균 진행률</p>
                 <p className="text-2xl font-bold">{avgProgress}%</p>
+                {progressRank && (
+                  <p className="text-xs text-muted-foreground">
+                    연구실 {progressRank.rank}위 / {progressRank.total}명
+                  </p>
+                )}
               </div>
             </div>
           </CardContent>
@@ -461,7 +179,7 @@ export default async function MemberPerformancePage({
               <div>
                 <p className="text-sm text-muted-foreground">완료 마일스톤</p>
                 <p className="text-2xl font-bold">
-                  {completedMilestones.length}/{totalMilestones}개
+                  {completedMilestones}/{totalMilestones}개
                 </p>
               </div>
             </div>
@@ -552,9 +270,7 @@ export default async function MemberPerformancePage({
                   {/* 마일스톤 목록 */}
                   <div className="space-y-2">
                     {project.milestones.map((milestone) => {
-                      const progress = calculateMilestoneProgress(
-                        milestone.checklist_items
-                      );
+                      const progress = milestone.progress;
                       const isCompleted = progress === 100;
                       const isCurrent = progress > 0 && progress < 100;
 
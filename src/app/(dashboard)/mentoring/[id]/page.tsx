@@ -22,6 +22,7 @@ import { FileDownloadButton } from "@/components/features/mentoring/file-downloa
 import { FileUpload } from "@/components/features/mentoring/file-upload";
 import { DeletePostButton } from "@/components/features/mentoring/delete-post-button";
 import { ShareButton } from "@/components/features/mentoring/share-button";
+import type { DerivativesStatus } from "@/lib/storage/derivatives";
 
 interface MentoringDetailPageProps {
   params: Promise<{ id: string }>;
@@ -98,7 +99,8 @@ export default async function MentoringDetailPage({
     .from("files")
     .select("*")
     .eq("entity_type", "mentoring")
-    .eq("entity_id", id);
+    .eq("entity_id", id)
+    .is("parent_file_id", null); // 썸네일(파생 파일) 행 제외
 
   // 사용자의 좋아요 여부 확인
   let userLiked = false;
@@ -164,6 +166,7 @@ export default async function MentoringDetailPage({
     storage_path: string;
     mime_type: string;
     size: number;
+    derivatives_status: DerivativesStatus | null;
   }>;
 
   const isAuthor = currentMemberId === postData.author_id;
@@ -12,17 +12,16 @@ import Link from "next/link";
 import { createClient } from "@/lib/supabase/client";
 import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
 import { getInitials } from "@/lib/utils";
-
-const ALLOWED_FILE_TYPES = [
-  "application/pdf",
-  "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-  "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-  "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-  "image/png",
-  "image/jpeg",
-];
-
-const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB
+import {
+  createMentoringFileUpload,
+  completeMentoringFileUpload,
+} from "@/lib/actions/mentoring";
+import { uploadAttachment } from "@/lib/storage/upload-attachment";
+import {
+  ATTACHMENT_MIME_TYPES,
+  MAX_ATTACHMENT_SIZE,
+  MAX_ATTACHMENT_SIZE_LABEL,
+} from "@/lib/storage/upload-policy";
 
 interface TargetMember {
   id: string;
@@ -82,12 +81,13 @@ export default function NewMentoringPage() {
     const selectedFiles = Array.from(e.target.files || []);
 
     for (const file of selectedFiles) {
-      if (!ALLOWED_FILE_TYPES.includes(file.type)) {
+      if (!ATTACHMENT_MIME_TYPES.includes(file.type)) {
         setError("허용되지 않는 파일 형식입니다. (pdf, docx, xlsx, pptx, png, jpg만 가능)");
         return;
       }
-      if (file.size > MAX_FILE_SIZE) {
-        setError("파일 크기가 10MB를 초과합니다.");
+      // 이미지는 업로드 전에 축소되므로 크기 제한은 압축 후 다시 확인한다.
+      if (!file.type.startsWith("image/") && file.size > MAX_ATTACHMENT_SIZE) {
+        setError(`파일 크기가 ${MAX_ATTACHMENT_SIZE_LABEL}를 초과합니다.`);
         return;
       }
     }
@@ -168,31 +168,17 @@ export default function NewMentoringPage() {
 
     const postData = post as { id: string };
 
-    // 파일 업로드
-    if (files.length > 0) {
-      for (const file of files) {
-        const fileExt = file.name.split(".").pop();
-        const fileName = `${postData.id}/${Date.now()}_${Math.random().toString(36).substring(7)}.${fileExt}`;
-
-        const { error: uploadError } = await supabase.storage
-          .from("mentoring-files")
-          .upload(fileName, file);
-
-        if (uploadError) {
-          console.error("File upload error:", uploadError);
-          continue;
-        }
-
-        // 파일 메타데이터 저장
-        await supabase.from("files").insert({
-          name: file.name,
-          storage_path: fileName,
-          mime_type: file.type,
-          size: file.size,
-          entity_type: "mentoring",
-          entity_id: postData.id,
-          uploaded_by: memberData.id,
-        } as never);
+    // 파일 업로드 (브라우저 → Storage 직접 업로드)
+    for (const file of files) {
+      const result = await uploadAttachment({
+        file,
+        scope: `mentoring:${postData.id}`,
+        createUpload: (meta) => createMentoringFileUpload(postData.id, meta),
+        completeUpload: (path, meta) => completeMentoringFileUpload(postData.id, path, meta),
+      });
+
+      if (result.error) {
+        console.error("File upload error:", result.error);
       }
     }
 
@@ -361,7 +347,7 @@ export default function NewMentoringPage() {
                 <Upload className="h-8 w-8 mx-auto mb-2 text-muted-foreground" />
                 <p className="text-sm text-muted-foreground">
                   <Paperclip className="h-4 w-4 inline mr-1" />
-                  파일 선택 (최대 10MB, pdf/docx/xlsx/pptx/png/jpg)
+                  파일 선택 (최대 {MAX_ATTACHMENT_SIZE_LABEL}, pdf/docx/xlsx/pptx/png/jpg)
                 </p>
               </div>
               {files.length > 0 && (
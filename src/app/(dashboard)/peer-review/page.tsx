@@ -1,6 +1,6 @@
 "use client";
 
-import { useState, useEffect } from "react";
+import { useState, useEffect, useCallback } from "react";
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
@@ -30,6 +30,9 @@ const MarkdownSimple = dynamic(
   }
 );
 import { createClient } from "@/lib/supabase/client";
+import { readServerSentEvents } from "@/lib/peer-review/sse";
+import { LONG_MANUSCRIPT_CHARS } from "@/lib/peer-review/sections";
+import { useCurrentMember } from "@/hooks/use-current-member";
 import { format } from "date-fns";
 import { ko } from "date-fns/locale";
 
@@ -39,6 +42,7 @@ interface PeerReview {
   content: string;
   review_result: string | null;
   review_status: string;
+  cache_source?: "model" | "exact" | "delta";
   created_at: string;
   project?: {
     id: string;
@@ -46,6 +50,17 @@ interface PeerReview {
   } | null;
 }
 
+// 백그라운드 생성 중인 리뷰의 상태 확인 주기
+const POLL_INTERVAL_MS = 3000;
+
+interface CacheStats {
+  total_requests: number;
+  exact_hits: number;
+  delta_hits: number;
+  hit_rate: number;
+  tokens_saved: number;
+}
+
 interface Project {
   id: string;
   title: string;
@@ -60,23 +75,67 @@ export default function PeerReviewPage() {
   const [projects, setProjects] = useState<Project[]>([]);
   const [selectedReview, setSelectedReview] = useState<PeerReview | null>(null);
   const [activeTab, setActiveTab] = useState("new");
+  const [runInBackground, setRunInBackground] = useState(false);
+  const [longDocument, setLongDocument] = useState(false);
+  // 긴 원고 섹션 검토 진행 상황 (스트리밍 중인 리뷰)
+  const [sectionProgress, setSectionProgress] = useState<{
+    completed: number;
+    total: number;
+  } | null>(null);
+  // 이 화면에서 스트리밍으로 받고 있는 리뷰 (폴링 결과로 덮어쓰지 않음)
+  const [streamingId, setStreamingId] = useState<string | null>(null);
+  const { isAdmin } = useCurrentMember();
+  const [cacheStats, setCacheStats] = useState<{
+    month: CacheStats | null;
+    total: CacheStats | null;
+  } | null>(null);
 
-  useEffect(() => {
-    fetchReviews();
-    fetchProjects();
-  }, []);
-
-  async function fetchReviews() {
+  const fetchReviews = useCallback(async () => {
     try {
       const response = await fetch("/api/peer-review");
       if (response.ok) {
-        const data = await response.json();
+        const data: PeerReview[] = await response.json();
         setReviews(data);
+        return data;
       }
     } catch (error) {
       console.error("Failed to fetch reviews:", error);
     }
-  }
+    return null;
+  }, []);
+
+  useEffect(() => {
+    fetchReviews();
+    fetchProjects();
+  }, [fetchReviews]);
+
+  useEffect(() => {
+    if (!isAdmin) return;
+    fetch("/api/peer-review/stats")
+      .then((response) => (response.ok ? response.json() : null))
+      .then(setCacheStats)
+      .catch((error) => console.error("Failed to fetch cache stats:", error));
+  }, [isAdmin]);
+
+  // 처리 중인 리뷰(백그라운드 생성, 다른 탭/새로고침 이전 요청)는 완료될 때까지 폴링
+  const hasProcessing = reviews.some(
+    (review) => review.review_status === "processing" && review.id !== streamingId
+  );
+
+  useEffect(() => {
+    if (!hasProcessing) return;
+
+    const timer = setInterval(async () => {
+      const data = await fetchReviews();
+      if (!data) return;
+      setSelectedReview((current) => {
+        if (!current || current.id === streamingId) return current;
+        return data.find((review) => review.id === current.id) ?? current;
+      });
+    }, POLL_INTERVAL_MS);
+
+    return () => clearInterval(timer);
+  }, [hasProcessing, streamingId, fetchReviews]);
 
   async function fetchProjects() {
     try {
@@ -94,11 +153,35 @@ export default function PeerReviewPage() {
     }
   }
 
+  function showNewReview(id: string, overrides: Partial<PeerReview> = {}) {
+    const newReview: PeerReview = {
+      id,
+      title,
+      content,
+      review_result: null,
+      review_status: "processing",
+      created_at: new Date().toISOString(),
+      ...overrides,
+    };
+    setTitle("");
+    setContent("");
+    setSelectedProject("");
+    setSelectedReview(newReview);
+    setReviews((prev) => [newReview, ...prev.filter((review) => review.id !== id)]);
+    setActiveTab("history");
+  }
+
+  function updateStreamingReview(id: string, update: (review: PeerReview) => PeerReview) {
+    setSelectedReview((current) => (current?.id === id ? update(current) : current));
+    setReviews((prev) => prev.map((review) => (review.id === id ? update(review) : review)));
+  }
+
   async function handleSubmit(e: React.FormEvent) {
     e.preventDefault();
     if (!title.trim() || !content.trim()) return;
 
     setIsSubmitting(true);
+    let reviewId: string | null = null;
     try {
       const response = await fetch("/api/peer-review", {
         method: "POST",
@@ -107,36 +190,63 @@ export default function PeerReviewPage() {
           title,
           content,
           projectId: selectedProject || null,
+          mode: runInBackground ? "background" : "stream",
+          longDocument,
         }),
       });
 
-      if (response.ok) {
-        const result = await response.json();
-        setTitle("");
-        setContent("");
-        setSelectedProject("");
-        await fetchReviews();
-
-        // Show the result
-        const newReview = {
-          id: result.id,
-          title,
-          content,
-          review_result: result.reviewResult,
-          review_status: "completed",
-          created_at: new Date().toISOString(),
-        };
-        setSelectedReview(newReview);
-        setActiveTab("history");
-      } else {
+      if (!response.ok) {
         const error = await response.json();
         alert(error.error || "리뷰 생성에 실패했습니다.");
+        return;
+      }
+
+      // 백그라운드: 레코드만 받고 완료 여부는 폴링으로 확인 (동일 원고면 바로 완료)
+      if (runInBackground) {
+        const result = await response.json();
+        showNewReview(
+          result.id,
+          result.status === "completed"
+            ? { review_status: "completed", review_result: result.reviewResult, cache_source: "exact" }
+            : {}
+        );
+        return;
       }
+
+      await readServerSentEvents(response, ({ event, data }) => {
+        const payload = JSON.parse(data);
+
+        if (event === "review") {
+          reviewId = payload.id;
+          setStreamingId(payload.id);
+          showNewReview(payload.id, { cache_source: payload.cacheSource });
+          setIsSubmitting(false);
+        } else if (event === "progress") {
+          setSectionProgress(payload);
+        } else if (event === "delta" && reviewId) {
+          setSectionProgress(null);
+          updateStreamingReview(reviewId, (review) => ({
+            ...review,
+            review_result: (review.review_result ?? "") + payload.text,
+          }));
+        } else if ((event === "done" || event === "error") && reviewId) {
+          updateStreamingReview(reviewId, (review) => ({
+            ...review,
+            review_status: event === "done" ? "completed" : "error",
+          }));
+        }
+      });
     } catch (error) {
       console.error("Submit error:", error);
-      alert("리뷰 생성 중 오류가 발생했습니다.");
+      // 스트림이 끊겨도 서버에서는 생성이 계속되므로 폴링으로 이어 받는다.
+      if (!reviewId) alert("리뷰 생성 중 오류가 발생했습니다.");
     } finally {
       setIsSubmitting(false);
+      setSectionProgress(null);
+      if (reviewId) {
+        setStreamingId(null);
+        await fetchReviews();
+      }
     }
   }
 
@@ -235,6 +345,28 @@ export default function PeerReviewPage() {
                     />
                   </div>
 
+                  <label className="flex items-center gap-2 text-sm text-muted-foreground">
+                    <input
+                      type="checkbox"
+                      checked={longDocument || content.length > LONG_MANUSCRIPT_CHARS}
+                      onChange={(e) => setLongDocument(e.target.checked)}
+                      disabled={isSubmitting || content.length > LONG_MANUSCRIPT_CHARS}
+                      className="h-4 w-4"
+                    />
+                    긴 원고 모드 (제목(#) 기준 섹션별 병렬 검토 후 종합)
+                  </label>
+
+                  <label className="flex items-center gap-2 text-sm text-muted-foreground">
+                    <input
+                      type="checkbox"
+                      checked={runInBackground}
+                      onChange={(e) => setRunInBackground(e.target.checked)}
+                      disabled={isSubmitting}
+                      className="h-4 w-4"
+                    />
+                    백그라운드에서 생성 (페이지를 떠나도 계속 진행됩니다)
+                  </label>
+
                   <Button
                     type="submit"
                     className="w-full"
@@ -243,7 +375,7 @@ export default function PeerReviewPage() {
                     {isSubmitting ? (
                       <>
                         <Loader2 className="mr-2 h-4 w-4 animate-spin" />
-                        AI 리뷰 생성 중...
+                        리뷰 요청 중...
                       </>
                     ) : (
                       <>
@@ -361,6 +493,44 @@ export default function PeerReviewPage() {
               )}
             </CardContent>
           </Card>
+
+          {/* 캐시 통계 (교수 전용) */}
+          {isAdmin && cacheStats?.month && cacheStats.total && (
+            <Card>
+              <CardHeader className="pb-3">
+                <CardTitle className="text-base">리뷰 캐시 통계</CardTitle>
+                <CardDescription className="text-xs">
+                  동일 원고 재사용 및 변경 부분만 리뷰한 요청의 비율과 절약한 토큰
+                </CardDescription>
+              </CardHeader>
+              <CardContent>
+                <div className="grid grid-cols-2 md:grid-cols-4 gap-3 text-sm">
+                  {[
+                    { label: "이번 달", stats: cacheStats.month },
+                    { label: "전체", stats: cacheStats.total },
+                  ].map(({ label, stats }) => (
+                    <div key={label} className="col-span-2 grid grid-cols-2 gap-3">
+                      <div className="p-3 rounded-lg border">
+                        <p className="text-xs text-muted-foreground">{label} 캐시 적중률</p>
+                        <p className="text-lg font-semibold">
+                          {Math.round(Number(stats.hit_rate) * 100)}%
+                        </p>
+                        <p className="text-xs text-muted-foreground">
+                          재사용 {stats.exact_hits} · 부분 {stats.delta_hits} / {stats.total_requests}회
+                        </p>
+                      </div>
+                      <div className="p-3 rounded-lg border">
+                        <p className="text-xs text-muted-foreground">{label} 절약 토큰</p>
+                        <p className="text-lg font-semibold">
+                          {Number(stats.tokens_saved).toLocaleString()}
+                        </p>
+                      </div>
+                    </div>
+                  ))}
+                </div>
+              </CardContent>
+            </Card>
+          )}
         </TabsContent>
 
         <TabsContent value="history" className="mt-6">
@@ -413,10 +583,16 @@ export default function PeerReviewPage() {
                   {selectedReview ? selectedReview.title : "리뷰 선택"}
                 </CardTitle>
                 {selectedReview && (
-                  <CardDescription>
+                  <CardDescription className="flex items-center gap-2">
                     {format(new Date(selectedReview.created_at), "yyyy년 MM월 dd일 HH:mm", {
                       locale: ko,
                     })}
+                    {selectedReview.cache_source === "exact" && (
+                      <Badge variant="outline">이전 리뷰 재사용</Badge>
+                    )}
+                    {selectedReview.cache_source === "delta" && (
+                      <Badge variant="outline">변경 부분만 리뷰</Badge>
+                    )}
                   </CardDescription>
                 )}
               </CardHeader>
@@ -441,13 +617,21 @@ export default function PeerReviewPage() {
                       {selectedReview.review_result ? (
                         <div className="p-4 bg-purple-50/50 rounded-lg overflow-auto max-h-[600px] border border-purple-100">
                           <MarkdownSimple content={selectedReview.review_result} />
+                          {selectedReview.review_status === "processing" && (
+                            <div className="flex items-center gap-2 mt-3 text-xs text-muted-foreground">
+                              <Loader2 className="h-3 w-3 animate-spin" />
+                              리뷰 생성 중...
+                            </div>
+                          )}
                         </div>
                       ) : (
                         <div className="p-4 text-center text-muted-foreground">
                           {selectedReview.review_status === "processing" ? (
                             <div className="flex items-center justify-center gap-2">
                               <Loader2 className="h-4 w-4 animate-spin" />
-                              리뷰 생성 중...
+                              {sectionProgress && selectedReview.id === streamingId
+                                ? `섹션별 검토 중 (${sectionProgress.completed}/${sectionProgress.total})...`
+                                : "리뷰 생성 중..."}
                             </div>
                           ) : (
                             "리뷰 결과가 없습니다."
@@ -65,7 +65,19 @@ const MarkdownSimple = dynamic(
   }
 );
 import { createClient } from "@/lib/supabase/client";
-import { createResearchNote, updateResearchNote, deleteResearchNote, addNoteComment, deleteNoteComment } from "@/lib/actions/research-notes";
+import {
+  createResearchNote,
+  updateResearchNote,
+  deleteResearchNote,
+  addNoteComment,
+  deleteNoteComment,
+  getAllResearchNotes,
+  getResearchNoteStageCounts,
+  getResearchNoteDetail,
+  exportResearchNotes,
+  type ResearchNoteCursor,
+  type ResearchNoteListFilters,
+} from "@/lib/actions/research-notes";
 import { getInitials, formatDate } from "@/lib/utils";
 import { MILESTONE_STAGE_LABEL } from "@/lib/constants";
 import type { MilestoneStage } from "@/types/database.types";
@@ -101,16 +113,38 @@ interface Comment {
   author: Author;
 }
 
+// 목록 모드: 본문 대신 발췌/단어 수만 받는다
 interface ResearchNote {
   id: string;
   title: string;
-  content: string;
+  excerpt: string;
+  content_length: number;
+  word_count: number;
   stage: MilestoneStage;
   keywords: string[];
   created_at: string;
   updated_at: string;
   project: Project;
   author: Author;
+  comment_count: number;
+}
+
+// 카드를 펼칠 때 지연 조회하는 본문 + 댓글
+interface NoteDetail {
+  content: string;
+  comments: Comment[];
+}
+
+// 내보내기용 전체 노트
+interface ExportNote {
+  id: string;
+  title: string;
+  content: string;
+  stage: MilestoneStage;
+  keywords: string[];
+  created_at: string;
+  project: Project;
+  author: Author;
   comments: Comment[];
 }
 
@@ -128,8 +162,13 @@ function getTodayDate(): string {
 
 export default function ResearchNotesPage() {
   const [notes, setNotes] = useState<ResearchNote[]>([]);
+  const [nextCursor, setNextCursor] = useState<ResearchNoteCursor | null>(null);
+  const [totalNotes, setTotalNotes] = useState(0);
+  const [stageCounts, setStageCounts] = useState<Record<string, number>>({});
   const [projects, setProjects] = useState<Project[]>([]);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [exporting, setExporting] = useState(false);
   const [currentUser, setCurrentUser] = useState<CurrentUser | null>(null);
   const [isAdmin, setIsAdmin] = useState(false);
 
@@ -138,6 +177,7 @@ export default function ResearchNotesPage() {
   const [stageFilter, setStageFilter] = useState<string>("all");
   const [dateFilter, setDateFilter] = useState<string>(getTodayDate());
   const [keywordSearch, setKeywordSearch] = useState<string>("");
+  const [debouncedSearch, setDebouncedSearch] = useState<string>("");
   const [members, setMembers] = useState<{ id: string; name: string }[]>([]);
 
   // 노트 작성 모달 상태
@@ -159,6 +199,14 @@ export default function ResearchNotesPage() {
   const [editingNote, setEditingNote] = useState<ResearchNote | null>(null);
   const [deletingNoteId, setDeletingNoteId] = useState<string | null>(null);
 
+  // 본문/댓글 지연 로딩 상태
+  const [noteDetails, setNoteDetails] = useState<Record<string, NoteDetail>>({});
+  const [expandedContentIds, setExpandedContentIds] = useState<Set<string>>(new Set());
+  const [loadingDetailId, setLoadingDetailId] = useState<string | null>(null);
+
+  // 현재 목록 필터 (더 불러오기/내보내기에서 재사용)
+  const listFiltersRef = useRef<ResearchNoteListFilters | null>(null);
+
   // 댓글 상태
   const [expandedNoteId, setExpandedNoteId] = useState<string | null>(null);
   const [commentInputs, setCommentInputs] = useState<Record<string, string>>({});
@@ -230,79 +278,118 @@ export default function ResearchNotesPage() {
       return;
     }
 
-    let query = supabase
-      .from("research_notes")
-      .select(`
-        id,
-        title,
-        content,
-        stage,
-        keywords,
-        created_at,
-        updated_at,
-        project:research_projects!research_notes_project_id_fkey (
-          id,
-          title
-        ),
-        author:members!research_notes_author_id_fkey (
-          id,
-          name,
-          avatar_url,
-          position
-        ),
-        comments:research_note_comments (
-          id,
-          content,
-          created_at,
-          author:members!research_note_comments_author_id_fkey (
-            id,
-            name,
-            avatar_url,
-            position
-          )
-        )
-      `)
-      .order("created_at", { ascending: false });
-
-    // 작성자 필터 적용 (교수는 전체 또는 특정 연구원 선택 가능)
+    // 작성자 필터 (교수는 전체 또는 특정 연구원 선택 가능, 일반 연구원은 본인 노트만)
+    const filters: ResearchNoteListFilters = {};
     if (userIsAdmin) {
       if (authorFilter === "me") {
-        query = query.eq("author_id", user.id);
+        filters.authorId = user.id;
       } else if (authorFilter !== "all") {
-        query = query.eq("author_id", authorFilter);
+        filters.authorId = authorFilter;
       }
       // "all"인 경우 필터 없음 - 모든 노트 표시
     } else {
-      // 일반 연구원은 본인 노트만
-      query = query.eq("author_id", user.id);
+      filters.authorId = user.id;
     }
 
-    // 필터 적용
-    if (stageFilter !== "all") {
-      query = query.eq("stage", stageFilter);
-    }
     if (dateFilter) {
-      const startOfDay = `${dateFilter}T00:00:00`;
-      const endOfDay = `${dateFilter}T23:59:59`;
-      query = query.gte("created_at", startOfDay).lte("created_at", endOfDay);
+      filters.startDate = `${dateFilter}T00:00:00`;
+      filters.endDate = `${dateFilter}T23:59:59`;
     }
+    if (debouncedSearch) {
+      filters.search = debouncedSearch;
+    }
+
+    const listFilters: ResearchNoteListFilters = {
+      ...filters,
+      stage: stageFilter !== "all" ? stageFilter : undefined,
+    };
+    listFiltersRef.current = listFilters;
 
-    const { data, error } = await query;
+    const [listResult, countsResult] = await Promise.all([
+      getAllResearchNotes(listFilters),
+      getResearchNoteStageCounts(filters),
+    ]);
 
-    if (error) {
-      console.error("Error fetching notes:", error);
+    if (listResult.error) {
+      console.error("Error fetching notes:", listResult.error);
       setLoading(false);
       return;
     }
 
-    setNotes((data || []) as ResearchNote[]);
+    setNotes((listResult.data || []) as unknown as ResearchNote[]);
+    setNextCursor(listResult.nextCursor ?? null);
+    setTotalNotes(listResult.total ?? 0);
+    setStageCounts(countsResult.data || {});
     setLoading(false);
-  }, [authorFilter, stageFilter, dateFilter]);
+  }, [authorFilter, stageFilter, dateFilter, debouncedSearch]);
 
   useEffect(() => {
     fetchData();
   }, [fetchData]);
 
+  // 검색어 디바운스 (제목/키워드 검색은 서버에서 수행)
+  useEffect(() => {
+    const timer = setTimeout(() => {
+      setDebouncedSearch(keywordSearch.trim().toLowerCase().replace(/^#/, ""));
+    }, 300);
+    return () => clearTimeout(timer);
+  }, [keywordSearch]);
+
+  // 다음 페이지 불러오기
+  const handleLoadMore = async () => {
+    if (!nextCursor || !listFiltersRef.current) return;
+
+    setLoadingMore(true);
+    const result = await getAllResearchNotes(listFiltersRef.current, nextCursor);
+
+    if (result.error) {
+      alert(result.error);
+    } else {
+      const page = (result.data || []) as unknown as ResearchNote[];
+      setNotes((prev) => [...prev, ...page.filter((n) => !prev.some((p) => p.id === n.id))]);
+      setNextCursor(result.nextCursor ?? null);
+    }
+    setLoadingMore(false);
+  };
+
+  // 본문 + 댓글 지연 조회 (force: 댓글 변경 후 다시 조회)
+  const loadNoteDetail = async (noteId: string, force = false): Promise<NoteDetail | null> => {
+    if (!force && noteDetails[noteId]) return noteDetails[noteId];
+
+    setLoadingDetailId(noteId);
+    const result = await getResearchNoteDetail(noteId);
+    setLoadingDetailId(null);
+
+    if (result.error || !result.data) {
+      alert(result.error || "연구노트를 불러오는데 실패했습니다.");
+      return null;
+    }
+
+    const detail = result.data as unknown as NoteDetail;
+    setNoteDetails((prev) => ({ ...prev, [noteId]: detail }));
+    setNotes((prev) =>
+      prev.map((n) => (n.id === noteId ? { ...n, comment_count: detail.comments.length } : n))
+    );
+    return detail;
+  };
+
+  // 본문 전체 보기 토글
+  const toggleContent = async (noteId: string) => {
+    if (expandedContentIds.has(noteId)) {
+      setExpandedContentIds((prev) => {
+        const next = new Set(prev);
+        next.delete(noteId);
+        return next;
+      });
+      return;
+    }
+
+    const detail = await loadNoteDetail(noteId);
+    if (detail) {
+      setExpandedContentIds((prev) => new Set(prev).add(noteId));
+    }
+  };
+
   // 키워드 추가
   const handleAddKeyword = () => {
     const trimmed = keywordInput.trim().replace(/^#/, "");
@@ -381,7 +468,20 @@ export default function ResearchNotesPage() {
       }
     }
 
-    // 성공 시 초기화
+    // 성공 시 초기화 (수정된 노트의 본문 캐시 제거)
+    if (editingNote) {
+      const editedId = editingNote.id;
+      setNoteDetails((prev) => {
+        const next = { ...prev };
+        delete next[editedId];
+        return next;
+      });
+      setExpandedContentIds((prev) => {
+        const next = new Set(prev);
+        next.delete(editedId);
+        return next;
+      });
+    }
     resetForm();
     setFormOpen(false);
     setSaving(false);
@@ -399,11 +499,14 @@ export default function ResearchNotesPage() {
     setEditingNote(null);
   };
 
-  // 수정 시작
-  const handleEdit = (note: ResearchNote) => {
+  // 수정 시작 (본문은 지연 조회)
+  const handleEdit = async (note: ResearchNote) => {
+    const detail = await loadNoteDetail(note.id);
+    if (!detail) return;
+
     setEditingNote(note);
     setFormTitle(note.title);
-    setFormContent(note.content);
+    setFormContent(detail.content);
     setFormStage(note.stage);
     setFormKeywords(note.keywords);
     setFormProjectId(note.project.id);
@@ -437,9 +540,17 @@ export default function ResearchNotesPage() {
     return isAdmin || comment.author.id === currentUser.id;
   };
 
-  // 댓글 토글
-  const toggleComments = (noteId: string) => {
-    setExpandedNoteId(expandedNoteId === noteId ? null : noteId);
+  // 댓글 토글 (펼칠 때 댓글 지연 조회)
+  const toggleComments = async (noteId: string) => {
+    if (expandedNoteId === noteId) {
+      setExpandedNoteId(null);
+      return;
+    }
+
+    const detail = await loadNoteDetail(noteId);
+    if (detail) {
+      setExpandedNoteId(noteId);
+    }
   };
 
   // 댓글 입력 변경
@@ -459,13 +570,13 @@ export default function ResearchNotesPage() {
       alert(result.error);
     } else {
       setCommentInputs((prev) => ({ ...prev, [noteId]: "" }));
-      fetchData();
+      await loadNoteDetail(noteId, true);
     }
     setSubmittingComment(null);
   };
 
   // 댓글 삭제
-  const handleDeleteComment = async (commentId: string, projectId: string) => {
+  const handleDeleteComment = async (noteId: string, commentId: string, projectId: string) => {
     if (!confirm("댓글을 삭제하시겠습니까?")) return;
 
     setDeletingCommentId(commentId);
@@ -474,39 +585,44 @@ export default function ResearchNotesPage() {
     if (result.error) {
       alert(result.error);
     } else {
-      fetchData();
+      await loadNoteDetail(noteId, true);
     }
     setDeletingCommentId(null);
   };
 
-  // 키워드 검색 필터링
-  const filteredNotes = keywordSearch.trim()
-    ? notes.filter((note) => {
-        const searchTerm = keywordSearch.trim().toLowerCase().replace(/^#/, "");
-        // 키워드에서 검색
-        const keywordMatch = note.keywords.some((k) =>
-          k.toLowerCase().includes(searchTerm)
-        );
-        // 제목에서도 검색
-        const titleMatch = note.title.toLowerCase().includes(searchTerm);
-        return keywordMatch || titleMatch;
-      })
-    : notes;
+  // 내보내기용 전체 노트 조회 (본문 + 댓글 포함)
+  const fetchExportNotes = async (): Promise<ExportNote[] | null> => {
+    if (!listFiltersRef.current) return null;
 
-  // 마크다운으로 내보내기
-  const exportToMarkdown = () => {
-    if (filteredNotes.length === 0) {
+    setExporting(true);
+    const result = await exportResearchNotes(listFiltersRef.current);
+    setExporting(false);
+
+    if (result.error) {
+      alert(result.error);
+      return null;
+    }
+
+    const exportNotes = (result.data || []) as unknown as ExportNote[];
+    if (exportNotes.length === 0) {
       alert("내보낼 연구노트가 없습니다.");
-      return;
+      return null;
     }
+    return exportNotes;
+  };
+
+  // 마크다운으로 내보내기
+  const exportToMarkdown = async () => {
+    const exportNotes = await fetchExportNotes();
+    if (!exportNotes) return;
 
     const today = new Date().toLocaleDateString("ko-KR");
     let markdown = `# 연구노트 내보내기\n\n`;
     markdown += `> 내보내기 날짜: ${today}\n`;
-    markdown += `> 총 ${filteredNotes.length}개 노트\n\n`;
+    markdown += `> 총 ${exportNotes.length}개 노트\n\n`;
     markdown += `---\n\n`;
 
-    filteredNotes.forEach((note, index) => {
+    exportNotes.forEach((note, index) => {
       const noteDate = new Date(note.created_at).toLocaleDateString("ko-KR");
       markdown += `## ${index + 1}. ${note.title}\n\n`;
       markdown += `- **작성자**: ${note.author.name}\n`;
@@ -539,17 +655,15 @@ export default function ResearchNotesPage() {
   };
 
   // CSV로 내보내기
-  const exportToCSV = () => {
-    if (filteredNotes.length === 0) {
-      alert("내보낼 연구노트가 없습니다.");
-      return;
-    }
+  const exportToCSV = async () => {
+    const exportNotes = await fetchExportNotes();
+    if (!exportNotes) return;
 
     // CSV 헤더
     const headers = ["번호", "제목", "작성자", "작성일", "연구단계", "프로젝트", "키워드", "내용", "댓글수"];
 
     // CSV 데이터 행
-    const rows = filteredNotes.map((note, index) => {
+    const rows = exportNotes.map((note, index) => {
       const noteDate = new Date(note.created_at).toLocaleDateString("ko-KR");
       // CSV에서 쉼표와 줄바꿈 처리
       const escapeCSV = (str: string) => {
@@ -587,7 +701,7 @@ export default function ResearchNotesPage() {
   };
 
   // 날짜별 그룹화
-  const groupedNotes = filteredNotes.reduce((groups, note) => {
+  const groupedNotes = notes.reduce((groups, note) => {
     const date = note.created_at.split("T")[0];
     if (!groups[date]) {
       groups[date] = [];
@@ -598,12 +712,11 @@ export default function ResearchNotesPage() {
 
   const sortedDates = Object.keys(groupedNotes).sort((a, b) => b.localeCompare(a));
 
-  // 통계 (필터링된 노트 기준)
-  const totalNotes = filteredNotes.length;
-  const stageStats = filteredNotes.reduce((acc, note) => {
-    acc[note.stage] = (acc[note.stage] || 0) + 1;
-    return acc;
-  }, {} as Record<string, number>);
+  // 통계 (필터 조건 기준, 서버 집계)
+  const stageStats =
+    stageFilter === "all"
+      ? stageCounts
+      : { [stageFilter]: stageCounts[stageFilter] || 0 };
 
   // 오늘 날짜 표시
   const todayDisplay = new Date().toLocaleDateString("ko-KR", {
@@ -633,8 +746,12 @@ export default function ResearchNotesPage() {
           {/* 내보내기 드롭다운 */}
           <DropdownMenu>
             <DropdownMenuTrigger asChild>
-              <Button variant="outline">
-                <Download className="h-4 w-4 mr-2" />
+              <Button variant="outline" disabled={exporting}>
+                {exporting ? (
+                  <Loader2 className="h-4 w-4 mr-2 animate-spin" />
+                ) : (
+                  <Download className="h-4 w-4 mr-2" />
+                )}
                 내보내기
               </Button>
             </DropdownMenuTrigger>
@@ -818,7 +935,7 @@ export default function ResearchNotesPage() {
         <div className="flex items-center justify-center py-12">
           <Loader2 className="h-8 w-8 animate-spin text-muted-foreground" />
         </div>
-      ) : filteredNotes.length === 0 ? (
+      ) : notes.length === 0 ? (
         <Card>
           <CardContent className="py-12 text-center text-muted-foreground">
             {keywordSearch ? (
@@ -943,15 +1060,33 @@ export default function ResearchNotesPage() {
                             </div>
                           </div>
 
-                          {/* 본문 미리보기 */}
+                          {/* 본문 미리보기 (펼치면 전체 본문 지연 조회) */}
                           <div className="mt-3">
                             <MarkdownSimple
                               content={
-                                note.content.length > 500
-                                  ? note.content.slice(0, 500) + "..."
-                                  : note.content
+                                expandedContentIds.has(note.id) && noteDetails[note.id]
+                                  ? noteDetails[note.id].content
+                                  : note.content_length > note.excerpt.length
+                                  ? note.excerpt + "..."
+                                  : note.excerpt
                               }
                             />
+                            {note.content_length > note.excerpt.length && (
+                              <Button
+                                variant="link"
+                                size="sm"
+                                className="h-auto px-0 mt-1"
+                                onClick={() => toggleContent(note.id)}
+                                disabled={loadingDetailId === note.id}
+                              >
+                                {loadingDetailId === note.id && (
+                                  <Loader2 className="h-3 w-3 mr-1 animate-spin" />
+                                )}
+                                {expandedContentIds.has(note.id)
+                                  ? "접기"
+                                  : `전체 보기 (${note.word_count.toLocaleString()}단어)`}
+                              </Button>
+                            )}
                           </div>
 
                           {/* 프로젝트 & 키워드 */}
@@ -979,7 +1114,7 @@ export default function ResearchNotesPage() {
                               className="flex items-center gap-2 text-sm text-muted-foreground hover:text-foreground transition-colors"
                             >
                               <MessageSquare className="h-4 w-4" />
-                              <span>댓글 {note.comments?.length || 0}개</span>
+                              <span>댓글 {noteDetails[note.id]?.comments.length ?? note.comment_count}개</span>
                               {expandedNoteId === note.id ? (
                                 <ChevronUp className="h-4 w-4" />
                               ) : (
@@ -991,9 +1126,9 @@ export default function ResearchNotesPage() {
                             {expandedNoteId === note.id && (
                               <div className="mt-3 space-y-3">
                                 {/* 기존 댓글들 */}
-                                {note.comments && note.comments.length > 0 ? (
+                                {(noteDetails[note.id]?.comments.length ?? 0) > 0 ? (
                                   <div className="space-y-2">
-                                    {note.comments.map((comment) => (
+                                    {noteDetails[note.id].comments.map((comment) => (
                                       <div
                                         key={comment.id}
                                         className="flex items-start gap-2 p-2 rounded-md bg-muted/50"
@@ -1020,7 +1155,7 @@ export default function ResearchNotesPage() {
                                             variant="ghost"
                                             size="icon"
                                             className="h-6 w-6 text-muted-foreground hover:text-red-500"
-                                            onClick={() => handleDeleteComment(comment.id, note.project.id)}
+                                            onClick={() => handleDeleteComment(note.id, comment.id, note.project.id)}
                                             disabled={deletingCommentId === comment.id}
                                           >
                                             {deletingCommentId === comment.id ? (
@@ -1075,6 +1210,16 @@ export default function ResearchNotesPage() {
               </div>
             </div>
           ))}
+
+          {/* 다음 페이지 */}
+          {nextCursor && (
+            <div className="flex justify-center">
+              <Button variant="outline" onClick={handleLoadMore} disabled={loadingMore}>
+                {loadingMore && <Loader2 className="h-4 w-4 mr-2 animate-spin" />}
+                더 불러오기 ({notes.length}/{totalNotes})
+              </Button>
+            </div>
+          )}
         </div>
       )}
 
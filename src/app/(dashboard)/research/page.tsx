@@ -1,4 +1,4 @@
-import { createClient } from "@/lib/supabase/server";
+import { getCachedResearchRoster } from "@/lib/cache/lab-data";
 import { Card, CardContent, CardHeader } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
@@ -38,32 +38,8 @@ const globalNameOrder: Record<string, number> = {
 };
 
 export default async function ResearchPage() {
-  const supabase = await createClient();
-
-  // 연구원 및 프로젝트 조회 (필요한 필드만 선택)
-  const { data: members } = await supabase
-    .from("members")
-    .select(`
-      id,
-      name,
-      position,
-      employment_type,
-      avatar_url,
-      project_members (
-        role,
-        project:research_projects!inner (
-          id,
-          title,
-          status,
-          overall_progress,
-          target_date,
-          target_journal,
-          category
-        )
-      )
-    `)
-    .eq("status", "active")
-    .neq("position", "professor");
+  // 연구원 및 프로젝트 조회 (연구실 공유 캐시, 프로젝트 변경 액션에서 lab:projects 태그 무효화)
+  const members = await getCachedResearchRoster();
 
   type Project = {
     id: string;
@@ -444,6 +444,19 @@ function PapersListTab() {
     },
   });
 
+  // 서버 라우트를 거쳐야 논문 목록 캐시(getCachedPapers)가 함께 무효화된다
+  const updatePaper = async (body: { id: string; is_hidden?: boolean; is_lab_member?: boolean }) => {
+    const res = await fetch("/api/papers", {
+      method: "PATCH",
+      headers: { "Content-Type": "application/json" },
+      body: JSON.stringify(body),
+    });
+    if (!res.ok) {
+      const data = await res.json().catch(() => ({}));
+      throw new Error(data.error ?? "Failed to update paper");
+    }
+  };
+
   const toggleHidden = useMutation({
     mutationFn: async ({
       id,
@@ -452,11 +465,7 @@ function PapersListTab() {
       id: string;
       isHidden: boolean;
     }) => {
-      const { error } = await supabase
-        .from("papers")
-        .update({ is_hidden: isHidden })
-        .eq("id", id);
-      if (error) throw error;
+      await updatePaper({ id, is_hidden: isHidden });
     },
     onSuccess: () => queryClient.invalidateQueries({ queryKey: ["papers-list"] }),
   });
@@ -469,11 +478,7 @@ function PapersListTab() {
       id: string;
       isLabMember: boolean;
     }) => {
-      const { error } = await supabase
-        .from("papers")
-        .update({ is_lab_member: isLabMember })
-        .eq("id", id);
-      if (error) throw error;
+      await updatePaper({ id, is_lab_member: isLabMember });
     },
     onSuccess: () => {
       queryClient.invalidateQueries({ queryKey: ["papers-list"] });
@@ -0,0 +1,76 @@
+import { NextRequest, NextResponse } from "next/server";
+import {
+  getCachedCalendarFeedBody,
+  getCalendarFeedByToken,
+  type CalendarFeedState,
+} from "@/lib/cache/calendar-feed";
+
+// 멤버별 ICS 구독 피드 (캘린더 앱이 토큰 URL로 폴링, 로그인 세션 없음)
+// 피드 버전(calendar_feeds.version)으로 ETag/Last-Modified를 만들어
+// 바뀐 것이 없으면 본문 없이 304를 돌려준다.
+
+const TOKEN_PATTERN = /^[0-9a-f]{64}$/;
+
+function feedHeaders(feed: CalendarFeedState): Record<string, string> {
+  return {
+    ETag: `"feed-${feed.version}"`,
+    "Last-Modified": new Date(feed.changed_at).toUTCString(),
+    // 5분 동안은 버전 조회도 생략, 이후에는 ETag로 재검증
+    "Cache-Control": "private, max-age=300, must-revalidate",
+  };
+}
+
+function isNotModified(request: NextRequest, feed: CalendarFeedState, etag: string): boolean {
+  const ifNoneMatch = request.headers.get("if-none-match");
+  if (ifNoneMatch) {
+    return ifNoneMatch
+      .split(",")
+      .map((tag) => tag.trim().replace(/^W\//, ""))
+      .some((tag) => tag === "*" || tag === etag);
+  }
+
+  const ifModifiedSince = request.headers.get("if-modified-since");
+  if (ifModifiedSince) {
+    const since = Date.parse(ifModifiedSince);
+    // HTTP 날짜는 초 단위
+    const changed = Math.floor(Date.parse(feed.changed_at) / 1000) * 1000;
+    return !Number.isNaN(since) && changed <= since;
+  }
+  return false;
+}
+
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ token: string }> }
+) {
+  const { token } = await params;
+  const feedToken = token.replace(/\.ics$/, "");
+
+  if (!TOKEN_PATTERN.test(feedToken)) {
+    return NextResponse.json({ error: "Not found" }, { status: 404 });
+  }
+
+  const feed = await getCalendarFeedByToken(feedToken);
+  if (!feed) {
+    return NextResponse.json({ error: "Not found" }, { status: 404 });
+  }
+
+  const headers = feedHeaders(feed);
+  if (isNotModified(request, feed, headers.ETag)) {
+    return new NextResponse(null, { status: 304, headers });
+  }
+
+  try {
+    const body = await getCachedCalendarFeedBody(feed);
+    return new NextResponse(body, {
+      headers: {
+        ...headers,
+        "Content-Type": "text/calendar; charset=utf-8",
+        "Content-Disposition": 'inline; filename="sdc-lab.ics"',
+      },
+    });
+  } catch (error) {
+    console.error("Calendar feed build error:", error);
+    return NextResponse.json({ error: "Failed to build feed" }, { status: 500 });
+  }
+}
@@ -140,6 +140,14 @@ export async function GET(request: Request) {
     );
   }
 
+  // 대시보드 스냅샷의 날짜 기준(오늘 - 30일) 이동을 위해 일 1회 전체 갱신
+  const { error: snapshotError } = await supabase.rpc("refresh_dashboard_snapshot");
+  results.push(
+    snapshotError
+      ? `Dashboard snapshot: Error - ${snapshotError.message}`
+      : "Dashboard snapshot: refreshed"
+  );
+
   return NextResponse.json({
     success: true,
     notifications: notificationCount,
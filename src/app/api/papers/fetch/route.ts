@@ -4,6 +4,7 @@ import { searchSemanticScholar } from "@/lib/papers/semantic-scholar";
 import { searchOpenAlex } from "@/lib/papers/openalex";
 import { deduplicatePapers } from "@/lib/papers/normalize";
 import { matchLabMember } from "@/lib/papers/member-matcher";
+import { invalidateLabData, LAB_CACHE_TAGS } from "@/lib/cache/lab-data";
 import type {
   NormalizedPaper,
   SearchQuery,
@@ -251,7 +252,17 @@ async function fetchPapers(): Promise<FetchPapersResult> {
         .eq("id", field.id);
     }
 
-    // 6. Update log
+    // 6. Refresh per-field summaries for the research map
+    // (citation counts change on upsert, so refresh even when nothing was inserted)
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const { error: refreshError } = await (supabase as any).rpc(
+      "refresh_paper_field_summaries"
+    );
+    if (refreshError) {
+      errors.push(`Summary refresh error: ${refreshError.message}`);
+    }
+
+    // 7. Update log
     await updateLog(supabase, logId, "completed", {
       fields_searched: fields.length,
       papers_found: totalFound,
@@ -303,6 +314,9 @@ export async function GET(request: Request) {
 
   try {
     const result = await fetchPapers();
+    if (result.papersInserted > 0) {
+      invalidateLabData(LAB_CACHE_TAGS.papers);
+    }
     return NextResponse.json({
       success: true,
       ...result,
@@ -1,7 +1,9 @@
-import { NextRequest, NextResponse } from "next/server";
+import { NextRequest, NextResponse, after } from "next/server";
 import { cookies } from "next/headers";
 import { createServerClient } from "@supabase/ssr";
 import type { Database } from "@/types/database.types";
+import { createServiceRoleClient } from "@/lib/supabase/server";
+import { getCachedPapers, invalidateLabData, LAB_CACHE_TAGS } from "@/lib/cache/lab-data";
 
 async function createClient() {
   const cookieStore = await cookies();
@@ -38,6 +40,15 @@ export async function GET(request: NextRequest) {
   const labOnly = searchParams.get("lab_only") === "true";
   const search = searchParams.get("search");
 
+  // 검색어가 없는 목록 조회는 연구실 공용 캐시에서 응답 (숨김 논문 제외)
+  if (!search) {
+    const cached = await getCachedPapers({ fieldId, limit, offset, sort, labOnly });
+    if (cached.error) {
+      return NextResponse.json({ error: cached.error }, { status: 500 });
+    }
+    return NextResponse.json({ data: cached.data, total: cached.total });
+  }
+
   let query = supabase
     .from("papers")
     .select(
@@ -110,5 +121,21 @@ export async function PATCH(request: NextRequest) {
     return NextResponse.json({ error: error.message }, { status: 500 });
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.papers);
+
+  // 숨김 여부가 바뀌면 연구 지도 분야 요약을 응답 뒤에 다시 계산한다.
+  // 갱신은 서비스 롤 전용 RPC라 사용자 트랜잭션을 잡고 있지 않는다.
+  if ("is_hidden" in filtered) {
+    after(async () => {
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      const { error: refreshError } = await (createServiceRoleClient() as any).rpc(
+        "refresh_paper_field_summaries"
+      );
+      if (refreshError) {
+        console.error("Paper field summaries refresh error:", refreshError);
+      }
+    });
+  }
+
   return NextResponse.json({ success: true });
 }
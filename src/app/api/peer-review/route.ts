@@ -1,147 +1,120 @@
-import { NextRequest, NextResponse } from "next/server";
-import Anthropic from "@anthropic-ai/sdk";
+import { NextRequest, NextResponse, after } from "next/server";
 import { createClient } from "@/lib/supabase/server";
-import type { PeerReview, PeerReviewStatus } from "@/types/database";
-
-const anthropic = new Anthropic({
-  apiKey: process.env.ANTHROPIC_API_KEY,
-});
-
-const PEER_REVIEW_PROMPT = `당신은 다양한 학문 분야에서 풍부한 경험을 가진 학술 논문 심사위원입니다. 제출된 연구 내용에 대해 체계적이고 건설적인 동료 심사(Peer Review)를 제공해주세요.
-
-# 심사 원칙
-
-## 톤과 접근 방식
-- **건설적으로**: 비판을 개선 기회로 프레이밍
-- **구체적으로**: 실행 가능한 제안과 구체적 예시 제공
-- **균형있게**: 강점과 약점 모두 인정
-- **존중적으로**: 저자의 노력을 인정하면서 전문적으로 평가
-- **객관적으로**: 연구자가 아닌 연구에 집중
-
-## 평가 영역
-
-### 방법론 평가
-- 재현가능성: 다른 연구자가 연구를 재현할 수 있는가?
-- 엄밀성: 연구 질문에 적합한 방법인가?
-- 상세함: 프로토콜, 도구, 매개변수가 충분히 설명되었는가?
-- 윤리: 윤리 승인, 동의, 데이터 처리가 적절히 문서화되었는가?
-- 통계: 통계 방법이 적절하고 명확히 설명되었는가?
-- 검증: 대조군, 반복 실험이 적절한가?
-
-### 통계적 엄밀성 확인사항
-- 통계적 가정 충족 여부 (정규성, 독립성, 등분산성)
-- p-값과 함께 효과 크기 보고 여부
-- 다중 검정 보정 적용 여부
-- 신뢰구간 제공 여부
-- 검정력 분석을 통한 표본 크기 정당화 여부
-- 결측 데이터 처리 방법
-
-### 흔한 문제점 확인
-- P-해킹 (유의한 결과만 선택적 보고)
-- 부적절한 통계 검정 선택
-- 가유사복제 (기술적 복제를 생물학적 복제로 처리)
-- 적절한 대조군 부재
-- 교란변수 미통제
-- 결과 과장 해석
-- 선택적 보고 및 체리피킹
-
----
-
-# 심사 결과 형식
-
-다음 형식으로 심사 결과를 작성하세요:
-
-## 1. 종합 평가 (Summary Statement)
-연구의 전반적인 평가를 1-2 문단으로 제공하세요:
-- 연구 개요 (2-3문장)
-- 전체 권고사항 (수락/소수정/대수정/반려)
-- 핵심 강점 (2-3개 bullet points)
-- 핵심 약점 (2-3개 bullet points)
-- 중요성과 타당성에 대한 최종 평가
-
-## 2. 주요 코멘트 (Major Comments)
-원고의 타당성, 해석 가능성, 중요성에 큰 영향을 미치는 핵심 문제점을 [M1], [M2], [M3]... 형식으로 나열하세요.
-
-**주요 코멘트에 포함될 사항:**
-- 근본적인 방법론적 결함
-- 부적절한 통계 분석
-- 지지되지 않거나 과장된 결론
-- 누락된 핵심 대조군이나 실험
-- 심각한 재현가능성 우려
-- 문헌 검토의 주요 공백
-- 윤리적 우려
-
-각 주요 코멘트에는:
-1. 문제점을 명확히 기술
-2. 왜 문제인지 설명
-3. 구체적 해결책이나 추가 실험 제안
-4. 출판에 필수적인지 여부 표시
-
-## 3. 부수적 코멘트 (Minor Comments)
-명확성, 완전성, 표현을 개선할 수 있는 덜 중요한 문제점을 [m1], [m2], [m3]... 형식으로 나열하세요.
-
-**부수적 코멘트에 포함될 사항:**
-- 불명확한 그림 레이블이나 범례
-- 누락된 방법론 세부사항
-- 오탈자나 문법 오류
-- 데이터 표현 개선 제안
-- 사소한 통계 보고 문제
-- 결론을 강화할 보충 분석
-
-## 4. 저자에게 묻는 질문
-명확히 해야 할 구체적 질문들:
-- 불명확한 방법론 세부사항
-- 모순되는 것처럼 보이는 결과
-- 평가에 필요한 누락된 정보
-- 추가 데이터나 분석 요청
-
-## 5. 수정 우선순위 요약
-
-| 우선순위 | 항목 번호 | 내용 요약 | 필수 여부 |
-|---------|----------|----------|----------|
-| 🔴 높음 | [M1] | ... | 필수 |
-| 🟡 중간 | [M2] | ... | 권장 |
-| 🟢 낮음 | [m1] | ... | 선택 |
-
-## 6. 최종 의견 (Final Recommendation)
-- 연구의 학술적 가치와 기여도
-- 현재 상태에서의 출판/발표 가능성
-- 수정 후 잠재적 영향력
-- 저자에게 전하는 격려의 말
-
----
-**참고**: 이 리뷰는 연구 개선을 위한 건설적 피드백 목적입니다. 전문적이고 존중하는 톤을 유지하면서 학술적 엄밀성을 추구합니다.`;
+import { getCurrentMember } from "@/lib/cache/current-member";
+import {
+  PEER_REVIEW_MODEL,
+  recordPeerReviewUsage,
+  runPeerReview,
+  type PeerReviewDelta,
+  type PeerReviewJob,
+  type PeerReviewOutcome,
+  type PeerReviewProgress,
+} from "@/lib/peer-review/generate";
+import {
+  DELTA_SIMILARITY_THRESHOLD,
+  computePeerReviewHash,
+  diffManuscripts,
+} from "@/lib/peer-review/cache";
+import { PEER_REVIEW_PROMPT_VERSION } from "@/lib/peer-review/prompt";
+import { shouldReviewBySection, splitManuscriptSections } from "@/lib/peer-review/sections";
+import type { PeerReview } from "@/types/database";
+
+// 생성이 길어질 수 있으므로 함수 실행 시간을 늘린다 (after() 작업 포함)
+export const maxDuration = 300;
+
+// 거의 같은 원고를 찾을 때 비교하는 최근 리뷰 수
+const DELTA_CANDIDATE_LIMIT = 5;
+
+type CachedReview = Pick<PeerReview, "id" | "content" | "review_result"> & {
+  input_tokens: number | null;
+  output_tokens: number | null;
+};
+
+type SupabaseServerClient = Awaited<ReturnType<typeof createClient>>;
+
+// 본인의 완료된 리뷰에서 동일 원고(exact) 또는 거의 같은 원고(delta)를 찾는다.
+// delta 기준은 전체 생성(model) 리뷰만 사용해 이전 리뷰가 중첩되지 않게 한다.
+async function findCachedReview(
+  supabase: SupabaseServerClient,
+  memberId: string,
+  contentHash: string,
+  content: string
+): Promise<{ exact: CachedReview } | { delta: PeerReviewDelta } | null> {
+  const columns = "id, content, review_result, input_tokens, output_tokens";
+
+  const [{ data: exactRows }, { data: recentRows }] = (await Promise.all([
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    (supabase as any)
+      .from("peer_reviews")
+      .select(columns)
+      .eq("member_id", memberId)
+      .eq("review_status", "completed")
+      .eq("content_hash", contentHash)
+      .not("review_result", "is", null)
+      .order("created_at", { ascending: false })
+      .limit(1),
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    (supabase as any)
+      .from("peer_reviews")
+      .select(columns)
+      .eq("member_id", memberId)
+      .eq("review_status", "completed")
+      .eq("cache_source", "model")
+      .eq("prompt_version", PEER_REVIEW_PROMPT_VERSION)
+      .not("review_result", "is", null)
+      .order("created_at", { ascending: false })
+      .limit(DELTA_CANDIDATE_LIMIT),
+  ])) as Array<{ data: CachedReview[] | null }>;
+
+  if (exactRows?.[0]) return { exact: exactRows[0] };
+
+  let best: { review: CachedReview; diff: ReturnType<typeof diffManuscripts> } | null = null;
+  for (const review of recentRows ?? []) {
+    const diff = diffManuscripts(review.content, content);
+    if (!best || diff.similarity > best.diff.similarity) best = { review, diff };
+  }
 
+  if (!best || best.diff.similarity < DELTA_SIMILARITY_THRESHOLD) return null;
+  if (best.diff.added.length === 0 && best.diff.removed.length === 0) {
+    // 문단 순서만 바뀐 경우도 같은 원고로 본다.
+    return { exact: best.review };
+  }
+
+  const { review, diff } = best;
+  return {
+    delta: {
+      sourceReviewId: review.id,
+      previousReview: review.review_result!,
+      added: diff.added,
+      removed: diff.removed,
+      baselineTokens:
+        review.input_tokens != null && review.output_tokens != null
+          ? review.input_tokens + review.output_tokens
+          : null,
+    },
+  };
+}
+
+// POST: 심사 요청
+// - mode "stream"(기본): text/event-stream으로 토큰을 바로 전달
+//   event: review {id, cacheSource} → delta {text}... → done {id} | error {id, message}
+// - mode "background": 202 {id, status: "processing"}를 즉시 반환, 결과는 GET으로 조회
+// 두 모드 모두 생성은 after()에 등록되어 클라이언트가 연결을 끊어도 끝까지 진행·저장된다.
+// 동일 원고는 이전 리뷰를 즉시 반환하고(exact), 거의 같은 원고는 변경 부분만 생성한다(delta).
+// 긴 원고(longDocument 또는 LONG_MANUSCRIPT_CHARS 초과)는 섹션별로 동시에 검토한 뒤 병합하며,
+// 섹션 진행 상황은 event: progress {completed, total}로 전달한다.
 export async function POST(request: NextRequest) {
   try {
     const supabase = await createClient();
 
     // Check authentication
-    const {
-      data: { user },
-    } = await supabase.auth.getUser();
-
-    if (!user?.email) {
-      return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
-    }
-
-    // Get member by email
-    const { data: memberData } = await supabase
-      .from("members")
-      .select("id")
-      .eq("email", user.email)
-      .single();
-
-    const member = memberData as { id: string } | null;
+    const member = await getCurrentMember();
 
     if (!member) {
-      return NextResponse.json(
-        { error: "연구원 정보를 찾을 수 없습니다." },
-        { status: 404 }
-      );
+      return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
-    const { title, content, projectId } = await request.json();
+    const { title, content, projectId, mode, longDocument } = await request.json();
 
     if (!title || !content) {
       return NextResponse.json(
@@ -150,7 +123,12 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Create peer review record with pending status
+    const contentHash = computePeerReviewHash(title, content, PEER_REVIEW_MODEL);
+    const cached = await findCachedReview(supabase, member.id, contentHash, content);
+    const exact = cached && "exact" in cached ? cached.exact : null;
+    const delta = cached && "delta" in cached ? cached.delta : undefined;
+
+    // Create peer review record (동일 원고면 이전 결과로 바로 완료)
     // eslint-disable-next-line @typescript-eslint/no-explicit-any
     const { data: review, error: insertError } = await (supabase as any)
       .from("peer_reviews")
@@ -159,12 +137,17 @@ export async function POST(request: NextRequest) {
         project_id: projectId || null,
         title,
         content,
-        review_status: "processing",
+        content_hash: contentHash,
+        prompt_version: PEER_REVIEW_PROMPT_VERSION,
+        cache_source: exact ? "exact" : delta ? "delta" : "model",
+        source_review_id: exact?.id ?? delta?.sourceReviewId ?? null,
+        review_result: exact?.review_result ?? null,
+        review_status: exact ? "completed" : "processing",
       })
       .select()
       .single() as { data: PeerReview | null; error: Error | null };
 
-    if (insertError) {
+    if (insertError || !review) {
       console.error("Insert error:", insertError);
       return NextResponse.json(
         { error: "Failed to create review record" },
@@ -172,50 +155,108 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    // Call Claude API
-    const message = await anthropic.messages.create({
-      model: "claude-sonnet-4-20250514",
-      max_tokens: 8192,
-      messages: [
-        {
-          role: "user",
-          content: `다음 연구 내용에 대한 동료 심사를 진행해주세요.
-
-제목: ${title}
-
-내용:
-${content}`,
-        },
-      ],
-      system: PEER_REVIEW_PROMPT,
-    });
-
-    // Extract text content from the response
-    const reviewResult =
-      message.content[0].type === "text" ? message.content[0].text : "";
-
-    // Update the review with the result
-    // eslint-disable-next-line @typescript-eslint/no-explicit-any
-    const { error: updateError } = await (supabase as any)
-      .from("peer_reviews")
-      .update({
-        review_result: reviewResult,
-        review_status: "completed",
-      })
-      .eq("id", review!.id);
-
-    if (updateError) {
-      console.error("Update error:", updateError);
-      return NextResponse.json(
-        { error: "Failed to save review result" },
-        { status: 500 }
+    let generate: (
+      onText?: (text: string) => void,
+      onProgress?: (progress: PeerReviewProgress) => void
+    ) => Promise<PeerReviewOutcome>;
+
+    if (exact) {
+      const reviewResult = exact.review_result ?? "";
+      after(() =>
+        recordPeerReviewUsage({
+          reviewId: review.id,
+          memberId: member.id,
+          cacheSource: "exact",
+          inputTokens: 0,
+          outputTokens: 0,
+          tokensSaved: (exact.input_tokens ?? 0) + (exact.output_tokens ?? 0),
+        })
       );
+
+      if (mode === "background") {
+        return NextResponse.json({ id: review.id, status: "completed", reviewResult });
+      }
+
+      generate = async (onText) => {
+        onText?.(reviewResult);
+        return { status: "completed", result: reviewResult };
+      };
+    } else {
+      const job: PeerReviewJob = {
+        reviewId: review.id,
+        memberId: member.id,
+        title,
+        content,
+        delta,
+      };
+
+      // 변경 부분만 리뷰하는 경우는 이미 짧으므로 섹션 모드를 쓰지 않는다.
+      if (!delta) {
+        const sections = splitManuscriptSections(content);
+        if (sections.length > 1 && (longDocument || shouldReviewBySection(content, sections))) {
+          job.sections = sections;
+        }
+      }
+
+      if (mode === "background") {
+        after(() => runPeerReview(job));
+        return NextResponse.json(
+          { id: review.id, status: "processing" },
+          { status: 202 }
+        );
+      }
+
+      generate = (onText, onProgress) => runPeerReview(job, onText, onProgress);
     }
 
-    return NextResponse.json({
-      id: review!.id,
-      reviewResult,
-      status: "completed",
+    const encoder = new TextEncoder();
+    let closed = false;
+
+    const stream = new ReadableStream<Uint8Array>({
+      start(controller) {
+        const send = (event: string, data: unknown) => {
+          if (closed) return;
+          try {
+            controller.enqueue(
+              encoder.encode(`event: ${event}\ndata: ${JSON.stringify(data)}\n\n`)
+            );
+          } catch {
+            closed = true;
+          }
+        };
+
+        send("review", { id: review.id, cacheSource: review.cache_source });
+
+        const generation = generate(
+          (text) => send("delta", { text }),
+          (progress) => send("progress", progress)
+        ).then(({ status }) => {
+          if (status === "completed") {
+            send("done", { id: review.id });
+          } else {
+            send("error", { id: review.id, message: "Failed to generate peer review" });
+          }
+          if (!closed) {
+            closed = true;
+            controller.close();
+          }
+        });
+
+        // 스트림 소비와 분리: 응답이 끊겨도 생성과 저장은 계속된다.
+        after(() => generation);
+      },
+      cancel() {
+        closed = true;
+      },
+    });
+
+    return new Response(stream, {
+      headers: {
+        "Content-Type": "text/event-stream; charset=utf-8",
+        "Cache-Control": "no-cache, no-transform",
+        Connection: "keep-alive",
+        "X-Accel-Buffering": "no",
+      },
     });
   } catch (error) {
     console.error("Peer review error:", error);
@@ -231,28 +272,10 @@ export async function GET(request: NextRequest) {
     const supabase = await createClient();
 
     // Check authentication
-    const {
-      data: { user },
-    } = await supabase.auth.getUser();
-
-    if (!user?.email) {
-      return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
-    }
-
-    // Get member by email
-    const { data: memberData } = await supabase
-      .from("members")
-      .select("id")
-      .eq("email", user.email)
-      .single();
-
-    const member = memberData as { id: string } | null;
+    const member = await getCurrentMember();
 
     if (!member) {
-      return NextResponse.json(
-        { error: "연구원 정보를 찾을 수 없습니다." },
-        { status: 404 }
-      );
+      return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
     }
 
     // Calculate current month's start and end dates
@@ -0,0 +1,61 @@
+import { NextResponse } from "next/server";
+import { createClient } from "@/lib/supabase/server";
+import { getCurrentMember } from "@/lib/cache/current-member";
+
+interface PeerReviewCacheStats {
+  total_requests: number;
+  model_requests: number;
+  exact_hits: number;
+  delta_hits: number;
+  hit_rate: number;
+  input_tokens: number;
+  output_tokens: number;
+  tokens_saved: number;
+}
+
+// GET: AI 동료 심사 캐시 적중률 / 절약 토큰 (교수 전용)
+export async function GET() {
+  try {
+    const member = await getCurrentMember();
+
+    if (!member) {
+      return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
+    }
+
+    if (member.position !== "professor") {
+      return NextResponse.json({ error: "Forbidden" }, { status: 403 });
+    }
+
+    const supabase = await createClient();
+    const now = new Date();
+    const startOfMonth = new Date(now.getFullYear(), now.getMonth(), 1);
+
+    const [month, total] = (await Promise.all([
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      (supabase as any).rpc("get_peer_review_cache_stats", {
+        p_since: startOfMonth.toISOString(),
+      }),
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      (supabase as any).rpc("get_peer_review_cache_stats"),
+    ])) as Array<{ data: PeerReviewCacheStats[] | null; error: Error | null }>;
+
+    if (month.error || total.error) {
+      console.error("Fetch stats error:", month.error ?? total.error);
+      return NextResponse.json(
+        { error: "Failed to fetch stats" },
+        { status: 500 }
+      );
+    }
+
+    return NextResponse.json({
+      month: month.data?.[0] ?? null,
+      total: total.data?.[0] ?? null,
+    });
+  } catch (error) {
+    console.error("Fetch stats error:", error);
+    return NextResponse.json(
+      { error: "Failed to fetch stats" },
+      { status: 500 }
+    );
+  }
+}
@@ -0,0 +1,15 @@
+import { NextRequest, NextResponse } from "next/server";
+import { globalSearch } from "@/lib/actions/search";
+
+// 통합 검색 (타이핑 검색용)
+// 서버 액션은 클라이언트에서 취소할 수 없으므로, 입력 중 이전 요청을
+// AbortController로 끊을 수 있도록 GET 엔드포인트로도 노출한다.
+export async function GET(request: NextRequest) {
+  const query = request.nextUrl.searchParams.get("q") ?? "";
+  const results = await globalSearch(query);
+
+  return NextResponse.json(
+    { data: results },
+    { headers: { "Cache-Control": "private, max-age=30" } }
+  );
+}
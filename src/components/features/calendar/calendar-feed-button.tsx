@@ -0,0 +1,124 @@
+"use client";
+
+import { useState } from "react";
+import {
+  Dialog,
+  DialogContent,
+  DialogDescription,
+  DialogHeader,
+  DialogTitle,
+  DialogTrigger,
+} from "@/components/ui/dialog";
+import { Button } from "@/components/ui/button";
+import { Input } from "@/components/ui/input";
+import {
+  getCalendarFeedToken,
+  rotateCalendarFeedToken,
+} from "@/lib/actions/calendar";
+import { CalendarPlus, Check, Copy, Loader2, RefreshCw } from "lucide-react";
+
+// 개인 캘린더 앱(Google/Apple/Outlook) 구독용 ICS 주소
+export function CalendarFeedButton() {
+  const [open, setOpen] = useState(false);
+  const [token, setToken] = useState<string | null>(null);
+  const [loading, setLoading] = useState(false);
+  const [copied, setCopied] = useState(false);
+
+  const feedUrl = token
+    ? `${window.location.origin}/api/calendar/feed/${token}.ics`
+    : "";
+
+  async function handleOpenChange(next: boolean) {
+    setOpen(next);
+    if (!next || token) return;
+
+    setLoading(true);
+    try {
+      const result = await getCalendarFeedToken();
+      if (result.error || !result.token) {
+        console.error(result.error);
+        alert("구독 주소를 불러오지 못했습니다.");
+      } else {
+        setToken(result.token);
+      }
+    } finally {
+      setLoading(false);
+    }
+  }
+
+  async function handleCopy() {
+    try {
+      await navigator.clipboard.writeText(feedUrl);
+      setCopied(true);
+      setTimeout(() => setCopied(false), 2000);
+    } catch {
+      alert("주소 복사에 실패했습니다.");
+    }
+  }
+
+  async function handleRotate() {
+    if (!confirm("기존 구독 주소는 더 이상 동작하지 않습니다. 재발급하시겠습니까?")) return;
+
+    setLoading(true);
+    try {
+      const result = await rotateCalendarFeedToken();
+      if (result.error || !result.token) {
+        console.error(result.error);
+        alert("재발급에 실패했습니다.");
+      } else {
+        setToken(result.token);
+      }
+    } finally {
+      setLoading(false);
+    }
+  }
+
+  return (
+    <Dialog open={open} onOpenChange={handleOpenChange}>
+      <DialogTrigger asChild>
+        <Button size="sm" variant="outline">
+          <CalendarPlus className="h-4 w-4 mr-1" />
+          캘린더 구독
+        </Button>
+      </DialogTrigger>
+      <DialogContent className="sm:max-w-[500px]">
+        <DialogHeader>
+          <DialogTitle>내 캘린더 앱에서 구독</DialogTitle>
+          <DialogDescription>
+            공용 일정, 내 일정, 참여 프로젝트 마감일과 주간 목표가 포함됩니다.
+            주소는 본인만 사용하세요.
+          </DialogDescription>
+        </DialogHeader>
+
+        {loading && !token ? (
+          <div className="flex justify-center py-4">
+            <Loader2 className="h-6 w-6 animate-spin text-muted-foreground" />
+          </div>
+        ) : (
+          <div className="space-y-3">
+            <div className="flex gap-2">
+              <Input value={feedUrl} readOnly onFocus={(e) => e.target.select()} />
+              <Button type="button" variant="outline" onClick={handleCopy} disabled={!token}>
+                {copied ? (
+                  <Check className="h-4 w-4 text-green-500" />
+                ) : (
+                  <Copy className="h-4 w-4" />
+                )}
+              </Button>
+            </div>
+            <Button
+              type="button"
+              variant="ghost"
+              size="sm"
+              onClick={handleRotate}
+              disabled={!token || loading}
+            >
+              <RefreshCw className="h-4 w-4 mr-1" />
+              주소 재발급
+            </Button>
+          </div>
+        )}
+      </DialogContent>
+    </Dialog>
+  );
+}
@@ -4,7 +4,7 @@ import { useMemo } from "react";
 import FullCalendar from "@fullcalendar/react";
 import dayGridPlugin from "@fullcalendar/daygrid";
 import interactionPlugin from "@fullcalendar/interaction";
-import type { EventClickArg, DateSelectArg } from "@fullcalendar/core";
+import type { EventClickArg, DateSelectArg, DatesSetArg } from "@fullcalendar/core";
 import { CALENDAR_CATEGORY_CONFIG } from "@/lib/constants";
 import type { CalendarCategory } from "@/types/database.types";
 
@@ -17,6 +17,7 @@ interface CalendarEvent {
   all_day: boolean;
   category: CalendarCategory;
   is_public: boolean;
+  series_id?: string;
 }
 
 interface CalendarViewInnerProps {
@@ -26,6 +27,7 @@ interface CalendarViewInnerProps {
   onEventDrop: (info: {
     event: { id: string; start: Date | null; end: Date | null };
   }) => void;
+  onDatesSet: (arg: DatesSetArg) => void;
 }
 
 export function CalendarViewInner({
@@ -33,6 +35,7 @@ export function CalendarViewInner({
   onDateSelect,
   onEventClick,
   onEventDrop,
+  onDatesSet,
 }: CalendarViewInnerProps) {
   // FullCalendar 이벤트 형식으로 변환 (메모이제이션)
   const calendarEvents = useMemo(
@@ -43,6 +46,9 @@ export function CalendarViewInner({
         start: event.start_date,
         end: event.end_date || undefined,
         allDay: event.all_day,
+        // 반복 일정 회차는 드래그로 옮기지 않는다 (시리즈는 편집 모달에서 수정)
+        startEditable: !event.series_id,
+        durationEditable: !event.series_id,
         backgroundColor:
           CALENDAR_CATEGORY_CONFIG[event.category]?.color || "#6b7280",
         borderColor:
@@ -81,6 +87,7 @@ export function CalendarViewInner({
         select={onDateSelect}
         eventClick={onEventClick}
         eventDrop={onEventDrop}
+        datesSet={onDatesSet}
         height="auto"
         aspectRatio={1.2}
         eventDisplay="block"
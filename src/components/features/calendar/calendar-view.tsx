@@ -2,11 +2,11 @@
 
 import { useState, useCallback } from "react";
 import dynamic from "next/dynamic";
-import type { EventClickArg, DateSelectArg } from "@fullcalendar/core";
-import type { CalendarCategory } from "@/types/database.types";
+import type { EventClickArg, DateSelectArg, DatesSetArg } from "@fullcalendar/core";
 import { EventModal } from "./event-modal";
 import { updateEventDates } from "@/lib/actions/calendar";
-import { useRouter } from "next/navigation";
+import { useCalendarEvents, type CalendarMonthEvent } from "@/hooks/use-calendar-events";
+import type { MonthKey } from "@/lib/calendar/months";
 import { Button } from "@/components/ui/button";
 import { Plus, Loader2 } from "lucide-react";
 
@@ -23,25 +23,11 @@ const CalendarViewInner = dynamic(
   }
 );
 
-interface CalendarEvent {
-  id: string;
-  title: string;
-  description: string | null;
-  start_date: string;
-  end_date: string | null;
-  all_day: boolean;
-  category: CalendarCategory;
-  is_public: boolean;
-}
-
-interface CalendarViewProps {
-  events: CalendarEvent[];
-}
-
-export function CalendarView({ events }: CalendarViewProps) {
-  const router = useRouter();
+export function CalendarView() {
+  // 보이는 월 + 이웃 월 하나만 조회 (월 단위 클라이언트 캐시)
+  const { events, setVisibleRange, invalidateMonths } = useCalendarEvents();
   const [modalOpen, setModalOpen] = useState(false);
-  const [selectedEvent, setSelectedEvent] = useState<CalendarEvent | null>(
+  const [selectedEvent, setSelectedEvent] = useState<CalendarMonthEvent | null>(
     null
   );
   const [selectedDate, setSelectedDate] = useState<Date | null>(null);
@@ -82,15 +68,26 @@ export function CalendarView({ events }: CalendarViewProps) {
       if (result.error) {
         console.error(result.error);
         alert("일정 이동에 실패했습니다.");
-        router.refresh();
       }
+      // 실패 시에도 무효화해 드래그 전 위치로 되돌린다
+      invalidateMonths(result.months);
     },
-    [router]
+    [invalidateMonths]
   );
 
-  const handleSuccess = useCallback(() => {
-    router.refresh();
-  }, [router]);
+  const handleSuccess = useCallback(
+    (months?: MonthKey[]) => {
+      invalidateMonths(months);
+    },
+    [invalidateMonths]
+  );
+
+  const handleDatesSet = useCallback(
+    (arg: DatesSetArg) => {
+      setVisibleRange(arg.start, arg.end);
+    },
+    [setVisibleRange]
+  );
 
   // + 버튼 클릭 핸들러 (오늘 날짜로 새 일정 생성)
   const handleAddClick = useCallback(() => {
@@ -118,6 +115,7 @@ export function CalendarView({ events }: CalendarViewProps) {
         onDateSelect={handleDateSelect}
         onEventClick={handleEventClick}
         onEventDrop={handleEventDrop}
+        onDatesSet={handleDatesSet}
       />
 
       <EventModal
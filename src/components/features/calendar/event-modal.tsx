@@ -25,7 +25,14 @@ import {
   createCalendarEvent,
   updateCalendarEvent,
   deleteCalendarEvent,
+  cancelEventOccurrence,
 } from "@/lib/actions/calendar";
+import type { MonthKey } from "@/lib/calendar/months";
+import {
+  buildSimpleRRule,
+  describeSimpleRRule,
+  type RecurrenceFrequency,
+} from "@/lib/calendar/recurrence";
 import { Loader2, Trash2 } from "lucide-react";
 
 // 시간 범위 설정 상수 (8:00 AM ~ 6:00 PM)
@@ -98,6 +105,15 @@ const addMinutesToTime = (timeStr: string, minutesToAdd: number): string => {
   return `${String(newHours).padStart(2, "0")}:${String(newMinutes).padStart(2, "0")}`;
 };
 
+// 반복 옵션 ("none" = 단일 일정)
+const REPEAT_OPTIONS: { value: RecurrenceFrequency | "none"; label: string }[] = [
+  { value: "none", label: "반복 안 함" },
+  { value: "DAILY", label: "매일" },
+  { value: "WEEKLY", label: "매주" },
+  { value: "MONTHLY", label: "매월" },
+  { value: "YEARLY", label: "매년" },
+];
+
 interface CalendarEvent {
   id: string;
   title: string;
@@ -107,6 +123,10 @@ interface CalendarEvent {
   all_day: boolean;
   category: CalendarCategory;
   is_public: boolean;
+  rrule?: string | null;
+  // 반복 일정 회차일 때만 존재 (시리즈 id, 규칙상 원래 시작 시각)
+  series_id?: string;
+  occurrence_start?: string;
 }
 
 interface EventModalProps {
@@ -114,7 +134,8 @@ interface EventModalProps {
   onOpenChange: (open: boolean) => void;
   event?: CalendarEvent | null;
   defaultDate?: Date | null;
-  onSuccess?: () => void;
+  // 변경된 일정이 걸친 월 (월 단위 캐시 무효화용)
+  onSuccess?: (months?: MonthKey[]) => void;
 }
 
 export function EventModal({
@@ -125,8 +146,11 @@ export function EventModal({
   onSuccess,
 }: EventModalProps) {
   const isEditing = !!event;
+  // 회차를 열면 시리즈 전체를 수정한다 (날짜는 시리즈 기준이라 여기서 바꾸지 않음)
+  const isOccurrence = !!event?.series_id;
   const [loading, setLoading] = useState(false);
   const [deleting, setDeleting] = useState(false);
+  const [cancelling, setCancelling] = useState(false);
 
   const [title, setTitle] = useState("");
   const [description, setDescription] = useState("");
@@ -137,6 +161,8 @@ export function EventModal({
   const [isAllDay, setIsAllDay] = useState(false);
   const [category, setCategory] = useState<CalendarCategory>("meeting");
   const [isShared, setIsShared] = useState(true);
+  const [repeat, setRepeat] = useState<RecurrenceFrequency | "none">("none");
+  const [repeatUntil, setRepeatUntil] = useState("");
 
   // 로컬 타임존 기준으로 날짜 문자열 생성 (YYYY-MM-DD)
   const formatLocalDate = (date: Date) => {
@@ -167,6 +193,9 @@ export function EventModal({
       setIsAllDay(event.all_day);
       setCategory(event.category);
       setIsShared(event.is_public);
+      const recurrence = event.rrule ? describeSimpleRRule(event.rrule) : null;
+      setRepeat(recurrence?.freq ?? "none");
+      setRepeatUntil(recurrence?.untilDate ?? "");
     } else if (defaultDate) {
       const dateStr = formatLocalDate(defaultDate);
       setStartDate(dateStr);
@@ -186,6 +215,8 @@ export function EventModal({
       setIsAllDay(false);
       setCategory("meeting");
       setIsShared(true);
+      setRepeat("none");
+      setRepeatUntil("");
     }
   }
 
@@ -233,19 +264,32 @@ export function EventModal({
       all_day: isAllDay,
       category,
       is_public: isShared,
+      rrule: repeat === "none" ? null : buildSimpleRRule(repeat, repeatUntil || null),
     };
 
     try {
-      const result = isEditing
-        ? await updateCalendarEvent(event.id, input)
-        : await createCalendarEvent(input);
+      let result;
+      if (isOccurrence && event.series_id) {
+        // 시리즈 수정: 시작/종료 시각은 시리즈 원본을 유지
+        result = await updateCalendarEvent(event.series_id, {
+          title: input.title,
+          description: input.description,
+          category: input.category,
+          is_public: input.is_public,
+          rrule: input.rrule,
+        });
+      } else {
+        result = isEditing
+          ? await updateCalendarEvent(event.id, input)
+          : await createCalendarEvent(input);
+      }
 
       if (result.error) {
         console.error(result.error);
         alert("저장에 실패했습니다.");
       } else {
         onOpenChange(false);
-        onSuccess?.();
+        onSuccess?.(result.months);
       }
     } catch (error) {
       console.error(error);
@@ -256,17 +300,20 @@ export function EventModal({
   }
 
   async function handleDelete() {
-    if (!event || !confirm("정말 삭제하시겠습니까?")) return;
+    const message = isOccurrence
+      ? "반복 일정 전체를 삭제하시겠습니까?"
+      : "정말 삭제하시겠습니까?";
+    if (!event || !confirm(message)) return;
 
     setDeleting(true);
     try {
-      const result = await deleteCalendarEvent(event.id);
+      const result = await deleteCalendarEvent(event.series_id ?? event.id);
       if (result.error) {
         console.error(result.error);
         alert("삭제에 실패했습니다.");
       } else {
         onOpenChange(false);
-        onSuccess?.();
+        onSuccess?.(result.months);
       }
     } catch (error) {
       console.error(error);
@@ -276,6 +323,29 @@ export function EventModal({
     }
   }
 
+  // 반복 일정의 이 회차만 취소
+  async function handleCancelOccurrence() {
+    if (!event?.series_id || !event.occurrence_start) return;
+    if (!confirm("이 회차만 삭제하시겠습니까?")) return;
+
+    setCancelling(true);
+    try {
+      const result = await cancelEventOccurrence(event.series_id, event.occurrence_start);
+      if (result.error) {
+        console.error(result.error);
+        alert("삭제에 실패했습니다.");
+      } else {
+        onOpenChange(false);
+        onSuccess?.(result.months);
+      }
+    } catch (error) {
+      console.error(error);
+      alert("삭제에 실패했습니다.");
+    } finally {
+      setCancelling(false);
+    }
+  }
+
   return (
     <Dialog open={open} onOpenChange={onOpenChange}>
       <DialogContent className="sm:max-w-[500px]">
@@ -335,6 +405,7 @@ export function EventModal({
           <div className="flex items-center space-x-2">
             <Checkbox
               id="is_all_day"
+              disabled={isOccurrence}
               checked={isAllDay}
               onCheckedChange={(checked) => setIsAllDay(checked === true)}
             />
@@ -351,13 +422,18 @@ export function EventModal({
                 type="date"
                 value={startDate}
                 onChange={(e) => setStartDate(e.target.value)}
+                disabled={isOccurrence}
                 required
               />
             </div>
             {!isAllDay && (
               <div className="space-y-2">
                 <Label>시작 시간</Label>
-                <Select value={startTime} onValueChange={handleStartTimeChange}>
+                <Select
+                  value={startTime}
+                  onValueChange={handleStartTimeChange}
+                  disabled={isOccurrence}
+                >
                   <SelectTrigger>
                     <SelectValue placeholder="시간 선택" />
                   </SelectTrigger>
@@ -382,11 +458,16 @@ export function EventModal({
                   type="date"
                   value={endDate}
                   onChange={(e) => setEndDate(e.target.value)}
+                  disabled={isOccurrence}
                 />
               </div>
               <div className="space-y-2">
                 <Label>종료 시간</Label>
-                <Select value={endTime} onValueChange={setEndTime}>
+                <Select
+                  value={endTime}
+                  onValueChange={setEndTime}
+                  disabled={isOccurrence}
+                >
                   <SelectTrigger>
                     <SelectValue placeholder="시간 선택" />
                   </SelectTrigger>
@@ -402,6 +483,44 @@ export function EventModal({
             </div>
           )}
 
+          <div className="grid grid-cols-2 gap-4">
+            <div className="space-y-2">
+              <Label>반복</Label>
+              <Select
+                value={repeat}
+                onValueChange={(v) => setRepeat(v as RecurrenceFrequency | "none")}
+              >
+                <SelectTrigger>
+                  <SelectValue />
+                </SelectTrigger>
+                <SelectContent>
+                  {REPEAT_OPTIONS.map((opt) => (
+                    <SelectItem key={opt.value} value={opt.value}>
+                      {opt.label}
+                    </SelectItem>
+                  ))}
+                </SelectContent>
+              </Select>
+            </div>
+            {repeat !== "none" && (
+              <div className="space-y-2">
+                <Label htmlFor="repeat_until">반복 종료일</Label>
+                <Input
+                  id="repeat_until"
+                  type="date"
+                  value={repeatUntil}
+                  min={startDate}
+                  onChange={(e) => setRepeatUntil(e.target.value)}
+                />
+              </div>
+            )}
+          </div>
+          {isOccurrence && (
+            <p className="text-xs text-muted-foreground">
+              반복 일정입니다. 수정 내용은 모든 회차에 적용됩니다.
+            </p>
+          )}
+
           <div className="flex items-center space-x-2">
             <Checkbox
               id="is_shared"
@@ -426,7 +545,18 @@ export function EventModal({
                 ) : (
                   <Trash2 className="h-4 w-4" />
                 )}
-                <span className="ml-2">삭제</span>
+                <span className="ml-2">{isOccurrence ? "전체 삭제" : "삭제"}</span>
+              </Button>
+            )}
+            {isOccurrence && (
+              <Button
+                type="button"
+                variant="outline"
+                onClick={handleCancelOccurrence}
+                disabled={cancelling || deleting || loading}
+              >
+                {cancelling && <Loader2 className="h-4 w-4 animate-spin mr-2" />}
+                이 회차만 삭제
               </Button>
             )}
             <div className="flex gap-2">
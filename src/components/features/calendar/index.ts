@@ -1,2 +1,3 @@
 export { CalendarView } from "./calendar-view";
 export { EventModal } from "./event-modal";
+export { CalendarFeedButton } from "./calendar-feed-button";
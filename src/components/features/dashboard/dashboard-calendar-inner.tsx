@@ -2,7 +2,7 @@
 
 import { useMemo } from "react";
 import FullCalendar from "@fullcalendar/react";
-import type { EventClickArg } from "@fullcalendar/core";
+import type { DatesSetArg, EventClickArg } from "@fullcalendar/core";
 import dayGridPlugin from "@fullcalendar/daygrid";
 import { CALENDAR_CATEGORY_CONFIG } from "@/lib/constants";
 import type { CalendarCategory } from "@/types/database.types";
@@ -19,11 +19,13 @@ interface CalendarEvent {
 interface DashboardCalendarInnerProps {
   events: CalendarEvent[];
   onEventClick: (clickInfo: EventClickArg) => void;
+  onDatesSet: (arg: DatesSetArg) => void;
 }
 
 export function DashboardCalendarInner({
   events,
   onEventClick,
+  onDatesSet,
 }: DashboardCalendarInnerProps) {
   // 이벤트 변환을 메모이제이션
   const calendarEvents = useMemo(
@@ -67,6 +69,7 @@ export function DashboardCalendarInner({
           weekday: "narrow",
         }}
         eventClick={onEventClick}
+        datesSet={onDatesSet}
         selectable={false}
         editable={false}
       />
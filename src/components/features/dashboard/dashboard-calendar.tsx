@@ -2,17 +2,18 @@
 
 import { useCallback, useState } from "react";
 import dynamic from "next/dynamic";
-import type { EventClickArg } from "@fullcalendar/core";
+import type { DatesSetArg, EventClickArg } from "@fullcalendar/core";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { Calendar, X, Plus, Loader2 } from "lucide-react";
 import { cn } from "@/lib/utils";
 import { CALENDAR_CATEGORY_CONFIG } from "@/lib/constants";
-import type { CalendarCategory } from "@/types/database.types";
 import Link from "next/link";
 import { useRouter } from "next/navigation";
 import { EventModal } from "@/components/features/calendar/event-modal";
+import { useCalendarEvents, type CalendarMonthEvent } from "@/hooks/use-calendar-events";
+import type { MonthKey } from "@/lib/calendar/months";
 
 // FullCalendar를 동적 임포트 (SSR 비활성화)
 const DashboardCalendarInner = dynamic(
@@ -30,17 +31,7 @@ const DashboardCalendarInner = dynamic(
   }
 );
 
-interface CalendarEvent {
-  id: string;
-  title: string;
-  start_date: string;
-  end_date?: string | null;
-  category: CalendarCategory;
-  all_day: boolean;
-}
-
 interface DashboardCalendarProps {
-  events: CalendarEvent[];
   className?: string;
 }
 
@@ -52,12 +43,11 @@ interface DashboardCalendarProps {
  * - 상세 영역과 하위 섹션 간 충분한 여백 확보
  * - 모바일/태블릿 반응형 대응
  */
-export function DashboardCalendar({
-  events,
-  className,
-}: DashboardCalendarProps) {
+export function DashboardCalendar({ className }: DashboardCalendarProps) {
+  // 보이는 월만 조회 (캘린더 페이지와 같은 월 단위 캐시 공유)
+  const { events, setVisibleRange, invalidateMonths } = useCalendarEvents();
   const router = useRouter();
-  const [selectedEvent, setSelectedEvent] = useState<CalendarEvent | null>(
+  const [selectedEvent, setSelectedEvent] = useState<CalendarMonthEvent | null>(
     null
   );
   const [modalOpen, setModalOpen] = useState(false);
@@ -69,10 +59,21 @@ export function DashboardCalendar({
     setModalOpen(true);
   }, []);
 
-  // 일정 생성 성공 시 새로고침
-  const handleSuccess = useCallback(() => {
-    router.refresh();
-  }, [router]);
+  // 일정 생성 성공 시 해당 월만 다시 조회하고, 다가오는 마감일(서버 렌더링)은 새로고침
+  const handleSuccess = useCallback(
+    (months?: MonthKey[]) => {
+      invalidateMonths(months);
+      router.refresh();
+    },
+    [invalidateMonths, router]
+  );
+
+  const handleDatesSet = useCallback(
+    (arg: DatesSetArg) => {
+      setVisibleRange(arg.start, arg.end);
+    },
+    [setVisibleRange]
+  );
 
   const handleEventClick = useCallback(
     (clickInfo: EventClickArg) => {
@@ -136,6 +137,7 @@ export function DashboardCalendar({
         <DashboardCalendarInner
           events={events}
           onEventClick={handleEventClick}
+          onDatesSet={handleDatesSet}
         />
 
         {/*
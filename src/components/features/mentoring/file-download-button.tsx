@@ -2,8 +2,10 @@
 
 import { useState } from "react";
 import { Button } from "@/components/ui/button";
-import { Download, File, Loader2 } from "lucide-react";
+import { Download, Loader2 } from "lucide-react";
 import { createClient } from "@/lib/supabase/client";
+import type { DerivativesStatus } from "@/lib/storage/derivatives";
+import { FileThumbnail } from "@/components/file-thumbnail";
 
 interface FileDownloadButtonProps {
   file: {
@@ -12,6 +14,7 @@ interface FileDownloadButtonProps {
     storage_path: string;
     mime_type: string;
     size: number;
+    derivatives_status?: DerivativesStatus | null;
   };
 }
 
@@ -58,7 +61,12 @@ export function FileDownloadButton({ file }: FileDownloadButtonProps) {
   return (
     <div className="flex items-center justify-between gap-2 bg-muted/50 px-3 py-2 rounded-md">
       <div className="flex items-center gap-2 min-w-0">
-        <File className="h-4 w-4 text-muted-foreground flex-shrink-0" />
+        <FileThumbnail
+          bucket="mentoring-files"
+          fileId={file.id}
+          mimeType={file.mime_type}
+          status={file.derivatives_status}
+        />
         <span className="text-sm truncate">{file.name}</span>
         <span className="text-xs text-muted-foreground flex-shrink-0">
           ({formatFileSize(file.size)})
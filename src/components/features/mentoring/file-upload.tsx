@@ -3,15 +3,21 @@
 import { useState, useRef } from "react";
 import { Button } from "@/components/ui/button";
 import { Upload, Loader2, X, FileIcon } from "lucide-react";
-import { uploadMentoringFile } from "@/lib/actions/mentoring";
+import {
+  createMentoringFileUpload,
+  completeMentoringFileUpload,
+} from "@/lib/actions/mentoring";
+import { uploadAttachment } from "@/lib/storage/upload-attachment";
+import {
+  ATTACHMENT_EXTENSIONS,
+  MAX_ATTACHMENT_SIZE,
+  MAX_ATTACHMENT_SIZE_LABEL,
+} from "@/lib/storage/upload-policy";
 
 interface FileUploadProps {
   postId: string;
 }
 
-const ALLOWED_EXTENSIONS = ".pdf,.docx,.xlsx,.pptx,.png,.jpg,.jpeg";
-const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB
-
 function formatFileSize(bytes: number): string {
   if (bytes < 1024) return bytes + " B";
   if (bytes < 1024 * 1024) return (bytes / 1024).toFixed(1) + " KB";
@@ -23,6 +29,7 @@ export function FileUpload({ postId }: FileUploadProps) {
   const [selectedFile, setSelectedFile] = useState<File | null>(null);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [progress, setProgress] = useState(0);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
   const handleFileSelect = (e: React.ChangeEvent<HTMLInputElement>) => {
@@ -31,8 +38,9 @@ export function FileUpload({ postId }: FileUploadProps) {
 
     if (!file) return;
 
-    if (file.size > MAX_FILE_SIZE) {
-      setError("파일 크기는 10MB를 초과할 수 없습니다.");
+    // 이미지는 업로드 전에 축소되므로 크기 제한은 압축 후 다시 확인한다.
+    if (!file.type.startsWith("image/") && file.size > MAX_ATTACHMENT_SIZE) {
+      setError(`파일 크기는 ${MAX_ATTACHMENT_SIZE_LABEL}를 초과할 수 없습니다.`);
       return;
     }
 
@@ -44,11 +52,15 @@ export function FileUpload({ postId }: FileUploadProps) {
 
     setIsLoading(true);
     setError(null);
+    setProgress(0);
 
-    const formData = new FormData();
-    formData.append("file", selectedFile);
-
-    const result = await uploadMentoringFile(postId, formData);
+    const result = await uploadAttachment({
+      file: selectedFile,
+      scope: `mentoring:${postId}`,
+      createUpload: (meta) => createMentoringFileUpload(postId, meta),
+      completeUpload: (path, meta) => completeMentoringFileUpload(postId, path, meta),
+      onProgress: setProgress,
+    });
 
     if (result.error) {
       setError(result.error);
@@ -96,7 +108,7 @@ export function FileUpload({ postId }: FileUploadProps) {
       <input
         ref={fileInputRef}
         type="file"
-        accept={ALLOWED_EXTENSIONS}
+        accept={ATTACHMENT_EXTENSIONS}
         onChange={handleFileSelect}
         className="hidden"
         id="file-upload"
@@ -112,7 +124,7 @@ export function FileUpload({ postId }: FileUploadProps) {
             클릭하여 파일 선택
           </span>
           <span className="text-xs text-muted-foreground mt-1">
-            PDF, DOCX, XLSX, PPTX, PNG, JPG (최대 10MB)
+            PDF, DOCX, XLSX, PPTX, PNG, JPG (최대 {MAX_ATTACHMENT_SIZE_LABEL})
           </span>
         </label>
       ) : (
@@ -159,7 +171,7 @@ export function FileUpload({ postId }: FileUploadProps) {
           disabled={isLoading || !selectedFile}
         >
           {isLoading && <Loader2 className="mr-2 h-4 w-4 animate-spin" />}
-          업로드
+          {isLoading ? `업로드 중 ${progress}%` : "업로드"}
         </Button>
       </div>
     </div>
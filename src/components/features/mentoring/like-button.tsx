@@ -30,6 +30,10 @@ export function LikeButton({ postId, likesCount, userLiked }: LikeButtonProps) {
       setLiked(liked);
       setCount(count);
       alert(result.error);
+    } else if (result.liked !== undefined && result.likesCount !== undefined) {
+      // 서버 기준 값으로 동기화 (다른 사용자의 좋아요 반영)
+      setLiked(result.liked);
+      setCount(result.likesCount);
     }
 
     setIsLoading(false);
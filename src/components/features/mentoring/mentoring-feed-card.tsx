@@ -0,0 +1,178 @@
+"use client";
+
+import { memo } from "react";
+import Link from "next/link";
+import { Card, CardContent } from "@/components/ui/card";
+import { Button } from "@/components/ui/button";
+import { Avatar, AvatarFallback, AvatarImage } from "@/components/ui/avatar";
+import {
+  DropdownMenu,
+  DropdownMenuContent,
+  DropdownMenuItem,
+  DropdownMenuTrigger,
+} from "@/components/ui/dropdown-menu";
+import { MessageCircle, Share2, MoreVertical, CheckSquare } from "lucide-react";
+import { getInitials, formatDate } from "@/lib/utils";
+import { LikeButton } from "@/components/features/mentoring/like-button";
+import type { MentoringFeedPost } from "@/lib/actions/mentoring";
+
+interface MentoringFeedCardProps {
+  post: MentoringFeedPost;
+  onShare: (postId: string) => void;
+}
+
+// 화면 밖 카드는 content-visibility로 레이아웃/페인트를 생략한다 (브라우저 가상화).
+// contain-intrinsic-size는 생략된 카드의 예상 높이로, 스크롤바가 튀지 않게 한다.
+const OFFSCREEN_STYLE = {
+  contentVisibility: "auto",
+  containIntrinsicSize: "auto 280px",
+} as const;
+
+export const MentoringFeedCard = memo(function MentoringFeedCard({
+  post,
+  onShare,
+}: MentoringFeedCardProps) {
+  return (
+    <Card className="hover:shadow-md transition-shadow" style={OFFSCREEN_STYLE}>
+      <CardContent className="pt-4 md:pt-6 p-3 md:p-6">
+        <div className="flex items-start gap-2 md:gap-4">
+          <Link href={`/members/${post.author?.id}`}>
+            <Avatar className="h-10 w-10 md:h-12 md:w-12">
+              <AvatarImage src={post.author?.avatar_url || undefined} />
+              <AvatarFallback className="bg-sidebar-primary text-white text-sm md:text-base">
+                {post.author ? getInitials(post.author.name) : "?"}
+              </AvatarFallback>
+            </Avatar>
+          </Link>
+
+          <div className="flex-1 min-w-0">
+            {/* Header with author and menu */}
+            <div className="flex items-center justify-between mb-1">
+              <div className="flex items-center gap-1 md:gap-2 flex-wrap">
+                <Link
+                  href={`/members/${post.author?.id}`}
+                  className="font-semibold hover:underline text-sm md:text-base"
+                >
+                  {post.author?.name || "Unknown"}
+                </Link>
+                {post.meeting_date && (
+                  <span className="text-xs md:text-sm text-muted-foreground">
+                    {formatDate(post.meeting_date)}
+                  </span>
+                )}
+              </div>
+              <DropdownMenu>
+                <DropdownMenuTrigger asChild>
+                  <Button variant="ghost" size="icon" className="h-8 w-8">
+                    <MoreVertical className="h-4 w-4" />
+                  </Button>
+                </DropdownMenuTrigger>
+                <DropdownMenuContent align="end">
+                  <DropdownMenuItem asChild>
+                    <Link href={`/mentoring/${post.id}`}>상세 보기</Link>
+                  </DropdownMenuItem>
+                  <DropdownMenuItem asChild>
+                    <Link href={`/mentoring/${post.id}/edit`}>수정</Link>
+                  </DropdownMenuItem>
+                </DropdownMenuContent>
+              </DropdownMenu>
+            </div>
+
+            {/* Content */}
+            <Link href={`/mentoring/${post.id}`}>
+              <p className="text-muted-foreground line-clamp-3 mb-2 md:mb-3 cursor-pointer hover:text-foreground transition-colors text-sm md:text-base">
+                {post.content_preview}
+              </p>
+            </Link>
+
+            {/* Next Steps */}
+            {post.next_steps && post.next_steps.length > 0 && (
+              <div className="bg-muted/50 rounded-lg p-2 md:p-3 mb-2 md:mb-3">
+                <div className="flex items-center gap-1.5 md:gap-2 mb-1.5 md:mb-2">
+                  <CheckSquare className="h-3.5 w-3.5 md:h-4 md:w-4 text-primary" />
+                  <span className="font-medium text-xs md:text-sm">NEXT STEPS</span>
+                </div>
+                <ul className="space-y-0.5 md:space-y-1">
+                  {post.next_steps.map((step, index) => (
+                    <li
+                      key={index}
+                      className="text-xs md:text-sm text-muted-foreground flex items-start gap-1.5 md:gap-2"
+                    >
+                      <span className="text-muted-foreground mt-0.5">•</span>
+                      <span>{step}</span>
+                    </li>
+                  ))}
+                  {post.next_steps_count > post.next_steps.length && (
+                    <li className="text-xs md:text-sm text-muted-foreground">
+                      +{post.next_steps_count - post.next_steps.length} more...
+                    </li>
+                  )}
+                </ul>
+              </div>
+            )}
+
+            {/* Actions */}
+            <div className="flex items-center gap-0.5 md:gap-1 pt-2 border-t">
+              <LikeButton
+                postId={post.id}
+                likesCount={post.likes_count}
+                userLiked={post.user_liked}
+              />
+              <Link href={`/mentoring/${post.id}`}>
+                <Button variant="ghost" size="sm" className="gap-1 md:gap-2 h-8 px-2 md:px-3">
+                  <MessageCircle className="h-3.5 w-3.5 md:h-4 md:w-4" />
+                  <span className="text-xs md:text-sm">{post.comments_count}</span>
+                </Button>
+              </Link>
+              <Button
+                variant="ghost"
+                size="sm"
+                className="gap-1 md:gap-2 h-8 px-2 md:px-3"
+                onClick={() => onShare(post.id)}
+              >
+                <Share2 className="h-3.5 w-3.5 md:h-4 md:w-4" />
+                <span className="text-xs md:text-sm hidden sm:inline">공유</span>
+              </Button>
+            </div>
+
+            {/* Comments */}
+            {post.recent_comments.length > 0 && (
+              <div className="mt-2 md:mt-3 pt-2 md:pt-3 border-t space-y-1.5 md:space-y-2">
+                {post.recent_comments.map((comment) => (
+                  <div key={comment.id} className="flex items-start gap-1.5 md:gap-2">
+                    <Avatar className="h-6 w-6 md:h-7 md:w-7">
+                      <AvatarImage src={comment.author?.avatar_url || undefined} />
+                      <AvatarFallback className="bg-muted text-xs">
+                        {comment.author ? getInitials(comment.author.name) : "?"}
+                      </AvatarFallback>
+                    </Avatar>
+                    <div className="flex-1 min-w-0 bg-muted/50 rounded-lg px-2 md:px-3 py-1.5 md:py-2">
+                      <div className="flex items-center gap-1.5 md:gap-2 mb-0.5 flex-wrap">
+                        <span className="text-xs md:text-sm font-medium">
+                          {comment.author?.name || "Unknown"}
+                        </span>
+                        <span className="text-xs text-muted-foreground">
+                          {formatDate(comment.created_at)}
+                        </span>
+                      </div>
+                      <p className="text-xs md:text-sm text-muted-foreground">
+                        {comment.content}
+                      </p>
+                    </div>
+                  </div>
+                ))}
+                {post.comments_count > post.recent_comments.length && (
+                  <Link href={`/mentoring/${post.id}`}>
+                    <p className="text-xs md:text-sm text-primary hover:underline pl-7 md:pl-9">
+                      +{post.comments_count - post.recent_comments.length}개 댓글 더보기
+                    </p>
+                  </Link>
+                )}
+              </div>
+            )}
+          </div>
+        </div>
+      </CardContent>
+    </Card>
+  );
+});
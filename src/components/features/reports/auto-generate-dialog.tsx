@@ -26,19 +26,20 @@ import {
   getReportTemplates,
   getProjects,
   getSubProjects,
-  getProgressLogs,
+  getProgressLogRollup,
   createReport,
 } from "@/lib/actions/reports";
+import {
+  buildReportContentFromRollup,
+  rollupPreviewLogs,
+  sumRollup,
+} from "@/lib/reports/rollup";
 import type {
   ReportTemplate,
   Project,
   SubProject,
-  ProgressLogWithDetails,
+  ProgressLogRollupCell,
   ReportContent,
-  ReportContentMatrix,
-  ReportContentList,
-  ReportContentLogEntry,
-  ReportSectionContent,
 } from "@/types/database";
 
 interface AutoGenerateDialogProps {
@@ -92,7 +93,7 @@ export function AutoGenerateDialog({
 
   // Step 2: Progress preview
   const [subProjects, setSubProjects] = useState<SubProject[]>([]);
-  const [progressLogs, setProgressLogs] = useState<ProgressLogWithDetails[]>([]);
+  const [rollupCells, setRollupCells] = useState<ProgressLogRollupCell[]>([]);
   const [checkedLogIds, setCheckedLogIds] = useState<Set<string>>(new Set());
   const [loading, setLoading] = useState(false);
   const [fetchingLogs, setFetchingLogs] = useState(false);
@@ -106,6 +107,9 @@ export function AutoGenerateDialog({
     [templates, selectedTemplateId]
   );
 
+  const progressLogs = useMemo(() => rollupPreviewLogs(rollupCells), [rollupCells]);
+  const totals = useMemo(() => sumRollup(rollupCells), [rollupCells]);
+
   // Load templates and projects on open
   useEffect(() => {
     if (!open) return;
@@ -161,7 +165,7 @@ export function AutoGenerateDialog({
   // Auto-fetch progress logs when all required fields set
   useEffect(() => {
     if (!selectedProjectId || !periodStart || !periodEnd) {
-      setProgressLogs([]);
+      setRollupCells([]);
       setCheckedLogIds(new Set());
       return;
     }
@@ -170,17 +174,20 @@ export function AutoGenerateDialog({
     async function fetchLogs() {
       setFetchingLogs(true);
       try {
-        const result = await getProgressLogs({
+        // 원본 로그 대신 서버에서 집계된 칸 단위 결과만 받는다
+        const result = await getProgressLogRollup({
           projectId: selectedProjectId,
           startDate: periodStart,
           endDate: periodEnd,
         });
         if (cancelled) return;
         if (result.data) {
-          const logs = result.data as ProgressLogWithDetails[];
-          setProgressLogs(logs);
+          const cells = result.data as ProgressLogRollupCell[];
+          setRollupCells(cells);
           // Default: all logs checked
-          setCheckedLogIds(new Set(logs.map((l) => l.id)));
+          setCheckedLogIds(
+            new Set(cells.flatMap((c) => c.items.map((item) => item.id)))
+          );
         }
       } catch (err) {
         console.error("Failed to fetch progress logs:", err);
@@ -241,80 +248,13 @@ export function AutoGenerateDialog({
 
   const buildReportContent = useCallback((): ReportContent => {
     if (!selectedTemplate) return {};
-
-    const checkedLogs = progressLogs.filter((l) => checkedLogIds.has(l.id));
-    const content: ReportContent = {};
-
-    for (const section of selectedTemplate.sections) {
-      if (section.type === "progress_matrix") {
-        const matrix: ReportContentMatrix = {};
-
-        for (const sp of subProjects) {
-          const spLogs = checkedLogs.filter(
-            (l) => l.sub_project_id === sp.id
-          );
-
-          if (section.columns) {
-            const cell: Record<string, ReportContentLogEntry[]> = {};
-            for (const col of section.columns) {
-              // Match logs to columns based on auto_fill config
-              const matchingLogs = spLogs.filter((log) => {
-                if (!section.auto_fill) return true;
-                const statusMatch =
-                  !section.auto_fill.status ||
-                  section.auto_fill.status.includes(log.status);
-                const typeMatch =
-                  !section.auto_fill.log_type ||
-                  section.auto_fill.log_type.includes(log.log_type);
-                // Map column key to status
-                if (col.key === "completed" || col.key === "progress") {
-                  return (
-                    (log.status === "completed" || log.status === "in_progress") &&
-                    typeMatch
-                  );
-                }
-                if (col.key === "planned" || col.key === "plan") {
-                  return log.status === "planned" && typeMatch;
-                }
-                return statusMatch && typeMatch;
-              });
-
-              cell[col.key] = matchingLogs.map((log) => ({
-                log_id: log.id,
-                text: log.title,
-              }));
-            }
-            matrix[sp.id] = cell;
-          }
-        }
-
-        content[section.id] = matrix as ReportSectionContent;
-      } else if (section.type === "list") {
-        const filteredLogs = checkedLogs.filter((log) => {
-          if (!section.auto_fill) return true;
-          const typeMatch =
-            !section.auto_fill.log_type ||
-            section.auto_fill.log_type.includes(log.log_type);
-          const statusMatch =
-            !section.auto_fill.status ||
-            section.auto_fill.status.includes(log.status);
-          return typeMatch && statusMatch;
-        });
-
-        const listContent: ReportContentList = {
-          items: filteredLogs.map((log) => ({
-            log_id: log.id,
-            text: log.title,
-          })),
-        };
-        content[section.id] = listContent as ReportSectionContent;
-      } else if (section.type === "text") {
-        content[section.id] = { text: "" } as ReportSectionContent;
-      }
-    }
-
-    return content;
-  }, [selectedTemplate, progressLogs, checkedLogIds, subProjects]);
+    return buildReportContentFromRollup(
+      selectedTemplate,
+      subProjects,
+      rollupCells,
+      checkedLogIds
+    );
+  }, [selectedTemplate, rollupCells, checkedLogIds, subProjects]);
 
   const handleGenerate = useCallback(async () => {
     if (!selectedTemplate || !periodStart || !periodEnd) return;
@@ -367,7 +307,7 @@ export function AutoGenerateDialog({
     setSelectedProjectId("");
     setPeriodStart("");
     setPeriodEnd("");
-    setProgressLogs([]);
+    setRollupCells([]);
     setCheckedLogIds(new Set());
     setSubProjects([]);
     setIncludeNextPeriodPlans(true);
@@ -474,7 +414,15 @@ export function AutoGenerateDialog({
           {/* 추진경과 미리보기 */}
           {(progressLogs.length > 0 || fetchingLogs) && (
             <div className="space-y-2">
-              <Label>추진경과 미리보기</Label>
+              <div className="flex items-center justify-between">
+                <Label>추진경과 미리보기</Label>
+                {!fetchingLogs && (
+                  <span className="text-xs text-muted-foreground">
+                    {totals.count}건
+                    {totals.hours > 0 && ` · ${totals.hours}시간`}
+                  </span>
+                )}
+              </div>
               {fetchingLogs ? (
                 <div className="flex items-center justify-center py-6">
                   <Loader2 className="h-5 w-5 animate-spin text-muted-foreground" />
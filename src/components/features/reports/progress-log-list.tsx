@@ -31,12 +31,15 @@ import {
 } from "@/components/ui/select";
 import {
   getProgressLogs,
+  getProgressSummary,
   getSubProjects,
   deleteProgressLog,
 } from "@/lib/actions/reports";
+import { totalsByPeriod } from "@/lib/reports/rollup";
 import type {
   ProgressLogType,
   ProgressLogStatus,
+  ProgressSummaryRow,
   SubProject,
 } from "@/types/database";
 import { ProgressLogForm } from "./progress-log-form";
@@ -87,6 +90,7 @@ export function ProgressLogList({
   });
 
   const [logs, setLogs] = useState<Array<Record<string, unknown>>>([]);
+  const [summaryRows, setSummaryRows] = useState<ProgressSummaryRow[]>([]);
   const [subProjects, setSubProjects] = useState<SubProject[]>([]);
   const [loading, setLoading] = useState(false);
   const [formOpen, setFormOpen] = useState(false);
@@ -99,14 +103,22 @@ export function ProgressLogList({
     if (!selectedProjectId || !startDate || !endDate) return;
     setLoading(true);
     try {
-      const result = await getProgressLogs({
-        projectId: selectedProjectId,
-        startDate,
-        endDate,
-      });
+      // 월별 합계는 원본 로그를 다시 더하지 않고 집계 테이블에서 받는다
+      const [result, summary] = await Promise.all([
+        getProgressLogs({ projectId: selectedProjectId, startDate, endDate }),
+        getProgressSummary({
+          projectId: selectedProjectId,
+          startDate,
+          endDate,
+          granularity: "month",
+        }),
+      ]);
       if (result.data) {
         setLogs(result.data as Array<Record<string, unknown>>);
       }
+      if (summary.data) {
+        setSummaryRows(summary.data as ProgressSummaryRow[]);
+      }
     } catch (err) {
       console.error("Failed to fetch progress logs:", err);
     } finally {
@@ -164,6 +176,8 @@ export function ProgressLogList({
     return map;
   }, [subProjects]);
 
+  const monthlyTotals = useMemo(() => totalsByPeriod(summaryRows), [summaryRows]);
+
   return (
     <>
       {/* Back link */}
@@ -226,6 +240,17 @@ export function ProgressLogList({
         </Button>
       </div>
 
+      {/* Monthly Totals */}
+      {!loading && monthlyTotals.length > 0 && (
+        <div className="flex flex-wrap gap-2">
+          {monthlyTotals.map((t) => (
+            <Badge key={t.periodStart} variant="secondary" className="font-normal">
+              {t.periodStart.slice(0, 7)} · {t.count}건 · {t.hours}시간
+            </Badge>
+          ))}
+        </div>
+      )}
+
       {/* Logs Table */}
       {loading ? (
         <div className="flex items-center justify-center py-12">
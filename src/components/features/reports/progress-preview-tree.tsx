@@ -8,11 +8,12 @@ import {
   CollapsibleTrigger,
 } from "@/components/ui/collapsible";
 import { ChevronDown, ChevronRight } from "lucide-react";
-import type { SubProject, ProgressLogWithDetails } from "@/types/database";
+import type { SubProject } from "@/types/database";
+import type { ProgressPreviewLog } from "@/lib/reports/rollup";
 
 interface ProgressPreviewTreeProps {
   subProjects: SubProject[];
-  progressLogs: ProgressLogWithDetails[];
+  progressLogs: ProgressPreviewLog[];
   checkedLogIds: Set<string>;
   onToggleLog: (logId: string) => void;
   onToggleSubProject: (subProjectId: string) => void;
@@ -35,7 +36,7 @@ export function ProgressPreviewTree({
   });
 
   const logsBySubProject = useMemo(() => {
-    const map = new Map<string, ProgressLogWithDetails[]>();
+    const map = new Map<string, ProgressPreviewLog[]>();
     for (const log of progressLogs) {
       const key = log.sub_project_id ?? "__unassigned__";
       const existing = map.get(key) ?? [];
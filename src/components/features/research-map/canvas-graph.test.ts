@@ -0,0 +1,42 @@
+import { describe, it, expect } from "vitest";
+import {
+  bundleSegments,
+  isLabelShownAtZoom,
+  isNodeShownAtZoom,
+  PAPER_MIN_ZOOM,
+} from "./canvas-graph";
+
+describe("bundleSegments", () => {
+  it("should merge links between the same pair of cells regardless of direction", () => {
+    const bundles = bundleSegments(
+      [
+        { x1: 5, y1: 5, x2: 105, y2: 5 },
+        { x1: 108, y1: 9, x2: 9, y2: 9 },
+        { x1: 5, y1: 5, x2: 5, y2: 205 },
+      ],
+      50
+    );
+
+    expect(bundles).toHaveLength(2);
+    expect(bundles[0]).toEqual({ x1: 7, y1: 7, x2: 106.5, y2: 7, count: 2 });
+    expect(bundles[1].count).toBe(1);
+  });
+
+  it("should drop links that start and end in the same cell", () => {
+    expect(bundleSegments([{ x1: 1, y1: 1, x2: 10, y2: 10 }], 50)).toEqual([]);
+  });
+});
+
+describe("level of detail", () => {
+  it("should hide paper nodes below the paper zoom threshold", () => {
+    expect(isNodeShownAtZoom("paper", PAPER_MIN_ZOOM - 0.1)).toBe(false);
+    expect(isNodeShownAtZoom("paper", PAPER_MIN_ZOOM)).toBe(true);
+    expect(isNodeShownAtZoom("student", 0.1)).toBe(true);
+  });
+
+  it("should always label axes but only label keywords when zoomed in", () => {
+    expect(isLabelShownAtZoom("axis", 0.1)).toBe(true);
+    expect(isLabelShownAtZoom("theme", 0.8)).toBe(false);
+    expect(isLabelShownAtZoom("theme", 1.2)).toBe(true);
+  });
+});
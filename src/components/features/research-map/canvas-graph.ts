@@ -0,0 +1,430 @@
+import * as d3 from "d3";
+import { NODE_COLORS, type NodeType } from "./research-map-data";
+import {
+  labelFontSize,
+  linkDash,
+  nodeFill,
+  nodeId,
+  nodeStrokeOpacity,
+  nodeStrokeWidth,
+  origLinkColor,
+  origLinkOpacity,
+  origLinkWidth,
+  type SimLink,
+  type SimNode,
+  type VisualState,
+} from "./graph-model";
+
+// ============================================
+// Research Map Canvas 렌더러
+// ============================================
+// 논문 노드가 붙으면 SVG 요소가 수천 개가 되어 팬/줌이 끊긴다.
+// Canvas 한 장에 그리고, 마우스 판정은 quadtree로 한다.
+// 확대 배율에 따라 그리는 양을 줄인다 (level of detail):
+// - 논문 노드와 그 링크는 PAPER_MIN_ZOOM 이상에서만
+// - 라벨은 타입별 배율 이상에서만 (선택/이웃 노드는 항상)
+// - BUNDLE_MAX_ZOOM 미만에서는 화면 격자 셀 단위로 링크를 묶어 굵기로 개수를 표시
+
+export const PAPER_MIN_ZOOM = 0.6;
+export const BUNDLE_MAX_ZOOM = 0.5;
+// 묶음 판정 격자 한 칸 크기 (화면 px)
+const BUNDLE_CELL_PX = 48;
+
+const LABEL_MIN_ZOOM: Record<NodeType, number> = {
+  axis: 0,
+  student: 0.5,
+  project: 0.9,
+  conference: 0.9,
+  theme: 1.1,
+  method: 1.1,
+  tech: 1.1,
+  paper: 1.6,
+};
+
+const SELECTED_STROKE = "#FFD700";
+const LABEL_COLOR = "#8898b8";
+const LABEL_OUTLINE = "#06081a";
+const BUNDLE_COLOR = "#6a7aa8";
+
+export function isNodeShownAtZoom(type: NodeType, k: number): boolean {
+  return type !== "paper" || k >= PAPER_MIN_ZOOM;
+}
+
+export function isLabelShownAtZoom(type: NodeType, k: number): boolean {
+  return k >= LABEL_MIN_ZOOM[type];
+}
+
+export interface BundleSegment {
+  x1: number;
+  y1: number;
+  x2: number;
+  y2: number;
+}
+
+export interface Bundle extends BundleSegment {
+  count: number;
+}
+
+// 양 끝점이 같은 격자 셀 쌍에 속한 링크를 하나로 묶고, 선은 셀 안 끝점들의 평균 위치를 잇는다.
+// 같은 셀 안에서 끝나는 링크는 화면에서 점에 가까우므로 버린다.
+export function bundleSegments(segments: BundleSegment[], cellSize: number): Bundle[] {
+  const groups = new Map<
+    string,
+    { sx: number; sy: number; tx: number; ty: number; count: number }
+  >();
+
+  for (const seg of segments) {
+    let a = [Math.floor(seg.x1 / cellSize), Math.floor(seg.y1 / cellSize)];
+    let b = [Math.floor(seg.x2 / cellSize), Math.floor(seg.y2 / cellSize)];
+    let [x1, y1, x2, y2] = [seg.x1, seg.y1, seg.x2, seg.y2];
+    if (a[0] === b[0] && a[1] === b[1]) continue;
+
+    // 방향과 무관하게 같은 셀 쌍이 되도록 정렬
+    if (a[0] > b[0] || (a[0] === b[0] && a[1] > b[1])) {
+      [a, b] = [b, a];
+      [x1, y1, x2, y2] = [x2, y2, x1, y1];
+    }
+
+    const key = `${a[0]},${a[1]}>${b[0]},${b[1]}`;
+    const group = groups.get(key);
+    if (group) {
+      group.sx += x1;
+      group.sy += y1;
+      group.tx += x2;
+      group.ty += y2;
+      group.count++;
+    } else {
+      groups.set(key, { sx: x1, sy: y1, tx: x2, ty: y2, count: 1 });
+    }
+  }
+
+  return [...groups.values()].map((g) => ({
+    x1: g.sx / g.count,
+    y1: g.sy / g.count,
+    x2: g.tx / g.count,
+    y2: g.ty / g.count,
+    count: g.count,
+  }));
+}
+
+interface DragSubject {
+  node: SimNode;
+  x: number;
+  y: number;
+}
+
+export interface CanvasGraphOptions {
+  canvas: HTMLCanvasElement;
+  width: number;
+  height: number;
+  nodes: SimNode[];
+  links: SimLink[];
+  onHover: (node: SimNode | null, event: MouseEvent) => void;
+  onNodeClick: (node: SimNode) => void;
+  onBackgroundClick: () => void;
+  onDragStart: (node: SimNode) => void;
+  onDrag: (node: SimNode, x: number, y: number) => void;
+  onDragEnd: (node: SimNode) => void;
+}
+
+export interface CanvasGraph {
+  // 좌표가 바뀌었을 때 호출 — 다음 프레임에 한 번 그린다
+  render: () => void;
+  setVisualState: (state: VisualState) => void;
+  zoomTo: (transform: d3.ZoomTransform, duration: number) => void;
+  destroy: () => void;
+}
+
+export function mountCanvasGraph(options: CanvasGraphOptions): CanvasGraph {
+  const { canvas, width, height, nodes, links } = options;
+  const context = canvas.getContext("2d");
+  if (!context) throw new Error("Canvas 2D context is not available");
+  const ctx = context;
+
+  const dpr = window.devicePixelRatio || 1;
+  canvas.width = Math.round(width * dpr);
+  canvas.height = Math.round(height * dpr);
+  canvas.style.width = `${width}px`;
+  canvas.style.height = `${height}px`;
+
+  let transform = d3.zoomIdentity;
+  let visualState: VisualState | null = null;
+  let frame: number | null = null;
+  // 좌표나 배율(LOD)이 바뀌면 다시 만든다
+  let tree: d3.Quadtree<SimNode> | null = null;
+  const maxNodeSize = d3.max(nodes, (n) => n.size) ?? 0;
+  // 캔버스 font에는 CSS var()를 쓸 수 없으므로 next/font 변수 값을 한 번 읽어 둔다
+  const paperlogy = getComputedStyle(canvas).getPropertyValue("--font-paperlogy").trim();
+  const labelFontFamily = [paperlogy, "'Pretendard'", "sans-serif"].filter(Boolean).join(", ");
+
+  const isShown = (n: SimNode) =>
+    isNodeShownAtZoom(n.type, transform.k) ||
+    n.id === visualState?.selectedId ||
+    (visualState?.neighbors.has(n.id) ?? false);
+
+  function hitTest(screenX: number, screenY: number): SimNode | null {
+    if (!tree) {
+      tree = d3
+        .quadtree<SimNode>()
+        .x((n) => n.x ?? 0)
+        .y((n) => n.y ?? 0)
+        .addAll(nodes.filter(isShown));
+    }
+    const [x, y] = transform.invert([screenX, screenY]);
+    // 가장 가까운 노드를 찾고 실제 반지름 안인지 확인 (작게 보일 때는 몇 px 여유)
+    const slack = 3 / transform.k;
+    const node = tree.find(x, y, maxNodeSize + slack);
+    if (!node) return null;
+    const distance = Math.hypot((node.x ?? 0) - x, (node.y ?? 0) - y);
+    return distance <= node.size + slack ? node : null;
+  }
+
+  function linkStyle(link: SimLink) {
+    const state = visualState;
+    const s = nodeId(link.source);
+    const t = nodeId(link.target);
+    const bothVisible = !state || (state.visible.has(s) && state.visible.has(t));
+    const connectsSelected =
+      !!state?.selectedId && (s === state.selectedId || t === state.selectedId);
+
+    if (!bothVisible) {
+      return { color: origLinkColor(link), alpha: 0.04, width: origLinkWidth(link), highlight: false };
+    }
+    if (connectsSelected) {
+      return { color: SELECTED_STROKE, alpha: 0.8, width: 2.5, highlight: true };
+    }
+    const widen = state?.hasDimming && !state.selectedId ? 0.5 : 0;
+    return {
+      color: origLinkColor(link),
+      alpha: origLinkOpacity(link),
+      width: origLinkWidth(link) + widen,
+      highlight: false,
+    };
+  }
+
+  function drawLinks(shown: Set<string>, bundled: boolean) {
+    // 같은 스타일끼리 한 path로 모아 stroke 호출 수를 줄인다
+    const batches = new Map<string, { style: ReturnType<typeof linkStyle>; dash: number[] | null; path: Path2D }>();
+    const bundleInputs: BundleSegment[] = [];
+
+    for (const link of links) {
+      const source = link.source as SimNode;
+      const target = link.target as SimNode;
+      if (!shown.has(source.id) || !shown.has(target.id)) continue;
+
+      const style = linkStyle(link);
+      const segment = {
+        x1: source.x ?? 0,
+        y1: source.y ?? 0,
+        x2: target.x ?? 0,
+        y2: target.y ?? 0,
+      };
+
+      // 묶음 모드에서도 선택 노드의 링크는 그대로 그린다
+      if (bundled && !style.highlight) {
+        if (style.alpha > 0.04) bundleInputs.push(segment);
+        continue;
+      }
+
+      const dash = linkDash(link);
+      const key = `${style.color}|${style.alpha}|${style.width}|${dash?.join(",") ?? ""}`;
+      let batch = batches.get(key);
+      if (!batch) {
+        batch = { style, dash, path: new Path2D() };
+        batches.set(key, batch);
+      }
+      batch.path.moveTo(segment.x1, segment.y1);
+      batch.path.lineTo(segment.x2, segment.y2);
+    }
+
+    if (bundled) {
+      ctx.strokeStyle = BUNDLE_COLOR;
+      ctx.setLineDash([]);
+      for (const bundle of bundleSegments(bundleInputs, BUNDLE_CELL_PX / transform.k)) {
+        ctx.globalAlpha = Math.min(0.15 + bundle.count * 0.03, 0.5);
+        ctx.lineWidth = (1 + Math.log2(bundle.count)) / transform.k;
+        ctx.beginPath();
+        ctx.moveTo(bundle.x1, bundle.y1);
+        ctx.lineTo(bundle.x2, bundle.y2);
+        ctx.stroke();
+      }
+    }
+
+    // 강조 링크가 위에 오도록 마지막에 그린다
+    const ordered = [...batches.values()].sort(
+      (a, b) => Number(a.style.highlight) - Number(b.style.highlight)
+    );
+    for (const { style, dash, path } of ordered) {
+      ctx.globalAlpha = style.alpha;
+      ctx.strokeStyle = style.color;
+      ctx.lineWidth = style.width;
+      ctx.setLineDash(dash ?? []);
+      ctx.stroke(path);
+    }
+    ctx.setLineDash([]);
+  }
+
+  function drawNode(node: SimNode) {
+    const state = visualState;
+    const isVisible = !state || state.visible.has(node.id);
+    const isSelected = node.id === state?.selectedId;
+    const isNeighbor = !isSelected && (state?.neighbors.has(node.id) ?? false);
+    const x = node.x ?? 0;
+    const y = node.y ?? 0;
+
+    ctx.beginPath();
+    ctx.arc(x, y, node.size, 0, Math.PI * 2);
+
+    if (isSelected || isNeighbor) {
+      ctx.shadowColor = NODE_COLORS[node.type];
+      ctx.shadowBlur = 12;
+    }
+
+    ctx.globalAlpha = isVisible ? 1 : 0.08;
+    ctx.fillStyle = nodeFill(node.type);
+    ctx.fill();
+
+    if (isSelected) {
+      ctx.globalAlpha = 1;
+      ctx.strokeStyle = SELECTED_STROKE;
+      ctx.lineWidth = 3.5;
+    } else if (isNeighbor) {
+      ctx.globalAlpha = 1;
+      ctx.strokeStyle = NODE_COLORS[node.type];
+      ctx.lineWidth = 2;
+    } else {
+      ctx.globalAlpha = isVisible ? nodeStrokeOpacity(node.type) : 0.1;
+      ctx.strokeStyle = NODE_COLORS[node.type];
+      ctx.lineWidth = nodeStrokeWidth(node.type);
+    }
+    ctx.setLineDash(node.type === "paper" ? [3, 2] : []);
+    ctx.stroke();
+    ctx.shadowBlur = 0;
+  }
+
+  function drawLabel(node: SimNode) {
+    const isVisible = !visualState || visualState.visible.has(node.id);
+    const size = labelFontSize(node.type);
+    const x = node.x ?? 0;
+    const y = (node.y ?? 0) + node.size + 14;
+
+    ctx.globalAlpha = isVisible ? 1 : 0.05;
+    ctx.font = `500 ${size}px ${labelFontFamily}`;
+    ctx.strokeText(node.label, x, y);
+    ctx.fillText(node.label, x, y);
+  }
+
+  function draw() {
+    frame = null;
+    tree = null;
+
+    ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+    ctx.translate(transform.x, transform.y);
+    ctx.scale(transform.k, transform.k);
+
+    // 화면 밖 노드는 건너뛴다 (라벨 여유분 포함)
+    const [minX, minY] = transform.invert([-40, -40]);
+    const [maxX, maxY] = transform.invert([width + 40, height + 40]);
+    const inView = (n: SimNode) => {
+      const x = n.x ?? 0;
+      const y = n.y ?? 0;
+      return x + n.size >= minX && x - n.size <= maxX && y + n.size >= minY && y - n.size <= maxY;
+    };
+
+    const shownNodes = nodes.filter(isShown);
+    const shown = new Set(shownNodes.map((n) => n.id));
+    const visibleNodes = shownNodes.filter(inView);
+
+    drawLinks(shown, transform.k < BUNDLE_MAX_ZOOM);
+
+    for (const node of visibleNodes) drawNode(node);
+
+    ctx.textAlign = "center";
+    ctx.textBaseline = "alphabetic";
+    ctx.fillStyle = LABEL_COLOR;
+    ctx.strokeStyle = LABEL_OUTLINE;
+    ctx.lineWidth = 3;
+    ctx.lineJoin = "round";
+    for (const node of visibleNodes) {
+      const highlighted =
+        node.id === visualState?.selectedId || visualState?.neighbors.has(node.id);
+      if (highlighted || isLabelShownAtZoom(node.type, transform.k)) drawLabel(node);
+    }
+    ctx.globalAlpha = 1;
+  }
+
+  function render() {
+    if (frame === null) frame = requestAnimationFrame(draw);
+  }
+
+  // ─── Interaction ───
+  // drag를 zoom보다 먼저 등록: 노드 위에서 누르면 drag가 이벤트를 가져가고, 빈 곳이면 팬/줌
+  const selection = d3.select(canvas);
+  let dragMoved = false;
+
+  // drag 좌표는 화면 기준으로 받아서 현재 배율로 역변환한다
+  const drag = d3
+    .drag<HTMLCanvasElement, unknown, DragSubject | null>()
+    .subject((event) => {
+      const node = hitTest(event.x, event.y);
+      return node
+        ? { node, x: transform.applyX(node.x ?? 0), y: transform.applyY(node.y ?? 0) }
+        : null;
+    })
+    .on("start", (event) => {
+      dragMoved = false;
+      options.onDragStart(event.subject!.node);
+    })
+    .on("drag", (event) => {
+      dragMoved = true;
+      const [x, y] = transform.invert([event.x, event.y]);
+      options.onDrag(event.subject!.node, x, y);
+    })
+    .on("end", (event) => {
+      const { node } = event.subject!;
+      options.onDragEnd(node);
+      if (!dragMoved) options.onNodeClick(node);
+    });
+
+  const zoom = d3
+    .zoom<HTMLCanvasElement, unknown>()
+    .scaleExtent([0.1, 5])
+    .on("zoom", (event) => {
+      transform = event.transform;
+      render();
+    });
+
+  selection
+    .call(drag)
+    .call(zoom)
+    .on("mousemove.hover", (event: MouseEvent) => {
+      const [x, y] = d3.pointer(event, canvas);
+      const node = hitTest(x, y);
+      canvas.style.cursor = node ? "pointer" : "default";
+      options.onHover(node, event);
+    })
+    .on("mouseleave.hover", (event: MouseEvent) => options.onHover(null, event))
+    .on("click.background", (event: MouseEvent) => {
+      const [x, y] = d3.pointer(event, canvas);
+      if (!hitTest(x, y)) options.onBackgroundClick();
+    });
+
+  render();
+
+  return {
+    render,
+    setVisualState(state) {
+      visualState = state;
+      render();
+    },
+    zoomTo(target, duration) {
+      selection.transition().duration(duration).call(zoom.transform, target);
+    },
+    destroy() {
+      if (frame !== null) cancelAnimationFrame(frame);
+      selection.interrupt();
+      selection.on(".drag", null).on(".zoom", null).on(".hover", null).on(".background", null);
+    },
+  };
+}
@@ -0,0 +1,95 @@
+import * as d3 from "d3";
+import type { MapLink, NodeType } from "./research-map-data";
+
+// ============================================
+// Research Map 힘 기반 레이아웃 (Web Worker 공용)
+// ============================================
+// 시뮬레이션은 force-layout.worker.ts에서 돌고, 메인 스레드와는 인덱스 기반 메시지만 주고받는다.
+// 좌표는 노드 순서대로 [x0, y0, x1, y1, ...] Float32Array로 보내고 버퍼를 transfer한다.
+
+export interface LayoutNode {
+  type: NodeType;
+  size: number;
+  x?: number;
+  y?: number;
+}
+
+export interface LayoutLink {
+  source: number;
+  target: number;
+  type: MapLink["type"];
+}
+
+export type LayoutRequest =
+  | {
+      type: "start";
+      nodes: LayoutNode[];
+      links: LayoutLink[];
+      width: number;
+      height: number;
+      // 캐시된 좌표가 있으면 시뮬레이션 없이 그대로 쓴다 (드래그 시에만 다시 움직임)
+      positions: Float32Array | null;
+    }
+  | { type: "dragstart"; index: number; x: number; y: number }
+  | { type: "drag"; index: number; x: number; y: number }
+  | { type: "dragend"; index: number };
+
+export type LayoutResponse =
+  | { type: "tick"; positions: Float32Array }
+  // 수렴 완료 — 이 좌표를 캐시에 저장한다
+  | { type: "end"; positions: Float32Array };
+
+type SimNode = LayoutNode & d3.SimulationNodeDatum;
+type SimLink = d3.SimulationLinkDatum<SimNode> & { type: LayoutLink["type"] };
+
+function linkDistance(link: SimLink): number {
+  if (link.type === "kk") return 60;
+  if (link.type === "collab") return 70;
+  const s = link.source as SimNode;
+  const t = link.target as SimNode;
+  if (s.type === "paper" || t.type === "paper") return 50;
+  if (s.type === "axis" || t.type === "axis") return 200;
+  if (s.type === "student" !== (t.type === "student")) return 100;
+  return 130;
+}
+
+function chargeStrength(node: SimNode): number {
+  if (node.type === "axis") return -900;
+  if (node.type === "paper") return -150;
+  if (node.type === "student" || node.type === "project" || node.type === "conference") {
+    return -400;
+  }
+  return -200;
+}
+
+// 시뮬레이션 타이머는 만들지 않는다 (stop 상태). 호출 측에서 tick()을 직접 돌린다.
+export function createForceSimulation(
+  nodes: LayoutNode[],
+  links: LayoutLink[],
+  width: number,
+  height: number
+) {
+  const simNodes: SimNode[] = nodes.map((n) => ({ ...n }));
+  const simLinks: SimLink[] = links.map((l) => ({ ...l }));
+
+  const simulation = d3
+    .forceSimulation<SimNode>(simNodes)
+    .stop()
+    .force("link", d3.forceLink<SimNode, SimLink>(simLinks).distance(linkDistance))
+    .force("charge", d3.forceManyBody<SimNode>().strength(chargeStrength))
+    .force("center", d3.forceCenter(width / 2, height / 2))
+    .force("collision", d3.forceCollide<SimNode>().radius((d) => d.size + 10))
+    .force("x", d3.forceX(width / 2).strength(0.02))
+    .force("y", d3.forceY(height / 2).strength(0.02));
+
+  return { simulation, nodes: simNodes };
+}
+
+export function readPositions(nodes: { x?: number; y?: number }[]): Float32Array {
+  const positions = new Float32Array(nodes.length * 2);
+  nodes.forEach((n, i) => {
+    positions[i * 2] = n.x ?? 0;
+    positions[i * 2 + 1] = n.y ?? 0;
+  });
+  return positions;
+}
@@ -0,0 +1,103 @@
+import {
+  createForceSimulation,
+  readPositions,
+  type LayoutRequest,
+  type LayoutResponse,
+} from "./force-layout";
+
+// ============================================
+// Research Map 레이아웃 Web Worker
+// ============================================
+// 메인 스레드에서 d3 타이머로 돌던 시뮬레이션을 옮겼다.
+// 프레임(약 16ms)마다 시간 예산만큼 tick을 돌리고 좌표를 한 번 보낸다.
+
+// tsconfig는 dom lib만 쓰므로 워커 전역을 Worker 인터페이스로 본다
+const ctx = self as unknown as Worker;
+
+const FRAME_MS = 16;
+const TICK_BUDGET_MS = 8;
+
+let state: ReturnType<typeof createForceSimulation> | null = null;
+let timer: ReturnType<typeof setTimeout> | null = null;
+
+function post(message: LayoutResponse) {
+  ctx.postMessage(message, [message.positions.buffer]);
+}
+
+function isSettled() {
+  if (!state) return true;
+  const { simulation } = state;
+  return simulation.alphaTarget() === 0 && simulation.alpha() < simulation.alphaMin();
+}
+
+function step() {
+  timer = null;
+  if (!state) return;
+
+  const started = performance.now();
+  do {
+    state.simulation.tick();
+  } while (!isSettled() && performance.now() - started < TICK_BUDGET_MS);
+
+  const positions = readPositions(state.nodes);
+  if (isSettled()) {
+    post({ type: "end", positions });
+    return;
+  }
+
+  post({ type: "tick", positions });
+  timer = setTimeout(step, FRAME_MS);
+}
+
+function run() {
+  if (timer === null) timer = setTimeout(step, 0);
+}
+
+ctx.onmessage = (event: MessageEvent<LayoutRequest>) => {
+  const message = event.data;
+
+  switch (message.type) {
+    case "start": {
+      if (timer !== null) clearTimeout(timer);
+      timer = null;
+
+      const { positions } = message;
+      const nodes = positions
+        ? message.nodes.map((n, i) => ({ ...n, x: positions[i * 2], y: positions[i * 2 + 1] }))
+        : message.nodes;
+
+      state = createForceSimulation(nodes, message.links, message.width, message.height);
+      if (positions) {
+        // 캐시된 수렴 좌표: 드래그 전까지 움직이지 않는다
+        state.simulation.alpha(0);
+      } else {
+        run();
+      }
+      break;
+    }
+    case "dragstart": {
+      if (!state) return;
+      const node = state.nodes[message.index];
+      state.simulation.alphaTarget(0.3).alpha(Math.max(state.simulation.alpha(), 0.3));
+      node.fx = message.x;
+      node.fy = message.y;
+      run();
+      break;
+    }
+    case "drag": {
+      if (!state) return;
+      const node = state.nodes[message.index];
+      node.fx = message.x;
+      node.fy = message.y;
+      break;
+    }
+    case "dragend": {
+      if (!state) return;
+      const node = state.nodes[message.index];
+      state.simulation.alphaTarget(0);
+      node.fx = null;
+      node.fy = null;
+      break;
+    }
+  }
+};
@@ -0,0 +1,176 @@
+import type { MapLink, MapNode, NodeType } from "./research-map-data";
+import { NODE_COLORS } from "./research-map-data";
+
+// ============================================
+// Research Map 그래프 모델 (SVG/Canvas 렌더러 공용)
+// ============================================
+// 보기 모드·노드 타입 필터·선택 상태를 계산하고, 두 렌더러가 같은 기본 스타일을 쓰도록
+// 노드/링크 스타일 값을 한곳에 둔다.
+
+// ─── Graph types (positions come from the layout worker) ───
+export interface SimNode extends MapNode {
+  x?: number;
+  y?: number;
+}
+
+export interface SimLink extends Omit<MapLink, "source" | "target"> {
+  source: SimNode | string;
+  target: SimNode | string;
+}
+
+export type ViewMode = "all" | "urban" | "rural" | "bridge" | "conf";
+
+// ─── Helper: get id from node or string ───
+export function nodeId(n: SimNode | string): string {
+  return typeof n === "object" ? n.id : n;
+}
+
+// ─── Helper: compute view-mode visible node set ───
+export function computeViewModeVisible(
+  viewMode: ViewMode,
+  nodes: SimNode[],
+  links: SimLink[]
+): Set<string> {
+  if (viewMode === "all") return new Set(nodes.map((n) => n.id));
+
+  if (viewMode === "urban" || viewMode === "rural") {
+    // Axis node + students in this axis
+    const seeds = new Set<string>([viewMode]);
+    for (const n of nodes) {
+      if (n.axes?.includes(viewMode)) seeds.add(n.id);
+    }
+    // Expand 1-hop from seeds (don't cascade)
+    const vis = new Set(seeds);
+    for (const l of links) {
+      const s = nodeId(l.source);
+      const t = nodeId(l.target);
+      if (seeds.has(s)) vis.add(t);
+      if (seeds.has(t)) vis.add(s);
+    }
+    return vis;
+  }
+
+  if (viewMode === "conf") {
+    // Conference nodes + all direct connections
+    const seeds = new Set<string>();
+    for (const n of nodes) {
+      if (n.type === "conference") seeds.add(n.id);
+    }
+    const vis = new Set(seeds);
+    for (const l of links) {
+      const s = nodeId(l.source);
+      const t = nodeId(l.target);
+      if (seeds.has(s)) vis.add(t);
+      if (seeds.has(t)) vis.add(s);
+    }
+    return vis;
+  }
+
+  if (viewMode === "bridge") {
+    // Method + tech nodes + students connected to them
+    const seeds = new Set<string>();
+    for (const n of nodes) {
+      if (n.type === "method" || n.type === "tech") seeds.add(n.id);
+    }
+    const vis = new Set(seeds);
+    for (const l of links) {
+      const s = nodeId(l.source);
+      const t = nodeId(l.target);
+      if (seeds.has(s)) {
+        const tn = nodes.find((x) => x.id === t);
+        if (tn && tn.type === "student") vis.add(t);
+      }
+      if (seeds.has(t)) {
+        const sn = nodes.find((x) => x.id === s);
+        if (sn && sn.type === "student") vis.add(s);
+      }
+    }
+    return vis;
+  }
+
+  return new Set(nodes.map((n) => n.id));
+}
+
+// ─── Helper: original link properties ───
+export function origLinkOpacity(d: SimLink): number {
+  return d.type === "kk" ? 0.06 : d.type === "collab" ? 0.4 : 0.15;
+}
+export function origLinkWidth(d: SimLink): number {
+  return d.type === "kk" ? 1 : d.type === "collab" ? 2 : 1.2;
+}
+
+export function origLinkColor(d: SimLink): string {
+  if (d.type === "kk") return "#ffffff";
+  if (d.type === "collab") return NODE_COLORS.student;
+  return typeof d.target === "object" ? NODE_COLORS[d.target.type] : "#1a2040";
+}
+export function linkDash(d: SimLink): number[] | null {
+  return d.type === "kk" ? [2, 4] : d.type === "collab" ? [5, 3] : null;
+}
+
+// ─── Helper: original node properties ───
+export function nodeFill(type: NodeType): string {
+  if (type === "axis") return NODE_COLORS[type] + "30";
+  if (type === "paper") return NODE_COLORS[type] + "88";
+  return NODE_COLORS[type] + "cc";
+}
+export function nodeStrokeWidth(type: NodeType): number {
+  return type === "axis" ? 2 : 1.5;
+}
+export function nodeStrokeOpacity(type: NodeType): number {
+  return type === "axis" ? 0.5 : type === "paper" ? 0.5 : 0.7;
+}
+export function labelFontSize(type: NodeType): number {
+  return type === "student" ? 11 : type === "axis" ? 12 : 9.5;
+}
+
+// ─── Unified visual state ───
+export interface VisualState {
+  // 보기 모드 + 노드 타입 필터를 통과한 노드 (나머지는 흐리게)
+  visible: Set<string>;
+  selectedId: string | null;
+  // 선택 노드 + 1-hop 이웃 — 강조에만 쓰고 표시 여부에는 영향 없음
+  neighbors: Set<string>;
+  hasDimming: boolean;
+}
+
+export function computeVisualState(
+  nodes: SimNode[],
+  links: SimLink[],
+  viewMode: ViewMode,
+  disabledTypes: Set<NodeType>,
+  selectedNodeId: string | null
+): VisualState {
+  // Layer 1: View Mode
+  const viewVisible = computeViewModeVisible(viewMode, nodes, links);
+
+  // Layer 2: Node Type filter (remove disabled types from visible set)
+  const typeVisible = new Set<string>();
+  for (const n of nodes) {
+    if (viewVisible.has(n.id) && !disabledTypes.has(n.type)) typeVisible.add(n.id);
+  }
+
+  // Layer 3: Node selection — visibility stays as typeVisible, highlight is separate
+  const effectiveSelectedId =
+    selectedNodeId && typeVisible.has(selectedNodeId) ? selectedNodeId : null;
+
+  // Neighborhood set (selected + 1-hop) — used ONLY for highlight, not for visibility
+  const neighborSet = new Set<string>();
+  if (effectiveSelectedId) {
+    neighborSet.add(effectiveSelectedId);
+    for (const l of links) {
+      const s = nodeId(l.source);
+      const t = nodeId(l.target);
+      if (s === effectiveSelectedId && typeVisible.has(t)) neighborSet.add(t);
+      if (t === effectiveSelectedId && typeVisible.has(s)) neighborSet.add(s);
+    }
+  }
+
+  return {
+    // typeVisible always (no dimming on selection)
+    visible: typeVisible,
+    selectedId: effectiveSelectedId,
+    neighbors: neighborSet,
+    hasDimming: viewMode !== "all" || disabledTypes.size > 0,
+  };
+}
@@ -0,0 +1,48 @@
+import { describe, it, expect, beforeEach } from "vitest";
+import { computeLayoutVersion, loadLayout, saveLayout } from "./layout-cache";
+
+const nodes = [
+  { id: "a", type: "student", size: 10 },
+  { id: "b", type: "theme", size: 8 },
+];
+const links = [{ source: "a", target: "b", type: "link" }];
+
+describe("computeLayoutVersion", () => {
+  it("should be stable for the same graph", () => {
+    expect(computeLayoutVersion(nodes, links)).toBe(computeLayoutVersion(nodes, links));
+  });
+
+  it("should change when nodes or links change", () => {
+    const base = computeLayoutVersion(nodes, links);
+
+    expect(computeLayoutVersion([...nodes, { id: "c", type: "paper", size: 12 }], links)).not.toBe(base);
+    expect(computeLayoutVersion(nodes, [{ source: "b", target: "a", type: "link" }])).not.toBe(base);
+    expect(computeLayoutVersion([nodes[0], { ...nodes[1], size: 9 }], links)).not.toBe(base);
+  });
+});
+
+describe("layout cache", () => {
+  beforeEach(() => localStorage.clear());
+
+  it("should restore positions relative to the current viewport center", () => {
+    saveLayout("v1", new Float32Array([110, 40, 90, 60]), 200, 100);
+
+    expect(Array.from(loadLayout("v1", 2, 400, 300) ?? [])).toEqual([210, 140, 190, 160]);
+  });
+
+  it("should miss for another version or node count", () => {
+    saveLayout("v1", new Float32Array([0, 0, 1, 1]), 100, 100);
+
+    expect(loadLayout("v2", 2, 100, 100)).toBeNull();
+    expect(loadLayout("v1", 3, 100, 100)).toBeNull();
+  });
+
+  it("should keep only the most recent versions", () => {
+    for (let i = 0; i < 6; i++) {
+      saveLayout(`v${i}`, new Float32Array([i, i]), 0, 0);
+    }
+
+    expect(loadLayout("v0", 1, 0, 0)).toBeNull();
+    expect(loadLayout("v5", 1, 0, 0)).not.toBeNull();
+  });
+});
@@ -0,0 +1,92 @@
+// ============================================
+// Research Map 수렴 레이아웃 캐시 (localStorage)
+// ============================================
+// 노드/링크 구성(정적 데이터 + 논문 노드)이 같으면 지난번 수렴 좌표를 그대로 써서
+// 재방문·테마 전환 시 시뮬레이션 없이 바로 그린다.
+// 보기 모드(all/urban/...)는 표시만 바꾸고 레이아웃에는 영향이 없으므로 키에 넣지 않는다.
+// 좌표는 화면 중심 기준으로 저장해 창 크기가 달라도 가운데에 놓인다.
+
+const STORAGE_KEY = "sdc-lab:research-map-layout";
+// 논문 표시 on/off, 데이터 갱신 직후 등 최근 버전 몇 개만 유지
+const MAX_ENTRIES = 4;
+
+interface LayoutEntry {
+  version: string;
+  // 중심 기준 좌표 [dx0, dy0, dx1, dy1, ...]
+  offsets: number[];
+}
+
+interface VersionNode {
+  id: string;
+  type: string;
+  size: number;
+}
+
+interface VersionLink {
+  source: string;
+  target: string;
+  type: string;
+}
+
+// FNV-1a 32bit — 구성이 바뀌었는지만 판별하면 되므로 충분하다
+function hashString(value: string): string {
+  let hash = 0x811c9dc5;
+  for (let i = 0; i < value.length; i++) {
+    hash ^= value.charCodeAt(i);
+    hash = Math.imul(hash, 0x01000193);
+  }
+  return (hash >>> 0).toString(36);
+}
+
+export function computeLayoutVersion(nodes: VersionNode[], links: VersionLink[]): string {
+  const nodePart = nodes.map((n) => `${n.id}:${n.type}:${n.size}`).join("|");
+  const linkPart = links.map((l) => `${l.source}>${l.target}:${l.type}`).join("|");
+  return `${nodes.length}.${links.length}.${hashString(`${nodePart}#${linkPart}`)}`;
+}
+
+function readEntries(): LayoutEntry[] {
+  try {
+    const raw = localStorage.getItem(STORAGE_KEY);
+    return raw ? (JSON.parse(raw) as LayoutEntry[]) : [];
+  } catch {
+    return [];
+  }
+}
+
+export function loadLayout(
+  version: string,
+  nodeCount: number,
+  width: number,
+  height: number
+): Float32Array | null {
+  const entry = readEntries().find((e) => e.version === version);
+  if (!entry || entry.offsets.length !== nodeCount * 2) return null;
+
+  const positions = new Float32Array(entry.offsets.length);
+  for (let i = 0; i < entry.offsets.length; i += 2) {
+    positions[i] = entry.offsets[i] + width / 2;
+    positions[i + 1] = entry.offsets[i + 1] + height / 2;
+  }
+  return positions;
+}
+
+export function saveLayout(
+  version: string,
+  positions: Float32Array,
+  width: number,
+  height: number
+) {
+  const offsets = Array.from(positions, (value, i) =>
+    Math.round((value - (i % 2 === 0 ? width : height) / 2) * 10) / 10
+  );
+  const entries = [
+    { version, offsets },
+    ...readEntries().filter((e) => e.version !== version),
+  ].slice(0, MAX_ENTRIES);
+
+  try {
+    localStorage.setItem(STORAGE_KEY, JSON.stringify(entries));
+  } catch {
+    // 저장 공간이 없으면 다음 방문에 다시 계산한다.
+  }
+}
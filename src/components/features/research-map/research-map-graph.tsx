@@ -11,28 +11,30 @@ import {
   LINKS,
   NODE_COLORS,
   NODE_LABELS,
-  type MapNode,
-  type MapLink,
   type NodeType,
   type StudentProfile,
 } from "./research-map-data";
+import {
+  computeVisualState,
+  labelFontSize,
+  linkDash,
+  nodeFill,
+  nodeId,
+  nodeStrokeOpacity,
+  nodeStrokeWidth,
+  origLinkColor,
+  origLinkOpacity,
+  origLinkWidth,
+  type SimLink,
+  type SimNode,
+  type ViewMode,
+  type VisualState,
+} from "./graph-model";
+import { mountCanvasGraph } from "./canvas-graph";
+import type { LayoutRequest, LayoutResponse } from "./force-layout";
+import { computeLayoutVersion, loadLayout, saveLayout } from "./layout-cache";
 import { usePapers } from "@/hooks/use-papers";
 
-// ─── Types for D3 simulation ───
-interface SimNode extends MapNode {
-  x?: number;
-  y?: number;
-  fx?: number | null;
-  fy?: number | null;
-}
-
-interface SimLink extends Omit<MapLink, "source" | "target"> {
-  source: SimNode | string;
-  target: SimNode | string;
-}
-
-type ViewMode = "all" | "urban" | "rural" | "bridge" | "conf";
-
 const VIEW_OPTIONS: { mode: ViewMode; label: string }[] = [
   { mode: "all", label: "All Connections" },
   { mode: "urban", label: "Urban Context (도시)" },
@@ -63,9 +65,12 @@ const LEGEND_ITEMS: { type: NodeType; label: string }[] = [
   { type: "paper", label: "논문 (Paper)" },
 ];
 
-// ─── Helper: get id from node or string ───
-function nodeId(n: SimNode | string): string {
-  return typeof n === "object" ? n.id : n;
+// ─── Helper: copy worker positions onto nodes ───
+function applyPositions(nodes: SimNode[], positions: Float32Array) {
+  nodes.forEach((n, i) => {
+    n.x = positions[i * 2];
+    n.y = positions[i * 2 + 1];
+  });
 }
 
 // ─── Helper: get connections for a node ───
@@ -95,122 +100,19 @@ function getConnections(
     .filter(Boolean) as (SimNode & { linkType: string })[];
 }
 
-// ─── Helper: compute view-mode visible node set ───
-function computeViewModeVisible(
-  viewMode: ViewMode,
-  nodes: SimNode[],
-  links: SimLink[]
-): Set<string> {
-  if (viewMode === "all") return new Set(nodes.map((n) => n.id));
-
-  if (viewMode === "urban" || viewMode === "rural") {
-    // Axis node + students in this axis
-    const seeds = new Set<string>([viewMode]);
-    for (const n of nodes) {
-      if (n.axes?.includes(viewMode)) seeds.add(n.id);
-    }
-    // Expand 1-hop from seeds (don't cascade)
-    const vis = new Set(seeds);
-    for (const l of links) {
-      const s = nodeId(l.source);
-      const t = nodeId(l.target);
-      if (seeds.has(s)) vis.add(t);
-      if (seeds.has(t)) vis.add(s);
-    }
-    return vis;
-  }
-
-  if (viewMode === "conf") {
-    // Conference nodes + all direct connections
-    const seeds = new Set<string>();
-    for (const n of nodes) {
-      if (n.type === "conference") seeds.add(n.id);
-    }
-    const vis = new Set(seeds);
-    for (const l of links) {
-      const s = nodeId(l.source);
-      const t = nodeId(l.target);
-      if (seeds.has(s)) vis.add(t);
-      if (seeds.has(t)) vis.add(s);
-    }
-    return vis;
-  }
-
-  if (viewMode === "bridge") {
-    // Method + tech nodes + students connected to them
-    const seeds = new Set<string>();
-    for (const n of nodes) {
-      if (n.type === "method" || n.type === "tech") seeds.add(n.id);
-    }
-    const vis = new Set(seeds);
-    for (const l of links) {
-      const s = nodeId(l.source);
-      const t = nodeId(l.target);
-      if (seeds.has(s)) {
-        const tn = nodes.find((x) => x.id === t);
-        if (tn && tn.type === "student") vis.add(t);
-      }
-      if (seeds.has(t)) {
-        const sn = nodes.find((x) => x.id === s);
-        if (sn && sn.type === "student") vis.add(s);
-      }
-    }
-    return vis;
-  }
-
-  return new Set(nodes.map((n) => n.id));
-}
-
-// ─── Helper: original link properties ───
-function origLinkOpacity(d: SimLink): number {
-  return d.type === "kk" ? 0.06 : d.type === "collab" ? 0.4 : 0.15;
-}
-function origLinkWidth(d: SimLink): number {
-  return d.type === "kk" ? 1 : d.type === "collab" ? 2 : 1.2;
-}
-
-// ─── Unified visual state ───
-function applyVisualState(
+// ─── Apply visual state to SVG elements ───
+function applySvgVisualState(
   nodeEls: d3.Selection<SVGGElement, SimNode, SVGGElement, unknown>,
   linkEls: d3.Selection<SVGLineElement, SimLink, SVGGElement, unknown>,
-  nodes: SimNode[],
-  links: SimLink[],
-  viewMode: ViewMode,
-  disabledTypes: Set<NodeType>,
-  selectedNodeId: string | null,
+  state: VisualState,
   duration: number = 300
 ) {
-  // Layer 1: View Mode
-  const viewVisible = computeViewModeVisible(viewMode, nodes, links);
-
-  // Layer 2: Node Type filter (remove disabled types from visible set)
-  const typeVisible = new Set<string>();
-  for (const id of viewVisible) {
-    const n = nodes.find((x) => x.id === id);
-    if (n && !disabledTypes.has(n.type)) typeVisible.add(id);
-  }
-
-  // Layer 3: Node selection — visibility stays as typeVisible, highlight is separate
-  const effectiveSelectedId =
-    selectedNodeId && typeVisible.has(selectedNodeId) ? selectedNodeId : null;
-
-  // Neighborhood set (selected + 1-hop) — used ONLY for highlight, not for visibility
-  const neighborSet = new Set<string>();
-  if (effectiveSelectedId) {
-    neighborSet.add(effectiveSelectedId);
-    for (const l of links) {
-      const s = nodeId(l.source);
-      const t = nodeId(l.target);
-      if (s === effectiveSelectedId && typeVisible.has(t)) neighborSet.add(t);
-      if (t === effectiveSelectedId && typeVisible.has(s)) neighborSet.add(s);
-    }
-  }
-
-  // finalNodeVisible = typeVisible always (no dimming on selection)
-  const finalNodeVisible = typeVisible;
-
-  const hasDimming =
-    viewMode !== "all" || disabledTypes.size > 0;
+  const {
+    visible: finalNodeVisible,
+    selectedId: effectiveSelectedId,
+    neighbors: neighborSet,
+    hasDimming,
+  } = state;
 
   // ── Apply to nodes ──
   nodeEls.each(function (d: SimNode) {
@@ -222,9 +124,8 @@ function applyVisualState(
 
     const circle = g.select("circle");
     const origStroke = NODE_COLORS[d.type];
-    const origStrokeWidth = d.type === "axis" ? 2 : 1.5;
-    const origStrokeOpacity =
-      d.type === "axis" ? 0.5 : d.type === "paper" ? 0.5 : 0.7;
+    const origStrokeWidth = nodeStrokeWidth(d.type);
+    const origStrokeOpacity = nodeStrokeOpacity(d.type);
 
     if (isSelected) {
       // Selected node: bright gold stroke + glow
@@ -275,18 +176,7 @@ function applyVisualState(
 
     const origOp = origLinkOpacity(d);
     const origW = origLinkWidth(d);
-
-    // Compute original stroke color for this link
-    const nodes_ = nodes;
-    let origColor: string;
-    if (d.type === "kk") {
-      origColor = "#ffffff";
-    } else if (d.type === "collab") {
-      origColor = NODE_COLORS.student;
-    } else {
-      const tn = nodes_.find((x) => x.id === nodeId(d.target));
-      origColor = tn ? NODE_COLORS[tn.type] : "#1a2040";
-    }
+    const origColor = origLinkColor(d);
 
     let targetOpacity: number;
     let targetWidth: number;
@@ -324,16 +214,183 @@ function applyVisualState(
   });
 }
 
+// ─── Renderer backends ───
+type RendererMode = "svg" | "canvas";
+
+// 노드 수가 이보다 많으면 기본으로 Canvas 렌더러를 쓴다 (논문 노드 포함)
+const CANVAS_NODE_THRESHOLD = 300;
+
+interface GraphViewCallbacks {
+  onHover: (node: SimNode | null, event: MouseEvent) => void;
+  onNodeClick: (node: SimNode) => void;
+  onBackgroundClick: () => void;
+  onDragStart: (node: SimNode) => void;
+  onDrag: (node: SimNode, x: number, y: number) => void;
+  onDragEnd: (node: SimNode) => void;
+}
+
+interface GraphView {
+  render: () => void;
+  setVisualState: (state: VisualState, duration?: number) => void;
+  zoomTo: (transform: d3.ZoomTransform, duration: number) => void;
+  destroy: () => void;
+}
+
+function mountSvgGraph(
+  svgEl: SVGSVGElement,
+  W: number,
+  H: number,
+  nodes: SimNode[],
+  links: SimLink[],
+  callbacks: GraphViewCallbacks
+): GraphView {
+  d3.select(svgEl).selectAll("*").remove();
+
+  const svg = d3.select(svgEl).attr("width", W).attr("height", H);
+  const g = svg.append("g");
+
+  // Zoom
+  const zoom = d3
+    .zoom<SVGSVGElement, unknown>()
+    .scaleExtent([0.1, 5])
+    .on("zoom", (e) => g.attr("transform", e.transform));
+  svg.call(zoom);
+
+  // Glow filters
+  const defs = svg.append("defs");
+  for (const [key] of Object.entries(NODE_COLORS)) {
+    const filter = defs.append("filter").attr("id", `glow-${key}`);
+    filter
+      .append("feGaussianBlur")
+      .attr("stdDeviation", 3)
+      .attr("result", "blur");
+    const merge = filter.append("feMerge");
+    merge.append("feMergeNode").attr("in", "blur");
+    merge.append("feMergeNode").attr("in", "SourceGraphic");
+  }
+
+  // Links
+  const linkG = g.append("g");
+  const linkEls = linkG
+    .selectAll<SVGLineElement, SimLink>("line")
+    .data(links)
+    .enter()
+    .append("line")
+    .attr("class", (d) =>
+      d.type === "kk" ? "rm-link rm-link-kk" : "rm-link"
+    )
+    .attr("stroke", (d) => origLinkColor(d))
+    .attr("stroke-width", (d) => origLinkWidth(d))
+    .attr("stroke-opacity", (d) => origLinkOpacity(d))
+    .attr("stroke-dasharray", (d) => linkDash(d)?.join(",") ?? null);
+
+  // Nodes
+  const nodeG = g.append("g");
+  let dragMoved = false;
+  const nodeEls = nodeG
+    .selectAll<SVGGElement, SimNode>("g")
+    .data(nodes)
+    .enter()
+    .append("g")
+    .attr("class", "rm-node")
+    .style("cursor", "pointer")
+    .call(
+      d3
+        .drag<SVGGElement, SimNode>()
+        .on("start", (e, d) => {
+          dragMoved = false;
+          callbacks.onDragStart(d);
+        })
+        .on("drag", (e, d) => {
+          dragMoved = true;
+          callbacks.onDrag(d, e.x, e.y);
+        })
+        .on("end", (e, d) => {
+          callbacks.onDragEnd(d);
+          if (!dragMoved) {
+            e.sourceEvent?.stopPropagation();
+            callbacks.onNodeClick(d);
+          }
+        })
+    );
+
+  nodeEls
+    .append("circle")
+    .attr("r", (d) => d.size)
+    .attr("fill", (d) => nodeFill(d.type))
+    .attr("stroke", (d) => NODE_COLORS[d.type])
+    .attr("stroke-width", (d) => nodeStrokeWidth(d.type))
+    .attr("stroke-opacity", (d) => nodeStrokeOpacity(d.type))
+    .attr("stroke-dasharray", (d) => (d.type === "paper" ? "3,2" : null));
+
+  nodeEls
+    .append("text")
+    .attr("dy", (d) => d.size + 14)
+    .attr("text-anchor", "middle")
+    .attr("font-size", (d) => `${labelFontSize(d.type)}px`)
+    .attr("fill", "#8898b8")
+    .attr("font-weight", 500)
+    .attr("font-family", "var(--font-paperlogy), 'Pretendard', sans-serif")
+    .style("pointer-events", "none")
+    .style("text-shadow", "0 0 8px #06081a, 0 0 16px #06081a")
+    .text((d) => d.label);
+
+  nodeEls
+    .on("mouseover", (e, d) => callbacks.onHover(d, e))
+    .on("mousemove", (e, d) => callbacks.onHover(d, e))
+    .on("mouseout", (e) => callbacks.onHover(null, e));
+
+  // Background click to clear selection
+  g.insert("rect", ":first-child")
+    .attr("width", W * 10)
+    .attr("height", H * 10)
+    .attr("x", -W * 5)
+    .attr("y", -H * 5)
+    .attr("fill", "transparent")
+    .style("cursor", "default")
+    .on("click", () => callbacks.onBackgroundClick());
+
+  // Tick — 워커 메시지는 프레임당 한 번만 DOM에 반영
+  let frame: number | null = null;
+  const draw = () => {
+    frame = null;
+    linkEls
+      .attr("x1", (d) => (d.source as SimNode).x ?? 0)
+      .attr("y1", (d) => (d.source as SimNode).y ?? 0)
+      .attr("x2", (d) => (d.target as SimNode).x ?? 0)
+      .attr("y2", (d) => (d.target as SimNode).y ?? 0);
+    nodeEls.attr("transform", (d) => `translate(${d.x ?? 0},${d.y ?? 0})`);
+  };
+  draw();
+
+  return {
+    render() {
+      if (frame === null) frame = requestAnimationFrame(draw);
+    },
+    setVisualState(state, duration) {
+      applySvgVisualState(nodeEls, linkEls, state, duration);
+    },
+    zoomTo(transform, duration) {
+      svg.transition().duration(duration).call(zoom.transform, transform);
+    },
+    destroy() {
+      if (frame !== null) cancelAnimationFrame(frame);
+      svg.interrupt();
+    },
+  };
+}
+
 // ════════════════════════════════════════════════════════
 // ─── Main Component ───
 // ════════════════════════════════════════════════════════
 
 export function ResearchMapGraph() {
   const svgRef = useRef<SVGSVGElement>(null);
+  const canvasRef = useRef<HTMLCanvasElement>(null);
   const containerRef = useRef<HTMLDivElement>(null);
-  const simRef = useRef<d3.Simulation<SimNode, SimLink> | null>(null);
   const nodesRef = useRef<SimNode[]>([]);
   const linksRef = useRef<SimLink[]>([]);
+  const viewRef = useRef<GraphView | null>(null);
 
   const { resolvedTheme } = useTheme();
   const isDark = resolvedTheme === "dark";
@@ -343,48 +400,35 @@ export function ResearchMapGraph() {
   const [showPrompt, setShowPrompt] = useState(true);
   const [disabledTypes, setDisabledTypes] = useState<Set<NodeType>>(new Set());
   const [showPapers, setShowPapers] = useState(false);
+  // null: 노드 수에 따라 자동 선택
+  const [rendererChoice, setRendererChoice] = useState<RendererMode | null>(null);
 
   // DB paper nodes
   const { data: paperMapData } = usePapers({ enabled: true });
 
+  const totalNodes =
+    NODES.length + (showPapers ? (paperMapData?.nodes.length ?? 0) : 0);
+  const renderer: RendererMode =
+    rendererChoice ?? (totalNodes > CANVAS_NODE_THRESHOLD ? "canvas" : "svg");
+
   // Ref for D3 callbacks to read latest selection without stale closures
   const selectedNodeRef = useRef<string | null>(null);
   selectedNodeRef.current = selectedNode?.id ?? null;
 
+  // 렌더러를 다시 만들 때 현재 보기 상태를 바로 적용하기 위한 ref
+  const visualInputsRef = useRef({ viewMode, disabledTypes });
+  visualInputsRef.current = { viewMode, disabledTypes };
+
   // ─── D3 initialization ───
   useEffect(() => {
-    const svgEl = svgRef.current;
     const container = containerRef.current;
-    if (!svgEl || !container) return;
-
-    d3.select(svgEl).selectAll("*").remove();
+    const svgEl = svgRef.current;
+    const canvasEl = canvasRef.current;
+    if (!container || (renderer === "svg" ? !svgEl : !canvasEl)) return;
 
     const W = container.clientWidth;
     const H = container.clientHeight;
 
-    const svg = d3.select(svgEl).attr("width", W).attr("height", H);
-    const g = svg.append("g");
-
-    // Zoom
-    const zoom = d3
-      .zoom<SVGSVGElement, unknown>()
-      .scaleExtent([0.1, 5])
-      .on("zoom", (e) => g.attr("transform", e.transform));
-    svg.call(zoom);
-
-    // Glow filters
-    const defs = svg.append("defs");
-    for (const [key] of Object.entries(NODE_COLORS)) {
-      const filter = defs.append("filter").attr("id", `glow-${key}`);
-      filter
-        .append("feGaussianBlur")
-        .attr("stdDeviation", 3)
-        .attr("result", "blur");
-      const merge = filter.append("feMerge");
-      merge.append("feMergeNode").attr("in", "blur");
-      merge.append("feMergeNode").attr("in", "SourceGraphic");
-    }
-
     // Clone data for D3 mutation — merge static + DB paper nodes
     const nodes: SimNode[] = NODES.map((n) => ({ ...n }));
     const links: SimLink[] = LINKS.map((l) => ({ ...l }));
@@ -394,154 +438,52 @@ export function ResearchMapGraph() {
       for (const pn of paperMapData.nodes) {
         if (!existingIds.has(pn.id)) {
           nodes.push({ ...pn, axes: undefined, actions: undefined, student: undefined });
+          existingIds.add(pn.id);
         }
       }
       for (const pl of paperMapData.links) {
-        const srcExists = nodes.some((n) => n.id === pl.source);
-        const tgtExists = nodes.some((n) => n.id === pl.target);
-        if (srcExists && tgtExists) {
+        if (existingIds.has(pl.source) && existingIds.has(pl.target)) {
           links.push({ ...pl });
         }
       }
     }
 
+    // forceLink가 하던 것처럼 링크 끝점을 노드 객체로 연결 (렌더링·선택 로직이 그대로 사용)
+    const nodeById = new Map(nodes.map((n) => [n.id, n]));
+    for (const l of links) {
+      l.source = nodeById.get(nodeId(l.source)) ?? l.source;
+      l.target = nodeById.get(nodeId(l.target)) ?? l.target;
+    }
+
     nodesRef.current = nodes;
     linksRef.current = links;
 
-    // Simulation
-    const sim = d3
-      .forceSimulation<SimNode>(nodes)
-      .force(
-        "link",
-        d3
-          .forceLink<SimNode, SimLink>(links)
-          .id((d) => d.id)
-          .distance((d) => {
-            if (d.type === "kk") return 60;
-            if (d.type === "collab") return 70;
-            const s = nodes.find((x) => x.id === nodeId(d.source));
-            const t = nodes.find((x) => x.id === nodeId(d.target));
-            if (!s || !t) return 100;
-            if (s.type === "paper" || t.type === "paper") return 50;
-            if (s.type === "axis" || t.type === "axis") return 200;
-            if (s.type === "student" !== (t.type === "student")) return 100;
-            return 130;
-          })
-      )
-      .force(
-        "charge",
-        d3.forceManyBody<SimNode>().strength((d) => {
-          if (d.type === "axis") return -900;
-          if (d.type === "paper") return -150;
-          if (
-            d.type === "student" ||
-            d.type === "project" ||
-            d.type === "conference"
-          )
-            return -400;
-          return -200;
-        })
-      )
-      .force("center", d3.forceCenter(W / 2, H / 2))
-      .force(
-        "collision",
-        d3.forceCollide<SimNode>().radius((d) => d.size + 10)
-      )
-      .force("x", d3.forceX(W / 2).strength(0.02))
-      .force("y", d3.forceY(H / 2).strength(0.02));
-
-    simRef.current = sim;
-
-    // Links
-    const linkG = g.append("g");
-    const linkEls = linkG
-      .selectAll<SVGLineElement, SimLink>("line")
-      .data(links)
-      .enter()
-      .append("line")
-      .attr("class", (d) =>
-        d.type === "kk" ? "rm-link rm-link-kk" : "rm-link"
-      )
-      .attr("stroke", (d) => {
-        if (d.type === "kk") return "#ffffff";
-        if (d.type === "collab") return NODE_COLORS.student;
-        const tn = nodes.find((x) => x.id === nodeId(d.target));
-        return tn ? NODE_COLORS[tn.type] : "#1a2040";
-      })
-      .attr("stroke-width", (d) => origLinkWidth(d))
-      .attr("stroke-opacity", (d) => origLinkOpacity(d))
-      .attr("stroke-dasharray", (d) =>
-        d.type === "kk" ? "2,4" : d.type === "collab" ? "5,3" : null
-      );
-
-    // Nodes
-    const nodeG = g.append("g");
-    let dragMoved = false;
-    const nodeEls = nodeG
-      .selectAll<SVGGElement, SimNode>("g")
-      .data(nodes)
-      .enter()
-      .append("g")
-      .attr("class", "rm-node")
-      .style("cursor", "pointer")
-      .call(
-        d3
-          .drag<SVGGElement, SimNode>()
-          .on("start", (e, d) => {
-            dragMoved = false;
-            if (!e.active) sim.alphaTarget(0.3).restart();
-            d.fx = d.x;
-            d.fy = d.y;
-          })
-          .on("drag", (e, d) => {
-            dragMoved = true;
-            d.fx = e.x;
-            d.fy = e.y;
-          })
-          .on("end", (e, d) => {
-            if (!e.active) sim.alphaTarget(0);
-            d.fx = null;
-            d.fy = null;
-            if (!dragMoved) {
-              e.sourceEvent?.stopPropagation();
-              tooltip.style("opacity", 0);
-              setShowPrompt(false);
-              // Toggle: re-clicking same node clears selection
-              if (selectedNodeRef.current === d.id) {
-                setSelectedNode(null);
-              } else {
-                setSelectedNode({ ...d });
-              }
-            }
-          })
-      );
-
-    nodeEls
-      .append("circle")
-      .attr("r", (d) => d.size)
-      .attr("fill", (d) => {
-        if (d.type === "axis") return NODE_COLORS[d.type] + "30";
-        if (d.type === "paper") return NODE_COLORS[d.type] + "88";
-        return NODE_COLORS[d.type] + "cc";
-      })
-      .attr("stroke", (d) => NODE_COLORS[d.type])
-      .attr("stroke-width", (d) => (d.type === "axis" ? 2 : 1.5))
-      .attr("stroke-opacity", (d) => (d.type === "axis" ? 0.5 : d.type === "paper" ? 0.5 : 0.7))
-      .attr("stroke-dasharray", (d) => (d.type === "paper" ? "3,2" : null));
-
-    nodeEls
-      .append("text")
-      .attr("dy", (d) => d.size + 14)
-      .attr("text-anchor", "middle")
-      .attr("font-size", (d) =>
-        d.type === "student" ? "11px" : d.type === "axis" ? "12px" : "9.5px"
-      )
-      .attr("fill", "#8898b8")
-      .attr("font-weight", 500)
-      .attr("font-family", "var(--font-paperlogy), 'Pretendard', sans-serif")
-      .style("pointer-events", "none")
-      .style("text-shadow", "0 0 8px #06081a, 0 0 16px #06081a")
-      .text((d) => d.label);
+    // Simulation — Web Worker에서 실행하고 좌표만 받아 그린다.
+    // 같은 구성의 수렴 좌표가 캐시에 있으면 시뮬레이션 없이 바로 배치한다.
+    const nodeIndex = new Map(nodes.map((n, i) => [n.id, i]));
+    const layoutVersion = computeLayoutVersion(nodes, links.map((l) => ({
+      source: nodeId(l.source),
+      target: nodeId(l.target),
+      type: l.type,
+    })));
+    const cachedPositions = loadLayout(layoutVersion, nodes.length, W, H);
+    if (cachedPositions) applyPositions(nodes, cachedPositions);
+
+    const worker = new Worker(new URL("./force-layout.worker.ts", import.meta.url));
+    const postToWorker = (message: LayoutRequest) => worker.postMessage(message);
+
+    postToWorker({
+      type: "start",
+      nodes: nodes.map((n) => ({ type: n.type, size: n.size })),
+      links: links.map((l) => ({
+        source: nodeIndex.get(nodeId(l.source)) ?? 0,
+        target: nodeIndex.get(nodeId(l.target)) ?? 0,
+        type: l.type,
+      })),
+      width: W,
+      height: H,
+      positions: cachedPositions,
+    });
 
     // Tooltip
     const tooltip = d3
@@ -563,63 +505,88 @@ export function ResearchMapGraph() {
       .style("box-shadow", "0 8px 32px rgba(0,0,0,0.6)")
       .style("backdrop-filter", "blur(8px)");
 
-    nodeEls
-      .on("mouseover", (e, d) => {
-        const rect = container.getBoundingClientRect();
-        tooltip
-          .style("opacity", 1)
-          .html(
-            `<b style="color:#d0d8f0">${d.label}</b>
-             <div style="font-size:0.6rem;letter-spacing:1px;text-transform:uppercase;margin-top:1px;color:${NODE_COLORS[d.type]}">${NODE_LABELS[d.type]}</div>
-             <div style="margin-top:3px">${d.desc || ""}</div>`
-          )
-          .style("left", e.clientX - rect.left + 14 + "px")
-          .style("top", e.clientY - rect.top - 10 + "px");
-      })
-      .on("mousemove", (e) => {
+    let hoveredId: string | null = null;
+    const callbacks: GraphViewCallbacks = {
+      onHover: (d, e) => {
+        if (!d) {
+          hoveredId = null;
+          tooltip.style("opacity", 0);
+          return;
+        }
         const rect = container.getBoundingClientRect();
+        if (hoveredId !== d.id) {
+          hoveredId = d.id;
+          tooltip
+            .style("opacity", 1)
+            .html(
+              `<b style="color:#d0d8f0">${d.label}</b>
+               <div style="font-size:0.6rem;letter-spacing:1px;text-transform:uppercase;margin-top:1px;color:${NODE_COLORS[d.type]}">${NODE_LABELS[d.type]}</div>
+               <div style="margin-top:3px">${d.desc || ""}</div>`
+            );
+        }
         tooltip
           .style("left", e.clientX - rect.left + 14 + "px")
           .style("top", e.clientY - rect.top - 10 + "px");
-      })
-      .on("mouseout", () => tooltip.style("opacity", 0));
-
-    // Background click to clear selection
-    g.insert("rect", ":first-child")
-      .attr("width", W * 10)
-      .attr("height", H * 10)
-      .attr("x", -W * 5)
-      .attr("y", -H * 5)
-      .attr("fill", "transparent")
-      .style("cursor", "default")
-      .on("click", () => {
-        setSelectedNode(null);
-      });
-
-    // Tick
-    sim.on("tick", () => {
-      linkEls
-        .attr("x1", (d) => (d.source as SimNode).x ?? 0)
-        .attr("y1", (d) => (d.source as SimNode).y ?? 0)
-        .attr("x2", (d) => (d.target as SimNode).x ?? 0)
-        .attr("y2", (d) => (d.target as SimNode).y ?? 0);
-      nodeEls.attr("transform", (d) => `translate(${d.x ?? 0},${d.y ?? 0})`);
-    });
+      },
+      onNodeClick: (d) => {
+        hoveredId = null;
+        tooltip.style("opacity", 0);
+        setShowPrompt(false);
+        // Toggle: re-clicking same node clears selection
+        if (selectedNodeRef.current === d.id) {
+          setSelectedNode(null);
+        } else {
+          setSelectedNode({ ...d });
+        }
+      },
+      onBackgroundClick: () => setSelectedNode(null),
+      onDragStart: (d) => {
+        postToWorker({
+          type: "dragstart",
+          index: nodeIndex.get(d.id) ?? 0,
+          x: d.x ?? 0,
+          y: d.y ?? 0,
+        });
+      },
+      onDrag: (d, x, y) => {
+        // 워커 응답을 기다리지 않고 끌고 있는 노드는 바로 옮긴다
+        d.x = x;
+        d.y = y;
+        view.render();
+        postToWorker({ type: "drag", index: nodeIndex.get(d.id) ?? 0, x, y });
+      },
+      onDragEnd: (d) => {
+        postToWorker({ type: "dragend", index: nodeIndex.get(d.id) ?? 0 });
+      },
+    };
+
+    const view: GraphView =
+      renderer === "canvas"
+        ? mountCanvasGraph({ canvas: canvasEl!, width: W, height: H, nodes, links, ...callbacks })
+        : mountSvgGraph(svgEl!, W, H, nodes, links, callbacks);
+    viewRef.current = view;
+
+    worker.onmessage = (e: MessageEvent<LayoutResponse>) => {
+      applyPositions(nodes, e.data.positions);
+      view.render();
+      if (e.data.type === "end") {
+        saveLayout(layoutVersion, e.data.positions, W, H);
+      }
+    };
+
+    // 렌더러/데이터가 바뀌어도 현재 보기 모드·필터·선택을 유지
+    const { viewMode: currentViewMode, disabledTypes: currentDisabled } =
+      visualInputsRef.current;
+    view.setVisualState(
+      computeVisualState(nodes, links, currentViewMode, currentDisabled, selectedNodeRef.current),
+      0
+    );
 
     // Initial zoom
-    setTimeout(() => {
-      svg
-        .transition()
-        .duration(700)
-        .call(
-          zoom.transform,
-          d3.zoomIdentity.translate(W * 0.05, H * 0.05).scale(0.8)
-        );
+    const zoomTimer = setTimeout(() => {
+      view.zoomTo(d3.zoomIdentity.translate(W * 0.05, H * 0.05).scale(0.8), 700);
     }, 400);
 
-    // Store refs for effects to use
-    (svgEl as any).__rm = { nodeEls, linkEls, nodes, links };
-
     // Keyboard
     const handleKey = (e: KeyboardEvent) => {
       if (e.key === "Escape") {
@@ -629,18 +596,20 @@ export function ResearchMapGraph() {
     document.addEventListener("keydown", handleKey);
 
     return () => {
-      sim.stop();
+      clearTimeout(zoomTimer);
+      worker.terminate();
+      view.destroy();
+      viewRef.current = null;
       tooltip.remove();
       document.removeEventListener("keydown", handleKey);
     };
     // eslint-disable-next-line react-hooks/exhaustive-deps
-  }, [isDark, showPapers, paperMapData]);
+  }, [isDark, showPapers, paperMapData, renderer]);
 
   // ─── Unified visual state effect ───
   useEffect(() => {
-    const svgEl = svgRef.current;
-    if (!svgEl || !(svgEl as any).__rm) return;
-    const { nodeEls, linkEls, nodes, links } = (svgEl as any).__rm;
+    const view = viewRef.current;
+    if (!view) return;
 
     // If selected node's type got disabled, clear selection
     if (selectedNode && disabledTypes.has(selectedNode.type)) {
@@ -648,14 +617,14 @@ export function ResearchMapGraph() {
       return;
     }
 
-    applyVisualState(
-      nodeEls,
-      linkEls,
-      nodes,
-      links,
-      viewMode,
-      disabledTypes,
-      selectedNode?.id ?? null
+    view.setVisualState(
+      computeVisualState(
+        nodesRef.current,
+        linksRef.current,
+        viewMode,
+        disabledTypes,
+        selectedNode?.id ?? null
+      )
     );
   }, [viewMode, disabledTypes, selectedNode]);
 
@@ -680,10 +649,7 @@ export function ResearchMapGraph() {
 
   // ─── Click node from detail panel ───
   const handleDetailNodeClick = useCallback((id: string) => {
-    const svgEl = svgRef.current;
-    if (!svgEl || !(svgEl as any).__rm) return;
-    const { nodes } = (svgEl as any).__rm;
-    const node = nodes.find((n: SimNode) => n.id === id);
+    const node = nodesRef.current.find((n) => n.id === id);
     if (!node) return;
     setSelectedNode({ ...node });
   }, []);
@@ -853,6 +819,23 @@ export function ResearchMapGraph() {
               </span>
             )}
           </button>
+          <button
+            onClick={() => setRendererChoice(renderer === "canvas" ? "svg" : "canvas")}
+            className="mt-1.5 flex w-full items-center gap-2 rounded-md px-3 py-1.5 text-[12px] transition-all"
+            style={{
+              background: "transparent",
+              border: "1px solid rgba(40,50,90,0.3)",
+              color: "#5a6a90",
+            }}
+            title="노드가 많으면 Canvas가 더 빠릅니다"
+          >
+            Renderer: {renderer === "canvas" ? "Canvas" : "SVG"}
+            {rendererChoice === null && (
+              <span className="ml-auto text-[11px]" style={{ color: "#3a4a6a" }}>
+                auto
+              </span>
+            )}
+          </button>
         </div>
 
         {/* Legend — interactive, synced with Node Types */}
@@ -970,7 +953,11 @@ export function ResearchMapGraph() {
             backgroundSize: "32px 32px",
           }}
         />
-        <svg ref={svgRef} className="h-full w-full" />
+        {renderer === "canvas" ? (
+          <canvas ref={canvasRef} className="block h-full w-full" />
+        ) : (
+          <svg ref={svgRef} className="h-full w-full" />
+        )}
 
         {/* ── Detail Panel — absolute overlay inside graph container ── */}
         <div
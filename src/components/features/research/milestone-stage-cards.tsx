@@ -0,0 +1,132 @@
+"use client";
+
+import { useRouter } from "next/navigation";
+import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
+import { Badge } from "@/components/ui/badge";
+import { Progress } from "@/components/ui/progress";
+import { Checkbox } from "@/components/ui/checkbox";
+import { toggleChecklistItem } from "@/lib/actions/research";
+import { CheckCircle2, Target } from "lucide-react";
+import { calculateChecklistProgress } from "@/lib/utils";
+import type { ResearchDetailMilestone } from "@/lib/cache/research-detail";
+
+interface MilestoneStageCardsProps {
+  projectId: string;
+  milestones: ResearchDetailMilestone[];
+}
+
+export function MilestoneStageCards({ projectId, milestones }: MilestoneStageCardsProps) {
+  const router = useRouter();
+
+  // 체크리스트 토글
+  const handleToggleChecklistItem = async (itemId: string, isCompleted: boolean) => {
+    await toggleChecklistItem(itemId, isCompleted, projectId);
+    router.refresh();
+  };
+
+  const sortedMilestones = [...milestones].sort((a, b) => a.order_index - b.order_index);
+
+  // 현재 진행 중인 첫 번째 마일스톤 (완료되지 않은 첫 번째)
+  const currentMilestone = sortedMilestones.find(
+    (m) => calculateChecklistProgress(m.checklist_items) < 100
+  );
+
+  return (
+    <div className="space-y-4">
+      <h2 className="text-xl font-semibold flex items-center gap-2">
+        <Target className="h-5 w-5" />
+        단계별 진행 현황
+      </h2>
+      <div className="grid gap-4 md:grid-cols-2 lg:grid-cols-3">
+        {sortedMilestones.map((milestone, index) => {
+          const progress = calculateChecklistProgress(milestone.checklist_items);
+          const isCompleted = progress === 100;
+          const isCurrent = !isCompleted && currentMilestone?.id === milestone.id;
+
+          return (
+            <Card
+              key={milestone.id}
+              className={`transition-all ${
+                isCompleted
+                  ? "border-green-500 border-2"
+                  : isCurrent
+                  ? "border-primary border-2 shadow-lg"
+                  : "border-muted"
+              }`}
+            >
+              <CardHeader className="pb-3">
+                <div className="flex items-center justify-between">
+                  <div className="flex items-center gap-2">
+                    <div
+                      className={`w-8 h-8 rounded-full flex items-center justify-center text-sm font-bold ${
+                        isCompleted
+                          ? "bg-green-500 text-white"
+                          : isCurrent
+                          ? "bg-primary text-white"
+                          : "bg-muted text-muted-foreground"
+                      }`}
+                    >
+                      {isCompleted ? (
+                        <CheckCircle2 className="h-5 w-5" />
+                      ) : (
+                        index + 1
+                      )}
+                    </div>
+                    <div>
+                      <CardTitle className="text-base">{milestone.title}</CardTitle>
+                      <p className="text-xs text-muted-foreground">
+                        가중치: {milestone.weight}%
+                      </p>
+                    </div>
+                  </div>
+                  {isCurrent && (
+                    <Badge className="bg-orange-500 text-xs">CURRENT</Badge>
+                  )}
+                </div>
+              </CardHeader>
+              <CardContent className="space-y-3">
+                {/* 진행률 바 */}
+                <div className="flex items-center gap-2">
+                  <Progress
+                    value={progress}
+                    className={`h-2 flex-1 ${isCompleted ? "[&>div]:bg-green-500" : ""}`}
+                  />
+                  <span className="text-sm font-medium w-10 text-right">{progress}%</span>
+                </div>
+
+                {/* 체크리스트 */}
+                <div className="space-y-2">
+                  {[...milestone.checklist_items]
+                    .sort((a, b) => a.order_index - b.order_index)
+                    .map((item) => (
+                      <div
+                        key={item.id}
+                        className="flex items-start gap-2 text-sm"
+                      >
+                        <Checkbox
+                          checked={item.is_completed}
+                          onCheckedChange={(checked) =>
+                            handleToggleChecklistItem(item.id, checked === true)
+                          }
+                          className="mt-0.5"
+                        />
+                        <span
+                          className={
+                            item.is_completed
+                              ? "line-through text-muted-foreground"
+                              : ""
+                          }
+                        >
+                          {item.content}
+                        </span>
+                      </div>
+                    ))}
+                </div>
+              </CardContent>
+            </Card>
+          );
+        })}
+      </div>
+    </div>
+  );
+}
@@ -0,0 +1,194 @@
+"use client";
+
+import { useState } from "react";
+import { useRouter } from "next/navigation";
+import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
+import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
+import { Input } from "@/components/ui/input";
+import { Label } from "@/components/ui/label";
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from "@/components/ui/select";
+import {
+  Table,
+  TableBody,
+  TableCell,
+  TableHead,
+  TableHeader,
+  TableRow,
+} from "@/components/ui/table";
+import {
+  Dialog,
+  DialogContent,
+  DialogHeader,
+  DialogTitle,
+  DialogTrigger,
+} from "@/components/ui/dialog";
+import { getAuthorRoleLabel } from "@/lib/utils";
+import { addProjectAuthor, deleteProjectAuthor } from "@/lib/actions/research";
+import { Plus, Trash2, Users, Loader2 } from "lucide-react";
+import type { ResearchDetailAuthor } from "@/lib/cache/research-detail";
+
+interface ProjectAuthorsCardProps {
+  projectId: string;
+  authors: ResearchDetailAuthor[];
+}
+
+export function ProjectAuthorsCard({ projectId, authors }: ProjectAuthorsCardProps) {
+  const router = useRouter();
+  const [saving, setSaving] = useState(false);
+
+  // 저자 추가 다이얼로그
+  const [isAddAuthorOpen, setIsAddAuthorOpen] = useState(false);
+  const [newAuthorName, setNewAuthorName] = useState("");
+  const [newAuthorRole, setNewAuthorRole] = useState("co_author");
+  const [newAuthorResponsibilities, setNewAuthorResponsibilities] = useState("");
+
+  // 저자 추가
+  const handleAddAuthor = async () => {
+    if (!newAuthorName.trim()) return;
+    setSaving(true);
+
+    await addProjectAuthor(projectId, newAuthorName, newAuthorRole, newAuthorResponsibilities);
+
+    setNewAuthorName("");
+    setNewAuthorRole("co_author");
+    setNewAuthorResponsibilities("");
+    setIsAddAuthorOpen(false);
+    router.refresh();
+    setSaving(false);
+  };
+
+  // 저자 삭제
+  const handleDeleteAuthor = async (authorId: string) => {
+    if (!confirm("정말로 이 저자를 삭제하시겠습니까?")) return;
+
+    await deleteProjectAuthor(authorId, projectId);
+    router.refresh();
+  };
+
+  return (
+    <Card>
+      <CardHeader>
+        <div className="flex items-center justify-between">
+          <CardTitle className="flex items-center gap-2">
+            <Users className="h-5 w-5" />
+            저자 정보
+          </CardTitle>
+          <Dialog open={isAddAuthorOpen} onOpenChange={setIsAddAuthorOpen}>
+            <DialogTrigger asChild>
+              <Button size="sm">
+                <Plus className="h-4 w-4 mr-1" />
+                저자 추가
+              </Button>
+            </DialogTrigger>
+            <DialogContent>
+              <DialogHeader>
+                <DialogTitle>저자 추가</DialogTitle>
+              </DialogHeader>
+              <div className="space-y-4 pt-4">
+                <div className="space-y-2">
+                  <Label>이름</Label>
+                  <Input
+                    value={newAuthorName}
+                    onChange={(e) => setNewAuthorName(e.target.value)}
+                    placeholder="저자 이름"
+                  />
+                </div>
+                <div className="space-y-2">
+                  <Label>역할</Label>
+                  <Select value={newAuthorRole} onValueChange={setNewAuthorRole}>
+                    <SelectTrigger>
+                      <SelectValue />
+                    </SelectTrigger>
+                    <SelectContent>
+                      <SelectItem value="first_author">1저자</SelectItem>
+                      <SelectItem value="corresponding">교신저자</SelectItem>
+                      <SelectItem value="co_author">공저자</SelectItem>
+                    </SelectContent>
+                  </Select>
+                </div>
+                <div className="space-y-2">
+                  <Label>담당업무</Label>
+                  <Input
+                    value={newAuthorResponsibilities}
+                    onChange={(e) => setNewAuthorResponsibilities(e.target.value)}
+                    placeholder="예: 데이터 분석, 논문 작성"
+                  />
+                </div>
+                <div className="flex gap-2 pt-2">
+                  <Button onClick={handleAddAuthor} disabled={!newAuthorName.trim() || saving}>
+                    {saving && <Loader2 className="h-4 w-4 animate-spin mr-2" />}
+                    추가
+                  </Button>
+                  <Button variant="outline" onClick={() => setIsAddAuthorOpen(false)}>
+                    취소
+                  </Button>
+                </div>
+              </div>
+            </DialogContent>
+          </Dialog>
+        </div>
+      </CardHeader>
+      <CardContent>
+        {authors.length > 0 ? (
+          <Table>
+            <TableHeader>
+              <TableRow>
+                <TableHead>이름</TableHead>
+                <TableHead>역할</TableHead>
+                <TableHead>담당업무</TableHead>
+                <TableHead className="w-[50px]"></TableHead>
+              </TableRow>
+            </TableHeader>
+            <TableBody>
+              {authors.map((author) => (
+                <TableRow key={author.id}>
+                  <TableCell className="font-medium">{author.name}</TableCell>
+                  <TableCell>
+                    <Badge
+                      variant="outline"
+                      className={
+                        author.role === "first_author"
+                          ? "border-blue-500 text-blue-600"
+                          : author.role === "corresponding"
+                          ? "border-purple-500 text-purple-600"
+                          : ""
+                      }
+                    >
+                      {getAuthorRoleLabel(author.role)}
+                    </Badge>
+                  </TableCell>
+                  <TableCell className="text-muted-foreground">
+                    {author.responsibilities || "-"}
+                  </TableCell>
+                  <TableCell>
+                    <Button
+                      variant="ghost"
+                      size="icon"
+                      className="h-8 w-8 text-red-500 hover:text-red-600 hover:bg-red-50"
+                      onClick={() => handleDeleteAuthor(author.id)}
+                    >
+                      <Trash2 className="h-4 w-4" />
+                    </Button>
+                  </TableCell>
+                </TableRow>
+              ))}
+            </TableBody>
+          </Table>
+        ) : (
+          <div className="text-center py-8 text-muted-foreground">
+            <Users className="h-12 w-12 mx-auto mb-4 opacity-50" />
+            <p>등록된 저자가 없습니다.</p>
+            <p className="text-sm">저자 추가 버튼을 클릭하여 저자를 등록하세요.</p>
+          </div>
+        )}
+      </CardContent>
+    </Card>
+  );
+}
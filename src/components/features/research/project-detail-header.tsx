@@ -0,0 +1,319 @@
+"use client";
+
+import { useState } from "react";
+import { useRouter } from "next/navigation";
+import Link from "next/link";
+import { Card, CardContent } from "@/components/ui/card";
+import { Badge } from "@/components/ui/badge";
+import { Button } from "@/components/ui/button";
+import { Progress } from "@/components/ui/progress";
+import { Input } from "@/components/ui/input";
+import {
+  Select,
+  SelectContent,
+  SelectItem,
+  SelectTrigger,
+  SelectValue,
+} from "@/components/ui/select";
+import {
+  calculateDday,
+  getProjectTypeLabel,
+  formatDate,
+  getSubmissionStatusLabel,
+  getSubmissionStatusColor,
+  SUBMISSION_STATUS_CONFIG,
+} from "@/lib/utils";
+import {
+  updateProject,
+  updateSubmissionStatus,
+  toggleFavoriteProject,
+} from "@/lib/actions/research";
+import { ArrowLeft, Edit, Save, X, Loader2, Star, Award } from "lucide-react";
+import { FUNDING_ACKNOWLEDGMENT, FUNDING_BADGE_COLORS } from "@/lib/constants";
+import { DeleteProjectButton } from "@/components/features/DeleteProjectButton";
+import type { ResearchDetailProject } from "@/lib/cache/research-detail";
+
+interface ProjectDetailHeaderProps {
+  project: ResearchDetailProject;
+  canDelete: boolean;
+  initialIsFavorite: boolean;
+}
+
+export function ProjectDetailHeader({
+  project,
+  canDelete,
+  initialIsFavorite,
+}: ProjectDetailHeaderProps) {
+  const router = useRouter();
+  const id = project.id;
+
+  const [saving, setSaving] = useState(false);
+  const [isFavorite, setIsFavorite] = useState(initialIsFavorite);
+  const [favoriteLoading, setFavoriteLoading] = useState(false);
+
+  // 편집 상태
+  const [isEditingHeader, setIsEditingHeader] = useState(false);
+  const [editTitle, setEditTitle] = useState(project.title);
+  const [editType, setEditType] = useState(project.project_type || "general");
+  const [editJournal, setEditJournal] = useState(project.target_journal || "");
+  const [editDeadline, setEditDeadline] = useState(project.target_date || "");
+
+  // 헤더 저장
+  const handleSaveHeader = async () => {
+    setSaving(true);
+
+    await updateProject(id, {
+      title: editTitle,
+      project_type: editType,
+      target_journal: editJournal || undefined,
+      deadline: editDeadline || undefined,
+    });
+
+    setIsEditingHeader(false);
+    router.refresh();
+    setSaving(false);
+  };
+
+  // 즐겨찾기 토글
+  const handleToggleFavorite = async () => {
+    setFavoriteLoading(true);
+    const result = await toggleFavoriteProject(id);
+    if (result.success && result.data) {
+      setIsFavorite((result.data as { isFavorite: boolean }).isFavorite);
+    }
+    setFavoriteLoading(false);
+  };
+
+  const dday = project.target_date ? calculateDday(project.target_date) : null;
+
+  // 상태 뱃지 색상
+  const getStatusBadge = () => {
+    const progress = project.overall_progress;
+
+    if (progress === 0) {
+      return <Badge className="bg-gray-500">Preparing</Badge>;
+    }
+
+    if (dday?.isOverdue) {
+      return <Badge className="bg-red-500">Delayed</Badge>;
+    }
+
+    if (progress >= 80 || (dday && dday.dday > 30)) {
+      return <Badge className="bg-green-500">On Track</Badge>;
+    }
+
+    return <Badge className="bg-blue-500">In Progress</Badge>;
+  };
+
+  return (
+    <>
+      {/* Header */}
+      <div className="flex items-center gap-4">
+        <Link href="/research">
+          <Button variant="ghost" size="icon">
+            <ArrowLeft className="h-5 w-5" />
+          </Button>
+        </Link>
+        <div className="flex-1">
+          <p className="text-sm text-muted-foreground mb-1">Research Project</p>
+          {!isEditingHeader ? (
+            <h1 className="text-2xl lg:text-3xl font-bold">{project.title}</h1>
+          ) : (
+            <Input
+              value={editTitle}
+              onChange={(e) => setEditTitle(e.target.value)}
+              className="text-2xl font-bold h-auto py-1"
+            />
+          )}
+        </div>
+        {!isEditingHeader ? (
+          <div className="flex gap-2">
+            <Button
+              variant="ghost"
+              size="icon"
+              onClick={handleToggleFavorite}
+              disabled={favoriteLoading}
+              title={isFavorite ? "즐겨찾기 해제" : "즐겨찾기 추가"}
+            >
+              {favoriteLoading ? (
+                <Loader2 className="h-5 w-5 animate-spin" />
+              ) : (
+                <Star
+                  className={`h-5 w-5 ${
+                    isFavorite ? "fill-yellow-400 text-yellow-400" : "text-muted-foreground"
+                  }`}
+                />
+              )}
+            </Button>
+            <Button variant="outline" onClick={() => setIsEditingHeader(true)}>
+              <Edit className="h-4 w-4 mr-2" />
+              수정
+            </Button>
+            {canDelete && (
+              <DeleteProjectButton
+                projectId={id}
+                projectTitle={project.title}
+                redirectPath="/research"
+              />
+            )}
+          </div>
+        ) : (
+          <div className="flex gap-2">
+            <Button onClick={handleSaveHeader} disabled={saving}>
+              {saving ? <Loader2 className="h-4 w-4 animate-spin mr-2" /> : <Save className="h-4 w-4 mr-2" />}
+              저장
+            </Button>
+            <Button variant="ghost" onClick={() => setIsEditingHeader(false)}>
+              <X className="h-4 w-4" />
+            </Button>
+          </div>
+        )}
+      </div>
+
+      {/* Project Info Card */}
+      <Card>
+        <CardContent className="pt-6">
+          <div className="grid gap-6 md:grid-cols-2 lg:grid-cols-5">
+            {/* TYPE */}
+            <div className="space-y-1">
+              <p className="text-xs text-muted-foreground uppercase tracking-wide">TYPE</p>
+              {!isEditingHeader ? (
+                <Badge variant="outline" className="text-sm">
+                  {getProjectTypeLabel(project.project_type || "general")}
+                </Badge>
+              ) : (
+                <Select value={editType} onValueChange={setEditType}>
+                  <SelectTrigger className="h-8">
+                    <SelectValue />
+                  </SelectTrigger>
+                  <SelectContent>
+                    <SelectItem value="advanced">선진연구</SelectItem>
+                    <SelectItem value="general">일반연구</SelectItem>
+                  </SelectContent>
+                </Select>
+              )}
+            </div>
+
+            {/* 타겟 저널 */}
+            <div className="space-y-1">
+              <p className="text-xs text-muted-foreground uppercase tracking-wide">타겟 저널</p>
+              {!isEditingHeader ? (
+                <p className="font-medium truncate">{project.target_journal || "-"}</p>
+              ) : (
+                <Input
+                  value={editJournal}
+                  onChange={(e) => setEditJournal(e.target.value)}
+                  placeholder="저널명"
+                  className="h-8"
+                />
+              )}
+            </div>
+
+            {/* 마감일 & D-day */}
+            <div className="space-y-1">
+              <p className="text-xs text-muted-foreground uppercase tracking-wide">마감일</p>
+              {!isEditingHeader ? (
+                <div className="flex items-center gap-2">
+                  <span className="font-medium">
+                    {project.target_date ? formatDate(project.target_date) : "-"}
+                  </span>
+                  {dday && (
+                    <Badge
+                      className={
+                        dday.isOverdue
+                          ? "bg-red-500"
+                          : dday.dday <= 7
+                          ? "bg-orange-500"
+                          : "bg-blue-500"
+                      }
+                    >
+                      {dday.label}
+                    </Badge>
+                  )}
+                </div>
+              ) : (
+                <Input
+                  type="date"
+                  value={editDeadline}
+                  onChange={(e) => setEditDeadline(e.target.value)}
+                  className="h-8"
+                />
+              )}
+            </div>
+
+            {/* 상태 */}
+            <div className="space-y-1">
+              <p className="text-xs text-muted-foreground uppercase tracking-wide">상태</p>
+              {getStatusBadge()}
+            </div>
+
+            {/* 전체 진행률 */}
+            <div className="space-y-1">
+              <p className="text-xs text-muted-foreground uppercase tracking-wide">전체 진행률</p>
+              <div className="flex items-center gap-2">
+                <Progress value={project.overall_progress} className="h-2 flex-1" />
+                <span className="text-lg font-bold text-primary min-w-[3rem] text-right">
+                  {project.overall_progress}%
+                </span>
+              </div>
+            </div>
+          </div>
+
+          {/* 사사표기 */}
+          {FUNDING_ACKNOWLEDGMENT[project.id] && (
+            <div className="mt-4 pt-4 border-t">
+              <div className="flex items-center gap-2">
+                <p className="text-xs text-muted-foreground uppercase tracking-wide">사사표기</p>
+                <Badge variant="outline" className={`text-xs font-medium border ${FUNDING_BADGE_COLORS[FUNDING_ACKNOWLEDGMENT[project.id]] || ""}`}>
+                  <Award className="h-3 w-3 mr-1" />
+                  {FUNDING_ACKNOWLEDGMENT[project.id]}
+                </Badge>
+              </div>
+            </div>
+          )}
+
+          {/* 투고 상태 섹션 (진행률 100% 또는 투고 후에만 표시) */}
+          {(project.overall_progress === 100 || project.submission_status !== "not_submitted") && (
+            <div className="mt-6 pt-6 border-t">
+              <div className="flex items-center justify-between">
+                <div className="space-y-1">
+                  <p className="text-xs text-muted-foreground uppercase tracking-wide">투고 상태</p>
+                  <Badge className={getSubmissionStatusColor(project.submission_status)}>
+                    {getSubmissionStatusLabel(project.submission_status)}
+                  </Badge>
+                  {project.submitted_at && (
+                    <p className="text-xs text-muted-foreground mt-1">
+                      투고일: {formatDate(project.submitted_at)}
+                    </p>
+                  )}
+                </div>
+                {project.submission_status !== "not_submitted" && (
+                  <Select
+                    value={project.submission_status}
+                    onValueChange={async (value) => {
+                      await updateSubmissionStatus(id, value);
+                      router.refresh();
+                    }}
+                  >
+                    <SelectTrigger className="w-[180px]">
+                      <SelectValue placeholder="상태 변경" />
+                    </SelectTrigger>
+                    <SelectContent>
+                      {Object.entries(SUBMISSION_STATUS_CONFIG)
+                        .filter(([key]) => key !== "not_submitted")
+                        .map(([key, config]) => (
+                          <SelectItem key={key} value={key}>
+                            {config.label}
+                          </SelectItem>
+                        ))}
+                    </SelectContent>
+                  </Select>
+                )}
+              </div>
+            </div>
+          )}
+        </CardContent>
+      </Card>
+    </>
+  );
+}
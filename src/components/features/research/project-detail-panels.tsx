@@ -0,0 +1,37 @@
+"use client";
+
+import { useRouter } from "next/navigation";
+import { WeeklyGoals } from "@/components/features/research/weekly-goals";
+import { ProjectTimeline } from "@/components/features/research/project-timeline";
+import { ResearchFlowchart } from "@/components/features/research/research-flowchart";
+import { MeetingNotesSection } from "@/components/features/research/meeting-notes-section";
+import type { ComponentProps } from "react";
+
+// 연구 상세 페이지는 서버 컴포넌트 섹션으로 스트리밍되므로
+// 기존 클라이언트 섹션의 onRefresh를 router.refresh()로 연결한다.
+
+export function WeeklyGoalsPanel(props: Omit<ComponentProps<typeof WeeklyGoals>, "onRefresh">) {
+  const router = useRouter();
+  return <WeeklyGoals {...props} onRefresh={router.refresh} />;
+}
+
+export function ProjectTimelinePanel(
+  props: Omit<ComponentProps<typeof ProjectTimeline>, "onRefresh">
+) {
+  const router = useRouter();
+  return <ProjectTimeline {...props} onRefresh={router.refresh} />;
+}
+
+export function ResearchFlowchartPanel(
+  props: Omit<ComponentProps<typeof ResearchFlowchart>, "onRefresh">
+) {
+  const router = useRouter();
+  return <ResearchFlowchart {...props} onRefresh={router.refresh} />;
+}
+
+export function MeetingNotesPanel(
+  props: Omit<ComponentProps<typeof MeetingNotesSection>, "onRefresh">
+) {
+  const router = useRouter();
+  return <MeetingNotesSection {...props} onRefresh={router.refresh} />;
+}
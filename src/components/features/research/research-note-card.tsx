@@ -42,7 +42,16 @@ const MarkdownRenderer = dynamic(
     ),
   }
 );
-import { deleteResearchNote, uploadNoteFile, deleteNoteFile } from "@/lib/actions/research-notes";
+import {
+  deleteResearchNote,
+  createNoteFileUpload,
+  completeNoteFileUpload,
+  deleteNoteFile,
+} from "@/lib/actions/research-notes";
+import { uploadAttachment } from "@/lib/storage/upload-attachment";
+import { ATTACHMENT_EXTENSIONS } from "@/lib/storage/upload-policy";
+import type { DerivativesStatus } from "@/lib/storage/derivatives";
+import { FileThumbnail } from "@/components/file-thumbnail";
 import { formatDate, getInitials } from "@/lib/utils";
 import { MILESTONE_STAGE_LABEL } from "@/lib/constants";
 import { NoteCommentSection } from "./note-comment-section";
@@ -68,6 +77,7 @@ interface FileItem {
   file_path: string;
   file_size: number | null;
   mime_type: string | null;
+  derivatives_status: DerivativesStatus | null;
 }
 
 interface ResearchNoteCardProps {
@@ -125,9 +135,12 @@ export function ResearchNoteCard({
 
     setUploading(true);
     try {
-      const formData = new FormData();
-      formData.append("file", file);
-      const result = await uploadNoteFile(note.id, formData);
+      const result = await uploadAttachment({
+        file,
+        scope: `note:${note.id}`,
+        createUpload: (meta) => createNoteFileUpload(note.id, meta),
+        completeUpload: (path, meta) => completeNoteFileUpload(note.id, path, meta),
+      });
       if (!result.error) {
         onRefresh();
       } else {
@@ -283,7 +296,7 @@ export function ResearchNoteCard({
                       type="file"
                       className="hidden"
                       onChange={handleFileUpload}
-                      accept=".pdf,.docx,.xlsx,.pptx,.png,.jpg,.jpeg"
+                      accept={ATTACHMENT_EXTENSIONS}
                       disabled={uploading}
                     />
                     <Button
@@ -310,6 +323,12 @@ export function ResearchNoteCard({
                       key={file.id}
                       className="flex items-center justify-between gap-2 p-2 rounded-md bg-muted/50"
                     >
+                      <FileThumbnail
+                        bucket="research-notes"
+                        fileId={file.id}
+                        mimeType={file.mime_type}
+                        status={file.derivatives_status}
+                      />
                       <span className="text-sm truncate flex-1">
                         {file.original_filename}
                         <span className="text-muted-foreground ml-2">
@@ -17,6 +17,7 @@ import { ResearchNoteForm } from "./research-note-form";
 import { createClient } from "@/lib/supabase/client";
 import { MILESTONE_STAGE_LABEL } from "@/lib/constants";
 import type { MilestoneStage } from "@/types/database.types";
+import type { DerivativesStatus } from "@/lib/storage/derivatives";
 
 // 8단계 연구 단계
 const MILESTONE_STAGES: MilestoneStage[] = [
@@ -54,6 +55,7 @@ interface FileItem {
   file_path: string;
   file_size: number | null;
   mime_type: string | null;
+  derivatives_status: DerivativesStatus | null;
 }
 
 interface ResearchNote {
@@ -148,9 +150,10 @@ export function ResearchNotesSection({
     if (noteIds.length > 0) {
       const { data: filesData } = await supabase
         .from("files")
-        .select("id, original_filename, file_path, file_size, mime_type, entity_id")
+        .select("id, original_filename, file_path, file_size, mime_type, derivatives_status, entity_id")
         .eq("entity_type", "research_note")
-        .in("entity_id", noteIds);
+        .in("entity_id", noteIds)
+        .is("parent_file_id", null); // 썸네일(파생 파일) 행 제외
 
       type FileQueryResult = {
         id: string;
@@ -158,6 +161,7 @@ export function ResearchNotesSection({
         file_path: string;
         file_size: number | null;
         mime_type: string | null;
+        derivatives_status: DerivativesStatus | null;
         entity_id: string;
       };
       const files = (filesData || []) as FileQueryResult[];
@@ -171,6 +175,7 @@ export function ResearchNotesSection({
           file_path: file.file_path,
           file_size: file.file_size,
           mime_type: file.mime_type,
+          derivatives_status: file.derivatives_status,
         });
       });
     }
@@ -0,0 +1,79 @@
+"use client";
+
+import { useEffect, useState } from "react";
+import Image from "next/image";
+import { File, FileText, ImageIcon } from "lucide-react";
+import { createClient } from "@/lib/supabase/client";
+import {
+  derivativePath,
+  pickDerivativeWidth,
+  type DerivativesStatus,
+} from "@/lib/storage/derivatives";
+import { cn } from "@/lib/utils";
+
+// 서명 URL 유효 시간 (초)
+const SIGNED_URL_TTL = 60 * 60;
+
+interface FileThumbnailProps {
+  bucket: string;
+  fileId: string;
+  mimeType: string | null;
+  status?: DerivativesStatus | null;
+  // 표시 크기 (CSS px, 정사각형)
+  size?: number;
+  className?: string;
+}
+
+// 첨부파일 미리보기: 원본 대신 표시 크기에 맞는 가장 작은 썸네일을 받는다.
+// 썸네일이 아직 없으면(워커 대기 중, 문서 파일) 아이콘을 보여준다.
+export function FileThumbnail({
+  bucket,
+  fileId,
+  mimeType,
+  status,
+  size = 40,
+  className,
+}: FileThumbnailProps) {
+  const [src, setSrc] = useState<string | null>(null);
+  const isReady = status === "ready";
+
+  useEffect(() => {
+    if (!isReady) return;
+
+    let cancelled = false;
+    const width = pickDerivativeWidth(size, window.devicePixelRatio);
+    createClient()
+      .storage.from(bucket)
+      .createSignedUrl(derivativePath(fileId, width), SIGNED_URL_TTL)
+      .then(({ data }) => {
+        if (!cancelled && data) setSrc(data.signedUrl);
+      });
+
+    return () => {
+      cancelled = true;
+    };
+  }, [bucket, fileId, size, isReady]);
+
+  const boxClass = cn(
+    "relative flex-shrink-0 overflow-hidden rounded bg-muted flex items-center justify-center",
+    className
+  );
+
+  if (isReady && src) {
+    return (
+      <div className={boxClass} style={{ width: size, height: size }}>
+        {/* 이미 표시 크기에 맞춘 파생본이라 Next.js 이미지 최적화를 거치지 않는다 */}
+        <Image src={src} alt="" fill sizes={`${size}px`} unoptimized className="object-cover" />
+      </div>
+    );
+  }
+
+  const Icon =
+    mimeType === "application/pdf" ? FileText : mimeType?.startsWith("image/") ? ImageIcon : File;
+
+  return (
+    <div className={boxClass} style={{ width: size, height: size }}>
+      <Icon className="h-4 w-4 text-muted-foreground" />
+    </div>
+  );
+}
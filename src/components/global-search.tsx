@@ -2,7 +2,7 @@
 
 import * as React from "react";
 import { useRouter } from "next/navigation";
-import { Search, User, FileText, MessageSquare } from "lucide-react";
+import { Search, User, FileText, MessageSquare, BookOpen, Megaphone, Library } from "lucide-react";
 import {
   CommandDialog,
   CommandEmpty,
@@ -12,14 +12,14 @@ import {
   CommandList,
 } from "@/components/ui/command";
 import { Button } from "@/components/ui/button";
-import { globalSearch, type SearchResult } from "@/lib/actions/search";
+import type { SearchResult, SearchResultType } from "@/lib/actions/search";
+import { useGlobalSearch } from "@/hooks/use-global-search";
 
 export function GlobalSearch() {
   const router = useRouter();
   const [open, setOpen] = React.useState(false);
   const [query, setQuery] = React.useState("");
-  const [results, setResults] = React.useState<SearchResult[]>([]);
-  const [isLoading, setIsLoading] = React.useState(false);
+  const { results, isLoading } = useGlobalSearch(query);
 
   // Keyboard shortcut (Cmd/Ctrl + K)
   React.useEffect(() => {
@@ -34,33 +34,14 @@ export function GlobalSearch() {
     return () => document.removeEventListener("keydown", down);
   }, []);
 
-  // Search with debounce
-  React.useEffect(() => {
-    if (!query || query.length < 2) {
-      setResults([]);
-      return;
-    }
-
-    const timeoutId = setTimeout(async () => {
-      setIsLoading(true);
-      try {
-        const searchResults = await globalSearch(query);
-        setResults(searchResults);
-      } catch (error) {
-        console.error("Search error:", error);
-        setResults([]);
-      } finally {
-        setIsLoading(false);
-      }
-    }, 300);
-
-    return () => clearTimeout(timeoutId);
-  }, [query]);
-
   const handleSelect = (href: string) => {
     setOpen(false);
     setQuery("");
-    setResults([]);
+    // 논문은 외부 링크(DOI/URL)일 수 있음
+    if (/^https?:\/\//.test(href)) {
+      window.open(href, "_blank", "noopener,noreferrer");
+      return;
+    }
     router.push(href);
   };
 
@@ -72,6 +53,12 @@ export function GlobalSearch() {
         return <FileText className="h-4 w-4" />;
       case "mentoring":
         return <MessageSquare className="h-4 w-4" />;
+      case "research_note":
+        return <BookOpen className="h-4 w-4" />;
+      case "announcement":
+        return <Megaphone className="h-4 w-4" />;
+      case "paper":
+        return <Library className="h-4 w-4" />;
     }
   };
 
@@ -83,19 +70,23 @@ export function GlobalSearch() {
         return "연구 프로젝트";
       case "mentoring":
         return "멘토링";
+      case "research_note":
+        return "연구노트";
+      case "announcement":
+        return "공지사항";
+      case "paper":
+        return "논문";
     }
   };
 
-  // Group results by type
+  // Group results by type (결과는 관련도순이므로 가장 관련도 높은 결과가 있는 그룹이 먼저 온다)
   const groupedResults = React.useMemo(() => {
-    const groups: Record<SearchResult["type"], SearchResult[]> = {
-      member: [],
-      project: [],
-      mentoring: [],
-    };
+    const groups = new Map<SearchResultType, SearchResult[]>();
 
     for (const result of results) {
-      groups[result.type].push(result);
+      const items = groups.get(result.type) ?? [];
+      items.push(result);
+      groups.set(result.type, items);
     }
 
     return groups;
@@ -115,7 +106,7 @@ export function GlobalSearch() {
 
       <CommandDialog open={open} onOpenChange={setOpen}>
         <CommandInput
-          placeholder="연구원, 프로젝트, 멘토링 검색..."
+          placeholder="연구원, 프로젝트, 멘토링, 연구노트, 공지, 논문 검색..."
           value={query}
           onValueChange={setQuery}
         />
@@ -138,10 +129,7 @@ export function GlobalSearch() {
 
           {!isLoading && results.length > 0 && (
             <>
-              {(["member", "project", "mentoring"] as const).map((type) => {
-                const items = groupedResults[type];
-                if (items.length === 0) return null;
-
+              {Array.from(groupedResults.entries()).map(([type, items]) => {
                 return (
                   <CommandGroup key={type} heading={getGroupTitle(type)}>
                     {items.map((result) => (
@@ -0,0 +1,88 @@
+"use client";
+
+import { useCallback, useEffect, useState } from "react";
+import { useQueries, useQueryClient, type UseQueryResult } from "@tanstack/react-query";
+import { getCalendarEventsForMonth } from "@/lib/actions/calendar";
+import type { CachedCalendarEvent } from "@/lib/cache/lab-data";
+import { monthKey, monthsInView, shiftMonth, type MonthKey } from "@/lib/calendar/months";
+
+export type CalendarMonthEvent = CachedCalendarEvent;
+
+// 월별 쿼리 키: ["calendar-events", "YYYY-MM"]
+export const CALENDAR_EVENTS_QUERY_KEY = "calendar-events";
+
+async function fetchMonth(month: MonthKey): Promise<CalendarMonthEvent[]> {
+  const result = await getCalendarEventsForMonth(month);
+  if (result.error) throw new Error(result.error);
+  return result.data ?? [];
+}
+
+// 여러 달에 걸친 일정은 월마다 한 번씩 내려오므로 id로 합친다.
+// 모듈 수준 함수라 결과가 바뀌지 않으면 같은 참조가 유지된다.
+function combineMonths(results: UseQueryResult<CalendarMonthEvent[]>[]) {
+  const byId = new Map<string, CalendarMonthEvent>();
+  for (const result of results) {
+    for (const event of result.data ?? []) byId.set(event.id, event);
+  }
+  return {
+    events: Array.from(byId.values()).sort((a, b) =>
+      a.start_date.localeCompare(b.start_date)
+    ),
+    isLoading: results.some((r) => r.isLoading),
+  };
+}
+
+/**
+ * 캘린더에 보이는 월만 조회하고 이동 방향의 이웃 월 하나를 미리 받아 둔다.
+ * FullCalendar의 datesSet에서 setVisibleRange를 호출하고,
+ * 일정 변경 후에는 서버 액션이 돌려준 months로 invalidateMonths를 호출한다.
+ */
+export function useCalendarEvents() {
+  const queryClient = useQueryClient();
+  const [view, setView] = useState<{ months: MonthKey[]; direction: 1 | -1 }>(() => ({
+    months: [monthKey(new Date())],
+    direction: 1,
+  }));
+
+  const { events, isLoading } = useQueries({
+    queries: view.months.map((month) => ({
+      queryKey: [CALENDAR_EVENTS_QUERY_KEY, month],
+      queryFn: () => fetchMonth(month),
+    })),
+    combine: combineMonths,
+  });
+
+  useEffect(() => {
+    const neighbor =
+      view.direction > 0
+        ? shiftMonth(view.months[view.months.length - 1], 1)
+        : shiftMonth(view.months[0], -1);
+    queryClient.prefetchQuery({
+      queryKey: [CALENDAR_EVENTS_QUERY_KEY, neighbor],
+      queryFn: () => fetchMonth(neighbor),
+    });
+  }, [queryClient, view]);
+
+  const setVisibleRange = useCallback((start: Date, end: Date) => {
+    const months = monthsInView(start, end);
+    setView((prev) => {
+      if (prev.months.join() === months.join()) return prev;
+      return { months, direction: months[0] < prev.months[0] ? -1 : 1 };
+    });
+  }, []);
+
+  const invalidateMonths = useCallback(
+    (months?: MonthKey[]) => {
+      if (!months) {
+        queryClient.invalidateQueries({ queryKey: [CALENDAR_EVENTS_QUERY_KEY] });
+        return;
+      }
+      for (const month of new Set(months)) {
+        queryClient.invalidateQueries({ queryKey: [CALENDAR_EVENTS_QUERY_KEY, month] });
+      }
+    },
+    [queryClient]
+  );
+
+  return { events, isLoading, setVisibleRange, invalidateMonths };
+}
@@ -0,0 +1,67 @@
+import { useEffect, useState } from "react";
+import type { SearchResult } from "@/lib/actions/search";
+import { SearchCache, SEARCH_MIN_LENGTH, normalizeSearchQuery } from "@/lib/search/typeahead";
+
+const SEARCH_DEBOUNCE_MS = 200;
+
+// 탭 내 모든 검색창이 공유하는 결과 캐시
+const searchCache = new SearchCache();
+
+// 통합 검색 타이핑 훅
+// - 캐시/접두 좁히기로 답할 수 있으면 디바운스 없이 즉시 반환 (서버 호출 없음)
+// - 그 외에는 디바운스 후 /api/search 조회, 새 입력이 오면 이전 요청을 취소
+export function useGlobalSearch(query: string) {
+  const [results, setResults] = useState<SearchResult[]>([]);
+  const [isLoading, setIsLoading] = useState(false);
+
+  useEffect(() => {
+    const term = normalizeSearchQuery(query);
+
+    if (term.length < SEARCH_MIN_LENGTH) {
+      setResults([]);
+      setIsLoading(false);
+      return;
+    }
+
+    const cached = searchCache.get(term);
+    if (cached) {
+      setResults(cached);
+      setIsLoading(false);
+      return;
+    }
+
+    setIsLoading(true);
+    const controller = new AbortController();
+
+    const timeoutId = setTimeout(async () => {
+      try {
+        const response = await fetch(`/api/search?q=${encodeURIComponent(term)}`, {
+          signal: controller.signal,
+        });
+        if (!response.ok) {
+          throw new Error(`Search failed: ${response.status}`);
+        }
+
+        const { data } = (await response.json()) as { data: SearchResult[] };
+        searchCache.set(term, data);
+        if (!controller.signal.aborted) {
+          setResults(data);
+          setIsLoading(false);
+        }
+      } catch (error) {
+        if (controller.signal.aborted) return;
+        console.error("Search error:", error);
+        setResults([]);
+        setIsLoading(false);
+      }
+    }, SEARCH_DEBOUNCE_MS);
+
+    // 새 입력이 오면 대기 중인 타이머와 진행 중인 요청을 모두 취소
+    return () => {
+      clearTimeout(timeoutId);
+      controller.abort();
+    };
+  }, [query]);
+
+  return { results, isLoading };
+}
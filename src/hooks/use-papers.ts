@@ -1,14 +1,7 @@
 import { useQuery } from "@tanstack/react-query";
-import { createClient } from "@supabase/supabase-js";
+import { createClient } from "@/lib/supabase/client";
 import type { PaperMapData, PaperMapNode, PaperMapLink } from "@/lib/papers/types";
 
-function createPapersClient() {
-  return createClient(
-    process.env.NEXT_PUBLIC_SUPABASE_URL!,
-    process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!
-  );
-}
-
 interface UsePapersOptions {
   enabled?: boolean;
 }
@@ -21,33 +14,45 @@ interface FieldPaper {
   doi: string | null;
 }
 
+// get_paper_field_summaries() 결과 (00036 paper_field_summaries)
 interface FieldSummary {
-  fieldId: string;
-  fieldName: string;
-  mapNodeId: string | null;
-  papers: FieldPaper[];
+  field_id: string;
+  field_name: string;
+  map_node_id: string | null;
+  paper_count: number;
+  top_papers: FieldPaper[];
+  top_journals: string[];
+  year_histogram: Record<string, number>;
 }
 
-function buildSummaryHtml(papers: FieldPaper[]): string {
-  const topPapers = [...papers]
-    .sort((a, b) => b.citation_count - a.citation_count)
-    .slice(0, 5);
-
-  const journalCounts = new Map<string, number>();
-  for (const p of papers) {
-    if (p.journal) {
-      journalCounts.set(p.journal, (journalCounts.get(p.journal) ?? 0) + 1);
-    }
-  }
-  const topJournals = [...journalCounts.entries()]
-    .sort((a, b) => b[1] - a[1])
-    .slice(0, 3)
-    .map(([name]) => name);
+// 최근 연도만 표시 (오래된 연도는 막대가 너무 많아진다)
+const HISTOGRAM_YEARS = 8;
+
+function buildYearHistogramHtml(histogram: Record<string, number>): string {
+  const years = Object.keys(histogram)
+    .map(Number)
+    .sort((a, b) => a - b)
+    .slice(-HISTOGRAM_YEARS);
+  if (years.length === 0) return "";
+
+  const max = Math.max(...years.map((y) => histogram[y]));
+  const bars = years
+    .map((y) => {
+      const count = histogram[y];
+      const height = Math.max(2, Math.round((count / max) * 32));
+      return `<div title="${y}: ${count}편" style="flex:1;display:flex;flex-direction:column;align-items:center;justify-content:flex-end;gap:2px"><div style="width:100%;height:${height}px;background:#3b82f6;border-radius:2px"></div><span style="font-size:9px;color:#64748b">${String(y).slice(2)}</span></div>`;
+    })
+    .join("");
+
+  return `<p style="margin:0 0 6px;font-size:11px;font-weight:600;color:#8898b8">연도별 논문 수</p><div style="display:flex;gap:3px;height:46px;margin:0 0 10px">${bars}</div>`;
+}
 
+function buildSummaryHtml(summary: FieldSummary): string {
+  const { top_papers: topPapers, top_journals: topJournals } = summary;
   const parts: string[] = [];
 
   parts.push(
-    `<p style="margin:0 0 8px;font-size:12px;color:#94a3b8">총 <strong style="color:#e0e8ff">${papers.length}</strong>편 논문</p>`
+    `<p style="margin:0 0 8px;font-size:12px;color:#94a3b8">총 <strong style="color:#e0e8ff">${summary.paper_count}</strong>편 논문</p>`
   );
 
   if (topJournals.length > 0) {
@@ -56,6 +61,8 @@ function buildSummaryHtml(papers: FieldPaper[]): string {
     );
   }
 
+  parts.push(buildYearHistogramHtml(summary.year_histogram));
+
   if (topPapers.length > 0) {
     parts.push(`<p style="margin:0 0 6px;font-size:11px;font-weight:600;color:#8898b8">인용 상위 논문</p>`);
     parts.push(`<ol style="margin:0;padding-left:16px">`);
@@ -85,19 +92,19 @@ function escapeHtml(str: string): string {
 }
 
 function summaryToMapNode(summary: FieldSummary): PaperMapNode {
-  const count = summary.papers.length;
-  const topJournals = getTopJournals(summary.papers, 2);
+  const count = summary.paper_count;
+  const topJournals = summary.top_journals.slice(0, 2);
   const desc = topJournals.length > 0
     ? `${count}편 | ${topJournals.join(", ")}`
     : `${count}편`;
 
   return {
-    id: `papersummary_${summary.fieldId.slice(0, 8)}`,
-    label: `${summary.fieldName} (${count})`,
+    id: `papersummary_${summary.field_id.slice(0, 8)}`,
+    label: `${summary.field_name} (${count})`,
     type: "paper",
     size: Math.min(12 + count * 0.5, 25),
     desc,
-    body: buildSummaryHtml(summary.papers),
+    body: buildSummaryHtml(summary),
     doi: null,
     url: null,
     publicationDate: null,
@@ -107,25 +114,12 @@ function summaryToMapNode(summary: FieldSummary): PaperMapNode {
   };
 }
 
-function getTopJournals(papers: FieldPaper[], n: number): string[] {
-  const counts = new Map<string, number>();
-  for (const p of papers) {
-    if (p.journal) {
-      counts.set(p.journal, (counts.get(p.journal) ?? 0) + 1);
-    }
-  }
-  return [...counts.entries()]
-    .sort((a, b) => b[1] - a[1])
-    .slice(0, n)
-    .map(([name]) => name);
-}
-
 function summaryToMapLinks(summary: FieldSummary): PaperMapLink[] {
-  if (!summary.mapNodeId) return [];
+  if (!summary.map_node_id) return [];
   return [
     {
-      source: `papersummary_${summary.fieldId.slice(0, 8)}`,
-      target: summary.mapNodeId,
+      source: `papersummary_${summary.field_id.slice(0, 8)}`,
+      target: summary.map_node_id,
       type: "link",
     },
   ];
@@ -141,60 +135,15 @@ export function usePapers(options?: UsePapersOptions): {
   const query = useQuery<PaperMapData>({
     queryKey: ["papers", "field-summary"],
     queryFn: async () => {
-      const supabase = createPapersClient();
-
-      // 1. Get all active research fields
-      const { data: fields, error: fieldsError } = await supabase
-        .from("research_fields")
-        .select("id, name, map_node_id")
-        .eq("is_active", true);
-      if (fieldsError) throw fieldsError;
-
-      // 2. Get all visible papers with their field links
-      const { data: papers, error: papersError } = await supabase
-        .from("papers")
-        .select(`
-          id, title, journal, publication_year, citation_count, doi,
-          paper_field_links(field_id)
-        `)
-        .eq("is_hidden", false)
-        .order("citation_count", { ascending: false })
-        .limit(500);
-      if (papersError) throw papersError;
-
-      // 3. Group papers by field
-      const fieldMap = new Map<string, FieldPaper[]>();
-      for (const paper of (papers ?? []) as unknown as {
-        title: string;
-        journal: string | null;
-        publication_year: number | null;
-        citation_count: number;
-        doi: string | null;
-        paper_field_links: { field_id: string }[];
-      }[]) {
-        for (const link of paper.paper_field_links ?? []) {
-          const existing = fieldMap.get(link.field_id) ?? [];
-          existing.push({
-            title: paper.title,
-            journal: paper.journal,
-            publication_year: paper.publication_year,
-            citation_count: paper.citation_count,
-            doi: paper.doi,
-          });
-          fieldMap.set(link.field_id, existing);
-        }
-      }
-
-      // 4. Build summary nodes per field
-      const summaries: FieldSummary[] = (fields ?? [])
-        .filter((f) => (fieldMap.get(f.id)?.length ?? 0) > 0)
-        .map((f) => ({
-          fieldId: f.id,
-          fieldName: f.name,
-          mapNodeId: f.map_node_id,
-          papers: fieldMap.get(f.id) ?? [],
-        }));
+      const supabase = createClient();
+
+      // 분야별 요약은 서버에서 미리 계산해 둔다 (논문 자동 검색 후 갱신)
+      // 논문이 없는 분야는 RPC에서 제외된다.
+      // eslint-disable-next-line @typescript-eslint/no-explicit-any
+      const { data, error } = await (supabase as any).rpc("get_paper_field_summaries");
+      if (error) throw error;
 
+      const summaries = (data ?? []) as FieldSummary[];
       const nodes: PaperMapNode[] = summaries.map(summaryToMapNode);
       const mapLinks: PaperMapLink[] = summaries.flatMap(summaryToMapLinks);
 
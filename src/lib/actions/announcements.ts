@@ -1,7 +1,9 @@
 "use server";
 
 import { createClient } from "@/lib/supabase/server";
+import { getCurrentMember } from "@/lib/cache/current-member";
 import { revalidatePath } from "next/cache";
+import { invalidateLabData, LAB_CACHE_TAGS } from "@/lib/cache/lab-data";
 import type { AnnouncementPriority } from "@/types/database.types";
 
 export interface AnnouncementFormState {
@@ -106,24 +108,10 @@ export async function createAnnouncement(
   formData: FormData
 ): Promise<AnnouncementFormState> {
   const supabase = await createClient();
-
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // 현재 사용자의 member 정보 조회
-  const { data: member } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("id", user.id)
-    .single() as { data: { id: string; position: string } | null; error: unknown };
+  const member = await getCurrentMember();
 
   if (!member) {
-    return { error: "회원 정보를 찾을 수 없습니다." };
+    return { error: "로그인이 필요합니다." };
   }
 
   // professor 권한 확인
@@ -156,6 +144,7 @@ export async function createAnnouncement(
     return { error: "공지사항 생성에 실패했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.announcements);
   revalidatePath("/dashboard");
   revalidatePath("/announcements");
   return { success: true };
@@ -167,23 +156,13 @@ export async function updateAnnouncement(
   formData: FormData
 ): Promise<AnnouncementFormState> {
   const supabase = await createClient();
+  const member = await getCurrentMember();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
-  // 현재 사용자의 member 정보 조회
-  const { data: member } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("id", user.id)
-    .single() as { data: { id: string; position: string } | null; error: unknown };
-
-  if (!member || member.position !== "professor") {
+  if (member.position !== "professor") {
     return { error: "공지사항 수정 권한이 없습니다." };
   }
 
@@ -209,6 +188,7 @@ export async function updateAnnouncement(
     return { error: "공지사항 수정에 실패했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.announcements);
   revalidatePath("/dashboard");
   revalidatePath("/announcements");
   return { success: true };
@@ -219,23 +199,13 @@ export async function deleteAnnouncement(
   id: string
 ): Promise<AnnouncementFormState> {
   const supabase = await createClient();
+  const member = await getCurrentMember();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
-  // 현재 사용자의 member 정보 조회
-  const { data: member } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("id", user.id)
-    .single() as { data: { id: string; position: string } | null; error: unknown };
-
-  if (!member || member.position !== "professor") {
+  if (member.position !== "professor") {
     return { error: "공지사항 삭제 권한이 없습니다." };
   }
 
@@ -247,6 +217,7 @@ export async function deleteAnnouncement(
     return { error: "공지사항 삭제에 실패했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.announcements);
   revalidatePath("/dashboard");
   revalidatePath("/announcements");
   return { success: true };
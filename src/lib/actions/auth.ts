@@ -4,6 +4,8 @@ import { createClient } from "@/lib/supabase/server";
 import { createAdminClient } from "@/lib/supabase/admin";
 import { redirect } from "next/navigation";
 import { revalidatePath } from "next/cache";
+import { invalidateLabData, LAB_CACHE_TAGS } from "@/lib/cache/lab-data";
+import { getCurrentMember } from "@/lib/cache/current-member";
 import type { Member, MemberPosition, EmploymentType, MemberStatus } from "@/types/database";
 
 export type AuthState = {
@@ -138,21 +140,13 @@ export async function signOut() {
 export async function approveMember(memberId: string) {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const currentMember = await getCurrentMember();
 
-  if (!user) {
+  if (!currentMember) {
     return { error: "인증이 필요합니다." };
   }
 
-  const { data: currentMember } = await supabase
-    .from("members")
-    .select("position")
-    .eq("id", user.id)
-    .single() as { data: { position: MemberPosition } | null; error: unknown };
-
-  if (currentMember?.position !== "professor") {
+  if (currentMember.position !== "professor") {
     return { error: "권한이 없습니다." };
   }
 
@@ -165,6 +159,7 @@ export async function approveMember(memberId: string) {
     return { error: "승인에 실패했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects);
   revalidatePath("/admin/approvals");
   return { success: true };
 }
@@ -172,21 +167,13 @@ export async function approveMember(memberId: string) {
 export async function rejectMember(memberId: string) {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const currentMember = await getCurrentMember();
 
-  if (!user) {
+  if (!currentMember) {
     return { error: "인증이 필요합니다." };
   }
 
-  const { data: currentMember } = await supabase
-    .from("members")
-    .select("position")
-    .eq("id", user.id)
-    .single() as { data: { position: MemberPosition } | null; error: unknown };
-
-  if (currentMember?.position !== "professor") {
+  if (currentMember.position !== "professor") {
     return { error: "권한이 없습니다." };
   }
 
@@ -196,6 +183,7 @@ export async function rejectMember(memberId: string) {
     return { error: "거절에 실패했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects);
   revalidatePath("/admin/approvals");
   return { success: true };
 }
@@ -208,21 +196,13 @@ export async function adminCreateMember(
   const supabase = await createClient();
 
   // 관리자 권한 확인
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const currentMember = await getCurrentMember();
 
-  if (!user) {
+  if (!currentMember) {
     return { error: "인증이 필요합니다." };
   }
 
-  const { data: currentMember } = await supabase
-    .from("members")
-    .select("position")
-    .eq("id", user.id)
-    .single() as { data: { position: MemberPosition } | null; error: unknown };
-
-  if (currentMember?.position !== "professor") {
+  if (currentMember.position !== "professor") {
     return { error: "관리자 권한이 필요합니다." };
   }
 
@@ -1,9 +1,18 @@
 "use server";
 
 import { createClient } from "@/lib/supabase/server";
-import { revalidatePath } from "next/cache";
 import type { CalendarCategory } from "@/types/database.types";
 import { notifyAdmins } from "@/lib/actions/notifications";
+import {
+  getCachedPublicCalendarMonth,
+  invalidateCalendarMonths,
+  invalidateLabData,
+  LAB_CACHE_TAGS,
+  queryCalendarMonth,
+} from "@/lib/cache/lab-data";
+import { getCurrentMember } from "@/lib/cache/current-member";
+import { eventMonths, type MonthKey } from "@/lib/calendar/months";
+import { recurrenceEnd } from "@/lib/calendar/recurrence";
 
 export type CalendarFormState = {
   error?: string;
@@ -18,30 +27,102 @@ export interface CalendarEventInput {
   all_day: boolean;
   category: CalendarCategory;
   is_public: boolean;
+  // RFC 5545 RRULE 본문 (예: FREQ=WEEKLY). 없으면 단일 일정
+  rrule?: string | null;
+}
+
+// ============================================
+// 월 단위 조회
+// ============================================
+// 캘린더는 보이는 월과 이웃 월 하나만 요청한다 (use-calendar-events).
+// 공개 일정은 월별 공유 캐시, 개인 일정(RLS 적용)만 사용자 클라이언트로 조회한다.
+// 반복 일정은 이 달의 회차만 전개되어 내려온다.
+export async function getCalendarEventsForMonth(month: MonthKey) {
+  const supabase = await createClient();
+
+  const [publicEvents, { data: privateEvents, error }] = await Promise.all([
+    getCachedPublicCalendarMonth(month),
+    queryCalendarMonth(supabase, month, false),
+  ]);
+
+  if (error) {
+    console.error("Error fetching calendar month:", error);
+    return { error };
+  }
+
+  const data = [...publicEvents, ...privateEvents].sort((a, b) =>
+    a.start_date.localeCompare(b.start_date)
+  );
+  return { data };
+}
+
+interface StoredEventDates {
+  start_date: string;
+  end_date: string | null;
+  rrule: string | null;
+}
+
+// 변경 전 일정 (수정/삭제 시 이전 월도 무효화하고, 반복 종료 시각을 다시 계산해야 함)
+async function getStoredEventDates(
+  supabase: Awaited<ReturnType<typeof createClient>>,
+  id: string
+): Promise<StoredEventDates | null> {
+  const { data } = await supabase
+    .from("calendar_events")
+    .select("start_date, end_date, rrule")
+    .eq("id", id)
+    .single();
+  return data as StoredEventDates | null;
+}
+
+// 무효화할 월. 반복 시리즈가 관련되면 모든 월(undefined)
+function affectedMonths(...events: (StoredEventDates | null)[]): MonthKey[] | undefined {
+  const known = events.filter((e): e is StoredEventDates => e !== null);
+  if (known.some((e) => e.rrule)) return undefined;
+  return known.flatMap((e) => eventMonths(e.start_date, e.end_date));
+}
+
+// 시리즈 상한(recurrence_end) 계산. 규칙이 잘못되면 오류 메시지
+function recurrenceFields(
+  event: StoredEventDates
+): { rrule: string | null; recurrence_end: string | null } | { error: string } {
+  if (!event.rrule) return { rrule: null, recurrence_end: null };
+  try {
+    const end = recurrenceEnd({ id: "", ...event });
+    return { rrule: event.rrule, recurrence_end: end ? end.toISOString() : null };
+  } catch {
+    return { error: "반복 규칙이 올바르지 않습니다." };
+  }
+}
+
+function invalidateCalendar(months: MonthKey[] | undefined) {
+  invalidateCalendarMonths(months);
+  // 대시보드 다가오는 일정 캐시
+  invalidateLabData(LAB_CACHE_TAGS.calendar);
 }
 
 export async function createCalendarEvent(input: CalendarEventInput) {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user || !user.email) {
+  if (!member) {
     return { error: "Unauthorized" };
   }
 
-  // Get member_id from user email
-  const { data: memberData } = await supabase
-    .from("members")
-    .select("id")
-    .eq("email", user.email)
-    .single();
+  const memberId = member.id;
 
-  const member = memberData as { id: string } | null;
-  const memberId = member?.id;
+  const recurrence = recurrenceFields({
+    start_date: input.start_date,
+    end_date: input.end_date ?? null,
+    rrule: input.rrule || null,
+  });
+  if ("error" in recurrence) {
+    return { error: recurrence.error };
+  }
 
   const insertData = {
+    ...recurrence,
     title: input.title,
     description: input.description,
     start_date: input.start_date,
@@ -49,7 +130,7 @@ export async function createCalendarEvent(input: CalendarEventInput) {
     all_day: input.all_day,
     category: input.category,
     is_public: input.is_public,
-    created_by: memberId || null,
+    created_by: memberId,
     member_id: input.is_public ? null : memberId,
   };
 
@@ -65,25 +146,23 @@ export async function createCalendarEvent(input: CalendarEventInput) {
   }
 
   // 관리자 알림
-  if (memberId) {
-    const { data: actorMember } = await supabase
-      .from("members")
-      .select("name")
-      .eq("id", memberId)
-      .single();
-    const actorName = (actorMember as { name: string } | null)?.name || "멤버";
-
-    await notifyAdmins({
-      actorId: memberId,
-      actorName,
-      title: "캘린더 일정 추가",
-      message: `${actorName}님이 일정을 추가했습니다: "${input.title}"`,
-      link: `/calendar`,
-    });
-  }
+  const actorName = member.name || "멤버";
 
-  revalidatePath("/calendar");
-  return { data };
+  await notifyAdmins({
+    actorId: memberId,
+    actorName,
+    title: "캘린더 일정 추가",
+    message: `${actorName}님이 일정을 추가했습니다: "${input.title}"`,
+    link: `/calendar`,
+  });
+
+  const months = affectedMonths({
+    start_date: input.start_date,
+    end_date: input.end_date ?? null,
+    rrule: recurrence.rrule,
+  });
+  invalidateCalendar(months);
+  return { data, months };
 }
 
 export async function updateCalendarEvent(
@@ -92,11 +171,9 @@ export async function updateCalendarEvent(
 ) {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "Unauthorized" };
   }
 
@@ -115,6 +192,22 @@ export async function updateCalendarEvent(
     }
   }
 
+  const previous = await getStoredEventDates(supabase, id);
+
+  // 날짜나 반복 규칙이 바뀌면 시리즈 상한을 다시 계산
+  const next: StoredEventDates | null = previous && {
+    start_date: input.start_date ?? previous.start_date,
+    end_date: input.end_date !== undefined ? input.end_date : previous.end_date,
+    rrule: input.rrule !== undefined ? input.rrule || null : previous.rrule,
+  };
+  if (next) {
+    const recurrence = recurrenceFields(next);
+    if ("error" in recurrence) {
+      return { error: recurrence.error };
+    }
+    Object.assign(updateData, recurrence);
+  }
+
   const { data, error } = await supabase
     .from("calendar_events")
     .update(updateData as never)
@@ -127,38 +220,34 @@ export async function updateCalendarEvent(
     return { error: error.message };
   }
 
+  const months = affectedMonths(previous, next);
+
   // 관리자 알림
-  const { data: actorMember } = await supabase
-    .from("members")
-    .select("id, name")
-    .eq("id", user.id)
-    .single();
-  const actorId = (actorMember as { id: string; name: string } | null)?.id || user.id;
-  const actorName = (actorMember as { id: string; name: string } | null)?.name || "멤버";
+  const actorName = member.name || "멤버";
 
   await notifyAdmins({
-    actorId,
+    actorId: member.id,
     actorName,
     title: "캘린더 일정 수정",
     message: `${actorName}님이 일정을 수정했습니다: "${input.title || ""}"`,
     link: `/calendar`,
   });
 
-  revalidatePath("/calendar");
-  return { data };
+  invalidateCalendar(months);
+  return { data, months };
 }
 
 export async function deleteCalendarEvent(id: string) {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "Unauthorized" };
   }
 
+  const months = affectedMonths(await getStoredEventDates(supabase, id));
+
   const { error } = await supabase
     .from("calendar_events")
     .delete()
@@ -169,8 +258,8 @@ export async function deleteCalendarEvent(id: string) {
     return { error: error.message };
   }
 
-  revalidatePath("/calendar");
-  return { success: true };
+  invalidateCalendar(months);
+  return { success: true, months };
 }
 
 export async function updateEventDates(
@@ -180,17 +269,27 @@ export async function updateEventDates(
 ) {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "Unauthorized" };
   }
 
+  const previous = await getStoredEventDates(supabase, id);
+  const next: StoredEventDates = {
+    start_date,
+    end_date: end_date ?? null,
+    rrule: previous?.rrule ?? null,
+  };
+  const recurrence = recurrenceFields(next);
+  if ("error" in recurrence) {
+    return { error: recurrence.error };
+  }
+
   const updateData = {
     start_date,
     end_date,
+    recurrence_end: recurrence.recurrence_end,
   };
 
   const { error } = await supabase
@@ -203,8 +302,108 @@ export async function updateEventDates(
     return { error: error.message };
   }
 
-  revalidatePath("/calendar");
-  return { success: true };
+  const months = affectedMonths(previous, next);
+  invalidateCalendar(months);
+  return { success: true, months };
+}
+
+// 반복 일정의 한 회차만 취소 (calendar_event_exceptions)
+export async function cancelEventOccurrence(seriesId: string, originalStart: string) {
+  const supabase = await createClient();
+
+  const member = await getCurrentMember();
+
+  if (!member) {
+    return { error: "Unauthorized" };
+  }
+
+  const { error } = await supabase
+    .from("calendar_event_exceptions")
+    .upsert(
+      {
+        event_id: seriesId,
+        original_start: originalStart,
+        is_cancelled: true,
+        created_by: member.id,
+      } as never,
+      { onConflict: "event_id,original_start" }
+    );
+
+  if (error) {
+    console.error("Error cancelling occurrence:", error);
+    return { error: error.message };
+  }
+
+  const months = eventMonths(originalStart);
+  invalidateCalendar(months);
+  return { success: true, months };
+}
+
+// ============================================
+// 캘린더 구독 피드 (ICS)
+// ============================================
+// 피드 URL의 토큰이 곧 인증이다 (/api/calendar/feed/[token]).
+// 처음 요청할 때 본인 피드 행을 만들고, 유출되면 토큰만 재발급한다.
+
+function newFeedToken() {
+  return (crypto.randomUUID() + crypto.randomUUID()).replace(/-/g, "");
+}
+
+export async function getCalendarFeedToken() {
+  const supabase = await createClient();
+
+  const member = await getCurrentMember();
+
+  if (!member) {
+    return { error: "Unauthorized" };
+  }
+
+  const { data: existing } = await supabase
+    .from("calendar_feeds")
+    .select("token")
+    .eq("member_id", member.id)
+    .maybeSingle();
+
+  if (existing) {
+    return { token: (existing as { token: string }).token };
+  }
+
+  const { data, error } = await supabase
+    .from("calendar_feeds")
+    .insert({ member_id: member.id, token: newFeedToken() } as never)
+    .select("token")
+    .single();
+
+  if (error) {
+    console.error("Error creating calendar feed:", error);
+    return { error: error.message };
+  }
+
+  return { token: (data as { token: string }).token };
+}
+
+export async function rotateCalendarFeedToken() {
+  const supabase = await createClient();
+
+  const member = await getCurrentMember();
+
+  if (!member) {
+    return { error: "Unauthorized" };
+  }
+
+  const { data, error } = await supabase
+    .from("calendar_feeds")
+    .update({ token: newFeedToken() } as never)
+    .eq("member_id", member.id)
+    .select("token")
+    .single();
+
+  if (error) {
+    console.error("Error rotating calendar feed token:", error);
+    return { error: error.message };
+  }
+
+  return { token: (data as { token: string }).token };
 }
 
 // Form-compatible wrapper functions for useActionState
@@ -0,0 +1,54 @@
+"use server";
+
+import { getCachedDashboardSnapshot } from "@/lib/cache/lab-data";
+import type { SubmissionStatus } from "@/types/database.types";
+
+export interface DashboardSnapshotProject {
+  id: string;
+  title: string;
+  status: string;
+  overall_progress: number;
+  updated_at: string;
+  submission_status: SubmissionStatus;
+  target_journal: string | null;
+  is_archived: boolean;
+}
+
+export interface DashboardSnapshotGoal {
+  id: string;
+  content: string;
+  deadline: string;
+  is_completed: boolean;
+  project_id: string;
+  project_title: string;
+  member_name: string | null;
+  member_avatar_url: string | null;
+}
+
+export interface DashboardSnapshot {
+  project_status_counts: Record<string, number>;
+  total_projects: number;
+  average_progress: number;
+  submitted_projects: DashboardSnapshotProject[];
+  goal_deadlines: DashboardSnapshotGoal[];
+  goals_window_start: string;
+  projects_refreshed_at: string;
+  goals_refreshed_at: string;
+}
+
+const EMPTY_SNAPSHOT: DashboardSnapshot = {
+  project_status_counts: {},
+  total_projects: 0,
+  average_progress: 0,
+  submitted_projects: [],
+  goal_deadlines: [],
+  goals_window_start: "",
+  projects_refreshed_at: "",
+  goals_refreshed_at: "",
+};
+
+// 대시보드 스냅샷 조회 (트리거로 미리 계산된 단일 행, 00027)
+// 연구실 공용 데이터이므로 공유 캐시(lab:dashboard 태그)를 거친다.
+export async function getDashboardSnapshot(): Promise<DashboardSnapshot> {
+  return (await getCachedDashboardSnapshot()) ?? EMPTY_SNAPSHOT;
+}
@@ -1,26 +1,103 @@
 "use server";
 
 import { createClient } from "@/lib/supabase/server";
+import { getCurrentMember } from "@/lib/cache/current-member";
 import { revalidatePath } from "next/cache";
 import { redirect } from "next/navigation";
 import { notifyAdmins } from "@/lib/actions/notifications";
+import {
+  buildAttachmentPath,
+  validateAttachment,
+  type AttachmentMeta,
+  type UploadTarget,
+} from "@/lib/storage/upload-policy";
+import { getUploadedObjectSize } from "@/lib/storage/uploaded-object";
 
 export interface MentoringFormState {
   error?: string;
   success?: boolean;
 }
 
+export interface MentoringUploadState extends MentoringFormState {
+  data?: UploadTarget;
+}
+
+export interface MentoringLikeState extends MentoringFormState {
+  liked?: boolean;
+  likesCount?: number;
+}
+
+export interface MentoringFeedCursor {
+  meetingDate: string;
+  id: string;
+}
+
+export interface MentoringFeedComment {
+  id: string;
+  content: string;
+  created_at: string;
+  author: { id: string; name: string; avatar_url: string | null } | null;
+}
+
+export interface MentoringFeedPost {
+  id: string;
+  meeting_date: string;
+  content_preview: string;
+  next_steps: string[] | null;
+  next_steps_count: number;
+  likes_count: number;
+  comments_count: number;
+  user_liked: boolean;
+  created_at: string;
+  author: { id: string; name: string; position: string; avatar_url: string | null } | null;
+  recent_comments: MentoringFeedComment[];
+}
+
+const MENTORING_FEED_PAGE_SIZE = 10;
+
+// 멘토링 피드 (get_mentoring_feed RPC, 00033)
+// (meeting_date DESC, id DESC) keyset 페이지네이션이라 이력이 늘어나도 페이지당 비용이 같다.
+export async function getMentoringFeed(
+  cursor?: MentoringFeedCursor | null,
+  search?: string
+): Promise<{ data: MentoringFeedPost[]; nextCursor: MentoringFeedCursor | null; error?: string }> {
+  const supabase = await createClient();
+
+  // 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data, error } = await (supabase as any).rpc("get_mentoring_feed", {
+    p_cursor_date: cursor?.meetingDate ?? null,
+    p_cursor_id: cursor?.id ?? null,
+    p_limit: MENTORING_FEED_PAGE_SIZE + 1,
+    p_search: search?.trim() || null,
+  });
+
+  if (error) {
+    console.error("Mentoring feed error:", error);
+    return { data: [], nextCursor: null, error: "멘토링 기록 조회에 실패했습니다." };
+  }
+
+  const rows = (data || []) as MentoringFeedPost[];
+  const page = rows.slice(0, MENTORING_FEED_PAGE_SIZE);
+  const last = page[page.length - 1];
+
+  return {
+    data: page,
+    nextCursor:
+      rows.length > MENTORING_FEED_PAGE_SIZE && last
+        ? { meetingDate: last.meeting_date, id: last.id }
+        : null,
+  };
+}
+
 export async function createMentoringPost(
   prevState: MentoringFormState,
   formData: FormData
 ): Promise<MentoringFormState> {
   const supabase = await createClient();
+  const member = await getCurrentMember();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -39,7 +116,7 @@ export async function createMentoringPost(
   const { data: post, error } = (await supabase
     .from("mentoring_posts")
     .insert({
-      author_id: user.id,
+      author_id: member.id,
       meeting_date: meetingDate,
       content,
       next_steps: nextSteps,
@@ -53,15 +130,10 @@ export async function createMentoringPost(
   }
 
   // 관리자 알림
-  const { data: actorMember } = await supabase
-    .from("members")
-    .select("name")
-    .eq("id", user.id)
-    .single();
-  const actorName = (actorMember as { name: string } | null)?.name || "멤버";
+  const actorName = member.name || "멤버";
 
   await notifyAdmins({
-    actorId: user.id,
+    actorId: member.id,
     actorName,
     title: "멘토링 기록 등록",
     message: `${actorName}님이 멘토링 기록을 등록했습니다 (${meetingDate})`,
@@ -78,12 +150,9 @@ export async function updateMentoringPost(
   formData: FormData
 ): Promise<MentoringFormState> {
   const supabase = await createClient();
+  const member = await getCurrentMember();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -116,15 +185,10 @@ export async function updateMentoringPost(
   }
 
   // 관리자 알림
-  const { data: actorMember } = await supabase
-    .from("members")
-    .select("name")
-    .eq("id", user.id)
-    .single();
-  const actorName = (actorMember as { name: string } | null)?.name || "멤버";
+  const actorName = member.name || "멤버";
 
   await notifyAdmins({
-    actorId: user.id,
+    actorId: member.id,
     actorName,
     title: "멘토링 기록 수정",
     message: `${actorName}님이 멘토링 기록을 수정했습니다 (${meetingDate})`,
@@ -140,12 +204,9 @@ export async function deleteMentoringPost(
   postId: string
 ): Promise<MentoringFormState> {
   const supabase = await createClient();
+  const member = await getCurrentMember();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -168,27 +229,12 @@ export async function addComment(
   formData: FormData
 ): Promise<MentoringFormState> {
   const supabase = await createClient();
-
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user || !user.email) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // user email로 member id 찾기
-  const { data: member } = await supabase
-    .from("members")
-    .select("id, name")
-    .eq("email", user.email)
-    .single();
+  const member = await getCurrentMember();
 
   if (!member) {
-    return { error: "회원 정보를 찾을 수 없습니다." };
+    return { error: "로그인이 필요합니다." };
   }
 
-  const memberData = member as { id: string; name: string };
   const content = formData.get("content") as string;
 
   if (!content) {
@@ -197,7 +243,7 @@ export async function addComment(
 
   const { error } = (await supabase.from("mentoring_comments").insert({
     post_id: postId,
-    author_id: memberData.id,
+    author_id: member.id,
     content,
   } as never)) as { error: unknown };
 
@@ -206,32 +252,7 @@ export async function addComment(
     return { error: "댓글 작성에 실패했습니다." };
   }
 
-  // 게시물 작성자에게 인앱 알림 발송
-  try {
-    const { data: post } = await supabase
-      .from("mentoring_posts")
-      .select("id, author_id")
-      .eq("id", postId)
-      .single();
-
-    if (post) {
-      const postData = post as { id: string; author_id: string };
-
-      // 본인 게시물에 댓글 달면 알림 안 보냄
-      if (postData.author_id !== memberData.id) {
-        await supabase.from("notifications").insert({
-          member_id: postData.author_id,
-          type: "comment",
-          title: "새 댓글",
-          message: `${memberData.name}님이 회원님의 게시물에 댓글을 남겼습니다.`,
-          link: `/mentoring/${postId}`,
-          is_read: false,
-        } as never);
-      }
-    }
-  } catch (notifError) {
-    console.error("Comment notification error:", notifError);
-  }
+  // 게시물 작성자 알림은 trigger_create_comment_notification이 생성 (00032)
 
   revalidatePath(`/mentoring/${postId}`);
   return { success: true };
@@ -242,12 +263,9 @@ export async function deleteComment(
   postId: string
 ): Promise<MentoringFormState> {
   const supabase = await createClient();
+  const member = await getCurrentMember();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -265,92 +283,28 @@ export async function deleteComment(
   return { success: true };
 }
 
-export async function toggleLike(postId: string): Promise<MentoringFormState> {
+// 좋아요 토글 (toggle_mentoring_like RPC, 00032)
+// 토글, likes_count 갱신, 작성자 알림을 한 트랜잭션으로 처리한다.
+export async function toggleLike(postId: string): Promise<MentoringLikeState> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user || !user.email) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // 현재 사용자 정보 가져오기
-  const { data: currentMember } = await supabase
-    .from("members")
-    .select("id, name")
-    .eq("email", user.email)
-    .single();
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data, error } = await (supabase as any).rpc("toggle_mentoring_like", {
+    p_post_id: postId,
+  });
 
-  if (!currentMember) {
-    return { error: "회원 정보를 찾을 수 없습니다." };
+  if (error) {
+    console.error("Toggle like error:", error);
+    return {
+      error: error.code === "42501" ? "로그인이 필요합니다." : "좋아요 처리에 실패했습니다.",
+    };
   }
 
-  const currentMemberData = currentMember as { id: string; name: string };
-
-  // 좋아요 존재 여부 확인
-  const { data: existingLike } = (await supabase
-    .from("mentoring_likes")
-    .select("id")
-    .eq("post_id", postId)
-    .eq("member_id", currentMemberData.id)
-    .single()) as { data: { id: string } | null; error: unknown };
-
-  if (existingLike) {
-    // 좋아요 취소
-    const { error } = (await supabase
-      .from("mentoring_likes")
-      .delete()
-      .eq("id", existingLike.id)) as { error: unknown };
-
-    if (error) {
-      console.error("Unlike error:", error);
-      return { error: "좋아요 취소에 실패했습니다." };
-    }
-  } else {
-    // 좋아요 추가
-    const { error } = (await supabase.from("mentoring_likes").insert({
-      post_id: postId,
-      member_id: currentMemberData.id,
-    } as never)) as { error: unknown };
-
-    if (error) {
-      console.error("Like error:", error);
-      return { error: "좋아요에 실패했습니다." };
-    }
-
-    // 게시물 작성자에게 인앱 알림 발송 (좋아요 추가 시에만)
-    try {
-      const { data: post } = await supabase
-        .from("mentoring_posts")
-        .select("id, author_id")
-        .eq("id", postId)
-        .single();
-
-      if (post) {
-        const postData = post as { id: string; author_id: string };
-
-        // 본인 게시물에 좋아요하면 알림 안 보냄
-        if (postData.author_id !== currentMemberData.id) {
-          await supabase.from("notifications").insert({
-            member_id: postData.author_id,
-            type: "like",
-            title: "좋아요",
-            message: `${currentMemberData.name}님이 회원님의 게시물을 좋아합니다.`,
-            link: `/mentoring/${postId}`,
-            is_read: false,
-          } as never);
-        }
-      }
-    } catch (notifError) {
-      console.error("Like notification error:", notifError);
-    }
-  }
+  const result = data as { liked: boolean; likes_count: number };
 
   revalidatePath(`/mentoring/${postId}`);
   revalidatePath("/mentoring");
-  return { success: true };
+  return { success: true, liked: result.liked, likesCount: result.likes_count };
 }
 
 export async function addProfessorComment(
@@ -358,12 +312,9 @@ export async function addProfessorComment(
   comment: string
 ): Promise<MentoringFormState> {
   const supabase = await createClient();
+  const member = await getCurrentMember();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -383,33 +334,18 @@ export async function addProfessorComment(
   return { success: true };
 }
 
-export async function uploadMentoringFile(
-  postId: string,
-  formData: FormData
-): Promise<MentoringFormState> {
-  const supabase = await createClient();
-
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+// 파일은 브라우저에서 Storage로 직접 올린다 (src/lib/storage/upload-attachment.ts).
+// 여기서는 서명된 업로드 URL 발급과 업로드 완료 후 메타데이터 저장만 한다.
+const MENTORING_FILES_BUCKET = "mentoring-files";
 
-  if (!user || !user.email) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // Check if user is professor
-  const { data: member } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("email", user.email)
-    .single();
+async function getUploadablePost(postId: string) {
+  const supabase = await createClient();
+  const member = await getCurrentMember();
 
   if (!member) {
-    return { error: "회원 정보를 찾을 수 없습니다." };
+    return { error: "로그인이 필요합니다." } as const;
   }
 
-  const memberData = member as { id: string; position: string };
-
   // Check if post exists
   const { data: post } = await supabase
     .from("mentoring_posts")
@@ -418,74 +354,95 @@ export async function uploadMentoringFile(
     .single();
 
   if (!post) {
-    return { error: "멘토링 기록을 찾을 수 없습니다." };
+    return { error: "멘토링 기록을 찾을 수 없습니다." } as const;
   }
 
   const postData = post as { id: string; author_id: string };
-  const isAuthor = memberData.id === postData.author_id;
-  const isAdmin = memberData.position === "professor";
+  const isAuthor = member.id === postData.author_id;
+  const isAdmin = member.position === "professor";
 
   // Only author or professor can upload files
   if (!isAuthor && !isAdmin) {
-    return { error: "파일 업로드 권한이 없습니다." };
+    return { error: "파일 업로드 권한이 없습니다." } as const;
+  }
+
+  return { supabase, member };
+}
+
+export async function createMentoringFileUpload(
+  postId: string,
+  meta: AttachmentMeta
+): Promise<MentoringUploadState> {
+  const context = await getUploadablePost(postId);
+  if ("error" in context) {
+    return { error: context.error };
   }
 
-  const file = formData.get("file") as File;
-  if (!file) {
-    return { error: "파일을 선택해주세요." };
+  // Validate file type and size
+  const validationError = validateAttachment(meta);
+  if (validationError) {
+    return { error: validationError };
   }
 
-  // Validate file type
-  const allowedTypes = [
-    "application/pdf",
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-    "image/png",
-    "image/jpeg",
-  ];
-
-  if (!allowedTypes.includes(file.type)) {
-    return { error: "허용되지 않는 파일 형식입니다. (PDF, DOCX, XLSX, PPTX, PNG, JPG만 허용)" };
+  const filename = buildAttachmentPath(postId, meta.name);
+  const { data, error } = await context.supabase.storage
+    .from(MENTORING_FILES_BUCKET)
+    .createSignedUploadUrl(filename);
+
+  if (error || !data) {
+    console.error("Signed upload URL error:", error);
+    return { error: "파일 업로드 준비에 실패했습니다." };
   }
 
-  // Validate file size (10MB)
-  if (file.size > 10 * 1024 * 1024) {
-    return { error: "파일 크기는 10MB를 초과할 수 없습니다." };
+  return {
+    success: true,
+    data: { bucket: MENTORING_FILES_BUCKET, path: data.path, token: data.token },
+  };
+}
+
+export async function completeMentoringFileUpload(
+  postId: string,
+  filename: string,
+  meta: AttachmentMeta
+): Promise<MentoringFormState> {
+  const context = await getUploadablePost(postId);
+  if ("error" in context) {
+    return { error: context.error };
   }
+  const { supabase, member } = context;
 
-  // Generate unique filename
-  const timestamp = Date.now();
-  const randomStr = Math.random().toString(36).substring(2, 8);
-  const ext = file.name.split(".").pop();
-  const filename = `${postId}/${timestamp}_${randomStr}.${ext}`;
+  if (!filename.startsWith(`${postId}/`)) {
+    return { error: "잘못된 업로드 경로입니다." };
+  }
 
-  // Upload to storage
-  const { error: uploadError } = await supabase.storage
-    .from("mentoring-files")
-    .upload(filename, file);
+  // Verify the uploaded object and use its stored size
+  const fileSize = await getUploadedObjectSize(supabase, MENTORING_FILES_BUCKET, filename);
+  if (fileSize === null) {
+    return { error: "업로드된 파일을 찾을 수 없습니다." };
+  }
 
-  if (uploadError) {
-    console.error("File upload error:", uploadError);
-    return { error: "파일 업로드에 실패했습니다." };
+  const validationError = validateAttachment({ ...meta, size: fileSize });
+  if (validationError) {
+    await supabase.storage.from(MENTORING_FILES_BUCKET).remove([filename]);
+    return { error: validationError };
   }
 
   // Save file metadata
   const { error: dbError } = (await supabase.from("files").insert({
     filename: filename,
-    original_filename: file.name,
+    original_filename: meta.name,
     storage_path: filename,
-    mime_type: file.type,
-    file_size: file.size,
+    mime_type: meta.type,
+    file_size: fileSize,
     entity_type: "mentoring",
     entity_id: postId,
-    uploaded_by: memberData.id,
+    uploaded_by: member.id,
   } as never)) as { error: unknown };
 
   if (dbError) {
     console.error("File metadata save error:", dbError);
     // Try to delete uploaded file
-    await supabase.storage.from("mentoring-files").remove([filename]);
+    await supabase.storage.from(MENTORING_FILES_BUCKET).remove([filename]);
     return { error: "파일 정보 저장에 실패했습니다." };
   }
 
@@ -1,6 +1,7 @@
 "use server";
 
 import { createClient } from "@/lib/supabase/server";
+import { getCurrentMember } from "@/lib/cache/current-member";
 import { revalidatePath } from "next/cache";
 import type { Notification } from "@/types/database";
 
@@ -12,18 +13,16 @@ export interface NotificationFormState {
 export async function getNotifications(): Promise<Notification[]> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return [];
   }
 
   const { data } = (await supabase
     .from("notifications")
     .select("*")
-    .eq("member_id", user.id)
+    .eq("member_id", member.id)
     .order("created_at", { ascending: false })
     .limit(50)) as { data: Notification[] | null };
 
@@ -35,11 +34,9 @@ export async function markAsRead(
 ): Promise<NotificationFormState> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -47,7 +44,7 @@ export async function markAsRead(
     .from("notifications")
     .update({ is_read: true } as never)
     .eq("id", notificationId)
-    .eq("member_id", user.id)) as { error: unknown };
+    .eq("member_id", member.id)) as { error: unknown };
 
   if (error) {
     console.error("Mark as read error:", error);
@@ -61,18 +58,16 @@ export async function markAsRead(
 export async function markAllAsRead(): Promise<NotificationFormState> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
   const { error } = (await supabase
     .from("notifications")
     .update({ is_read: true } as never)
-    .eq("member_id", user.id)
+    .eq("member_id", member.id)
     .eq("is_read", false)) as { error: unknown };
 
   if (error) {
@@ -89,11 +84,9 @@ export async function deleteNotification(
 ): Promise<NotificationFormState> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -101,7 +94,7 @@ export async function deleteNotification(
     .from("notifications")
     .delete()
     .eq("id", notificationId)
-    .eq("member_id", user.id)) as { error: unknown };
+    .eq("member_id", member.id)) as { error: unknown };
 
   if (error) {
     console.error("Delete notification error:", error);
@@ -115,18 +108,16 @@ export async function deleteNotification(
 export async function deleteAllNotifications(): Promise<NotificationFormState> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
   const { error } = (await supabase
     .from("notifications")
     .delete()
-    .eq("member_id", user.id)) as { error: unknown };
+    .eq("member_id", member.id)) as { error: unknown };
 
   if (error) {
     console.error("Delete all notifications error:", error);
@@ -142,11 +133,9 @@ export async function getUnreadNotificationCount(userId?: string): Promise<numbe
 
   let uid = userId;
   if (!uid) {
-    const {
-      data: { user },
-    } = await supabase.auth.getUser();
-    if (!user) return 0;
-    uid = user.id;
+    const member = await getCurrentMember();
+    if (!member) return 0;
+    uid = member.id;
   }
 
   const { count } = await supabase
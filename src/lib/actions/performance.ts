@@ -0,0 +1,120 @@
+"use server";
+
+import { createClient } from "@/lib/supabase/server";
+import type { MemberPosition } from "@/types/database.types";
+
+// =====================
+// 연구원 성과 지표 (00028)
+// =====================
+
+export interface MemberPerformanceStats {
+  total_projects: number;
+  avg_progress: number;
+  total_milestones: number;
+  completed_milestones: number;
+  on_time_milestones: number;
+  delayed_milestones: number;
+  schedule_adherence: number;
+  mentoring_posts_count: number;
+  mentoring_comments_count: number;
+  refreshed_at: string;
+}
+
+export interface MemberPerformanceMilestone {
+  id: string;
+  stage: string;
+  progress: number;
+  end_date: string | null;
+  completed_at: string | null;
+}
+
+export interface MemberPerformanceProject {
+  id: string;
+  title: string;
+  status: string;
+  overall_progress: number;
+  role: string;
+  milestones: MemberPerformanceMilestone[];
+}
+
+export interface MemberPerformanceActivity {
+  type: "checklist" | "milestone" | "mentoring" | "comment";
+  description: string;
+  date: string;
+  project_title: string | null;
+}
+
+export interface MemberPerformance {
+  member: {
+    id: string;
+    name: string;
+    position: MemberPosition;
+    avatar_url: string | null;
+    admission_date: string | null;
+    graduation_date: string | null;
+  } | null;
+  stats: MemberPerformanceStats | null;
+  projects: MemberPerformanceProject[];
+  recent_activities: MemberPerformanceActivity[];
+}
+
+export interface PerformanceRankingEntry extends MemberPerformanceStats {
+  member_id: string;
+  member: {
+    id: string;
+    name: string;
+    position: MemberPosition;
+    avatar_url: string | null;
+  } | null;
+}
+
+// 성과 페이지 데이터 조회 (get_member_performance RPC, 1회 왕복)
+export async function getMemberPerformance(memberId: string) {
+  const supabase = await createClient();
+
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data, error } = await (supabase as any).rpc("get_member_performance", {
+    p_member_id: memberId,
+  });
+
+  if (error) {
+    console.error("Member performance fetch error:", error);
+    return { error: "성과 정보를 불러오는데 실패했습니다." };
+  }
+
+  return { data: data as MemberPerformance };
+}
+
+// 연구실 성과 순위 (미리 계산된 지표를 그대로 정렬)
+export async function getPerformanceRanking(
+  orderBy: "avg_progress" | "schedule_adherence" | "completed_milestones" = "avg_progress",
+  limit = 20
+) {
+  const supabase = await createClient();
+
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data, error } = await (supabase as any)
+    .from("member_performance_stats")
+    .select(
+      `
+      *,
+      member:members!inner (
+        id,
+        name,
+        position,
+        avatar_url,
+        status
+      )
+    `
+    )
+    .eq("member.status", "active")
+    .order(orderBy, { ascending: false })
+    .limit(limit);
+
+  if (error) {
+    console.error("Performance ranking fetch error:", error);
+    return { error: "성과 순위를 불러오는데 실패했습니다." };
+  }
+
+  return { data: (data || []) as PerformanceRankingEntry[] };
+}
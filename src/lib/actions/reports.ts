@@ -1,11 +1,15 @@
 "use server";
 
 import { createClient } from "@/lib/supabase/server";
+import { getCurrentMember } from "@/lib/cache/current-member";
 import { revalidatePath } from "next/cache";
 import type { ActionResult } from "./research";
 import type {
+  ProgressLogRollupCell,
+  ProgressLogRollupPeriod,
   ProgressLogStatus,
   ProgressLogType,
+  ProgressSummaryRow,
   ReportContent,
   ReportStatus,
 } from "@/types/database";
@@ -73,6 +77,50 @@ export async function getProgressLogs(params: {
   return { success: true, data };
 }
 
+// 보고서 자동 생성용: 원본 로그 대신 하위과제 × 기간 × 유형 × 상태별 집계만 받는다.
+export async function getProgressLogRollup(params: {
+  projectId: string;
+  startDate: string;
+  endDate: string;
+  period?: ProgressLogRollupPeriod;
+}): Promise<ActionResult> {
+  const supabase = await createClient();
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data, error } = await (supabase as any).rpc("get_progress_log_rollup", {
+    p_project_id: params.projectId,
+    p_start_date: params.startDate,
+    p_end_date: params.endDate,
+    p_period: params.period ?? "range",
+  });
+  if (error) return { error: error.message };
+  return { success: true, data: (data ?? []) as ProgressLogRollupCell[] };
+}
+
+// 건수/투입 시간만 필요할 때: progress_rollups(주 단위 증분 집계)에서 읽고
+// 기간 경계에 걸친 주만 원본을 본다. projectId/assigneeId 중 하나 이상 지정한다.
+export async function getProgressSummary(params: {
+  projectId?: string;
+  assigneeId?: string;
+  startDate: string;
+  endDate: string;
+  granularity?: ProgressLogRollupPeriod;
+}): Promise<ActionResult> {
+  if (!params.projectId && !params.assigneeId) {
+    return { error: "projectId or assigneeId is required" };
+  }
+  const supabase = await createClient();
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data, error } = await (supabase as any).rpc("get_progress_summary", {
+    p_start_date: params.startDate,
+    p_end_date: params.endDate,
+    p_granularity: params.granularity ?? "month",
+    p_project_id: params.projectId ?? null,
+    p_assignee_id: params.assigneeId ?? null,
+  });
+  if (error) return { error: error.message };
+  return { success: true, data: (data ?? []) as ProgressSummaryRow[] };
+}
+
 export async function getPersonalProgressLogs(params: {
   assigneeId: string;
   startDate: string;
@@ -107,17 +155,8 @@ export async function addProgressLog(params: {
   hoursSpent?: number;
 }): Promise<ActionResult> {
   const supabase = await createClient();
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) return { error: "Not authenticated" };
-
-  const { data: member } = await supabase
-    .from("members")
-    .select("id")
-    .eq("user_id", user.id)
-    .single();
-
-  const memberData = member as { id: string } | null;
-  if (!memberData) return { error: "Member not found" };
+  const memberData = await getCurrentMember();
+  if (!memberData) return { error: "Not authenticated" };
 
   const { data, error } = await supabase
     .from("progress_logs")
@@ -266,17 +305,8 @@ export async function createReport(params: {
   content: ReportContent;
 }): Promise<ActionResult> {
   const supabase = await createClient();
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) return { error: "Not authenticated" };
-
-  const { data: member } = await supabase
-    .from("members")
-    .select("id")
-    .eq("user_id", user.id)
-    .single();
-
-  const memberData = member as { id: string } | null;
-  if (!memberData) return { error: "Member not found" };
+  const memberData = await getCurrentMember();
+  if (!memberData) return { error: "Not authenticated" };
 
   const { data, error } = await supabase
     .from("reports")
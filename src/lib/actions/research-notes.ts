@@ -1,9 +1,18 @@
 "use server";
 
 import { createClient } from "@/lib/supabase/server";
+import { getCurrentMember } from "@/lib/cache/current-member";
 import { revalidatePath } from "next/cache";
 import type { MilestoneStage } from "@/types/database.types";
 import { notifyAdmins } from "@/lib/actions/notifications";
+import {
+  buildAttachmentPath,
+  validateAttachment,
+  type AttachmentMeta,
+  type UploadTarget,
+} from "@/lib/storage/upload-policy";
+import { getUploadedObjectSize } from "@/lib/storage/uploaded-object";
+import { derivativePaths } from "@/lib/storage/derivatives";
 
 // Types
 interface CreateNoteData {
@@ -31,21 +40,9 @@ export async function createResearchNote(data: CreateNoteData) {
   const supabase = await createClient();
 
   // 현재 사용자 확인
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // 멤버 ID 조회
-  const { data: memberData } = await supabase
-    .from("members")
-    .select("id")
-    .eq("id", user.id)
-    .single();
-
-  const member = memberData as { id: string } | null;
+  const member = await getCurrentMember();
   if (!member) {
-    return { error: "멤버 정보를 찾을 수 없습니다." };
+    return { error: "로그인이 필요합니다." };
   }
 
   // 노트 생성
@@ -70,12 +67,7 @@ export async function createResearchNote(data: CreateNoteData) {
   }
 
   // 관리자 알림
-  const { data: memberInfo } = await supabase
-    .from("members")
-    .select("name")
-    .eq("id", member.id)
-    .single();
-  const memberName = (memberInfo as { name: string } | null)?.name || "멤버";
+  const memberName = member.name || "멤버";
 
   await notifyAdmins({
     actorId: member.id,
@@ -93,8 +85,8 @@ export async function updateResearchNote(noteId: string, data: UpdateNoteData) {
   const supabase = await createClient();
 
   // 현재 사용자 확인
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) {
+  const currentMember = await getCurrentMember();
+  if (!currentMember) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -111,15 +103,8 @@ export async function updateResearchNote(noteId: string, data: UpdateNoteData) {
   }
 
   // 권한 확인 (작성자 또는 교수)
-  const { data: currentMemberData } = await supabase
-    .from("members")
-    .select("id, name, position")
-    .eq("id", user.id)
-    .single();
-
-  const currentMember = currentMemberData as { id: string; name: string; position: string } | null;
-  const isAuthor = currentMember?.id === existingNote.author_id;
-  const isAdmin = currentMember?.position === "professor";
+  const isAuthor = currentMember.id === existingNote.author_id;
+  const isAdmin = currentMember.position === "professor";
 
   if (!isAuthor && !isAdmin) {
     return { error: "수정 권한이 없습니다." };
@@ -145,9 +130,9 @@ export async function updateResearchNote(noteId: string, data: UpdateNoteData) {
   }
 
   // 관리자 알림
-  const memberName = currentMember?.name || "멤버";
+  const memberName = currentMember.name || "멤버";
   await notifyAdmins({
-    actorId: currentMember?.id || "",
+    actorId: currentMember.id,
     actorName: memberName,
     title: "연구노트 수정",
     message: `${memberName}님이 연구노트를 수정했습니다: "${data.title}"`,
@@ -162,8 +147,8 @@ export async function deleteResearchNote(noteId: string) {
   const supabase = await createClient();
 
   // 현재 사용자 확인
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) {
+  const currentMember = await getCurrentMember();
+  if (!currentMember) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -180,15 +165,8 @@ export async function deleteResearchNote(noteId: string) {
   }
 
   // 권한 확인 (작성자 또는 교수)
-  const { data: currentMemberData } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("id", user.id)
-    .single();
-
-  const currentMember = currentMemberData as { id: string; position: string } | null;
-  const isAuthor = currentMember?.id === existingNote.author_id;
-  const isAdmin = currentMember?.position === "professor";
+  const isAuthor = currentMember.id === existingNote.author_id;
+  const isAdmin = currentMember.position === "professor";
 
   if (!isAuthor && !isAdmin) {
     return { error: "삭제 권한이 없습니다." };
@@ -237,21 +215,9 @@ export async function addNoteComment(noteId: string, content: string) {
   const supabase = await createClient();
 
   // 현재 사용자 확인
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // 멤버 정보 조회
-  const { data: memberData } = await supabase
-    .from("members")
-    .select("id, name")
-    .eq("id", user.id)
-    .single();
-
-  const member = memberData as { id: string; name: string } | null;
+  const member = await getCurrentMember();
   if (!member) {
-    return { error: "멤버 정보를 찾을 수 없습니다." };
+    return { error: "로그인이 필요합니다." };
   }
 
   // 노트 정보 조회 (알림용)
@@ -301,8 +267,8 @@ export async function deleteNoteComment(commentId: string, projectId: string) {
   const supabase = await createClient();
 
   // 현재 사용자 확인
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) {
+  const currentMember = await getCurrentMember();
+  if (!currentMember) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -319,15 +285,8 @@ export async function deleteNoteComment(commentId: string, projectId: string) {
   }
 
   // 권한 확인 (작성자 또는 교수)
-  const { data: currentMemberData } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("id", user.id)
-    .single();
-
-  const currentMember = currentMemberData as { id: string; position: string } | null;
-  const isAuthor = currentMember?.id === comment.author_id;
-  const isAdmin = currentMember?.position === "professor";
+  const isAuthor = currentMember.id === comment.author_id;
+  const isAdmin = currentMember.position === "professor";
 
   if (!isAuthor && !isAdmin) {
     return { error: "삭제 권한이 없습니다." };
@@ -351,24 +310,18 @@ export async function deleteNoteComment(commentId: string, projectId: string) {
 // =====================
 // 파일 업로드
 // =====================
+// 파일은 브라우저에서 Storage로 직접 올린다 (src/lib/storage/upload-attachment.ts).
+// 여기서는 서명된 업로드 URL 발급과 업로드 완료 후 메타데이터 저장만 한다.
+
+const NOTE_FILES_BUCKET = "research-notes";
 
-const ALLOWED_FILE_TYPES = [
-  "application/pdf",
-  "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-  "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-  "application/vnd.openxmlformats-officedocument.presentationml.presentation",
-  "image/png",
-  "image/jpeg",
-];
-const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB
-
-export async function uploadNoteFile(noteId: string, formData: FormData) {
+async function getUploadableNote(noteId: string) {
   const supabase = await createClient();
 
   // 현재 사용자 확인
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) {
-    return { error: "로그인이 필요합니다." };
+  const currentMember = await getCurrentMember();
+  if (!currentMember) {
+    return { error: "로그인이 필요합니다." } as const;
   }
 
   // 노트 조회 (권한 확인용)
@@ -380,52 +333,73 @@ export async function uploadNoteFile(noteId: string, formData: FormData) {
 
   const note = noteData as { author_id: string; project_id: string } | null;
   if (!note) {
-    return { error: "노트를 찾을 수 없습니다." };
+    return { error: "노트를 찾을 수 없습니다." } as const;
   }
 
   // 권한 확인 (작성자 또는 교수)
-  const { data: currentMemberData } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("id", user.id)
-    .single();
-
-  const currentMember = currentMemberData as { id: string; position: string } | null;
-  const isAuthor = currentMember?.id === note.author_id;
-  const isAdmin = currentMember?.position === "professor";
+  const isAuthor = currentMember.id === note.author_id;
+  const isAdmin = currentMember.position === "professor";
 
   if (!isAuthor && !isAdmin) {
-    return { error: "업로드 권한이 없습니다." };
+    return { error: "업로드 권한이 없습니다." } as const;
   }
 
-  const file = formData.get("file") as File;
-  if (!file) {
-    return { error: "파일이 없습니다." };
+  return { supabase, currentMember, note };
+}
+
+export async function createNoteFileUpload(
+  noteId: string,
+  meta: AttachmentMeta
+): Promise<{ data?: UploadTarget; error?: string }> {
+  const context = await getUploadableNote(noteId);
+  if ("error" in context) {
+    return { error: context.error };
   }
 
   // 파일 유효성 검사
-  if (!ALLOWED_FILE_TYPES.includes(file.type)) {
-    return { error: "허용되지 않는 파일 형식입니다." };
+  const validationError = validateAttachment(meta);
+  if (validationError) {
+    return { error: validationError };
   }
 
-  if (file.size > MAX_FILE_SIZE) {
-    return { error: "파일 크기는 10MB를 초과할 수 없습니다." };
+  const filename = buildAttachmentPath(noteId, meta.name);
+  const { data, error } = await context.supabase.storage
+    .from(NOTE_FILES_BUCKET)
+    .createSignedUploadUrl(filename);
+
+  if (error || !data) {
+    console.error("Error creating signed upload URL:", error);
+    return { error: "파일 업로드 준비에 실패했습니다." };
   }
 
-  // 파일명 생성
-  const timestamp = Date.now();
-  const randomStr = Math.random().toString(36).substring(2, 8);
-  const ext = file.name.split(".").pop();
-  const filename = `${noteId}/${timestamp}_${randomStr}.${ext}`;
+  return { data: { bucket: NOTE_FILES_BUCKET, path: data.path, token: data.token } };
+}
 
-  // 파일 업로드
-  const { error: uploadError } = await supabase.storage
-    .from("research-notes")
-    .upload(filename, file);
+export async function completeNoteFileUpload(
+  noteId: string,
+  filename: string,
+  meta: AttachmentMeta
+) {
+  const context = await getUploadableNote(noteId);
+  if ("error" in context) {
+    return { error: context.error };
+  }
+  const { supabase, currentMember, note } = context;
+
+  if (!filename.startsWith(`${noteId}/`)) {
+    return { error: "잘못된 업로드 경로입니다." };
+  }
 
-  if (uploadError) {
-    console.error("Error uploading file:", uploadError);
-    return { error: "파일 업로드에 실패했습니다." };
+  // 실제로 올라간 파일과 크기 확인
+  const fileSize = await getUploadedObjectSize(supabase, NOTE_FILES_BUCKET, filename);
+  if (fileSize === null) {
+    return { error: "업로드된 파일을 찾을 수 없습니다." };
+  }
+
+  const validationError = validateAttachment({ ...meta, size: fileSize });
+  if (validationError) {
+    await supabase.storage.from(NOTE_FILES_BUCKET).remove([filename]);
+    return { error: validationError };
   }
 
   // 파일 메타데이터 저장
@@ -433,11 +407,11 @@ export async function uploadNoteFile(noteId: string, formData: FormData) {
     .from("files")
     .insert({
       filename,
-      original_filename: file.name,
+      original_filename: meta.name,
       file_path: filename,
-      file_size: file.size,
-      mime_type: file.type,
-      uploaded_by: currentMember?.id,
+      file_size: fileSize,
+      mime_type: meta.type,
+      uploaded_by: currentMember.id,
       entity_type: "research_note",
       entity_id: noteId,
     } as any)
@@ -446,7 +420,7 @@ export async function uploadNoteFile(noteId: string, formData: FormData) {
 
   if (dbError) {
     // 업로드 롤백
-    await supabase.storage.from("research-notes").remove([filename]);
+    await supabase.storage.from(NOTE_FILES_BUCKET).remove([filename]);
     console.error("Error saving file metadata:", dbError);
     return { error: "파일 정보 저장에 실패했습니다." };
   }
@@ -459,8 +433,8 @@ export async function deleteNoteFile(fileId: string, projectId: string) {
   const supabase = await createClient();
 
   // 현재 사용자 확인
-  const { data: { user } } = await supabase.auth.getUser();
-  if (!user) {
+  const currentMember = await getCurrentMember();
+  if (!currentMember) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -477,22 +451,17 @@ export async function deleteNoteFile(fileId: string, projectId: string) {
   }
 
   // 권한 확인 (업로더 또는 교수)
-  const { data: currentMemberData } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("id", user.id)
-    .single();
-
-  const currentMember = currentMemberData as { id: string; position: string } | null;
-  const isUploader = currentMember?.id === file.uploaded_by;
-  const isAdmin = currentMember?.position === "professor";
+  const isUploader = currentMember.id === file.uploaded_by;
+  const isAdmin = currentMember.position === "professor";
 
   if (!isUploader && !isAdmin) {
     return { error: "삭제 권한이 없습니다." };
   }
 
-  // 스토리지에서 파일 삭제
-  await supabase.storage.from("research-notes").remove([file.file_path]);
+  // 스토리지에서 파일 삭제 (썸네일 행은 CASCADE, 객체는 고정 키로 함께 삭제)
+  await supabase.storage
+    .from("research-notes")
+    .remove([file.file_path, ...derivativePaths(fileId)]);
 
   // 메타데이터 삭제
   const { error } = await supabase
@@ -513,38 +482,55 @@ export async function deleteNoteFile(fileId: string, projectId: string) {
 // 전체 연구노트 조회
 // =====================
 
-export async function getAllResearchNotes(filters?: {
+export interface ResearchNoteListFilters {
   authorId?: string;
   stage?: string;
   startDate?: string;
   endDate?: string;
-}) {
-  const supabase = await createClient();
+  search?: string;
+}
 
-  let query = supabase
-    .from("research_notes")
-    .select(`
-      id,
-      title,
-      content,
-      stage,
-      keywords,
-      created_at,
-      updated_at,
-      project:research_projects!research_notes_project_id_fkey (
-        id,
-        title
-      ),
-      author:members!research_notes_author_id_fkey (
-        id,
-        name,
-        avatar_url,
-        position
-      )
-    `)
-    .order("created_at", { ascending: false });
+// keyset 커서: 마지막으로 받은 노트의 (created_at, id)
+export interface ResearchNoteCursor {
+  createdAt: string;
+  id: string;
+}
+
+const NOTE_AUTHOR_SELECT = `
+  id,
+  name,
+  avatar_url,
+  position
+`;
+
+// 목록 모드: 본문 대신 서버에서 계산된 발췌/단어 수만 조회 (00029)
+const NOTE_LIST_SELECT = `
+  id,
+  title,
+  excerpt,
+  content_length,
+  word_count,
+  stage,
+  keywords,
+  created_at,
+  updated_at,
+  project:research_projects!research_notes_project_id_fkey (
+    id,
+    title
+  ),
+  author:members!research_notes_author_id_fkey (${NOTE_AUTHOR_SELECT}),
+  comments:research_note_comments(count)
+`;
+
+const NOTE_PAGE_SIZE = 20;
+
+// 검색어의 LIKE 특수문자(\, %, _)를 문자 그대로 찾도록 이스케이프
+function escapeLikePattern(value: string): string {
+  return value.replace(/[\\%_]/g, (ch) => `\\${ch}`);
+}
 
-  // 필터 적용
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+function applyNoteFilters(query: any, filters?: ResearchNoteListFilters) {
   if (filters?.authorId) {
     query = query.eq("author_id", filters.authorId);
   }
@@ -557,13 +543,156 @@ export async function getAllResearchNotes(filters?: {
   if (filters?.endDate) {
     query = query.lte("created_at", filters.endDate);
   }
+  if (filters?.search) {
+    query = query.ilike("search_text", `%${escapeLikePattern(filters.search.toLowerCase())}%`);
+  }
+  return query;
+}
+
+// 연구노트 목록 (created_at DESC, id DESC keyset 페이지네이션)
+// 첫 페이지(cursor 없음)에서만 전체 개수를 함께 계산한다.
+export async function getAllResearchNotes(
+  filters?: ResearchNoteListFilters,
+  cursor?: ResearchNoteCursor | null,
+  limit: number = NOTE_PAGE_SIZE
+) {
+  const supabase = await createClient();
+  const pageSize = Math.min(Math.max(limit, 1), 100);
+
+  let query = applyNoteFilters(
+    supabase
+      .from("research_notes")
+      .select(NOTE_LIST_SELECT, cursor ? undefined : { count: "exact" }),
+    filters
+  );
+
+  if (cursor) {
+    query = query.or(
+      `created_at.lt."${cursor.createdAt}",and(created_at.eq."${cursor.createdAt}",id.lt.${cursor.id})`
+    );
+  }
 
-  const { data, error } = await query;
+  // 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+  const { data, error, count } = await query
+    .order("created_at", { ascending: false })
+    .order("id", { ascending: false })
+    .limit(pageSize + 1);
 
   if (error) {
     console.error("Error fetching research notes:", error);
     return { error: "연구노트 조회에 실패했습니다." };
   }
 
+  const rows = (data || []) as unknown as Array<{
+    id: string;
+    created_at: string;
+    comments: Array<{ count: number }>;
+    [key: string]: unknown;
+  }>;
+  const page = rows.slice(0, pageSize).map(({ comments, ...note }) => ({
+    ...note,
+    comment_count: comments?.[0]?.count ?? 0,
+  }));
+  const last = page[page.length - 1];
+
+  return {
+    data: page,
+    nextCursor:
+      rows.length > pageSize && last
+        ? { createdAt: last.created_at, id: last.id }
+        : null,
+    total: cursor ? undefined : (count ?? 0),
+  };
+}
+
+// 단계별 노트 수 (통계 카드)
+export async function getResearchNoteStageCounts(filters?: Omit<ResearchNoteListFilters, "stage">) {
+  const supabase = await createClient();
+
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data, error } = await (supabase as any).rpc("count_research_notes_by_stage", {
+    p_author_id: filters?.authorId ?? null,
+    p_start: filters?.startDate ?? null,
+    p_end: filters?.endDate ?? null,
+    p_search: filters?.search || null,
+  });
+
+  if (error) {
+    console.error("Error counting research notes:", error);
+    return { error: "연구노트 통계 조회에 실패했습니다." };
+  }
+
+  const counts: Record<string, number> = {};
+  for (const row of (data || []) as Array<{ stage: string; note_count: number }>) {
+    counts[row.stage] = Number(row.note_count);
+  }
+  return { data: counts };
+}
+
+// 노트 본문 + 댓글 (카드를 펼치거나 수정할 때 지연 조회)
+export async function getResearchNoteDetail(noteId: string) {
+  const supabase = await createClient();
+
+  const { data, error } = await supabase
+    .from("research_notes")
+    .select(`
+      id,
+      content,
+      comments:research_note_comments (
+        id,
+        content,
+        created_at,
+        author:members!research_note_comments_author_id_fkey (${NOTE_AUTHOR_SELECT})
+      )
+    `)
+    .eq("id", noteId)
+    .single();
+
+  if (error) {
+    console.error("Error fetching research note detail:", error);
+    return { error: "연구노트를 불러오는데 실패했습니다." };
+  }
+
+  return { data };
+}
+
+// 내보내기용 전체 조회 (본문 + 댓글 포함, 사용자가 요청할 때만 호출)
+export async function exportResearchNotes(filters?: ResearchNoteListFilters) {
+  const supabase = await createClient();
+
+  const query = applyNoteFilters(
+    supabase
+      .from("research_notes")
+      .select(`
+        id,
+        title,
+        content,
+        stage,
+        keywords,
+        created_at,
+        project:research_projects!research_notes_project_id_fkey (
+          id,
+          title
+        ),
+        author:members!research_notes_author_id_fkey (${NOTE_AUTHOR_SELECT}),
+        comments:research_note_comments (
+          id,
+          content,
+          created_at,
+          author:members!research_note_comments_author_id_fkey (${NOTE_AUTHOR_SELECT})
+        )
+      `),
+    filters
+  );
+
+  const { data, error } = await query
+    .order("created_at", { ascending: false })
+    .order("id", { ascending: false });
+
+  if (error) {
+    console.error("Error exporting research notes:", error);
+    return { error: "연구노트 내보내기에 실패했습니다." };
+  }
+
   return { data };
 }
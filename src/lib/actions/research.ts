@@ -5,6 +5,8 @@ import { redirect } from "next/navigation";
 import { revalidatePath } from "next/cache";
 import { MILESTONE_STAGES } from "@/lib/utils";
 import { createProjectUpdateNotification, notifyAdmins } from "@/lib/actions/notifications";
+import { invalidateLabData, LAB_CACHE_TAGS } from "@/lib/cache/lab-data";
+import { getCurrentMember } from "@/lib/cache/current-member";
 
 export type ProjectFormData = {
   title: string;
@@ -30,25 +32,10 @@ export async function createProject(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user?.email) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // 현재 사용자의 member 정보 조회 (email로 조회)
-  const { data: member } = await supabase
-    .from("members")
-    .select("id")
-    .eq("email", user.email)
-    .single();
-
-  const memberData = member as { id: string } | null;
+  const memberData = await getCurrentMember();
 
   if (!memberData) {
-    return { error: "연구원 정보를 찾을 수 없습니다. 관리자에게 문의하세요." };
+    return { error: "로그인이 필요합니다." };
   }
 
   // 프로젝트 생성
@@ -89,12 +76,7 @@ export async function createProject(
   }
 
   // 관리자 알림
-  const { data: actorMember } = await supabase
-    .from("members")
-    .select("name")
-    .eq("id", memberData.id)
-    .single();
-  const actorName = (actorMember as { name: string } | null)?.name || "멤버";
+  const actorName = memberData.name || "멤버";
 
   await notifyAdmins({
     actorId: memberData.id,
@@ -145,6 +127,7 @@ export async function createProject(
     }
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects, LAB_CACHE_TAGS.dashboard);
   revalidatePath("/research");
   return { success: true, id: projectData.id };
 }
@@ -156,11 +139,9 @@ export async function updateProject(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -212,11 +193,11 @@ export async function updateProject(
       .eq("project_id", id);
 
     if (members) {
-      for (const member of members as { member_id: string }[]) {
+      for (const projectMember of members as { member_id: string }[]) {
         // 자신에게는 알림을 보내지 않음
-        if (member.member_id !== user.id) {
+        if (projectMember.member_id !== member.id) {
           await createProjectUpdateNotification(
-            member.member_id,
+            projectMember.member_id,
             id,
             existing.title,
             updateType
@@ -228,15 +209,10 @@ export async function updateProject(
 
   // 관리자 알림 (프로젝트 변경 시 교수에게도 알림)
   if (existing) {
-    const { data: actorMember } = await supabase
-      .from("members")
-      .select("name")
-      .eq("id", user.id)
-      .single();
-    const actorName = (actorMember as { name: string } | null)?.name || "멤버";
+    const actorName = member.name || "멤버";
 
     await notifyAdmins({
-      actorId: user.id,
+      actorId: member.id,
       actorName,
       title: "연구 프로젝트 수정",
       message: `${actorName}님이 프로젝트를 수정했습니다: "${existing.title}"`,
@@ -244,6 +220,7 @@ export async function updateProject(
     });
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects, LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${id}`);
   revalidatePath("/research");
   return { success: true };
@@ -253,25 +230,10 @@ export async function updateProject(
 export async function deleteProject(id: string, redirectPath?: string): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user?.email) {
-    return { error: "로그인이 필요합니다." };
-  }
-
-  // 현재 사용자 정보 조회 (email로 조회)
-  const { data: member } = await supabase
-    .from("members")
-    .select("id, position")
-    .eq("email", user.email)
-    .single();
-
-  const memberData = member as { id: string; position: string } | null;
+  const memberData = await getCurrentMember();
 
   if (!memberData) {
-    return { error: "연구원 정보를 찾을 수 없습니다." };
+    return { error: "로그인이 필요합니다." };
   }
 
   const isAdmin = memberData.position === "professor";
@@ -284,7 +246,7 @@ export async function deleteProject(id: string, redirectPath?: string): Promise<
     .single();
 
   const projectData = project as { created_by: string } | null;
-  const isCreator = projectData?.created_by === user.id;
+  const isCreator = projectData?.created_by === memberData.id;
 
   // 관리자 또는 생성자만 삭제 가능
   if (!isAdmin && !isCreator) {
@@ -344,6 +306,7 @@ export async function deleteProject(id: string, redirectPath?: string): Promise<
     return { error: "프로젝트 삭제 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects, LAB_CACHE_TAGS.dashboard);
   revalidatePath("/research");
   revalidatePath("/dashboard");
   revalidatePath("/members");
@@ -363,11 +326,9 @@ export async function toggleChecklistItem(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -385,6 +346,7 @@ export async function toggleChecklistItem(
   // 진행률 재계산 (서버 사이드)
   await recalculateProgress(projectId);
 
+  invalidateLabData(LAB_CACHE_TAGS.projects, LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${projectId}`);
   return { success: true };
 }
@@ -457,11 +419,9 @@ export async function updateMilestoneNotes(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -487,11 +447,9 @@ export async function addProjectAuthor(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -530,11 +488,9 @@ export async function updateProjectAuthor(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -558,11 +514,9 @@ export async function deleteProjectAuthor(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -586,11 +540,9 @@ export async function setCurrentMilestone(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -627,11 +579,9 @@ export async function addWeeklyGoal(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -664,6 +614,7 @@ export async function addWeeklyGoal(
     return { error: `주간 목표 추가 중 오류가 발생했습니다: ${error.message}` };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${projectId}`);
   return { success: true, data };
 }
@@ -676,11 +627,9 @@ export async function toggleWeeklyGoal(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -696,6 +645,7 @@ export async function toggleWeeklyGoal(
     return { error: "주간 목표 업데이트 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${projectId}`);
   return { success: true };
 }
@@ -707,11 +657,9 @@ export async function deleteWeeklyGoal(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -724,6 +672,7 @@ export async function deleteWeeklyGoal(
     return { error: "주간 목표 삭제 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${projectId}`);
   return { success: true };
 }
@@ -738,11 +687,9 @@ export async function updateWeeklyGoal(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -768,6 +715,7 @@ export async function updateWeeklyGoal(
     return { error: "주간 목표 수정 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${projectId}`);
   return { success: true };
 }
@@ -785,11 +733,9 @@ export async function updateMilestoneDates(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -820,11 +766,9 @@ export async function updateFlowchart(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -856,11 +800,9 @@ export async function updateSubmissionStatus(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -897,6 +839,7 @@ export async function updateSubmissionStatus(
     return { error: "투고 상태 변경 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects, LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${projectId}`);
   revalidatePath("/dashboard");
   return { success: true };
@@ -909,11 +852,9 @@ export async function toggleProjectArchive(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -929,6 +870,7 @@ export async function toggleProjectArchive(
     return { error: "아카이브 상태 변경 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects, LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/research/${projectId}`);
   revalidatePath("/dashboard");
   revalidatePath("/research");
@@ -943,27 +885,12 @@ export async function toggleProjectArchive(
 export async function checkFavoriteStatus(projectId: string): Promise<boolean> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
-
-  if (!user?.email) {
-    return false;
-  }
-
-  // 현재 사용자의 member 정보 조회
-  const { data: member } = await supabase
-    .from("members")
-    .select("id")
-    .eq("email", user.email)
-    .single();
+  const memberData = await getCurrentMember();
 
-  if (!member) {
+  if (!memberData) {
     return false;
   }
 
-  const memberData = member as { id: string };
-
   const { data } = await supabase
     .from("research_project_favorites")
     .select("id")
@@ -978,27 +905,12 @@ export async function checkFavoriteStatus(projectId: string): Promise<boolean> {
 export async function toggleFavoriteProject(projectId: string): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const memberData = await getCurrentMember();
 
-  if (!user?.email) {
+  if (!memberData) {
     return { error: "로그인이 필요합니다." };
   }
 
-  // 현재 사용자의 member 정보 조회
-  const { data: member } = await supabase
-    .from("members")
-    .select("id")
-    .eq("email", user.email)
-    .single();
-
-  if (!member) {
-    return { error: "사용자 정보를 찾을 수 없습니다." };
-  }
-
-  const memberData = member as { id: string };
-
   // 현재 즐겨찾기 상태 확인
   const { data: existing } = await supabase
     .from("research_project_favorites")
@@ -1047,27 +959,12 @@ export async function getFavoriteProjects(): Promise<{
 }> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const memberData = await getCurrentMember();
 
-  if (!user?.email) {
+  if (!memberData) {
     return { error: "로그인이 필요합니다." };
   }
 
-  // 현재 사용자의 member 정보 조회
-  const { data: member } = await supabase
-    .from("members")
-    .select("id")
-    .eq("email", user.email)
-    .single();
-
-  if (!member) {
-    return { error: "사용자 정보를 찾을 수 없습니다." };
-  }
-
-  const memberData = member as { id: string };
-
   // 즐겨찾기한 프로젝트 ID 조회
   const { data: favorites, error: favError } = await supabase
     .from("research_project_favorites")
@@ -1118,11 +1015,9 @@ export async function addMeeting(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -1138,7 +1033,7 @@ export async function addMeeting(
       discussion_content: discussionContent.trim(),
       next_steps: nextSteps?.trim() || null,
       previous_content: previousContent?.trim() || null,
-      author_id: user.id,
+      author_id: member.id,
     } as never)
     .select()
     .single();
@@ -1152,15 +1047,10 @@ export async function addMeeting(
   }
 
   // 관리자 알림
-  const { data: actorMember } = await supabase
-    .from("members")
-    .select("name")
-    .eq("id", user.id)
-    .single();
-  const actorName = (actorMember as { name: string } | null)?.name || "멤버";
+  const actorName = member.name || "멤버";
 
   await notifyAdmins({
-    actorId: user.id,
+    actorId: member.id,
     actorName,
     title: "미팅 기록 추가",
     message: `${actorName}님이 미팅 기록을 추가했습니다 (${meetingDate})`,
@@ -1182,11 +1072,9 @@ export async function updateMeeting(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -1210,15 +1098,10 @@ export async function updateMeeting(
   }
 
   // 관리자 알림
-  const { data: actorMember } = await supabase
-    .from("members")
-    .select("name")
-    .eq("id", user.id)
-    .single();
-  const actorName = (actorMember as { name: string } | null)?.name || "멤버";
+  const actorName = member.name || "멤버";
 
   await notifyAdmins({
-    actorId: user.id,
+    actorId: member.id,
     actorName,
     title: "미팅 기록 수정",
     message: `${actorName}님이 미팅 기록을 수정했습니다 (${meetingDate})`,
@@ -1236,11 +1119,9 @@ export async function deleteMeeting(
 ): Promise<ActionResult> {
   const supabase = await createClient();
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  const member = await getCurrentMember();
 
-  if (!user) {
+  if (!member) {
     return { error: "로그인이 필요합니다." };
   }
 
@@ -0,0 +1,207 @@
+import { unstable_cache } from "next/cache";
+import { createServiceRoleClient } from "@/lib/supabase/server";
+import { buildIcsCalendar, type IcsEvent } from "@/lib/calendar/ics";
+import type { RecurrenceException } from "@/lib/calendar/recurrence";
+import { CALENDAR_CATEGORY_CONFIG } from "@/lib/constants";
+import type { CalendarCategory } from "@/types/database.types";
+
+// ============================================
+// 멤버별 ICS 구독 피드
+// ============================================
+// calendar_feeds.version은 피드에 들어가는 행이 바뀔 때만 트리거로 올라간다
+// (00040_create_calendar_feeds.sql). 폴링마다 토큰으로 버전만 읽고,
+// ICS 본문은 (멤버, 버전)을 키로 캐시해 버전이 바뀔 때만 다시 만든다.
+// 서비스 롤로 읽으므로 calendar_events RLS의 "공용 또는 본인 일정" 조건을 직접 적용한다.
+
+export interface CalendarFeedState {
+  member_id: string;
+  version: number;
+  changed_at: string;
+}
+
+// 지난 일정은 이 기간만 포함 (본문 크기 상한)
+const FEED_HISTORY_DAYS = 365;
+
+// 같은 버전이라도 하루에 한 번은 다시 만들어 지난 일정 기간을 당긴다 (초)
+const FEED_BODY_TTL = 60 * 60 * 24;
+
+const FEED_NAME = "SDC Lab";
+const FEED_UID_DOMAIN = "sdc-lab-dashboard";
+
+interface FeedCalendarEvent {
+  id: string;
+  title: string;
+  description: string | null;
+  start_date: string;
+  end_date: string | null;
+  all_day: boolean;
+  category: CalendarCategory;
+  rrule: string | null;
+}
+
+const FEED_EVENT_COLUMNS = "id, title, description, start_date, end_date, all_day, category, rrule";
+
+// 토큰 → 피드 상태. 폴링마다 호출되는 PK 수준 조회라 캐시하지 않는다.
+export async function getCalendarFeedByToken(token: string): Promise<CalendarFeedState | null> {
+  const supabase = createServiceRoleClient();
+  const { data, error } = await supabase
+    .from("calendar_feeds")
+    .select("member_id, version, changed_at")
+    .eq("token", token)
+    .maybeSingle();
+
+  if (error) {
+    console.error("Calendar feed lookup error:", error);
+    return null;
+  }
+  return data as CalendarFeedState | null;
+}
+
+function uid(kind: string, id: string): string {
+  return `${kind}-${id}@${FEED_UID_DOMAIN}`;
+}
+
+async function buildMemberFeed(memberId: string, changedAt: Date): Promise<string> {
+  const supabase = createServiceRoleClient();
+  const since = new Date(Date.now() - FEED_HISTORY_DAYS * 24 * 60 * 60 * 1000);
+  const sinceIso = since.toISOString();
+  const visible = `is_public.eq.true,member_id.eq.${memberId},created_by.eq.${memberId}`;
+
+  const [singles, series, memberships] = await Promise.all([
+    supabase
+      .from("calendar_events")
+      .select(FEED_EVENT_COLUMNS)
+      .or(visible)
+      .is("rrule", null)
+      .gte("start_date", sinceIso)
+      .order("start_date", { ascending: true }),
+    supabase
+      .from("calendar_events")
+      .select(FEED_EVENT_COLUMNS)
+      .or(visible)
+      .not("rrule", "is", null)
+      .overlaps("series_range", `[${sinceIso},infinity)`),
+    supabase.from("project_members").select("project_id").eq("member_id", memberId),
+  ]);
+
+  const error = singles.error ?? series.error ?? memberships.error;
+  if (error) throw new Error(error.message);
+
+  const seriesRows = (series.data || []) as FeedCalendarEvent[];
+  const projectIds = (memberships.data || []).map((m) => m.project_id);
+
+  const [exceptions, projects, goals] = await Promise.all([
+    seriesRows.length > 0
+      ? supabase
+          .from("calendar_event_exceptions")
+          .select("event_id, original_start, is_cancelled, start_date, end_date, title, description")
+          .in("event_id", seriesRows.map((e) => e.id))
+      : null,
+    projectIds.length > 0
+      ? supabase
+          .from("research_projects")
+          .select("id, title, target_date")
+          .in("id", projectIds)
+          .or("is_archived.is.null,is_archived.eq.false")
+      : null,
+    projectIds.length > 0
+      ? supabase
+          .from("weekly_goals")
+          .select("id, content, deadline, project_id")
+          .in("project_id", projectIds)
+          .eq("is_completed", false)
+          .gte("deadline", sinceIso.slice(0, 10))
+      : null,
+  ]);
+
+  const detailError = exceptions?.error ?? projects?.error ?? goals?.error;
+  if (detailError) throw new Error(detailError.message);
+
+  const exceptionRows = (exceptions?.data || []) as RecurrenceException[];
+  // 보관된 프로젝트는 마감일과 주간 목표 모두 제외
+  const projectRows = (projects?.data || []) as { id: string; title: string; target_date: string | null }[];
+  const projectTitles = new Map(projectRows.map((p) => [p.id, p.title]));
+  const goalRows = ((goals?.data || []) as {
+    id: string;
+    content: string;
+    deadline: string;
+    project_id: string;
+  }[]).filter((goal) => projectTitles.has(goal.project_id));
+
+  const toIcsEvent = (event: FeedCalendarEvent): IcsEvent => ({
+    uid: uid("event", event.id),
+    summary: event.title,
+    description: event.description,
+    start: event.start_date,
+    end: event.end_date,
+    allDay: event.all_day,
+    categories: CALENDAR_CATEGORY_CONFIG[event.category]?.label,
+  });
+
+  const events: IcsEvent[] = [
+    ...((singles.data || []) as FeedCalendarEvent[]).map(toIcsEvent),
+    ...seriesRows.flatMap((event) => {
+      const own = exceptionRows.filter((e) => e.event_id === event.id);
+      const master: IcsEvent = {
+        ...toIcsEvent(event),
+        rrule: event.rrule,
+        exdates: own.filter((e) => e.is_cancelled).map((e) => e.original_start),
+      };
+      // 회차 변경은 같은 UID + RECURRENCE-ID로 덮어쓴다
+      const overrides = own
+        .filter((e) => !e.is_cancelled)
+        .map((e): IcsEvent => {
+          const duration = event.end_date
+            ? new Date(event.end_date).getTime() - new Date(event.start_date).getTime()
+            : 0;
+          return {
+            ...master,
+            rrule: null,
+            exdates: undefined,
+            recurrenceId: e.original_start,
+            summary: e.title || event.title,
+            description: e.description || event.description,
+            start: e.start_date ?? e.original_start,
+            end:
+              e.end_date ??
+              (event.end_date
+                ? new Date(new Date(e.original_start).getTime() + duration).toISOString()
+                : null),
+          };
+        });
+      return [master, ...overrides];
+    }),
+    ...projectRows.flatMap((project): IcsEvent[] =>
+      project.target_date
+        ? [
+            {
+              uid: uid("project", project.id),
+              summary: `[마감] ${project.title}`,
+              start: project.target_date,
+              allDay: true,
+            },
+          ]
+        : []
+    ),
+    ...goalRows.map(
+      (goal): IcsEvent => ({
+        uid: uid("goal", goal.id),
+        summary: `[주간 목표] ${goal.content}`,
+        description: projectTitles.get(goal.project_id),
+        start: goal.deadline,
+        allDay: true,
+      })
+    ),
+  ];
+
+  return buildIcsCalendar(FEED_NAME, events, changedAt);
+}
+
+// 버전이 캐시 키에 들어가므로 행이 바뀌면 (트리거가 버전을 올리면) 자연히 새로 만든다.
+export function getCachedCalendarFeedBody(feed: CalendarFeedState): Promise<string> {
+  return unstable_cache(
+    () => buildMemberFeed(feed.member_id, new Date(feed.changed_at)),
+    ["calendar-feed", feed.member_id, String(feed.version)],
+    { revalidate: FEED_BODY_TTL }
+  )();
+}
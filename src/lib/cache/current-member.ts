@@ -0,0 +1,79 @@
+import { cache } from "react";
+import { createClient } from "@/lib/supabase/server";
+import { resolveAuthUser } from "@/lib/supabase/jwt";
+import type { MemberPosition, MemberStatus } from "@/types/database";
+
+// ============================================
+// 현재 로그인한 멤버 (요청 단위 캐시)
+// ============================================
+// 서버 액션/라우트마다 반복되던 auth.getUser() + members 조회를 한 곳으로 모은다.
+// React cache()로 같은 요청 안에서는 한 번만 확인한다.
+// - 인증: access token을 JWKS로 로컬 검증 (jwt.ts)
+// - 멤버: custom access token hook(00031)의 member claim이 있으면 DB 조회 없이 사용,
+//   없으면 members를 1회 조회한다. claim은 토큰 갱신(최대 1시간) 전까지 이전 값일 수 있다.
+
+export interface CurrentMember {
+  id: string;
+  authUserId: string;
+  email: string | null;
+  name: string;
+  position: MemberPosition;
+  status: MemberStatus;
+}
+
+export const getCurrentMember = cache(async (): Promise<CurrentMember | null> => {
+  const supabase = await createClient();
+  const user = await resolveAuthUser(supabase);
+
+  if (!user) return null;
+
+  const claim = user.claims?.member;
+  if (claim) {
+    return {
+      id: claim.id,
+      authUserId: user.id,
+      email: user.email,
+      name: claim.name,
+      position: claim.position as MemberPosition,
+      status: claim.status as MemberStatus,
+    };
+  }
+
+  // members.id = auth.users.id가 기본이고, 이전 가입자는 user_id 또는 email로 연결되어 있다.
+  // 세 키를 한 번에 조회하고 id > user_id > email 순으로 고른다.
+  const filters = [`id.eq.${user.id}`, `user_id.eq.${user.id}`];
+  if (user.email) filters.push(`email.eq."${user.email}"`);
+
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { data } = (await (supabase as any)
+    .from("members")
+    .select("id, user_id, email, name, position, status")
+    .or(filters.join(","))
+    .limit(3)) as {
+    data: Array<{
+      id: string;
+      user_id: string | null;
+      email: string;
+      name: string;
+      position: MemberPosition;
+      status: MemberStatus;
+    }> | null;
+  };
+
+  const rows = data ?? [];
+  const member =
+    rows.find((row) => row.id === user.id) ??
+    rows.find((row) => row.user_id === user.id) ??
+    rows.find((row) => row.email === user.email);
+
+  if (!member) return null;
+
+  return {
+    id: member.id,
+    authUserId: user.id,
+    email: user.email ?? member.email,
+    name: member.name,
+    position: member.position,
+    status: member.status,
+  };
+});
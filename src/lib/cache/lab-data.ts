@@ -0,0 +1,491 @@
+import { unstable_cache, revalidateTag } from "next/cache";
+import type { SupabaseClient } from "@supabase/supabase-js";
+import { createServiceRoleClient } from "@/lib/supabase/server";
+import type { Database } from "@/types/database";
+import type { AnnouncementPriority, CalendarCategory } from "@/types/database.types";
+import type { DashboardSnapshot } from "@/lib/actions/dashboard";
+import { monthBounds, type MonthKey } from "@/lib/calendar/months";
+import {
+  durationMs,
+  expandOccurrences,
+  type RecurrenceException,
+} from "@/lib/calendar/recurrence";
+
+// ============================================
+// 연구실 공용 데이터 공유 캐시
+// ============================================
+// createClient()는 쿠키를 읽기 때문에 페이지의 `revalidate`가 무시되고 매 요청 DB를 조회했음.
+// 사용자와 무관한 데이터는 서비스 롤 클라이언트로 한 번 읽어 태그 단위로 캐시하고,
+// 서버 액션에서 해당 태그만 무효화한다.
+// 서비스 롤은 RLS를 우회하므로 각 조회에서 RLS와 동일한 공개 조건을 직접 적용해야 한다.
+
+export const LAB_CACHE_TAGS = {
+  announcements: "lab:announcements",
+  projects: "lab:projects",
+  dashboard: "lab:dashboard",
+  calendar: "lab:calendar",
+  papers: "lab:papers",
+} as const;
+
+export type LabCacheTag = (typeof LAB_CACHE_TAGS)[keyof typeof LAB_CACHE_TAGS];
+
+// 무효화가 누락되더라도 오래된 데이터가 남지 않도록 하는 상한 (초)
+const LAB_CACHE_TTL = 300;
+
+// 서버 액션에서 호출: 변경된 데이터의 태그만 무효화
+export function invalidateLabData(...tags: LabCacheTag[]) {
+  for (const tag of tags) {
+    revalidateTag(tag);
+  }
+}
+
+// ============================================
+// 공지사항
+// ============================================
+
+export interface CachedAnnouncement {
+  id: string;
+  title: string;
+  content: string;
+  priority: AnnouncementPriority;
+  is_pinned: boolean;
+  author_id: string | null;
+  expires_at: string | null;
+  created_at: string;
+  updated_at: string;
+  author: { id: string; name: string } | null;
+}
+
+const fetchActiveAnnouncements = unstable_cache(
+  async (): Promise<CachedAnnouncement[]> => {
+    const supabase = createServiceRoleClient();
+    const now = new Date().toISOString();
+
+    const { data, error } = await supabase
+      .from("announcements")
+      .select(`
+        id,
+        title,
+        content,
+        priority,
+        is_pinned,
+        author_id,
+        expires_at,
+        created_at,
+        updated_at,
+        author:members (
+          id,
+          name
+        )
+      `)
+      .or(`expires_at.is.null,expires_at.gt.${now}`)
+      .order("is_pinned", { ascending: false })
+      .order("created_at", { ascending: false });
+
+    if (error) {
+      console.error("Cached announcements fetch error:", error);
+      return [];
+    }
+
+    return (data || []) as unknown as CachedAnnouncement[];
+  },
+  ["lab-announcements"],
+  { tags: [LAB_CACHE_TAGS.announcements], revalidate: LAB_CACHE_TTL }
+);
+
+// 만료되지 않은 공지사항 (캐시 이후 만료된 항목은 읽을 때 다시 제외)
+export async function getCachedAnnouncements(limit?: number): Promise<CachedAnnouncement[]> {
+  const now = Date.now();
+  const active = (await fetchActiveAnnouncements()).filter(
+    (a) => !a.expires_at || new Date(a.expires_at).getTime() > now
+  );
+  return limit ? active.slice(0, limit) : active;
+}
+
+// ============================================
+// 연구 프로젝트 목록 (연구원별)
+// ============================================
+
+export interface CachedRosterProject {
+  id: string;
+  title: string;
+  status: string;
+  overall_progress: number;
+  target_date: string | null;
+  target_journal: string | null;
+  category: string;
+}
+
+export interface CachedRosterMember {
+  id: string;
+  name: string;
+  position: string;
+  employment_type: string;
+  avatar_url: string | null;
+  project_members: Array<{
+    role: string;
+    project: CachedRosterProject | null;
+  }>;
+}
+
+export const getCachedResearchRoster = unstable_cache(
+  async (): Promise<CachedRosterMember[]> => {
+    const supabase = createServiceRoleClient();
+
+    const { data, error } = await supabase
+      .from("members")
+      .select(`
+        id,
+        name,
+        position,
+        employment_type,
+        avatar_url,
+        project_members (
+          role,
+          project:research_projects!inner (
+            id,
+            title,
+            status,
+            overall_progress,
+            target_date,
+            target_journal,
+            category
+          )
+        )
+      `)
+      .eq("status", "active")
+      .neq("position", "professor");
+
+    if (error) {
+      console.error("Cached research roster fetch error:", error);
+      return [];
+    }
+
+    return (data || []) as unknown as CachedRosterMember[];
+  },
+  ["lab-research-roster"],
+  { tags: [LAB_CACHE_TAGS.projects], revalidate: LAB_CACHE_TTL }
+);
+
+// ============================================
+// 대시보드 스냅샷 (00027)
+// ============================================
+// 원본 변경 시 트리거는 섹션을 표시만 하고, 재계산은 캐시가 비었을 때
+// 여기서 표시된 섹션만 수행한다 (00045). 쓰기 트랜잭션은 스냅샷 행을 잠그지 않는다.
+
+export const getCachedDashboardSnapshot = unstable_cache(
+  async (): Promise<DashboardSnapshot | null> => {
+    const supabase = createServiceRoleClient();
+
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const { error: refreshError } = await (supabase as any).rpc("refresh_dirty_dashboard_snapshot");
+    if (refreshError) {
+      // 재계산에 실패해도 마지막 스냅샷은 보여준다
+      console.error("Dashboard snapshot refresh error:", refreshError);
+    }
+
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const { data, error } = await (supabase as any)
+      .from("dashboard_snapshot")
+      .select(
+        "project_status_counts, total_projects, average_progress, submitted_projects, goal_deadlines, goals_window_start, projects_refreshed_at, goals_refreshed_at"
+      )
+      .eq("id", "lab")
+      .maybeSingle();
+
+    if (error) {
+      console.error("Cached dashboard snapshot fetch error:", error);
+      return null;
+    }
+
+    if (!data) return null;
+
+    return {
+      ...(data as DashboardSnapshot),
+      average_progress: Number((data as DashboardSnapshot).average_progress) || 0,
+    };
+  },
+  ["lab-dashboard-snapshot"],
+  { tags: [LAB_CACHE_TAGS.dashboard, LAB_CACHE_TAGS.projects], revalidate: LAB_CACHE_TTL }
+);
+
+// ============================================
+// 공개 캘린더 일정
+// ============================================
+
+export interface CachedCalendarEvent {
+  id: string;
+  title: string;
+  description: string | null;
+  start_date: string;
+  end_date: string | null;
+  all_day: boolean;
+  category: CalendarCategory;
+  is_public: boolean;
+  member_id: string | null;
+  rrule: string | null;
+  // 반복 일정 회차일 때만: 시리즈 id와 규칙상 원래 시작 시각
+  series_id?: string;
+  occurrence_start?: string;
+}
+
+const CALENDAR_EVENT_COLUMNS =
+  "id, title, description, start_date, end_date, all_day, category, is_public, member_id, rrule";
+
+// RLS "Users can view public events or their own events" 중 모든 사용자에게 공통인 부분(is_public)만 캐시.
+// 개인 일정은 호출 측에서 사용자 클라이언트로 is_public = false 조건만 별도 조회한다.
+
+// 월 단위 캐시: 태그가 월마다 다르므로 일정 변경 시 걸친 월만 무효화된다.
+// 반복 시리즈는 여러 달에 걸치므로 시리즈 변경 시에는 series 태그로 모든 월을 무효화한다.
+export function calendarMonthTag(month: MonthKey): string {
+  return `${LAB_CACHE_TAGS.calendar}:${month}`;
+}
+
+const CALENDAR_SERIES_TAG = `${LAB_CACHE_TAGS.calendar}:series`;
+
+// months가 없으면 반복 시리즈 변경 → 모든 월
+export function invalidateCalendarMonths(months: MonthKey[] | undefined) {
+  if (!months) {
+    revalidateTag(CALENDAR_SERIES_TAG);
+    return;
+  }
+  for (const month of new Set(months)) {
+    revalidateTag(calendarMonthTag(month));
+  }
+}
+
+// 반복 시리즈를 [windowStart, windowEnd)에 걸친 회차로 전개 (예외 반영)
+async function expandSeries(
+  supabase: SupabaseClient<Database>,
+  seriesRows: CachedCalendarEvent[],
+  windowStart: Date,
+  windowEnd: Date
+): Promise<{ data: CachedCalendarEvent[]; error: string | null }> {
+  if (seriesRows.length === 0) return { data: [], error: null };
+
+  // 창 이전에 시작해 창에 걸치는 회차의 예외도 필요하므로, 전개와 같이
+  // 가장 긴 회차 길이만큼 앞당겨 조회한다
+  const longest = Math.max(...seriesRows.map(durationMs));
+  const { data, error } = await supabase
+    .from("calendar_event_exceptions")
+    .select("event_id, original_start, is_cancelled, start_date, end_date, title, description")
+    .in("event_id", seriesRows.map((e) => e.id))
+    .gte("original_start", new Date(windowStart.getTime() - longest).toISOString())
+    .lt("original_start", windowEnd.toISOString());
+  if (error) return { data: [], error: error.message };
+
+  const exceptions = (data || []) as RecurrenceException[];
+  return {
+    data: seriesRows.flatMap((event) =>
+      expandOccurrences(event, exceptions, windowStart, windowEnd)
+    ),
+    error: null,
+  };
+}
+
+/**
+ * 해당 월에 걸친 일정 (월 이전에 시작해 월 안에서 끝나는 일정 포함).
+ * 단일 일정은 날짜 조건으로, 반복 시리즈는 series_range가 월과 겹치는 것만 읽어
+ * 이 달의 회차만 전개한다 (예외 반영).
+ */
+export async function queryCalendarMonth(
+  supabase: SupabaseClient<Database>,
+  month: MonthKey,
+  isPublic: boolean
+): Promise<{ data: CachedCalendarEvent[]; error: string | null }> {
+  const { start, end } = monthBounds(month);
+
+  const [singles, series] = await Promise.all([
+    supabase
+      .from("calendar_events")
+      .select(CALENDAR_EVENT_COLUMNS)
+      .eq("is_public", isPublic)
+      .is("rrule", null)
+      .lt("start_date", end)
+      // 경계 값에 오프셋(+09:00)이 있어 논리 필터 안에서는 따옴표로 감싼다
+      .or(`start_date.gte."${start}",end_date.gte."${start}"`)
+      .order("start_date", { ascending: true }),
+    supabase
+      .from("calendar_events")
+      .select(CALENDAR_EVENT_COLUMNS)
+      .eq("is_public", isPublic)
+      .not("rrule", "is", null)
+      .overlaps("series_range", `[${start},${end})`),
+  ]);
+
+  const error = singles.error ?? series.error;
+  if (error) return { data: [], error: error.message };
+
+  const expanded = await expandSeries(
+    supabase,
+    (series.data || []) as unknown as CachedCalendarEvent[],
+    new Date(start),
+    new Date(end)
+  );
+  if (expanded.error) return { data: [], error: expanded.error };
+
+  const data = [
+    ...((singles.data || []) as unknown as CachedCalendarEvent[]),
+    ...expanded.data,
+  ].sort((a, b) => a.start_date.localeCompare(b.start_date));
+  return { data, error: null };
+}
+
+export function getCachedPublicCalendarMonth(month: MonthKey): Promise<CachedCalendarEvent[]> {
+  return unstable_cache(
+    async (): Promise<CachedCalendarEvent[]> => {
+      const { data, error } = await queryCalendarMonth(createServiceRoleClient(), month, true);
+
+      if (error) {
+        console.error("Cached calendar month fetch error:", error);
+        return [];
+      }
+
+      return data;
+    },
+    ["lab-public-calendar-month", month],
+    { tags: [calendarMonthTag(month), CALENDAR_SERIES_TAG], revalidate: LAB_CACHE_TTL }
+  )();
+}
+
+// 다가오는 일정에 반복 회차를 펼치는 기간 (일)
+const UPCOMING_SERIES_DAYS = 60;
+
+/**
+ * fromDate(연구실 날짜, YYYY-MM-DD)부터 가장 이른 일정 limit개.
+ * 단일 일정과 [fromDate, fromDate + UPCOMING_SERIES_DAYS)에 전개한 반복 회차를
+ * 합쳐 정렬한 뒤 자른다.
+ */
+export async function queryUpcomingCalendarEvents(
+  supabase: SupabaseClient<Database>,
+  fromDate: string,
+  limit: number,
+  isPublic: boolean
+): Promise<{ data: CachedCalendarEvent[]; error: string | null }> {
+  const windowStart = new Date(`${fromDate}T00:00:00+09:00`);
+  const windowEnd = new Date(windowStart.getTime() + UPCOMING_SERIES_DAYS * 24 * 60 * 60 * 1000);
+  const start = windowStart.toISOString();
+
+  const [singles, series] = await Promise.all([
+    supabase
+      .from("calendar_events")
+      .select(CALENDAR_EVENT_COLUMNS)
+      .eq("is_public", isPublic)
+      .is("rrule", null)
+      .gte("start_date", start)
+      .order("start_date", { ascending: true })
+      .limit(limit),
+    supabase
+      .from("calendar_events")
+      .select(CALENDAR_EVENT_COLUMNS)
+      .eq("is_public", isPublic)
+      .not("rrule", "is", null)
+      .overlaps("series_range", `[${start},${windowEnd.toISOString()})`),
+  ]);
+
+  const error = singles.error ?? series.error;
+  if (error) return { data: [], error: error.message };
+
+  const expanded = await expandSeries(
+    supabase,
+    (series.data || []) as unknown as CachedCalendarEvent[],
+    windowStart,
+    windowEnd
+  );
+  if (expanded.error) return { data: [], error: expanded.error };
+
+  const data = [
+    ...((singles.data || []) as unknown as CachedCalendarEvent[]),
+    // 이미 시작해 진행 중인 회차는 "다가오는" 일정이 아니다
+    ...expanded.data.filter((occurrence) => new Date(occurrence.start_date) >= windowStart),
+  ]
+    .sort((a, b) => a.start_date.localeCompare(b.start_date))
+    .slice(0, limit);
+  return { data, error: null };
+}
+
+// 대시보드 "다가오는 마감일"용 공개 일정 (반복 회차 포함)
+// 기준일은 캐시 키에 포함되므로 날짜(YYYY-MM-DD) 단위로 전달할 것.
+export const getCachedUpcomingPublicCalendarEvents = unstable_cache(
+  async (fromDate: string, limit: number): Promise<CachedCalendarEvent[]> => {
+    const { data, error } = await queryUpcomingCalendarEvents(
+      createServiceRoleClient(),
+      fromDate,
+      limit,
+      true
+    );
+
+    if (error) {
+      console.error("Cached calendar events fetch error:", error);
+      return [];
+    }
+
+    return data;
+  },
+  ["lab-upcoming-public-calendar-events"],
+  { tags: [LAB_CACHE_TAGS.calendar, CALENDAR_SERIES_TAG], revalidate: LAB_CACHE_TTL }
+);
+
+// ============================================
+// 논문 목록 (/api/papers)
+// ============================================
+
+export interface CachedPapersQuery {
+  fieldId: string | null;
+  limit: number;
+  offset: number;
+  sort: string;
+  labOnly: boolean;
+}
+
+// RLS "Authenticated users can read visible papers" → is_hidden = false 조건을 직접 적용
+// 자유 검색어(search)는 캐시 키가 무한히 늘어나므로 캐시하지 않는다.
+export const getCachedPapers = unstable_cache(
+  async (params: CachedPapersQuery): Promise<{ data: unknown[]; total: number; error?: string }> => {
+    const supabase = createServiceRoleClient();
+
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    let query = (supabase as any)
+      .from("papers")
+      .select(
+        `
+        id, title, authors, abstract, doi, url, journal,
+        publication_date, publication_year, citation_count,
+        source, is_lab_member, member_id, is_hidden, created_at,
+        paper_field_links(
+          relevance,
+          field_id,
+          research_fields(id, name, name_en, map_node_id)
+        )
+      `,
+        { count: "exact" }
+      )
+      .eq("is_hidden", false);
+
+    if (params.labOnly) {
+      query = query.eq("is_lab_member", true);
+    }
+
+    if (params.fieldId) {
+      query = query.filter("paper_field_links.field_id", "eq", params.fieldId);
+    }
+
+    if (params.sort === "citations") {
+      query = query.order("citation_count", { ascending: false });
+    } else {
+      query = query.order("publication_date", { ascending: false, nullsFirst: false });
+    }
+
+    query = query.range(params.offset, params.offset + params.limit - 1);
+
+    const { data, error, count } = await query;
+
+    if (error) {
+      return { data: [], total: 0, error: error.message };
+    }
+
+    return { data: (data || []) as unknown[], total: count ?? 0 };
+  },
+  ["lab-papers"],
+  { tags: [LAB_CACHE_TAGS.papers], revalidate: LAB_CACHE_TTL }
+);
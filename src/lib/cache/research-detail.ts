@@ -0,0 +1,170 @@
+import { cache } from "react";
+import { createClient } from "@/lib/supabase/server";
+import { getCurrentMember } from "@/lib/cache/current-member";
+import type {
+  MilestoneStage,
+  ResearchMeeting,
+  SubmissionStatus,
+} from "@/types/database.types";
+
+// ============================================
+// 연구 상세 페이지 섹션별 데이터 (요청 단위 캐시)
+// ============================================
+// 상세 페이지의 각 섹션은 독립된 Suspense 경계에서 동시에 데이터를 조회한다.
+// 프로젝트/마일스톤/주간 목표는 여러 섹션이 함께 쓰므로 React cache()로
+// 같은 요청 안에서 한 번만 조회되도록 묶는다. (요청 간에는 공유되지 않음)
+
+export interface ResearchDetailProject {
+  id: string;
+  title: string;
+  category: string;
+  project_type: string | null;
+  description: string | null;
+  target_journal: string | null;
+  target_date: string | null;
+  status: string;
+  overall_progress: number;
+  flowchart_md: string | null;
+  submission_status: SubmissionStatus;
+  submitted_at: string | null;
+  created_at: string;
+  updated_at: string;
+  created_by: string;
+}
+
+export interface ResearchDetailChecklistItem {
+  id: string;
+  content: string;
+  is_completed: boolean;
+  order_index: number;
+}
+
+export interface ResearchDetailMilestone {
+  id: string;
+  title: string;
+  stage: string;
+  weight: number;
+  order_index: number;
+  progress: number;
+  start_date: string | null;
+  end_date: string | null;
+  checklist_items: ResearchDetailChecklistItem[];
+}
+
+export interface ResearchDetailWeeklyGoal {
+  id: string;
+  content: string;
+  deadline: string;
+  linked_stage: MilestoneStage | null;
+  is_completed: boolean;
+}
+
+export interface ResearchDetailAuthor {
+  id: string;
+  name: string;
+  role: string;
+  responsibilities: string | null;
+  sort_order: number;
+}
+
+export const getResearchDetailProject = cache(
+  async (projectId: string): Promise<ResearchDetailProject | null> => {
+    const supabase = await createClient();
+
+    const { data } = await supabase
+      .from("research_projects")
+      .select("*")
+      .eq("id", projectId)
+      .single();
+
+    return (data as ResearchDetailProject | null) ?? null;
+  }
+);
+
+// 삭제 권한 + 즐겨찾기 여부
+export const getResearchDetailViewer = cache(
+  async (projectId: string): Promise<{ canDelete: boolean; isFavorite: boolean }> => {
+    const supabase = await createClient();
+    const member = await getCurrentMember();
+    if (!member) {
+      return { canDelete: false, isFavorite: false };
+    }
+
+    const [project, { data: favorite }] = await Promise.all([
+      getResearchDetailProject(projectId),
+      supabase
+        .from("research_project_favorites")
+        .select("id")
+        .eq("user_id", member.id)
+        .eq("project_id", projectId)
+        .maybeSingle(),
+    ]);
+
+    const isAdmin = member.position === "professor";
+    const isCreator = project?.created_by === member.id;
+
+    return { canDelete: isAdmin || isCreator, isFavorite: !!favorite };
+  }
+);
+
+export const getResearchDetailMilestones = cache(
+  async (projectId: string): Promise<ResearchDetailMilestone[]> => {
+    const supabase = await createClient();
+
+    const { data, error } = await supabase
+      .from("milestones")
+      .select(`*, checklist_items (*)`)
+      .eq("project_id", projectId)
+      .order("order_index", { ascending: true });
+
+    if (error) {
+      console.error("Milestones fetch error:", error);
+    }
+
+    return (data || []) as ResearchDetailMilestone[];
+  }
+);
+
+export const getResearchDetailWeeklyGoals = cache(
+  async (projectId: string): Promise<ResearchDetailWeeklyGoal[]> => {
+    const supabase = await createClient();
+
+    const { data } = await supabase
+      .from("weekly_goals")
+      .select("*")
+      .eq("project_id", projectId)
+      .order("deadline", { ascending: true });
+
+    return (data || []) as ResearchDetailWeeklyGoal[];
+  }
+);
+
+export const getResearchDetailAuthors = cache(
+  async (projectId: string): Promise<ResearchDetailAuthor[]> => {
+    const supabase = await createClient();
+
+    const { data } = await supabase
+      .from("project_authors")
+      .select("*")
+      .eq("project_id", projectId)
+      .order("sort_order", { ascending: true });
+
+    return (data || []) as ResearchDetailAuthor[];
+  }
+);
+
+export const getResearchDetailMeetings = cache(
+  async (projectId: string): Promise<ResearchMeeting[]> => {
+    const supabase = await createClient();
+
+    const { data } = await supabase
+      .from("research_meetings")
+      .select("*")
+      .eq("project_id", projectId)
+      .order("meeting_date", { ascending: false })
+      .order("created_at", { ascending: false });
+
+    return (data || []) as ResearchMeeting[];
+  }
+);
+
@@ -0,0 +1,68 @@
+import { describe, it, expect } from "vitest";
+import { buildIcsCalendar } from "./ics";
+
+const stamp = new Date("2026-10-19T00:00:00Z");
+
+function lines(ics: string) {
+  return ics.split("\r\n");
+}
+
+describe("buildIcsCalendar", () => {
+  it("should write timed events as lab wall-clock time", () => {
+    const ics = buildIcsCalendar(
+      "SDC Lab",
+      [
+        {
+          uid: "ev1@sdc-lab",
+          summary: "랩 미팅",
+          start: "2026-10-04T23:00:00.000Z",
+          end: "2026-10-05T00:00:00.000Z",
+          allDay: false,
+          rrule: "FREQ=WEEKLY;BYDAY=MO;UNTIL=20261231",
+          exdates: ["2026-10-11T23:00:00.000Z"],
+        },
+      ],
+      stamp
+    );
+
+    expect(lines(ics)).toEqual(
+      expect.arrayContaining([
+        "DTSTAMP:20261019T000000Z",
+        "DTSTART;TZID=Asia/Seoul:20261005T080000",
+        "DTEND;TZID=Asia/Seoul:20261005T090000",
+        // 날짜만 있는 UNTIL은 연구실 기준 그날 끝 (UTC)
+        "RRULE:FREQ=WEEKLY;BYDAY=MO;UNTIL=20261231T145959Z",
+        "EXDATE;TZID=Asia/Seoul:20261012T080000",
+      ])
+    );
+    expect(ics.endsWith("END:VCALENDAR\r\n")).toBe(true);
+  });
+
+  it("should write all-day deadlines with an exclusive next-day end", () => {
+    const ics = buildIcsCalendar(
+      "SDC Lab",
+      [{ uid: "goal1@sdc-lab", summary: "초안 제출", start: "2026-10-30", allDay: true }],
+      stamp
+    );
+
+    expect(lines(ics)).toEqual(
+      expect.arrayContaining(["DTSTART;VALUE=DATE:20261030", "DTEND;VALUE=DATE:20261031"])
+    );
+  });
+
+  it("should escape text and fold long lines without splitting characters", () => {
+    const summary = "세미나, 발표; 준비\n".repeat(6);
+    const ics = buildIcsCalendar(
+      "SDC Lab",
+      [{ uid: "ev2@sdc-lab", summary, start: "2026-10-30", allDay: true }],
+      stamp
+    );
+
+    const encoder = new TextEncoder();
+    for (const line of lines(ics)) {
+      expect(encoder.encode(line).length).toBeLessThanOrEqual(75);
+    }
+    const unfolded = ics.replace(/\r\n /g, "");
+    expect(unfolded).toContain("SUMMARY:세미나\\, 발표\\; 준비\\n세미나");
+  });
+});
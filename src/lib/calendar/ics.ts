@@ -0,0 +1,170 @@
+// ============================================
+// iCalendar (RFC 5545) 직렬화
+// ============================================
+// 멤버별 구독 피드(/api/calendar/feed/[token])의 본문을 만든다.
+// 시각 일정은 Asia/Seoul 벽시계(TZID)로 적는다. UTC로 적으면
+// 이른 아침 일정의 BYDAY가 하루 밀려 반복 규칙이 달라진다.
+
+import { LAB_TIME_ZONE, parseRRule, toLabTime } from "./recurrence";
+
+export interface IcsEvent {
+  uid: string;
+  summary: string;
+  description?: string | null;
+  // ISO 타임스탬프 또는 종일 일정의 YYYY-MM-DD
+  start: string;
+  // 배타적 종료. 없으면 시각 일정은 시작과 같고 종일 일정은 하루
+  end?: string | null;
+  allDay: boolean;
+  rrule?: string | null;
+  // 취소된 회차의 원래 시작 시각
+  exdates?: string[];
+  // 특정 회차만 바꾼 경우 원래 회차 시작 시각
+  recurrenceId?: string;
+  categories?: string;
+}
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const MAX_LINE_OCTETS = 75;
+const encoder = new TextEncoder();
+
+function pad(n: number): string {
+  return String(n).padStart(2, "0");
+}
+
+function escapeText(value: string): string {
+  return value
+    .replace(/\\/g, "\\\\")
+    .replace(/;/g, "\\;")
+    .replace(/,/g, "\\,")
+    .replace(/\r?\n/g, "\\n");
+}
+
+// 75 옥텟마다 CRLF + 공백으로 접는다 (UTF-8 문자 중간에서 자르지 않음)
+function foldLine(line: string): string {
+  if (encoder.encode(line).length <= MAX_LINE_OCTETS) return line;
+
+  const parts: string[] = [];
+  let current = "";
+  let octets = 0;
+  for (const char of line) {
+    const size = encoder.encode(char).length;
+    // 이어지는 줄은 앞의 공백 1옥텟을 포함
+    const limit = parts.length === 0 ? MAX_LINE_OCTETS : MAX_LINE_OCTETS - 1;
+    if (octets + size > limit) {
+      parts.push(current);
+      current = "";
+      octets = 0;
+    }
+    current += char;
+    octets += size;
+  }
+  parts.push(current);
+  return parts.join("\r\n ");
+}
+
+function formatUtc(date: Date): string {
+  return (
+    `${date.getUTCFullYear()}${pad(date.getUTCMonth() + 1)}${pad(date.getUTCDate())}` +
+    `T${pad(date.getUTCHours())}${pad(date.getUTCMinutes())}${pad(date.getUTCSeconds())}Z`
+  );
+}
+
+function formatLabDateTime(value: string): string {
+  return formatUtc(toLabTime(new Date(value))).slice(0, -1);
+}
+
+// 종일 일정 날짜 (연구실 기준). 날짜만 있는 값은 그대로 쓴다
+function labDate(value: string): Date {
+  if (/^\d{4}-\d{2}-\d{2}$/.test(value)) return new Date(`${value}T00:00:00Z`);
+  const local = toLabTime(new Date(value));
+  return new Date(Date.UTC(local.getUTCFullYear(), local.getUTCMonth(), local.getUTCDate()));
+}
+
+function formatDate(date: Date): string {
+  return formatUtc(date).slice(0, 8);
+}
+
+// 날짜 속성: 종일이면 VALUE=DATE, 아니면 TZID 벽시계
+function dateProperty(name: string, value: string, allDay: boolean): string {
+  return allDay
+    ? `${name};VALUE=DATE:${formatDate(labDate(value))}`
+    : `${name};TZID=${LAB_TIME_ZONE}:${formatLabDateTime(value)}`;
+}
+
+// UNTIL은 DTSTART 형식을 따라야 한다: 종일이면 DATE, 시각 일정이면 UTC
+function formatRRule(rrule: string, allDay: boolean): string {
+  const rule = parseRRule(rrule);
+  const parts = rrule
+    .replace(/^RRULE:/i, "")
+    .split(";")
+    .filter((part) => part && !/^UNTIL=/i.test(part));
+  if (rule.until) {
+    parts.push(
+      `UNTIL=${allDay ? formatDate(labDate(rule.until.toISOString())) : formatUtc(rule.until)}`
+    );
+  }
+  return parts.join(";").toUpperCase();
+}
+
+function eventLines(event: IcsEvent, stamp: string): string[] {
+  const lines = [
+    "BEGIN:VEVENT",
+    `UID:${event.uid}`,
+    `DTSTAMP:${stamp}`,
+    dateProperty("DTSTART", event.start, event.allDay),
+  ];
+
+  if (event.allDay) {
+    const start = labDate(event.start).getTime();
+    const end = event.end ? labDate(event.end).getTime() : 0;
+    lines.push(`DTEND;VALUE=DATE:${formatDate(new Date(Math.max(end, start + DAY_MS)))}`);
+  } else if (event.end) {
+    lines.push(dateProperty("DTEND", event.end, false));
+  }
+
+  if (event.recurrenceId) {
+    lines.push(dateProperty("RECURRENCE-ID", event.recurrenceId, event.allDay));
+  } else if (event.rrule) {
+    lines.push(`RRULE:${formatRRule(event.rrule, event.allDay)}`);
+    for (const exdate of event.exdates ?? []) {
+      lines.push(dateProperty("EXDATE", exdate, event.allDay));
+    }
+  }
+
+  lines.push(`SUMMARY:${escapeText(event.summary)}`);
+  if (event.description) lines.push(`DESCRIPTION:${escapeText(event.description)}`);
+  if (event.categories) lines.push(`CATEGORIES:${escapeText(event.categories)}`);
+  lines.push("END:VEVENT");
+  return lines;
+}
+
+/**
+ * VCALENDAR 본문. stamp(DTSTAMP)는 피드가 마지막으로 바뀐 시각을 넘겨
+ * 같은 데이터면 같은 본문이 나오도록 한다.
+ */
+export function buildIcsCalendar(name: string, events: IcsEvent[], stamp: Date): string {
+  const dtstamp = formatUtc(stamp);
+  const lines = [
+    "BEGIN:VCALENDAR",
+    "VERSION:2.0",
+    "PRODID:-//SDC Lab//Dashboard Calendar//KO",
+    "CALSCALE:GREGORIAN",
+    "METHOD:PUBLISH",
+    `X-WR-CALNAME:${escapeText(name)}`,
+    `X-WR-TIMEZONE:${LAB_TIME_ZONE}`,
+    // 서머타임이 없어 STANDARD 하나로 충분
+    "BEGIN:VTIMEZONE",
+    `TZID:${LAB_TIME_ZONE}`,
+    "BEGIN:STANDARD",
+    "DTSTART:19700101T000000",
+    "TZOFFSETFROM:+0900",
+    "TZOFFSETTO:+0900",
+    "TZNAME:KST",
+    "END:STANDARD",
+    "END:VTIMEZONE",
+    ...events.flatMap((event) => eventLines(event, dtstamp)),
+    "END:VCALENDAR",
+  ];
+  return lines.map(foldLine).join("\r\n") + "\r\n";
+}
@@ -0,0 +1,56 @@
+import { describe, it, expect } from "vitest";
+import { eventMonths, monthBounds, monthsInView, shiftMonth } from "./months";
+
+describe("shiftMonth", () => {
+  it("should carry across year boundaries", () => {
+    expect(shiftMonth("2026-12", 1)).toBe("2027-01");
+    expect(shiftMonth("2026-01", -1)).toBe("2025-12");
+  });
+});
+
+describe("monthsInView", () => {
+  it("should list every month touched by an exclusive view range", () => {
+    // 2026년 10월 월간 보기: 9/27 ~ 11/8 (배타적)
+    expect(monthsInView(new Date(2026, 8, 27), new Date(2026, 10, 8))).toEqual([
+      "2026-09",
+      "2026-10",
+      "2026-11",
+    ]);
+    expect(monthsInView(new Date(2026, 9, 1), new Date(2026, 10, 1))).toEqual(["2026-10"]);
+  });
+});
+
+describe("monthBounds", () => {
+  it("should end at the first day of the next month", () => {
+    expect(monthBounds("2026-12")).toEqual({
+      start: "2026-12-01T00:00:00+09:00",
+      end: "2027-01-01T00:00:00+09:00",
+    });
+  });
+
+  it("should start at lab midnight, not UTC midnight", () => {
+    const { start } = monthBounds("2026-03");
+    expect(new Date(start).toISOString()).toBe("2026-02-28T15:00:00.000Z");
+  });
+});
+
+describe("eventMonths", () => {
+  it("should include every month a multi-day event spans", () => {
+    expect(eventMonths("2026-10-30T09:00:00", "2026-12-01T10:00:00")).toEqual([
+      "2026-10",
+      "2026-11",
+      "2026-12",
+    ]);
+    expect(eventMonths("2026-10-30T09:00:00", null)).toEqual(["2026-10"]);
+  });
+
+  it("should use the lab date for early-morning events on the 1st", () => {
+    // 3/1 07:00~08:00 KST는 UTC로 2/28 22:00~23:00
+    expect(eventMonths("2026-02-28T22:00:00.000Z", "2026-02-28T23:00:00.000Z")).toEqual([
+      "2026-03",
+    ]);
+    expect(eventMonths("2026-02-28T22:00:00+00:00")).toEqual(["2026-03"]);
+    // 3/31 23:00 KST는 4월이 아니다
+    expect(eventMonths("2026-03-31T14:00:00Z")).toEqual(["2026-03"]);
+  });
+});
@@ -0,0 +1,67 @@
+// ============================================
+// 캘린더 월 단위 범위
+// ============================================
+// 일정은 월(YYYY-MM) 단위로 조회·캐시한다. 서버 캐시 태그와 클라이언트 쿼리 키가
+// 같은 월 키를 쓰므로 일정 변경 시 해당 월만 무효화할 수 있다.
+// 월 경계는 연구실 시간(KST) 기준이다. DB의 UTC 시각으로 자르면 1일 09시 이전
+// 일정이 전달로 들어가 화면 월과 어긋난다.
+
+import { toLabTime } from "./recurrence";
+
+export type MonthKey = string; // "YYYY-MM"
+
+function pad(n: number): string {
+  return String(n).padStart(2, "0");
+}
+
+// 시간대가 붙은 ISO 문자열 (DB timestamptz, toISOString 결과)
+const ZONED_ISO = /(?:Z|[+-]\d{2}:?\d{2})$/i;
+
+// Date는 로컬(브라우저 = KST) 기준.
+// 문자열은 시간대가 있으면 KST 날짜로 바꾸고, 없으면 이미 벽시계 값이라 앞부분만 본다.
+export function monthKey(date: Date | string): MonthKey {
+  if (typeof date === "string") {
+    if (!ZONED_ISO.test(date)) return date.slice(0, 7);
+    return toLabTime(new Date(date)).toISOString().slice(0, 7);
+  }
+  return `${date.getFullYear()}-${pad(date.getMonth() + 1)}`;
+}
+
+export function shiftMonth(key: MonthKey, delta: number): MonthKey {
+  const [year, month] = key.split("-").map(Number);
+  const index = year * 12 + (month - 1) + delta;
+  return `${Math.floor(index / 12)}-${pad((index % 12) + 1)}`;
+}
+
+// [start, end] 양 끝을 포함하는 월 목록
+export function monthsBetween(start: MonthKey, end: MonthKey): MonthKey[] {
+  const months: MonthKey[] = [];
+  for (let key = start; key <= end; key = shiftMonth(key, 1)) {
+    months.push(key);
+  }
+  return months;
+}
+
+// FullCalendar 보이는 범위(end는 배타적)에 걸친 월 목록
+export function monthsInView(start: Date, end: Date): MonthKey[] {
+  const lastDay = new Date(end.getTime() - 1);
+  return monthsBetween(monthKey(start), monthKey(lastDay));
+}
+
+// Asia/Seoul 고정 오프셋 (recurrence.ts와 같이 서머타임 없음)
+const LAB_UTC_OFFSET = "+09:00";
+
+// 월의 [시작, 다음 달 시작) 시각 (KST 자정, 오프셋 포함 ISO)
+export function monthBounds(key: MonthKey): { start: string; end: string } {
+  return {
+    start: `${key}-01T00:00:00${LAB_UTC_OFFSET}`,
+    end: `${shiftMonth(key, 1)}-01T00:00:00${LAB_UTC_OFFSET}`,
+  };
+}
+
+// 일정이 걸친 월 (변경 시 무효화 대상)
+export function eventMonths(startDate: string, endDate?: string | null): MonthKey[] {
+  const start = monthKey(startDate);
+  const end = endDate ? monthKey(endDate) : start;
+  return end < start ? [start] : monthsBetween(start, end);
+}
@@ -0,0 +1,153 @@
+import { describe, it, expect } from "vitest";
+import {
+  buildSimpleRRule,
+  describeSimpleRRule,
+  expandOccurrences,
+  parseRRule,
+  recurrenceEnd,
+} from "./recurrence";
+import { monthBounds } from "./months";
+
+// 2026-10-05(월) 10:00 KST 랩 미팅, 1시간
+const weekly = {
+  id: "ev1",
+  title: "랩 미팅",
+  start_date: "2026-10-05T01:00:00.000Z",
+  end_date: "2026-10-05T02:00:00.000Z",
+  rrule: "FREQ=WEEKLY;BYDAY=MO,TH",
+};
+
+function starts(occurrences: { start_date: string }[]) {
+  return occurrences.map((o) => o.start_date);
+}
+
+describe("parseRRule", () => {
+  it("should parse frequency, interval, count and weekdays", () => {
+    expect(parseRRule("RRULE:FREQ=WEEKLY;INTERVAL=2;COUNT=5;BYDAY=MO,WE")).toEqual({
+      freq: "WEEKLY",
+      interval: 2,
+      count: 5,
+      byDay: [1, 3],
+    });
+  });
+
+  it("should reject unsupported rules", () => {
+    expect(() => parseRRule("FREQ=HOURLY")).toThrow();
+    expect(() => parseRRule("FREQ=MONTHLY;BYDAY=MO")).toThrow();
+  });
+});
+
+describe("buildSimpleRRule", () => {
+  it("should round-trip frequency and lab-local end date", () => {
+    const rrule = buildSimpleRRule("WEEKLY", "2026-12-31");
+    expect(rrule).toBe("FREQ=WEEKLY;UNTIL=20261231");
+    expect(describeSimpleRRule(rrule)).toEqual({ freq: "WEEKLY", untilDate: "2026-12-31" });
+    expect(describeSimpleRRule(buildSimpleRRule("MONTHLY"))).toEqual({ freq: "MONTHLY", untilDate: null });
+  });
+});
+
+describe("expandOccurrences", () => {
+  it("should only materialize occurrences inside the window", () => {
+    const occurrences = expandOccurrences(
+      weekly,
+      [],
+      new Date("2026-11-01T00:00:00Z"),
+      new Date("2026-11-10T00:00:00Z")
+    );
+
+    expect(starts(occurrences)).toEqual([
+      "2026-11-02T01:00:00.000Z",
+      "2026-11-05T01:00:00.000Z",
+      "2026-11-09T01:00:00.000Z",
+    ]);
+    expect(occurrences[0]).toMatchObject({
+      id: `ev1_${Date.parse("2026-11-02T01:00:00Z")}`,
+      series_id: "ev1",
+      end_date: "2026-11-02T02:00:00.000Z",
+    });
+  });
+
+  it("should use lab-local weekdays for early morning events", () => {
+    // 월요일 08:00 KST = 일요일 23:00 UTC
+    const early = { ...weekly, start_date: "2026-10-04T23:00:00.000Z", end_date: null, rrule: "FREQ=WEEKLY;BYDAY=MO" };
+    const occurrences = expandOccurrences(
+      early,
+      [],
+      new Date("2026-10-10T00:00:00Z"),
+      new Date("2026-10-20T00:00:00Z")
+    );
+
+    expect(starts(occurrences)).toEqual(["2026-10-11T23:00:00.000Z", "2026-10-18T23:00:00.000Z"]);
+  });
+
+  it("should expand into the lab-time month of an occurrence on the 1st", () => {
+    // 매주 일요일 08:00 KST, 2026-03-01(일) 회차는 UTC로 2/28 23:00
+    const sunday = { ...weekly, start_date: "2026-02-14T23:00:00.000Z", end_date: null, rrule: "FREQ=WEEKLY" };
+    const inMonth = (key: string) => {
+      const { start, end } = monthBounds(key);
+      return starts(expandOccurrences(sunday, [], new Date(start), new Date(end)));
+    };
+
+    expect(inMonth("2026-03")[0]).toBe("2026-02-28T23:00:00.000Z");
+    expect(inMonth("2026-02")).not.toContain("2026-02-28T23:00:00.000Z");
+  });
+
+  it("should apply cancellations and overrides by original start", () => {
+    const occurrences = expandOccurrences(
+      weekly,
+      [
+        {
+          event_id: "ev1",
+          original_start: "2026-11-02T01:00:00.000Z",
+          is_cancelled: true,
+          start_date: null,
+          end_date: null,
+          title: null,
+          description: null,
+        },
+        {
+          event_id: "ev1",
+          original_start: "2026-11-05T01:00:00.000Z",
+          is_cancelled: false,
+          start_date: "2026-11-05T05:00:00.000Z",
+          end_date: "2026-11-05T06:00:00.000Z",
+          title: "랩 미팅 (장소 변경)",
+          description: null,
+        },
+      ],
+      new Date("2026-11-01T00:00:00Z"),
+      new Date("2026-11-06T00:00:00Z")
+    );
+
+    expect(occurrences).toHaveLength(1);
+    expect(occurrences[0]).toMatchObject({
+      start_date: "2026-11-05T05:00:00.000Z",
+      occurrence_start: "2026-11-05T01:00:00.000Z",
+      title: "랩 미팅 (장소 변경)",
+    });
+  });
+
+  it("should skip months without the start day", () => {
+    const monthly = { ...weekly, start_date: "2026-01-31T01:00:00.000Z", end_date: null, rrule: "FREQ=MONTHLY" };
+    const occurrences = expandOccurrences(
+      monthly,
+      [],
+      new Date("2026-02-01T00:00:00Z"),
+      new Date("2026-04-01T00:00:00Z")
+    );
+
+    expect(starts(occurrences)).toEqual(["2026-03-31T01:00:00.000Z"]);
+  });
+});
+
+describe("recurrenceEnd", () => {
+  it("should end at the last counted occurrence", () => {
+    expect(recurrenceEnd({ ...weekly, rrule: "FREQ=WEEKLY;BYDAY=MO,TH;COUNT=3" })).toEqual(
+      new Date("2026-10-12T02:00:00.000Z")
+    );
+  });
+
+  it("should be open-ended without COUNT or UNTIL", () => {
+    expect(recurrenceEnd(weekly)).toBeNull();
+  });
+});
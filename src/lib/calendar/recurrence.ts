@@ -0,0 +1,271 @@
+// ============================================
+// 반복 일정 (RRULE 일부) 전개
+// ============================================
+// calendar_events.rrule에 RFC 5545 RRULE 본문을 한 번만 저장하고,
+// 조회 구간 [windowStart, windowEnd)에 걸친 회차만 서버에서 만들어 낸다.
+// 지원: FREQ=DAILY|WEEKLY|MONTHLY|YEARLY, INTERVAL, COUNT, UNTIL, BYDAY(WEEKLY)
+// 요일/날짜 계산은 연구실 기준 시간대(Asia/Seoul, 서머타임 없음)의 벽시계로 한다.
+
+export const LAB_TIME_ZONE = "Asia/Seoul";
+
+export type RecurrenceFrequency = "DAILY" | "WEEKLY" | "MONTHLY" | "YEARLY";
+
+export interface RecurrenceRule {
+  freq: RecurrenceFrequency;
+  interval: number;
+  count?: number;
+  until?: Date;
+  byDay: number[]; // 0 = 일요일 … 6 = 토요일
+}
+
+export interface RecurringEventSource {
+  id: string;
+  start_date: string;
+  end_date: string | null;
+  rrule: string | null;
+}
+
+export interface RecurrenceException {
+  event_id: string;
+  original_start: string;
+  is_cancelled: boolean;
+  start_date: string | null;
+  end_date: string | null;
+  title: string | null;
+  description: string | null;
+}
+
+export type Occurrence<T extends RecurringEventSource> = T & {
+  series_id: string;
+  occurrence_start: string;
+};
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+const LAB_TZ_OFFSET_MS = 9 * 60 * 60 * 1000;
+const WEEKDAYS = ["SU", "MO", "TU", "WE", "TH", "FR", "SA"];
+const FREQUENCIES: RecurrenceFrequency[] = ["DAILY", "WEEKLY", "MONTHLY", "YEARLY"];
+
+// 한 주기(interval 1)의 최대 길이. 건너뛰기 추정이 실제보다 앞서지 않도록 넉넉히 잡는다.
+const MAX_PERIOD_MS: Record<RecurrenceFrequency, number> = {
+  DAILY: DAY_MS,
+  WEEKLY: 7 * DAY_MS,
+  MONTHLY: 31 * DAY_MS,
+  YEARLY: 366 * DAY_MS,
+};
+
+// 31일/2월 29일처럼 해당 주기에 날짜가 없을 때 연속으로 건너뛸 수 있는 최대 주기 수
+const MAX_EMPTY_PERIODS = 48;
+
+export function parseRRule(rrule: string): RecurrenceRule {
+  const parts = new Map(
+    rrule
+      .replace(/^RRULE:/i, "")
+      .split(";")
+      .filter(Boolean)
+      .map((part) => {
+        const [key, value = ""] = part.split("=");
+        return [key.toUpperCase(), value.toUpperCase()] as const;
+      })
+  );
+
+  const freq = parts.get("FREQ") as RecurrenceFrequency | undefined;
+  if (!freq || !FREQUENCIES.includes(freq)) {
+    throw new Error(`Unsupported RRULE frequency: ${rrule}`);
+  }
+
+  const interval = parts.has("INTERVAL") ? Number(parts.get("INTERVAL")) : 1;
+  if (!Number.isInteger(interval) || interval < 1) {
+    throw new Error(`Invalid RRULE interval: ${rrule}`);
+  }
+
+  const rule: RecurrenceRule = { freq, interval, byDay: [] };
+
+  if (parts.has("COUNT")) {
+    const count = Number(parts.get("COUNT"));
+    if (!Number.isInteger(count) || count < 1) throw new Error(`Invalid RRULE count: ${rrule}`);
+    rule.count = count;
+  }
+
+  const until = parts.get("UNTIL");
+  if (until) {
+    // 20261231T235959Z 또는 20261231
+    const m = until.match(/^(\d{4})(\d{2})(\d{2})(?:T(\d{2})(\d{2})(\d{2})Z?)?$/);
+    if (!m) throw new Error(`Invalid RRULE until: ${rrule}`);
+    rule.until = m[4]
+      ? new Date(Date.UTC(+m[1], +m[2] - 1, +m[3], +m[4], +m[5], +m[6]))
+      : new Date(Date.UTC(+m[1], +m[2] - 1, +m[3] + 1) - LAB_TZ_OFFSET_MS - 1);
+  }
+
+  const byDay = parts.get("BYDAY");
+  if (byDay) {
+    if (freq !== "WEEKLY") throw new Error(`BYDAY is only supported with FREQ=WEEKLY: ${rrule}`);
+    rule.byDay = byDay.split(",").map((day) => {
+      const index = WEEKDAYS.indexOf(day);
+      if (index < 0) throw new Error(`Invalid RRULE weekday: ${rrule}`);
+      return index;
+    });
+  }
+
+  return rule;
+}
+
+// 일정 편집 화면의 "반복" 선택 (주기 + 종료일)을 RRULE로
+export function buildSimpleRRule(freq: RecurrenceFrequency, untilDate?: string | null): string {
+  return untilDate ? `FREQ=${freq};UNTIL=${untilDate.replace(/-/g, "")}` : `FREQ=${freq}`;
+}
+
+// RRULE → 편집 화면 값. 종료일은 연구실 기준 날짜(YYYY-MM-DD)
+export function describeSimpleRRule(rrule: string): {
+  freq: RecurrenceFrequency;
+  untilDate: string | null;
+} {
+  const rule = parseRRule(rrule);
+  return {
+    freq: rule.freq,
+    untilDate: rule.until ? toLabTime(rule.until).toISOString().slice(0, 10) : null,
+  };
+}
+
+// 연구실 벽시계 시각을 UTC 필드에 담은 Date (getUTC*로 읽는다)
+export function toLabTime(date: Date): Date {
+  return new Date(date.getTime() + LAB_TZ_OFFSET_MS);
+}
+
+function fromLabTime(date: Date): Date {
+  return new Date(date.getTime() - LAB_TZ_OFFSET_MS);
+}
+
+// p번째 주기의 회차 시작 (연구실 벽시계 기준, 오름차순)
+function periodStarts(rule: RecurrenceRule, local: Date, p: number): Date[] {
+  const step = p * rule.interval;
+  const y = local.getUTCFullYear();
+  const m = local.getUTCMonth();
+  const d = local.getUTCDate();
+  const timeOfDay = local.getTime() - Date.UTC(y, m, d);
+
+  switch (rule.freq) {
+    case "DAILY":
+      return [new Date(Date.UTC(y, m, d + step) + timeOfDay)];
+    case "WEEKLY": {
+      // 주 시작은 월요일 (RRULE WKST 기본값)
+      const weekday = local.getUTCDay();
+      const mondayOffset = (weekday + 6) % 7;
+      const days = rule.byDay.length > 0 ? rule.byDay : [weekday];
+      return Array.from(new Set(days.map((wd) => (wd + 6) % 7)))
+        .sort((a, b) => a - b)
+        .map((offset) => new Date(Date.UTC(y, m, d - mondayOffset + step * 7 + offset) + timeOfDay));
+    }
+    case "MONTHLY": {
+      const date = new Date(Date.UTC(y, m + step, d) + timeOfDay);
+      return date.getUTCDate() === d ? [date] : [];
+    }
+    case "YEARLY": {
+      const date = new Date(Date.UTC(y + step, m, d) + timeOfDay);
+      return date.getUTCMonth() === m ? [date] : [];
+    }
+  }
+}
+
+/**
+ * dtstart부터 규칙에 맞는 회차 시작 시각을 순서대로 낸다.
+ * COUNT가 없으면 from 직전 주기로 바로 건너뛰므로 오래된 시리즈도 비용이 일정하다.
+ */
+export function* iterateOccurrenceStarts(
+  rule: RecurrenceRule,
+  dtstart: Date,
+  from: Date = dtstart
+): Generator<Date> {
+  const local = toLabTime(dtstart);
+  const skip =
+    rule.count === undefined
+      ? Math.floor((from.getTime() - dtstart.getTime()) / (MAX_PERIOD_MS[rule.freq] * rule.interval)) - 1
+      : 0;
+  let emitted = 0;
+
+  for (let p = Math.max(0, skip), misses = 0; misses < MAX_EMPTY_PERIODS; p++) {
+    const starts = periodStarts(rule, local, p);
+    if (starts.length === 0) {
+      misses++;
+      continue;
+    }
+    misses = 0;
+    for (const localStart of starts) {
+      const start = fromLabTime(localStart);
+      if (start < dtstart) continue;
+      if (rule.until && start > rule.until) return;
+      if (rule.count !== undefined && emitted >= rule.count) return;
+      emitted++;
+      yield start;
+    }
+  }
+}
+
+// 시리즈 한 회차의 길이 (종료 시각이 없으면 0)
+export function durationMs(event: RecurringEventSource): number {
+  return event.end_date
+    ? Math.max(0, new Date(event.end_date).getTime() - new Date(event.start_date).getTime())
+    : 0;
+}
+
+/**
+ * 시리즈가 끝나는 시각 (마지막 회차의 종료). 끝이 없으면 null.
+ * calendar_events.recurrence_end에 저장되어 series_range 인덱스의 상한이 된다.
+ */
+export function recurrenceEnd(event: RecurringEventSource): Date | null {
+  if (!event.rrule) return null;
+  const rule = parseRRule(event.rrule);
+  const duration = durationMs(event);
+
+  if (rule.count !== undefined) {
+    let last: Date | null = null;
+    for (const start of iterateOccurrenceStarts(rule, new Date(event.start_date))) last = start;
+    return last ? new Date(last.getTime() + duration) : null;
+  }
+  return rule.until ? new Date(rule.until.getTime() + duration) : null;
+}
+
+/**
+ * [windowStart, windowEnd)에 걸친 회차만 만든다.
+ * 예외(calendar_event_exceptions)는 원래 회차 시작 시각으로 맞춰 취소/변경을 반영한다.
+ */
+export function expandOccurrences<T extends RecurringEventSource>(
+  event: T,
+  exceptions: RecurrenceException[],
+  windowStart: Date,
+  windowEnd: Date
+): Occurrence<T>[] {
+  if (!event.rrule) return [];
+  const rule = parseRRule(event.rrule);
+  const duration = durationMs(event);
+  const overrides = new Map(
+    exceptions
+      .filter((e) => e.event_id === event.id)
+      .map((e) => [new Date(e.original_start).getTime(), e])
+  );
+
+  const occurrences: Occurrence<T>[] = [];
+  const from = new Date(windowStart.getTime() - duration);
+
+  for (const start of iterateOccurrenceStarts(rule, new Date(event.start_date), from)) {
+    if (start >= windowEnd) break;
+    const end = new Date(start.getTime() + duration);
+    if (duration > 0 ? end <= windowStart : start < windowStart) continue;
+
+    const originalStart = start.toISOString();
+    const exception = overrides.get(start.getTime());
+    if (exception?.is_cancelled) continue;
+
+    occurrences.push({
+      ...event,
+      id: `${event.id}_${start.getTime()}`,
+      series_id: event.id,
+      occurrence_start: originalStart,
+      start_date: exception?.start_date ?? originalStart,
+      end_date: exception?.end_date ?? (event.end_date ? end.toISOString() : null),
+      ...(exception?.title ? { title: exception.title } : {}),
+      ...(exception?.description ? { description: exception.description } : {}),
+    });
+  }
+
+  return occurrences;
+}
@@ -0,0 +1,44 @@
+import { describe, it, expect } from "vitest";
+import { computePeerReviewHash, diffManuscripts, normalizeManuscript } from "./cache";
+
+describe("computePeerReviewHash", () => {
+  it("should ignore whitespace-only differences", () => {
+    const a = computePeerReviewHash("제목", "첫 문단\r\n\r\n\r\n둘째   문단  ", "model");
+    const b = computePeerReviewHash(" 제목 ", "첫 문단\n\n둘째 문단", "model");
+
+    expect(a).toBe(b);
+  });
+
+  it("should change with the model or the content", () => {
+    const base = computePeerReviewHash("제목", "내용", "model-a");
+
+    expect(computePeerReviewHash("제목", "내용", "model-b")).not.toBe(base);
+    expect(computePeerReviewHash("제목", "내용 수정", "model-a")).not.toBe(base);
+  });
+});
+
+describe("normalizeManuscript", () => {
+  it("should collapse blank lines and trim each line", () => {
+    expect(normalizeManuscript("  a \n\n\n\n b\t\tc ")).toBe("a\n\nb c");
+  });
+});
+
+describe("diffManuscripts", () => {
+  it("should report only changed paragraphs", () => {
+    const previous = "서론입니다.\n\n방법론입니다.\n\n결론입니다.";
+    const next = "서론입니다.\n\n방법론을 보완했습니다.\n\n결론입니다.";
+
+    const diff = diffManuscripts(previous, next);
+
+    expect(diff.added).toEqual(["방법론을 보완했습니다."]);
+    expect(diff.removed).toEqual(["방법론입니다."]);
+    expect(diff.similarity).toBeGreaterThan(0.5);
+    expect(diff.similarity).toBeLessThan(1);
+  });
+
+  it("should treat reordered paragraphs as unchanged", () => {
+    const diff = diffManuscripts("A\n\nB", "B\n\nA");
+
+    expect(diff).toEqual({ similarity: 1, added: [], removed: [] });
+  });
+});
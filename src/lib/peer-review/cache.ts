@@ -0,0 +1,90 @@
+import { createHash } from "crypto";
+import { PEER_REVIEW_PROMPT_VERSION } from "./prompt";
+
+// ============================================
+// AI 동료 심사 캐시 키 / 재제출 비교
+// ============================================
+// - 동일 원고: 정규화한 제목+내용+프롬프트 버전+모델의 sha256이 같으면 이전 리뷰를 그대로 재사용
+// - 거의 같은 원고: 문단 단위 비교로 유사도가 DELTA_SIMILARITY_THRESHOLD 이상이면
+//   바뀐 문단만 모델에 보낸다 (buildPeerReviewDeltaMessage)
+
+export const DELTA_SIMILARITY_THRESHOLD = 0.8;
+
+// 공백/줄바꿈 차이만 있는 재제출은 같은 원고로 본다.
+export function normalizeManuscript(text: string): string {
+  return text
+    .normalize("NFC")
+    .replace(/\r\n?/g, "\n")
+    .split("\n")
+    .map((line) => line.replace(/[ \t]+/g, " ").trim())
+    .join("\n")
+    .replace(/\n{3,}/g, "\n\n")
+    .trim();
+}
+
+export function computePeerReviewHash(title: string, content: string, model: string): string {
+  return createHash("sha256")
+    .update(PEER_REVIEW_PROMPT_VERSION)
+    .update("\0")
+    .update(model)
+    .update("\0")
+    .update(normalizeManuscript(title))
+    .update("\0")
+    .update(normalizeManuscript(content))
+    .digest("hex");
+}
+
+export function splitParagraphs(text: string): string[] {
+  return normalizeManuscript(text)
+    .split("\n\n")
+    .filter((paragraph) => paragraph.length > 0);
+}
+
+export interface ManuscriptDiff {
+  // 글자 수 가중 유사도 (0~1)
+  similarity: number;
+  added: string[];
+  removed: string[];
+}
+
+// 문단 multiset 비교: 순서 이동은 변경으로 보지 않고, 추가/삭제된 문단만 찾는다.
+export function diffManuscripts(previous: string, next: string): ManuscriptDiff {
+  const previousParagraphs = splitParagraphs(previous);
+  const nextParagraphs = splitParagraphs(next);
+
+  const remaining = new Map<string, number>();
+  for (const paragraph of previousParagraphs) {
+    remaining.set(paragraph, (remaining.get(paragraph) ?? 0) + 1);
+  }
+
+  const added: string[] = [];
+  let matchedChars = 0;
+  for (const paragraph of nextParagraphs) {
+    const count = remaining.get(paragraph) ?? 0;
+    if (count > 0) {
+      remaining.set(paragraph, count - 1);
+      matchedChars += paragraph.length;
+    } else {
+      added.push(paragraph);
+    }
+  }
+
+  const removed: string[] = [];
+  for (const paragraph of previousParagraphs) {
+    const count = remaining.get(paragraph) ?? 0;
+    if (count > 0) {
+      remaining.set(paragraph, count - 1);
+      removed.push(paragraph);
+    }
+  }
+
+  const totalChars =
+    previousParagraphs.reduce((sum, p) => sum + p.length, 0) +
+    nextParagraphs.reduce((sum, p) => sum + p.length, 0);
+
+  return {
+    similarity: totalChars === 0 ? 1 : (2 * matchedChars) / totalChars,
+    added,
+    removed,
+  };
+}
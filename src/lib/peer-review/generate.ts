@@ -0,0 +1,251 @@
+import Anthropic from "@anthropic-ai/sdk";
+import { createServiceRoleClient } from "@/lib/supabase/server";
+import {
+  PEER_REVIEW_PROMPT,
+  PEER_REVIEW_SECTION_PROMPT,
+  buildPeerReviewMessage,
+  buildPeerReviewDeltaMessage,
+  buildPeerReviewMergeMessage,
+  buildPeerReviewSectionMessage,
+} from "./prompt";
+import { mapWithConcurrency, type ManuscriptSection } from "./sections";
+
+// ============================================
+// AI 동료 심사 생성 (스트리밍 + 중간 저장)
+// ============================================
+// messages.stream()으로 토큰을 받는 즉시 onText로 넘기고,
+// 누적된 결과는 PERSIST_INTERVAL_MS마다 peer_reviews.review_result에 저장한다.
+// 클라이언트 연결과 무관하게 끝까지 실행되도록 service role 클라이언트로 저장한다.
+// 긴 원고(sections)는 섹션별 메모를 동시에 받은 뒤 병합 단계만 스트리밍한다.
+// 로컬 테스트: ANTHROPIC_BASE_URL=http://localhost:8787 (scripts/peer-review-stub-server.mjs)
+
+const anthropic = new Anthropic({
+  apiKey: process.env.ANTHROPIC_API_KEY,
+});
+
+export const PEER_REVIEW_MODEL = "claude-sonnet-4-20250514";
+const PEER_REVIEW_MAX_TOKENS = 8192;
+const PERSIST_INTERVAL_MS = 2000;
+const SECTION_MAX_TOKENS = 2048;
+// 섹션 검토 동시 호출 수 (API rate limit 고려)
+const SECTION_CONCURRENCY = 4;
+
+// 거의 같은 원고의 재제출: 바뀐 문단만 리뷰하고 이전 리뷰를 뒤에 붙인다.
+export interface PeerReviewDelta {
+  sourceReviewId: string;
+  previousReview: string;
+  added: string[];
+  removed: string[];
+  // 이전 전체 리뷰에 쓰인 토큰 (절약량 계산용, 기록이 없으면 null)
+  baselineTokens: number | null;
+}
+
+export interface PeerReviewJob {
+  reviewId: string;
+  memberId: string;
+  title: string;
+  content: string;
+  delta?: PeerReviewDelta;
+  // 긴 원고 섹션 모드 (splitManuscriptSections 결과)
+  sections?: ManuscriptSection[];
+}
+
+export interface PeerReviewProgress {
+  completed: number;
+  total: number;
+}
+
+export interface PeerReviewUsage {
+  reviewId: string;
+  memberId: string;
+  cacheSource: "model" | "exact" | "delta";
+  inputTokens: number;
+  outputTokens: number;
+  tokensSaved: number;
+}
+
+// 캐시 적중률/절약 토큰 통계용 기록 (peer_review_usage는 service role만 추가)
+export async function recordPeerReviewUsage(usage: PeerReviewUsage): Promise<void> {
+  const supabase = createServiceRoleClient();
+  // eslint-disable-next-line @typescript-eslint/no-explicit-any
+  const { error } = await (supabase as any).from("peer_review_usage").insert({
+    review_id: usage.reviewId,
+    member_id: usage.memberId,
+    cache_source: usage.cacheSource,
+    input_tokens: usage.inputTokens,
+    output_tokens: usage.outputTokens,
+    tokens_saved: usage.tokensSaved,
+  });
+  if (error) console.error("Peer review usage error:", error);
+}
+
+function buildDeltaHeader(delta: PeerReviewDelta): string {
+  return `> 이전 리뷰 이후 변경된 부분(추가·수정 ${delta.added.length}개, 삭제 ${delta.removed.length}개 문단)만 새로 검토했습니다.\n\n`;
+}
+
+function buildDeltaFooter(delta: PeerReviewDelta): string {
+  return `\n\n---\n\n# 이전 리뷰 (변경되지 않은 부분 참고)\n\n${delta.previousReview}`;
+}
+
+// 섹션별 검토 메모를 최대 SECTION_CONCURRENCY개씩 동시에 받는다.
+// 실패한 섹션은 병합 단계에 "검토하지 못함"으로 표시하고, 모두 실패하면 오류로 처리한다.
+async function reviewSections(
+  job: PeerReviewJob,
+  sections: ManuscriptSection[],
+  onProgress?: (progress: PeerReviewProgress) => void
+) {
+  const outline = sections.map((section) => section.heading);
+  let completed = 0;
+  let inputTokens = 0;
+  let outputTokens = 0;
+
+  onProgress?.({ completed, total: sections.length });
+
+  const notes = await mapWithConcurrency(sections, SECTION_CONCURRENCY, async (section, index) => {
+    try {
+      const response = await anthropic.messages.create({
+        model: PEER_REVIEW_MODEL,
+        max_tokens: SECTION_MAX_TOKENS,
+        system: PEER_REVIEW_SECTION_PROMPT,
+        messages: [
+          {
+            role: "user",
+            content: buildPeerReviewSectionMessage(job.title, outline, section, index),
+          },
+        ],
+      });
+      inputTokens += response.usage.input_tokens;
+      outputTokens += response.usage.output_tokens;
+
+      return response.content
+        .filter((block): block is Anthropic.TextBlock => block.type === "text")
+        .map((block) => block.text)
+        .join("");
+    } catch (error) {
+      console.error(`Peer review section ${index + 1} error:`, error);
+      return null;
+    } finally {
+      completed++;
+      onProgress?.({ completed, total: sections.length });
+    }
+  });
+
+  if (notes.every((note) => note === null)) {
+    throw new Error("All section reviews failed");
+  }
+
+  return {
+    sectionNotes: sections.map((section, index) => ({
+      heading: section.heading,
+      notes: notes[index],
+    })),
+    inputTokens,
+    outputTokens,
+  };
+}
+
+export interface PeerReviewOutcome {
+  status: "completed" | "error";
+  result: string;
+}
+
+export async function runPeerReview(
+  job: PeerReviewJob,
+  onText?: (text: string) => void,
+  onProgress?: (progress: PeerReviewProgress) => void
+): Promise<PeerReviewOutcome> {
+  const supabase = createServiceRoleClient();
+
+  const save = async (fields: Record<string, unknown>) => {
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    const { error } = await (supabase as any)
+      .from("peer_reviews")
+      .update(fields)
+      .eq("id", job.reviewId);
+    if (error) console.error("Peer review save error:", error);
+  };
+
+  const { delta, sections } = job;
+  let result = "";
+  // 섹션 검토에 쓴 토큰 (병합 단계 사용량과 합산)
+  let sectionInputTokens = 0;
+  let sectionOutputTokens = 0;
+  let lastSavedAt = Date.now();
+  // 중간 저장은 한 번에 하나만 진행하고, 최종 저장 전에 끝날 때까지 기다린다.
+  let pendingSave: Promise<void> | null = null;
+
+  const append = (text: string) => {
+    result += text;
+    onText?.(text);
+  };
+
+  try {
+    let message: string;
+    if (delta) {
+      message = buildPeerReviewDeltaMessage(job.title, delta.previousReview, delta);
+    } else if (sections) {
+      const reviewed = await reviewSections(job, sections, onProgress);
+      sectionInputTokens = reviewed.inputTokens;
+      sectionOutputTokens = reviewed.outputTokens;
+      message = buildPeerReviewMergeMessage(job.title, reviewed.sectionNotes);
+    } else {
+      message = buildPeerReviewMessage(job.title, job.content);
+    }
+
+    const stream = anthropic.messages.stream({
+      model: PEER_REVIEW_MODEL,
+      max_tokens: PEER_REVIEW_MAX_TOKENS,
+      system: PEER_REVIEW_PROMPT,
+      messages: [{ role: "user", content: message }],
+    });
+
+    if (delta) append(buildDeltaHeader(delta));
+
+    for await (const event of stream) {
+      if (event.type !== "content_block_delta" || event.delta.type !== "text_delta") {
+        continue;
+      }
+
+      append(event.delta.text);
+
+      if (!pendingSave && Date.now() - lastSavedAt >= PERSIST_INTERVAL_MS) {
+        lastSavedAt = Date.now();
+        pendingSave = save({ review_result: result }).finally(() => {
+          pendingSave = null;
+        });
+      }
+    }
+
+    const { usage } = await stream.finalMessage();
+    if (delta) append(buildDeltaFooter(delta));
+
+    const inputTokens = usage.input_tokens + sectionInputTokens;
+    const outputTokens = usage.output_tokens + sectionOutputTokens;
+
+    await pendingSave;
+    await save({
+      review_result: result,
+      review_status: "completed",
+      input_tokens: inputTokens,
+      output_tokens: outputTokens,
+    });
+
+    const spent = inputTokens + outputTokens;
+    await recordPeerReviewUsage({
+      reviewId: job.reviewId,
+      memberId: job.memberId,
+      cacheSource: delta ? "delta" : "model",
+      inputTokens,
+      outputTokens,
+      tokensSaved: delta?.baselineTokens ? Math.max(delta.baselineTokens - spent, 0) : 0,
+    });
+
+    return { status: "completed", result };
+  } catch (error) {
+    console.error("Peer review generation error:", error);
+    await pendingSave;
+    // 중간까지 생성된 내용은 남겨 둔다.
+    await save({ review_result: result || null, review_status: "error" });
+    return { status: "error", result };
+  }
+}
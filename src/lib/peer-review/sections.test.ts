@@ -0,0 +1,62 @@
+import { describe, it, expect } from "vitest";
+import { mapWithConcurrency, splitManuscriptSections } from "./sections";
+
+const paragraph = (label: string, length: number) => `${label} ${"가".repeat(length)}`;
+
+describe("splitManuscriptSections", () => {
+  it("should split by markdown headings", () => {
+    const content = [
+      "# 서론",
+      paragraph("intro", 2000),
+      "## 방법론",
+      paragraph("method", 2000),
+    ].join("\n\n");
+
+    const sections = splitManuscriptSections(content);
+
+    expect(sections.map((s) => s.heading)).toEqual(["서론", "방법론"]);
+    expect(sections[1].body.startsWith("method")).toBe(true);
+  });
+
+  it("should merge short sections into the next one", () => {
+    const content = ["# 초록", "짧은 초록", "# 서론", paragraph("intro", 2000)].join("\n\n");
+
+    const sections = splitManuscriptSections(content);
+
+    expect(sections).toHaveLength(1);
+    expect(sections[0].heading).toBe("초록 / 서론");
+    expect(sections[0].body).toContain("## 서론");
+  });
+
+  it("should ignore headings inside code blocks", () => {
+    const content = ["# 코드", "```", "# not a heading", "```", paragraph("x", 2000)].join("\n");
+
+    expect(splitManuscriptSections(content).map((s) => s.heading)).toEqual(["코드"]);
+  });
+
+  it("should split oversized sections at paragraph boundaries", () => {
+    const content = ["# 결과", paragraph("a", 7000), paragraph("b", 7000)].join("\n\n");
+
+    const sections = splitManuscriptSections(content);
+
+    expect(sections.map((s) => s.heading)).toEqual(["결과 (1/2)", "결과 (2/2)"]);
+  });
+});
+
+describe("mapWithConcurrency", () => {
+  it("should keep input order and respect the limit", async () => {
+    let running = 0;
+    let peak = 0;
+
+    const results = await mapWithConcurrency([30, 10, 20, 5], 2, async (ms, index) => {
+      running++;
+      peak = Math.max(peak, running);
+      await new Promise((resolve) => setTimeout(resolve, ms));
+      running--;
+      return index;
+    });
+
+    expect(results).toEqual([0, 1, 2, 3]);
+    expect(peak).toBe(2);
+  });
+});
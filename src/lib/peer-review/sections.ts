@@ -0,0 +1,106 @@
+// ============================================
+// 긴 원고 섹션 분할 + 동시 실행 제한
+// ============================================
+// 긴 원고는 마크다운 제목(#, ##, ###) 기준으로 나눠 섹션별로 동시에 검토한 뒤
+// 병합 단계에서 기존 리뷰 형식으로 합친다 (generate.ts).
+// 너무 짧은 섹션은 다음 섹션과 합치고, 너무 긴 섹션은 문단 경계에서 나눈다.
+
+// 이 길이를 넘고 섹션이 2개 이상이면 섹션 모드로 리뷰한다.
+export const LONG_MANUSCRIPT_CHARS = 12000;
+const MIN_SECTION_CHARS = 1500;
+const MAX_SECTION_CHARS = 12000;
+
+export interface ManuscriptSection {
+  heading: string;
+  body: string;
+}
+
+const HEADING_PATTERN = /^#{1,3}\s+(.+?)\s*#*\s*$/;
+
+function splitByHeadings(content: string): ManuscriptSection[] {
+  const sections: ManuscriptSection[] = [];
+  let current: ManuscriptSection = { heading: "", body: "" };
+  let inCodeBlock = false;
+
+  for (const line of content.replace(/\r\n?/g, "\n").split("\n")) {
+    if (line.trimStart().startsWith("```")) inCodeBlock = !inCodeBlock;
+
+    const match = inCodeBlock ? null : HEADING_PATTERN.exec(line);
+    if (match) {
+      if (current.heading || current.body.trim()) sections.push(current);
+      current = { heading: match[1], body: "" };
+    } else {
+      current.body += `${line}\n`;
+    }
+  }
+  if (current.heading || current.body.trim()) sections.push(current);
+
+  return sections.map((section) => ({ ...section, body: section.body.trim() }));
+}
+
+function splitLongSection(section: ManuscriptSection): ManuscriptSection[] {
+  if (section.body.length <= MAX_SECTION_CHARS) return [section];
+
+  const parts: ManuscriptSection[] = [];
+  let body = "";
+  for (const paragraph of section.body.split(/\n{2,}/)) {
+    if (body && body.length + paragraph.length > MAX_SECTION_CHARS) {
+      parts.push({ heading: section.heading, body });
+      body = "";
+    }
+    body = body ? `${body}\n\n${paragraph}` : paragraph;
+  }
+  if (body) parts.push({ heading: section.heading, body });
+
+  return parts.length === 1
+    ? parts
+    : parts.map((part, index) => ({
+        ...part,
+        heading: `${part.heading || "본문"} (${index + 1}/${parts.length})`,
+      }));
+}
+
+export function splitManuscriptSections(content: string): ManuscriptSection[] {
+  const merged: ManuscriptSection[] = [];
+
+  for (const section of splitByHeadings(content)) {
+    const previous = merged[merged.length - 1];
+    if (previous && previous.body.length < MIN_SECTION_CHARS) {
+      const heading = [previous.heading, section.heading].filter(Boolean).join(" / ");
+      const body = [previous.body, section.heading && `## ${section.heading}`, section.body]
+        .filter(Boolean)
+        .join("\n\n");
+      merged[merged.length - 1] = { heading, body };
+    } else {
+      merged.push(section);
+    }
+  }
+
+  return merged.flatMap(splitLongSection);
+}
+
+export function shouldReviewBySection(content: string, sections: ManuscriptSection[]): boolean {
+  return content.length > LONG_MANUSCRIPT_CHARS && sections.length > 1;
+}
+
+// 최대 limit개만 동시에 실행하고, 결과는 입력 순서대로 돌려준다.
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  await Promise.all(
+    Array.from({ length: Math.min(Math.max(limit, 1), items.length) }, worker)
+  );
+  return results;
+}
@@ -0,0 +1,26 @@
+import { describe, it, expect } from "vitest";
+import { parseServerSentEvents } from "./sse";
+
+describe("parseServerSentEvents", () => {
+  it("should parse complete events and keep the trailing fragment", () => {
+    const { events, rest } = parseServerSentEvents(
+      'event: review\ndata: {"id":"1"}\n\nevent: delta\ndata: {"text":"가'
+    );
+
+    expect(events).toEqual([{ event: "review", data: '{"id":"1"}' }]);
+    expect(rest).toBe('event: delta\ndata: {"text":"가');
+  });
+
+  it("should join multi-line data and default the event name", () => {
+    const { events } = parseServerSentEvents("data: a\ndata: b\n\n");
+
+    expect(events).toEqual([{ event: "message", data: "a\nb" }]);
+  });
+
+  it("should accept CRLF line endings", () => {
+    const { events, rest } = parseServerSentEvents("event: done\r\ndata: {}\r\n\r\n");
+
+    expect(events).toEqual([{ event: "done", data: "{}" }]);
+    expect(rest).toBe("");
+  });
+});
@@ -0,0 +1,61 @@
+// ============================================
+// Server-Sent Events 파서 (fetch 응답 본문용)
+// ============================================
+// EventSource는 GET만 지원하므로 POST 응답 스트림은 직접 읽는다.
+// 청크 경계가 이벤트 중간에 걸릴 수 있어 남은 조각은 다음 청크와 이어 붙인다.
+
+export interface ServerSentEvent {
+  event: string;
+  data: string;
+}
+
+export function parseServerSentEvents(buffer: string): {
+  events: ServerSentEvent[];
+  rest: string;
+} {
+  const normalized = buffer.replace(/\r\n?/g, "\n");
+  const blocks = normalized.split("\n\n");
+  const rest = blocks.pop() ?? "";
+
+  const events: ServerSentEvent[] = [];
+  for (const block of blocks) {
+    let event = "message";
+    const data: string[] = [];
+
+    for (const line of block.split("\n")) {
+      if (line.startsWith("event:")) {
+        event = line.slice(6).trim();
+      } else if (line.startsWith("data:")) {
+        data.push(line.slice(5).replace(/^ /, ""));
+      }
+    }
+
+    if (data.length > 0) events.push({ event, data: data.join("\n") });
+  }
+
+  return { events, rest };
+}
+
+export async function readServerSentEvents(
+  response: Response,
+  onEvent: (event: ServerSentEvent) => void
+): Promise<void> {
+  if (!response.body) return;
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+
+  while (true) {
+    const { value, done } = await reader.read();
+    if (done) break;
+
+    buffer += decoder.decode(value, { stream: true });
+    const { events, rest } = parseServerSentEvents(buffer);
+    buffer = rest;
+    events.forEach(onEvent);
+  }
+
+  const { events } = parseServerSentEvents(buffer + decoder.decode() + "\n\n");
+  events.forEach(onEvent);
+}
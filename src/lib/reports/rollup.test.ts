@@ -0,0 +1,125 @@
+import { describe, it, expect } from "vitest";
+import {
+  buildReportContentFromRollup,
+  rollupPreviewLogs,
+  sumRollup,
+  totalsByPeriod,
+} from "./rollup";
+import type {
+  ProgressLogRollupCell,
+  ProgressSummaryRow,
+  ReportTemplate,
+  SubProject,
+} from "@/types/database";
+
+function cell(overrides: Partial<ProgressLogRollupCell>): ProgressLogRollupCell {
+  return {
+    sub_project_id: "sp1",
+    period_start: "2025-01-01",
+    log_type: "task",
+    status: "completed",
+    log_count: 0,
+    hours_spent: 0,
+    items: [],
+    ...overrides,
+  };
+}
+
+function item(id: string, logDate: string) {
+  return { id, title: `log ${id}`, log_date: logDate, assignee_name: null };
+}
+
+const subProjects = [{ id: "sp1" }, { id: "sp2" }] as SubProject[];
+
+const template = {
+  sections: [
+    {
+      id: "matrix",
+      type: "progress_matrix",
+      title: "추진경과",
+      columns: [
+        { key: "completed", label: "추진실적" },
+        { key: "planned", label: "향후계획" },
+      ],
+      auto_fill: { status: ["completed", "in_progress"] },
+    },
+    { id: "meetings", type: "list", title: "회의", auto_fill: { log_type: ["meeting"] } },
+    { id: "memo", type: "text", title: "비고" },
+  ],
+} as unknown as ReportTemplate;
+
+const cells = [
+  cell({ log_count: 1, hours_spent: 1.5, items: [item("b", "2025-01-03")] }),
+  cell({ status: "in_progress", log_count: 1, hours_spent: 2.2, items: [item("a", "2025-01-02")] }),
+  cell({ status: "planned", log_count: 1, items: [item("c", "2025-01-05")] }),
+  cell({ log_type: "meeting", sub_project_id: "sp2", log_count: 1, hours_spent: 1.4, items: [item("m", "2025-01-04")] }),
+];
+
+describe("buildReportContentFromRollup", () => {
+  it("should fill matrix columns by status and lists by log type in date order", () => {
+    const checked = new Set(["a", "b", "c", "m"]);
+    const content = buildReportContentFromRollup(template, subProjects, cells, checked);
+
+    expect(content.matrix).toEqual({
+      sp1: {
+        completed: [
+          { log_id: "a", text: "log a" },
+          { log_id: "b", text: "log b" },
+        ],
+        planned: [{ log_id: "c", text: "log c" }],
+      },
+      sp2: {
+        completed: [{ log_id: "m", text: "log m" }],
+        planned: [],
+      },
+    });
+    expect(content.meetings).toEqual({ items: [{ log_id: "m", text: "log m" }] });
+    expect(content.memo).toEqual({ text: "" });
+  });
+
+  it("should leave out unchecked logs", () => {
+    const content = buildReportContentFromRollup(template, subProjects, cells, new Set(["b"]));
+
+    expect(content.matrix).toMatchObject({ sp1: { completed: [{ log_id: "b" }], planned: [] } });
+  });
+});
+
+describe("rollupPreviewLogs", () => {
+  it("should flatten cells into date-ordered logs with their sub project", () => {
+    expect(rollupPreviewLogs(cells).map((l) => [l.id, l.sub_project_id])).toEqual([
+      ["a", "sp1"],
+      ["b", "sp1"],
+      ["m", "sp2"],
+      ["c", "sp1"],
+    ]);
+  });
+});
+
+describe("sumRollup", () => {
+  it("should total counts and hours for the matching cells", () => {
+    expect(sumRollup(cells)).toEqual({ count: 4, hours: 5.1 });
+    expect(sumRollup(cells, { logType: ["meeting"] })).toEqual({ count: 1, hours: 1.4 });
+  });
+});
+
+describe("totalsByPeriod", () => {
+  it("should merge rows of the same period and sort by period", () => {
+    const row = (periodStart: string, count: number, hours: number): ProgressSummaryRow => ({
+      project_id: "p1",
+      sub_project_id: null,
+      assignee_id: null,
+      period_start: periodStart,
+      log_type: "task",
+      status: "completed",
+      log_count: count,
+      hours_spent: hours,
+    });
+
+    expect(
+      totalsByPeriod([row("2025-02-01", 1, 0.2), row("2025-01-01", 2, 1), row("2025-02-01", 3, 0.1)])
+    ).toEqual([
+      { periodStart: "2025-01-01", count: 2, hours: 1 },
+      { periodStart: "2025-02-01", count: 4, hours: 0.3 },
+    ]);
+  });
+});
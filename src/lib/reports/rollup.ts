@@ -0,0 +1,156 @@
+import type {
+  ProgressLogRollupCell,
+  ProgressLogRollupItem,
+  ProgressLogStatus,
+  ProgressLogType,
+  ProgressSummaryRow,
+  ReportContent,
+  ReportContentList,
+  ReportContentLogEntry,
+  ReportContentMatrix,
+  ReportSectionContent,
+  ReportTemplate,
+  ReportTemplateSection,
+  SubProject,
+} from "@/types/database";
+
+// ============================================
+// 추진경과 집계 → 보고서 내용
+// ============================================
+// get_progress_log_rollup() 결과(하위과제 × 기간 × 유형 × 상태별 항목 목록)로
+// 양식의 표/목록 칸을 채운다. 미리보기에서 체크 해제한 항목은 제외한다.
+
+export interface ProgressPreviewLog extends ProgressLogRollupItem {
+  sub_project_id: string | null;
+}
+
+type CellKey = Pick<ProgressLogRollupCell, "status" | "log_type">;
+
+function matchesAutoFill(
+  section: ReportTemplateSection,
+  cell: CellKey,
+  columnKey?: string
+): boolean {
+  if (!section.auto_fill) return true;
+  const typeMatch =
+    !section.auto_fill.log_type || section.auto_fill.log_type.includes(cell.log_type);
+
+  // Map column key to status
+  if (columnKey === "completed" || columnKey === "progress") {
+    return (cell.status === "completed" || cell.status === "in_progress") && typeMatch;
+  }
+  if (columnKey === "planned" || columnKey === "plan") {
+    return cell.status === "planned" && typeMatch;
+  }
+
+  const statusMatch =
+    !section.auto_fill.status || section.auto_fill.status.includes(cell.status);
+  return statusMatch && typeMatch;
+}
+
+function collectEntries(
+  cells: ProgressLogRollupCell[],
+  checkedLogIds: Set<string>
+): ReportContentLogEntry[] {
+  return cells
+    .flatMap((cell) => cell.items)
+    .filter((item) => checkedLogIds.has(item.id))
+    .sort((a, b) => a.log_date.localeCompare(b.log_date))
+    .map((item) => ({ log_id: item.id, text: item.title }));
+}
+
+export function buildReportContentFromRollup(
+  template: ReportTemplate,
+  subProjects: SubProject[],
+  cells: ProgressLogRollupCell[],
+  checkedLogIds: Set<string>
+): ReportContent {
+  const content: ReportContent = {};
+
+  for (const section of template.sections) {
+    if (section.type === "progress_matrix") {
+      const matrix: ReportContentMatrix = {};
+
+      if (section.columns) {
+        for (const sp of subProjects) {
+          const spCells = cells.filter((c) => c.sub_project_id === sp.id);
+          const row: Record<string, ReportContentLogEntry[]> = {};
+          for (const col of section.columns) {
+            row[col.key] = collectEntries(
+              spCells.filter((c) => matchesAutoFill(section, c, col.key)),
+              checkedLogIds
+            );
+          }
+          matrix[sp.id] = row;
+        }
+      }
+
+      content[section.id] = matrix as ReportSectionContent;
+    } else if (section.type === "list") {
+      const listContent: ReportContentList = {
+        items: collectEntries(
+          cells.filter((c) => matchesAutoFill(section, c)),
+          checkedLogIds
+        ),
+      };
+      content[section.id] = listContent as ReportSectionContent;
+    } else if (section.type === "text") {
+      content[section.id] = { text: "" } as ReportSectionContent;
+    }
+  }
+
+  return content;
+}
+
+// 미리보기 트리용 항목 목록 (날짜순)
+export function rollupPreviewLogs(cells: ProgressLogRollupCell[]): ProgressPreviewLog[] {
+  return cells
+    .flatMap((cell) =>
+      cell.items.map((item) => ({ ...item, sub_project_id: cell.sub_project_id }))
+    )
+    .sort((a, b) => a.log_date.localeCompare(b.log_date));
+}
+
+export interface RollupTotals {
+  count: number;
+  hours: number;
+}
+
+// 유형·상태별 합계 (예: 회의 건수, 완료 업무 투입 시간)
+export function sumRollup(
+  cells: ProgressLogRollupCell[],
+  filter?: { status?: ProgressLogStatus[]; logType?: ProgressLogType[] }
+): RollupTotals {
+  const totals = cells
+    .filter(
+      (c) =>
+        (!filter?.status || filter.status.includes(c.status)) &&
+        (!filter?.logType || filter.logType.includes(c.log_type))
+    )
+    .reduce(
+      (sum, c) => ({ count: sum.count + c.log_count, hours: sum.hours + Number(c.hours_spent) }),
+      { count: 0, hours: 0 }
+    );
+  // hours_spent는 소수 첫째 자리까지 저장된다
+  return { count: totals.count, hours: Math.round(totals.hours * 10) / 10 };
+}
+
+export interface PeriodTotals extends RollupTotals {
+  periodStart: string;
+}
+
+// get_progress_summary() 결과를 기간별 합계로 (기간순)
+export function totalsByPeriod(rows: ProgressSummaryRow[]): PeriodTotals[] {
+  const byPeriod = new Map<string, { count: number; hours: number }>();
+  for (const row of rows) {
+    const totals = byPeriod.get(row.period_start) ?? { count: 0, hours: 0 };
+    totals.count += row.log_count;
+    totals.hours += Number(row.hours_spent);
+    byPeriod.set(row.period_start, totals);
+  }
+  return Array.from(byPeriod, ([periodStart, totals]) => ({
+    periodStart,
+    count: totals.count,
+    hours: Math.round(totals.hours * 10) / 10,
+  })).sort((a, b) => a.periodStart.localeCompare(b.periodStart));
+}
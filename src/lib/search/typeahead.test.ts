@@ -0,0 +1,72 @@
+import { describe, it, expect } from "vitest";
+import { SearchCache, narrowSearchResults, SEARCH_RESULT_LIMIT } from "./typeahead";
+import type { SearchResult } from "@/lib/actions/search";
+
+function result(overrides: Partial<SearchResult>): SearchResult {
+  return {
+    type: "project",
+    id: "id",
+    title: "",
+    href: "/",
+    rank: 1,
+    ...overrides,
+  };
+}
+
+describe("narrowSearchResults", () => {
+  it("should keep only results whose title contains the narrower query", () => {
+    const broader = [
+      result({ id: "1", title: "Urban Heat Island" }),
+      result({ id: "2", title: "Urban Mobility" }),
+    ];
+
+    expect(narrowSearchResults(broader, "urban h")?.map((r) => r.id)).toEqual(["1"]);
+  });
+
+  it("should give up when a body-matched result cannot be verified", () => {
+    const broader = [
+      result({ id: "1", type: "research_note", title: "Weekly log" }),
+    ];
+
+    expect(narrowSearchResults(broader, "urban")).toBeNull();
+  });
+
+  it("should match mentoring posts on their content preview", () => {
+    const broader = [
+      result({ id: "1", type: "mentoring", title: "멘토링 (2026-01-05)", subtitle: "도시 열섬 분석" }),
+    ];
+
+    expect(narrowSearchResults(broader, "열섬")?.map((r) => r.id)).toEqual(["1"]);
+  });
+});
+
+describe("SearchCache", () => {
+  it("should answer a narrower query from a complete broader result", () => {
+    const cache = new SearchCache();
+    cache.set("ur", [result({ id: "1", title: "Urban" }), result({ id: "2", title: "Uruguay" })]);
+
+    expect(cache.get("urb")?.map((r) => r.id)).toEqual(["1"]);
+  });
+
+  it("should not narrow from a result that hit the limit", () => {
+    const cache = new SearchCache();
+    const full = Array.from({ length: SEARCH_RESULT_LIMIT }, (_, i) =>
+      result({ id: String(i), title: `Urban ${i}` })
+    );
+    cache.set("ur", full);
+
+    expect(cache.get("urb")).toBeNull();
+  });
+
+  it("should evict the least recently used query", () => {
+    const cache = new SearchCache(2);
+    cache.set("aa", []);
+    cache.set("bb", []);
+    cache.get("aa");
+    cache.set("cc", []);
+
+    expect(cache.get("aa")).toEqual([]);
+    expect(cache.get("bb")).toBeNull();
+    expect(cache.size).toBe(2);
+  });
+});
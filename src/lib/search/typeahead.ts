@@ -0,0 +1,113 @@
+import type { SearchResult } from "@/lib/actions/search";
+
+// ============================================
+// 통합 검색 타이핑 캐시
+// ============================================
+// 검색어별 결과를 LRU로 보관하고, 새 검색어가 이미 받아온 더 짧은 검색어를
+// 좁히기만 하는 경우(접두 확장)에는 서버 호출 없이 로컬에서 걸러낸다.
+
+// global_search RPC가 반환하는 최대 건수 (00030)
+export const SEARCH_RESULT_LIMIT = 20;
+
+export const SEARCH_MIN_LENGTH = 2;
+
+// 본문(content)으로도 일치할 수 있어 표시된 필드만으로는 제외 여부를 판단할 수 없는 유형
+const BODY_MATCH_TYPES = new Set<SearchResult["type"]>([
+  "mentoring",
+  "research_note",
+  "announcement",
+]);
+
+// 유형별로 global_search가 실제 검색하는 필드 중 결과에 그대로 노출되는 것
+// (멘토링 제목은 날짜이고 부제가 본문 앞부분)
+function getMatchableText(result: SearchResult): string {
+  return (result.type === "mentoring" ? result.subtitle ?? "" : result.title).toLowerCase();
+}
+
+export function normalizeSearchQuery(query: string): string {
+  return query.trim().toLowerCase();
+}
+
+interface CachedSearch {
+  results: SearchResult[];
+  // 결과가 상한보다 적으면 일치하는 항목을 모두 받은 것 → 좁히기에 재사용 가능
+  complete: boolean;
+}
+
+export class SearchCache {
+  private entries = new Map<string, CachedSearch>();
+
+  constructor(private readonly maxEntries = 50) {}
+
+  get size() {
+    return this.entries.size;
+  }
+
+  set(query: string, results: SearchResult[]) {
+    const key = normalizeSearchQuery(query);
+    this.entries.delete(key);
+    this.entries.set(key, {
+      results,
+      complete: results.length < SEARCH_RESULT_LIMIT,
+    });
+
+    // Map은 삽입 순서를 유지하므로 첫 키가 가장 오래 사용되지 않은 항목
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value;
+      if (oldest === undefined) break;
+      this.entries.delete(oldest);
+    }
+  }
+
+  // 정확히 같은 검색어 또는 좁힐 수 있는 더 짧은 검색어의 결과를 찾는다.
+  // 로컬에서 확정할 수 없으면 null (서버 조회 필요)
+  get(query: string): SearchResult[] | null {
+    const key = normalizeSearchQuery(query);
+
+    const exact = this.entries.get(key);
+    if (exact) {
+      this.touch(key, exact);
+      return exact.results;
+    }
+
+    for (let length = key.length - 1; length >= SEARCH_MIN_LENGTH; length--) {
+      const prefix = key.slice(0, length);
+      const broader = this.entries.get(prefix);
+      if (!broader || !broader.complete) continue;
+
+      const narrowed = narrowSearchResults(broader.results, key);
+      if (!narrowed) return null;
+
+      this.touch(prefix, broader);
+      this.set(key, narrowed);
+      return narrowed;
+    }
+
+    return null;
+  }
+
+  private touch(key: string, entry: CachedSearch) {
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+  }
+}
+
+// 더 넓은 검색어의 완전한 결과에서 새 검색어와 일치하는 항목만 남긴다.
+// 본문 일치 가능 항목이 제목/부제로 판별되지 않으면 null을 반환해 서버 조회로 넘긴다.
+export function narrowSearchResults(
+  broader: SearchResult[],
+  query: string
+): SearchResult[] | null {
+  const term = normalizeSearchQuery(query);
+  const narrowed: SearchResult[] = [];
+
+  for (const result of broader) {
+    if (getMatchableText(result).includes(term)) {
+      narrowed.push(result);
+    } else if (BODY_MATCH_TYPES.has(result.type)) {
+      return null;
+    }
+  }
+
+  return narrowed;
+}
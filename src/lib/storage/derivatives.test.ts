@@ -0,0 +1,30 @@
+import { describe, it, expect } from "vitest";
+import { derivativePath, derivativePaths, pickDerivativeWidth } from "./derivatives";
+
+describe("pickDerivativeWidth", () => {
+  it("should pick the smallest width that covers the display size", () => {
+    expect(pickDerivativeWidth(48)).toBe(160);
+    expect(pickDerivativeWidth(160)).toBe(160);
+    expect(pickDerivativeWidth(161)).toBe(480);
+  });
+
+  it("should account for the device pixel ratio", () => {
+    expect(pickDerivativeWidth(120, 2)).toBe(480);
+    expect(pickDerivativeWidth(120, 0.5)).toBe(160);
+  });
+
+  it("should fall back to the largest width", () => {
+    expect(pickDerivativeWidth(2000)).toBe(960);
+  });
+});
+
+describe("derivativePath", () => {
+  it("should build deterministic keys per file and width", () => {
+    expect(derivativePath("f1", 480)).toBe("derivatives/f1/w480.webp");
+    expect(derivativePaths("f1")).toEqual([
+      "derivatives/f1/w160.webp",
+      "derivatives/f1/w480.webp",
+      "derivatives/f1/w960.webp",
+    ]);
+  });
+});
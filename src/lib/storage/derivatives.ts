@@ -0,0 +1,35 @@
+// ============================================
+// 첨부파일 파생본(썸네일) 키/선택 (클라이언트/서버 공용)
+// ============================================
+// scripts/generate-file-derivatives.py가 이미지와 PDF 첫 페이지를
+// 아래 너비들의 WebP로 만들어 원본과 같은 버킷의 고정 키에 올린다.
+// 모든 너비가 만들어진 뒤에야 원본 행이 ready가 되므로, 화면은
+// files를 다시 조회하지 않고 키를 계산해 바로 요청한다.
+// 너비를 바꾸면 워커의 DERIVATIVE_WIDTHS도 함께 바꿔야 한다.
+
+export const DERIVATIVE_WIDTHS = [160, 480, 960] as const;
+
+export type DerivativeWidth = (typeof DERIVATIVE_WIDTHS)[number];
+
+export type DerivativesStatus = "pending" | "processing" | "ready" | "failed";
+
+export function derivativePath(fileId: string, width: DerivativeWidth): string {
+  return `derivatives/${fileId}/w${width}.webp`;
+}
+
+// 원본 삭제 시 함께 지울 파생본 키 (없는 키는 Storage가 무시)
+export function derivativePaths(fileId: string): string[] {
+  return DERIVATIVE_WIDTHS.map((width) => derivativePath(fileId, width));
+}
+
+/**
+ * 표시 크기(CSS px × 기기 픽셀 비율)를 채우는 가장 작은 너비.
+ * 모두 작으면 가장 큰 너비를 쓴다.
+ */
+export function pickDerivativeWidth(displayWidth: number, pixelRatio = 1): DerivativeWidth {
+  const needed = Math.ceil(displayWidth * Math.max(1, pixelRatio));
+  return (
+    DERIVATIVE_WIDTHS.find((width) => width >= needed) ??
+    DERIVATIVE_WIDTHS[DERIVATIVE_WIDTHS.length - 1]
+  );
+}
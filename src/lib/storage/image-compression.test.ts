@@ -0,0 +1,101 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+import { compressImage } from "./image-compression";
+
+const KB = 1024;
+
+function makeFile(size: number, type: string, name = "photo.jpg") {
+  return new File([new Uint8Array(size)], name, { type, lastModified: 1700000000000 });
+}
+
+let drawImage: ReturnType<typeof vi.fn>;
+let close: ReturnType<typeof vi.fn>;
+// 캔버스가 인코딩해 돌려줄 크기
+let encodedSize: number;
+
+function stubBitmap(width: number, height: number) {
+  vi.stubGlobal(
+    "createImageBitmap",
+    vi.fn().mockResolvedValue({ width, height, close })
+  );
+}
+
+beforeEach(() => {
+  drawImage = vi.fn();
+  close = vi.fn();
+  encodedSize = 100 * KB;
+  vi.spyOn(HTMLCanvasElement.prototype, "getContext").mockReturnValue({
+    drawImage,
+    imageSmoothingQuality: "low",
+  } as never);
+  vi.spyOn(HTMLCanvasElement.prototype, "toBlob").mockImplementation(function (
+    this: HTMLCanvasElement,
+    callback: BlobCallback,
+    type?: string
+  ) {
+    callback(new Blob([new Uint8Array(encodedSize)], { type }));
+  });
+});
+
+afterEach(() => {
+  vi.restoreAllMocks();
+  vi.unstubAllGlobals();
+});
+
+describe("compressImage", () => {
+  it("should keep non-image files and small images as they are", async () => {
+    stubBitmap(4000, 3000);
+    const pdf = makeFile(5 * 1024 * KB, "application/pdf", "a.pdf");
+    const small = makeFile(299 * KB, "image/jpeg");
+
+    expect(await compressImage(pdf)).toBe(pdf);
+    expect(await compressImage(small)).toBe(small);
+    expect(createImageBitmap).not.toHaveBeenCalled();
+  });
+
+  it("should keep the original when the browser cannot decode images", async () => {
+    vi.stubGlobal("createImageBitmap", undefined);
+    const file = makeFile(2 * 1024 * KB, "image/jpeg");
+
+    expect(await compressImage(file)).toBe(file);
+  });
+
+  it("should scale large JPEGs so the long edge is 2560px", async () => {
+    stubBitmap(5120, 2560);
+    const file = makeFile(2 * 1024 * KB, "image/jpeg");
+
+    const result = await compressImage(file);
+
+    expect(drawImage).toHaveBeenCalledWith(expect.anything(), 0, 0, 2560, 1280);
+    expect(result).not.toBe(file);
+    expect(result.size).toBe(encodedSize);
+    expect(result).toMatchObject({ name: "photo.jpg", type: "image/jpeg" });
+    expect(close).toHaveBeenCalled();
+  });
+
+  it("should re-encode JPEGs that are already small enough in pixels", async () => {
+    stubBitmap(1200, 800);
+    const file = makeFile(1024 * KB, "image/jpeg");
+
+    const result = await compressImage(file);
+
+    expect(drawImage).toHaveBeenCalledWith(expect.anything(), 0, 0, 1200, 800);
+    expect(result.size).toBe(encodedSize);
+  });
+
+  it("should not re-encode PNGs that need no downscaling", async () => {
+    stubBitmap(1200, 800);
+    const file = makeFile(1024 * KB, "image/png", "chart.png");
+
+    expect(await compressImage(file)).toBe(file);
+    expect(drawImage).not.toHaveBeenCalled();
+    expect(close).toHaveBeenCalled();
+  });
+
+  it("should keep the original when the encoded result is not smaller", async () => {
+    stubBitmap(5120, 2560);
+    const file = makeFile(400 * KB, "image/jpeg");
+    encodedSize = 400 * KB;
+
+    expect(await compressImage(file)).toBe(file);
+  });
+});
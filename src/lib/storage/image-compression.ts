@@ -0,0 +1,62 @@
+// ============================================
+// 업로드 전 이미지 축소/압축 (브라우저)
+// ============================================
+// 휴대폰 사진처럼 큰 이미지는 긴 변 MAX_IMAGE_DIMENSION으로 줄이고
+// JPEG는 다시 인코딩한다. PNG는 투명도/선명도를 위해 PNG로 유지하고 크기만 줄인다.
+// 결과가 원본보다 크면 원본을 그대로 쓴다.
+
+const MAX_IMAGE_DIMENSION = 2560;
+const JPEG_QUALITY = 0.85;
+// 이보다 작은 이미지는 그대로 올린다.
+const MIN_COMPRESS_BYTES = 300 * 1024;
+
+function canvasToBlob(canvas: HTMLCanvasElement, type: string, quality?: number) {
+  return new Promise<Blob | null>((resolve) => canvas.toBlob(resolve, type, quality));
+}
+
+export async function compressImage(file: File): Promise<File> {
+  if (
+    (file.type !== "image/jpeg" && file.type !== "image/png") ||
+    file.size < MIN_COMPRESS_BYTES ||
+    typeof createImageBitmap !== "function"
+  ) {
+    return file;
+  }
+
+  try {
+    // EXIF 회전을 반영해 디코딩
+    const bitmap = await createImageBitmap(file, { imageOrientation: "from-image" });
+    const scale = Math.min(1, MAX_IMAGE_DIMENSION / Math.max(bitmap.width, bitmap.height));
+
+    // PNG는 축소할 필요가 없으면 다시 인코딩하지 않는다 (무손실이라 대개 더 커짐)
+    if (file.type === "image/png" && scale === 1) {
+      bitmap.close();
+      return file;
+    }
+
+    const canvas = document.createElement("canvas");
+    canvas.width = Math.round(bitmap.width * scale);
+    canvas.height = Math.round(bitmap.height * scale);
+    const context = canvas.getContext("2d");
+    if (!context) {
+      bitmap.close();
+      return file;
+    }
+
+    context.imageSmoothingQuality = "high";
+    context.drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+    bitmap.close();
+
+    const blob = await canvasToBlob(
+      canvas,
+      file.type,
+      file.type === "image/jpeg" ? JPEG_QUALITY : undefined
+    );
+    if (!blob || blob.size >= file.size) return file;
+
+    return new File([blob], file.name, { type: file.type, lastModified: file.lastModified });
+  } catch (error) {
+    console.error("Image compression error:", error);
+    return file;
+  }
+}
@@ -0,0 +1,196 @@
+import { describe, it, expect, vi, beforeEach, afterEach } from "vitest";
+import { uploadResumable } from "./resumable-upload";
+import type { UploadTarget } from "./upload-policy";
+
+const MB = 1024 * 1024;
+const SUPABASE_URL = "https://lab.supabase.co";
+const UPLOAD_URL = `${SUPABASE_URL}/storage/v1/upload/resumable/sign/upload-1`;
+const TARGET: UploadTarget = { bucket: "research-notes", path: "note-1/file.pdf", token: "tok" };
+
+// 가짜 Storage: 업로드 URL별로 받은 바이트 수만 기록한다
+let received: Map<string, number>;
+let patchOffsets: number[];
+// 다음 PATCH들의 실패 (status 0 = 네트워크 오류, received = 끊기기 전에 서버가 받은 바이트)
+let patchFailures: { status: number; received: number }[];
+
+class FakeXhr {
+  status = 0;
+  upload: { onprogress: ((event: { loaded: number }) => void) | null } = { onprogress: null };
+  onload: (() => void) | null = null;
+  onerror: (() => void) | null = null;
+  onabort: (() => void) | null = null;
+  private url = "";
+  private requestHeaders: Record<string, string> = {};
+  private responseHeaders: Record<string, string> = {};
+
+  open(_method: string, url: string) {
+    this.url = url;
+  }
+
+  setRequestHeader(key: string, value: string) {
+    this.requestHeaders[key] = value;
+  }
+
+  getResponseHeader(key: string) {
+    return this.responseHeaders[key] ?? null;
+  }
+
+  abort() {
+    this.onabort?.();
+  }
+
+  send(chunk: Blob) {
+    const offset = Number(this.requestHeaders["Upload-Offset"]);
+    patchOffsets.push(offset);
+
+    queueMicrotask(() => {
+      const failure = patchFailures.shift();
+      if (failure) {
+        received.set(this.url, offset + failure.received);
+        if (failure.status === 0) {
+          this.onerror?.();
+        } else {
+          this.status = failure.status;
+          this.onload?.();
+        }
+        return;
+      }
+      if (received.get(this.url) !== offset) {
+        this.status = 409;
+        this.onload?.();
+        return;
+      }
+      received.set(this.url, offset + chunk.size);
+      this.status = 204;
+      this.responseHeaders["Upload-Offset"] = String(offset + chunk.size);
+      this.upload.onprogress?.({ loaded: chunk.size });
+      this.onload?.();
+    });
+  }
+}
+
+const fetchMock = vi.fn(async (url: string, init: RequestInit) => {
+  if (init.method === "POST") {
+    received.set(UPLOAD_URL, 0);
+    return new Response(null, { status: 201, headers: { Location: UPLOAD_URL } });
+  }
+  const offset = received.get(url);
+  return offset === undefined
+    ? new Response(null, { status: 404 })
+    : new Response(null, { status: 200, headers: { "Upload-Offset": String(offset) } });
+});
+
+function makeFile(size: number) {
+  return new File([new Uint8Array(size)], "file.pdf", {
+    type: "application/pdf",
+    lastModified: 1700000000000,
+  });
+}
+
+const resumeKey = (file: File) =>
+  `sdc-lab:upload:note-1:${file.name}:${file.size}:${file.lastModified}:${file.type}`;
+
+const methods = () => fetchMock.mock.calls.map(([, init]) => init.method);
+
+beforeEach(() => {
+  received = new Map();
+  patchOffsets = [];
+  patchFailures = [];
+  fetchMock.mockClear();
+  localStorage.clear();
+  vi.stubEnv("NEXT_PUBLIC_SUPABASE_URL", SUPABASE_URL);
+  vi.stubEnv("NEXT_PUBLIC_SUPABASE_ANON_KEY", "anon");
+  vi.stubGlobal("fetch", fetchMock);
+  vi.stubGlobal("XMLHttpRequest", FakeXhr);
+});
+
+afterEach(() => {
+  vi.useRealTimers();
+  vi.unstubAllEnvs();
+  vi.unstubAllGlobals();
+});
+
+describe("uploadResumable", () => {
+  it("should send 6MB chunks at increasing offsets and clear the resume entry", async () => {
+    const file = makeFile(13 * MB);
+    const createTarget = vi.fn().mockResolvedValue(TARGET);
+    const progress: number[] = [];
+
+    const target = await uploadResumable({
+      file,
+      scope: "note-1",
+      createTarget,
+      onProgress: (uploaded) => progress.push(uploaded),
+    });
+
+    expect(target).toEqual(TARGET);
+    expect(createTarget).toHaveBeenCalledTimes(1);
+    expect(methods()).toEqual(["POST"]);
+    expect(patchOffsets).toEqual([0, 6 * MB, 12 * MB]);
+    expect(received.get(UPLOAD_URL)).toBe(13 * MB);
+    expect(progress[progress.length - 1]).toBe(13 * MB);
+    expect(localStorage.getItem(resumeKey(file))).toBeNull();
+  });
+
+  it("should resume from the server offset of a stored upload", async () => {
+    const file = makeFile(13 * MB);
+    received.set(UPLOAD_URL, 6 * MB);
+    localStorage.setItem(
+      resumeKey(file),
+      JSON.stringify({ target: TARGET, uploadUrl: UPLOAD_URL, createdAt: Date.now() })
+    );
+    const createTarget = vi.fn();
+
+    await uploadResumable({ file, scope: "note-1", createTarget });
+
+    expect(createTarget).not.toHaveBeenCalled();
+    expect(methods()).toEqual(["HEAD"]);
+    expect(patchOffsets).toEqual([6 * MB, 12 * MB]);
+    expect(received.get(UPLOAD_URL)).toBe(13 * MB);
+  });
+
+  it("should start over when the stored upload is gone", async () => {
+    const file = makeFile(1 * MB);
+    localStorage.setItem(
+      resumeKey(file),
+      JSON.stringify({ target: TARGET, uploadUrl: `${UPLOAD_URL}-old`, createdAt: Date.now() })
+    );
+    const createTarget = vi.fn().mockResolvedValue(TARGET);
+
+    await uploadResumable({ file, scope: "note-1", createTarget });
+
+    expect(createTarget).toHaveBeenCalledTimes(1);
+    expect(methods()).toEqual(["HEAD", "POST"]);
+    expect(patchOffsets).toEqual([0]);
+  });
+
+  it("should re-read the offset after a failed chunk and continue from there", async () => {
+    vi.useFakeTimers({ toFake: ["setTimeout", "clearTimeout"] });
+    const file = makeFile(13 * MB);
+    // 첫 청크 도중 연결이 끊겨 서버에는 2MB만 남았다
+    patchFailures = [{ status: 0, received: 2 * MB }];
+
+    const upload = uploadResumable({
+      file,
+      scope: "note-1",
+      createTarget: vi.fn().mockResolvedValue(TARGET),
+    });
+    await vi.advanceTimersByTimeAsync(1000);
+    await upload;
+
+    expect(methods()).toEqual(["POST", "HEAD"]);
+    expect(patchOffsets).toEqual([0, 2 * MB, 8 * MB]);
+    expect(received.get(UPLOAD_URL)).toBe(13 * MB);
+  });
+
+  it("should not retry non-retryable chunk errors", async () => {
+    const file = makeFile(1 * MB);
+    patchFailures = [{ status: 400, received: 0 }];
+
+    await expect(
+      uploadResumable({ file, scope: "note-1", createTarget: vi.fn().mockResolvedValue(TARGET) })
+    ).rejects.toThrow("Chunk upload failed (400)");
+    // 다시 고르면 이어 올릴 수 있도록 항목을 남긴다
+    expect(localStorage.getItem(resumeKey(file))).not.toBeNull();
+  });
+});
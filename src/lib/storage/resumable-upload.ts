@@ -0,0 +1,238 @@
+import type { UploadTarget } from "./upload-policy";
+
+// ============================================
+// Supabase Storage 직접 업로드 (TUS resumable, 브라우저)
+// ============================================
+// 서버 액션은 서명된 업로드 토큰만 발급하고(createSignedUploadUrl),
+// 파일 바이트는 브라우저가 Storage의 TUS 엔드포인트로 청크 단위로 직접 보낸다.
+// - 청크 실패 시 지연 후 재시도하고, 409(offset 불일치)면 HEAD로 서버 offset을 다시 확인
+// - 업로드 URL을 localStorage에 남겨 새로고침/연결 끊김 후 같은 파일을 다시 고르면 이어서 업로드
+
+const TUS_VERSION = "1.0.0";
+// Supabase Storage resumable 업로드는 6MB 청크만 지원한다.
+const CHUNK_SIZE = 6 * 1024 * 1024;
+const RETRY_DELAYS_MS = [1000, 3000, 5000, 10000];
+// 서명된 업로드 토큰(2시간)이 만료되기 전까지만 이어 올린다.
+const RESUME_TTL_MS = 90 * 60 * 1000;
+const RESUME_KEY_PREFIX = "sdc-lab:upload:";
+
+interface ResumeEntry {
+  target: UploadTarget;
+  uploadUrl: string | null;
+  createdAt: number;
+}
+
+export interface ResumableUploadOptions {
+  file: File;
+  // 같은 파일이라도 업로드 대상(노트/게시물)이 다르면 따로 이어 올린다.
+  scope: string;
+  createTarget: () => Promise<UploadTarget>;
+  onProgress?: (uploaded: number, total: number) => void;
+  signal?: AbortSignal;
+}
+
+class TusError extends Error {
+  constructor(
+    message: string,
+    readonly status: number
+  ) {
+    super(message);
+  }
+}
+
+const endpoint = () =>
+  `${process.env.NEXT_PUBLIC_SUPABASE_URL}/storage/v1/upload/resumable/sign`;
+
+function baseHeaders(target: UploadTarget): Record<string, string> {
+  return {
+    "Tus-Resumable": TUS_VERSION,
+    apikey: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!,
+    "x-signature": target.token,
+  };
+}
+
+function encodeMetadata(values: Record<string, string>): string {
+  return Object.entries(values)
+    .map(([key, value]) => `${key} ${btoa(unescape(encodeURIComponent(value)))}`)
+    .join(",");
+}
+
+function resumeKey({ file, scope }: ResumableUploadOptions): string {
+  return `${RESUME_KEY_PREFIX}${scope}:${file.name}:${file.size}:${file.lastModified}:${file.type}`;
+}
+
+function loadEntry(key: string): ResumeEntry | null {
+  try {
+    const raw = localStorage.getItem(key);
+    if (!raw) return null;
+    const entry = JSON.parse(raw) as ResumeEntry;
+    if (Date.now() - entry.createdAt > RESUME_TTL_MS) {
+      localStorage.removeItem(key);
+      return null;
+    }
+    return entry;
+  } catch {
+    return null;
+  }
+}
+
+function saveEntry(key: string, entry: ResumeEntry) {
+  try {
+    localStorage.setItem(key, JSON.stringify(entry));
+  } catch {
+    // 저장 공간이 없거나 비공개 모드면 이어 올리기만 포기한다.
+  }
+}
+
+const sleep = (ms: number, signal?: AbortSignal) =>
+  new Promise<void>((resolve, reject) => {
+    const timer = setTimeout(resolve, ms);
+    signal?.addEventListener(
+      "abort",
+      () => {
+        clearTimeout(timer);
+        reject(new DOMException("Upload aborted", "AbortError"));
+      },
+      { once: true }
+    );
+  });
+
+async function createUpload(target: UploadTarget, file: File): Promise<string> {
+  const response = await fetch(endpoint(), {
+    method: "POST",
+    headers: {
+      ...baseHeaders(target),
+      "Upload-Length": String(file.size),
+      "Upload-Metadata": encodeMetadata({
+        bucketName: target.bucket,
+        objectName: target.path,
+        contentType: file.type,
+        cacheControl: "3600",
+      }),
+    },
+  });
+
+  const location = response.headers.get("Location");
+  if (!response.ok || !location) {
+    throw new TusError(`Failed to create upload (${response.status})`, response.status);
+  }
+  return new URL(location, endpoint()).toString();
+}
+
+async function fetchOffset(target: UploadTarget, uploadUrl: string): Promise<number> {
+  const response = await fetch(uploadUrl, {
+    method: "HEAD",
+    headers: baseHeaders(target),
+    cache: "no-store",
+  });
+  const offset = response.headers.get("Upload-Offset");
+  if (!response.ok || offset === null) {
+    throw new TusError(`Failed to read upload offset (${response.status})`, response.status);
+  }
+  return Number(offset);
+}
+
+// fetch는 업로드 진행률을 알 수 없어 PATCH만 XHR로 보낸다.
+function patchChunk(
+  target: UploadTarget,
+  uploadUrl: string,
+  offset: number,
+  chunk: Blob,
+  onChunkProgress: (loaded: number) => void,
+  signal?: AbortSignal
+): Promise<number> {
+  return new Promise((resolve, reject) => {
+    const xhr = new XMLHttpRequest();
+    xhr.open("PATCH", uploadUrl);
+    for (const [key, value] of Object.entries(baseHeaders(target))) {
+      xhr.setRequestHeader(key, value);
+    }
+    xhr.setRequestHeader("Upload-Offset", String(offset));
+    xhr.setRequestHeader("Content-Type", "application/offset+octet-stream");
+
+    const abort = () => xhr.abort();
+    signal?.addEventListener("abort", abort, { once: true });
+
+    xhr.upload.onprogress = (event) => onChunkProgress(event.loaded);
+    xhr.onload = () => {
+      signal?.removeEventListener("abort", abort);
+      const nextOffset = xhr.getResponseHeader("Upload-Offset");
+      if (xhr.status >= 200 && xhr.status < 300 && nextOffset !== null) {
+        resolve(Number(nextOffset));
+      } else {
+        reject(new TusError(`Chunk upload failed (${xhr.status})`, xhr.status));
+      }
+    };
+    xhr.onerror = () => {
+      signal?.removeEventListener("abort", abort);
+      reject(new TusError("Network error", 0));
+    };
+    xhr.onabort = () => reject(new DOMException("Upload aborted", "AbortError"));
+    xhr.send(chunk);
+  });
+}
+
+const isRetryable = (error: unknown) =>
+  error instanceof TusError &&
+  (error.status === 0 || error.status === 409 || error.status === 423 || error.status >= 500);
+
+const isGone = (error: unknown) =>
+  error instanceof TusError && [403, 404, 410].includes(error.status);
+
+export async function uploadResumable(options: ResumableUploadOptions): Promise<UploadTarget> {
+  const { file, createTarget, onProgress, signal } = options;
+  const key = resumeKey(options);
+
+  let entry = loadEntry(key);
+  let offset = 0;
+
+  // 이전 업로드가 남아 있으면 서버에 받은 만큼부터 이어서 올린다.
+  if (entry?.uploadUrl) {
+    try {
+      offset = await fetchOffset(entry.target, entry.uploadUrl);
+    } catch (error) {
+      if (!isGone(error)) throw error;
+      localStorage.removeItem(key);
+      entry = null;
+    }
+  }
+
+  if (!entry) {
+    entry = { target: await createTarget(), uploadUrl: null, createdAt: Date.now() };
+    saveEntry(key, entry);
+  }
+  if (!entry.uploadUrl) {
+    entry.uploadUrl = await createUpload(entry.target, file);
+    saveEntry(key, entry);
+  }
+
+  const { target, uploadUrl } = entry;
+  let attempt = 0;
+  onProgress?.(offset, file.size);
+
+  while (offset < file.size) {
+    signal?.throwIfAborted();
+    const chunk = file.slice(offset, offset + CHUNK_SIZE);
+
+    try {
+      offset = await patchChunk(
+        target,
+        uploadUrl,
+        offset,
+        chunk,
+        (loaded) => onProgress?.(offset + loaded, file.size),
+        signal
+      );
+      attempt = 0;
+      onProgress?.(offset, file.size);
+    } catch (error) {
+      if (!isRetryable(error) || attempt >= RETRY_DELAYS_MS.length) throw error;
+      await sleep(RETRY_DELAYS_MS[attempt++], signal);
+      // 일부만 전달됐을 수 있으므로 서버 offset을 기준으로 다시 시작
+      offset = await fetchOffset(target, uploadUrl).catch(() => offset);
+    }
+  }
+
+  localStorage.removeItem(key);
+  return target;
+}
@@ -0,0 +1,62 @@
+import { compressImage } from "./image-compression";
+import { uploadResumable } from "./resumable-upload";
+import { validateAttachment, type AttachmentMeta, type UploadTarget } from "./upload-policy";
+
+// ============================================
+// 첨부파일 업로드 흐름 (브라우저)
+// ============================================
+// 이미지 압축 → 서명된 업로드 URL 발급(서버 액션) → TUS 직접 업로드 → 메타데이터 저장(서버 액션)
+// 파일 바이트는 Next.js 함수를 거치지 않는다.
+
+interface UploadAttachmentOptions {
+  file: File;
+  // 이어 올리기 범위 (예: `note:${noteId}`)
+  scope: string;
+  createUpload: (meta: AttachmentMeta) => Promise<{ data?: UploadTarget; error?: string }>;
+  completeUpload: (path: string, meta: AttachmentMeta) => Promise<{ error?: string }>;
+  onProgress?: (percent: number) => void;
+  signal?: AbortSignal;
+}
+
+class UploadPreparationError extends Error {}
+
+export async function uploadAttachment({
+  file,
+  scope,
+  createUpload,
+  completeUpload,
+  onProgress,
+  signal,
+}: UploadAttachmentOptions): Promise<{ error?: string }> {
+  const prepared = await compressImage(file);
+  const meta: AttachmentMeta = { name: prepared.name, size: prepared.size, type: prepared.type };
+
+  const validationError = validateAttachment(meta);
+  if (validationError) return { error: validationError };
+
+  try {
+    const target = await uploadResumable({
+      file: prepared,
+      scope,
+      signal,
+      onProgress: (uploaded, total) =>
+        onProgress?.(total === 0 ? 100 : Math.round((uploaded / total) * 100)),
+      createTarget: async () => {
+        const result = await createUpload(meta);
+        if (!result.data) {
+          throw new UploadPreparationError(result.error ?? "업로드 준비에 실패했습니다.");
+        }
+        return result.data;
+      },
+    });
+
+    return await completeUpload(target.path, meta);
+  } catch (error) {
+    if (error instanceof UploadPreparationError) return { error: error.message };
+    if (error instanceof DOMException && error.name === "AbortError") {
+      return { error: "업로드가 취소되었습니다." };
+    }
+    console.error("Attachment upload error:", error);
+    return { error: "파일 업로드에 실패했습니다. 같은 파일을 다시 선택하면 이어서 업로드합니다." };
+  }
+}
@@ -0,0 +1,31 @@
+import { describe, it, expect } from "vitest";
+import { MAX_ATTACHMENT_SIZE, buildAttachmentPath, validateAttachment } from "./upload-policy";
+
+describe("validateAttachment", () => {
+  it("should accept files up to exactly 50MB", () => {
+    expect(MAX_ATTACHMENT_SIZE).toBe(50 * 1024 * 1024);
+    expect(
+      validateAttachment({ name: "a.pdf", size: MAX_ATTACHMENT_SIZE, type: "application/pdf" })
+    ).toBeNull();
+  });
+
+  it("should reject files over 50MB", () => {
+    expect(
+      validateAttachment({ name: "a.pdf", size: MAX_ATTACHMENT_SIZE + 1, type: "application/pdf" })
+    ).toContain("50MB");
+  });
+
+  it("should reject unsupported types regardless of size", () => {
+    expect(validateAttachment({ name: "a.gif", size: 10, type: "image/gif" })).toContain(
+      "허용되지 않는 파일 형식"
+    );
+  });
+});
+
+describe("buildAttachmentPath", () => {
+  it("should place the file under the entity id and keep the extension", () => {
+    expect(buildAttachmentPath("note-1", "결과 보고서.v2.pdf")).toMatch(
+      /^note-1\/\d+_[a-z0-9]+\.pdf$/
+    );
+  });
+});
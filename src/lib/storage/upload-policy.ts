@@ -0,0 +1,51 @@
+// ============================================
+// 첨부파일 업로드 정책 (클라이언트/서버 공용)
+// ============================================
+// 파일은 브라우저에서 Storage로 직접 업로드되므로(resumable-upload.ts)
+// Next.js 함수 본문 크기 제한과 무관하게 상한을 정할 수 있다.
+// 버킷 file_size_limit(00035)과 함께 바꿔야 한다.
+
+export const ATTACHMENT_MIME_TYPES = [
+  "application/pdf",
+  "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+  "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+  "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+  "image/png",
+  "image/jpeg",
+];
+
+export const ATTACHMENT_EXTENSIONS = ".pdf,.docx,.xlsx,.pptx,.png,.jpg,.jpeg";
+
+export const MAX_ATTACHMENT_SIZE = 50 * 1024 * 1024; // 50MB
+export const MAX_ATTACHMENT_SIZE_LABEL = "50MB";
+
+export interface AttachmentMeta {
+  name: string;
+  size: number;
+  type: string;
+}
+
+// 서명된 업로드 URL 발급 결과 (TUS 업로드 대상)
+export interface UploadTarget {
+  bucket: string;
+  path: string;
+  token: string;
+}
+
+export function validateAttachment(meta: AttachmentMeta): string | null {
+  if (!ATTACHMENT_MIME_TYPES.includes(meta.type)) {
+    return "허용되지 않는 파일 형식입니다. (PDF, DOCX, XLSX, PPTX, PNG, JPG만 허용)";
+  }
+  if (meta.size > MAX_ATTACHMENT_SIZE) {
+    return `파일 크기는 ${MAX_ATTACHMENT_SIZE_LABEL}를 초과할 수 없습니다.`;
+  }
+  return null;
+}
+
+// {entityId}/{timestamp}_{random}.{ext}
+export function buildAttachmentPath(entityId: string, filename: string): string {
+  const timestamp = Date.now();
+  const randomStr = Math.random().toString(36).substring(2, 8);
+  const ext = filename.split(".").pop();
+  return `${entityId}/${timestamp}_${randomStr}.${ext}`;
+}
@@ -0,0 +1,29 @@
+import type { createClient } from "@/lib/supabase/server";
+
+type SupabaseServerClient = Awaited<ReturnType<typeof createClient>>;
+
+// 브라우저가 직접 올린 파일이 실제로 Storage에 있는지 확인하고 저장된 크기를 돌려준다.
+// 클라이언트가 보낸 크기 대신 이 값을 files에 기록한다.
+export async function getUploadedObjectSize(
+  supabase: SupabaseServerClient,
+  bucket: string,
+  path: string
+): Promise<number | null> {
+  const slash = path.lastIndexOf("/");
+  const folder = path.slice(0, slash);
+  const name = path.slice(slash + 1);
+
+  const { data, error } = await supabase.storage
+    .from(bucket)
+    .list(folder, { search: name, limit: 1 });
+
+  if (error) {
+    console.error("Error checking uploaded file:", error);
+    return null;
+  }
+
+  const object = data?.find((item) => item.name === name);
+  if (!object) return null;
+
+  return Number(object.metadata?.size ?? 0);
+}
@@ -3,6 +3,7 @@
 import { createClient } from "./server";
 import { redirect } from "next/navigation";
 import { revalidatePath } from "next/cache";
+import { invalidateLabData, LAB_CACHE_TAGS } from "@/lib/cache/lab-data";
 import type { MemberPosition, EmploymentType, Database } from "@/types/database.types";
 
 type MemberInsert = Database["public"]["Tables"]["members"]["Insert"];
@@ -164,6 +165,7 @@ export async function approveMember(memberId: string): Promise<AuthResult> {
     return { error: "승인 처리 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects);
   revalidatePath("/admin/approvals");
   return { success: true };
 }
@@ -210,6 +212,7 @@ export async function rejectMember(memberId: string): Promise<AuthResult> {
     return { error: "거절 처리 중 오류가 발생했습니다." };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects);
   revalidatePath("/admin/approvals");
   return { success: true };
 }
@@ -268,6 +271,7 @@ export async function updateMemberProfile(
     return { error: "정보 수정 중 오류가 발생했습니다: " + error.message };
   }
 
+  invalidateLabData(LAB_CACHE_TAGS.projects, LAB_CACHE_TAGS.dashboard);
   revalidatePath(`/members/${memberId}`);
   return { success: true };
 }
@@ -0,0 +1,224 @@
+// ============================================
+// Supabase access token 로컬 검증
+// ============================================
+// 비대칭 서명 키(JWKS, ES256/RS256)로 access token을 직접 검증해
+// 미들웨어에서 요청마다 Auth 서버(getUser)에 왕복하지 않도록 한다.
+// Edge 런타임에서도 동작하도록 Web Crypto만 사용한다.
+
+import type { SupabaseClient } from "@supabase/supabase-js";
+
+// 공개 키 목록 캐시 유효 시간
+const JWKS_TTL_MS = 10 * 60 * 1000;
+// 모르는 kid(키 교체)로 인한 재조회 최소 간격 - 위조 토큰으로 JWKS를 반복 조회하지 않도록
+const JWKS_MIN_REFETCH_MS = 30 * 1000;
+
+export interface SupabaseJwtClaims {
+  sub: string;
+  exp: number;
+  iat?: number;
+  iss?: string;
+  aud?: string | string[];
+  role?: string;
+  email?: string;
+  session_id?: string;
+  // custom access token hook(00031)이 추가하는 멤버 정보
+  member?: {
+    id: string;
+    name: string;
+    position: string;
+    status: string;
+  };
+}
+
+export interface VerifiedAuthUser {
+  id: string;
+  email: string | null;
+  // 로컬 검증에 성공했을 때만 존재 (getUser() 경로에서는 null)
+  claims: SupabaseJwtClaims | null;
+}
+
+// local: access token을 JWKS로 직접 검증 (기본값)
+// network: 매번 supabase.auth.getUser()로 Auth 서버에 확인
+const AUTH_VERIFY_MODE =
+  process.env.SUPABASE_AUTH_VERIFY_MODE === "network" ? "network" : "local";
+
+interface JsonWebKeyWithKid extends JsonWebKey {
+  kid?: string;
+}
+
+type SupportedAlgorithm = "ES256" | "RS256";
+
+const ALGORITHMS: Record<
+  SupportedAlgorithm,
+  {
+    kty: string;
+    importParams: EcKeyImportParams | RsaHashedImportParams;
+    verifyParams: EcdsaParams | AlgorithmIdentifier;
+  }
+> = {
+  ES256: {
+    kty: "EC",
+    importParams: { name: "ECDSA", namedCurve: "P-256" },
+    verifyParams: { name: "ECDSA", hash: "SHA-256" },
+  },
+  RS256: {
+    kty: "RSA",
+    importParams: { name: "RSASSA-PKCS1-v1_5", hash: "SHA-256" },
+    verifyParams: { name: "RSASSA-PKCS1-v1_5" },
+  },
+};
+
+interface JwksCache {
+  keys: Map<string, JsonWebKeyWithKid>;
+  fetchedAt: number;
+}
+
+let jwksCache: JwksCache | null = null;
+let jwksRequest: Promise<JwksCache | null> | null = null;
+const importedKeys = new Map<string, Promise<CryptoKey>>();
+
+function getSupabaseUrl(): string {
+  return process.env.NEXT_PUBLIC_SUPABASE_URL!.replace(/\/$/, "");
+}
+
+function base64UrlDecode(input: string) {
+  const base64 = input.replace(/-/g, "+").replace(/_/g, "/");
+  const padded = base64 + "=".repeat((4 - (base64.length % 4)) % 4);
+  const binary = atob(padded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return bytes;
+}
+
+function decodeJson<T>(segment: string): T | null {
+  try {
+    return JSON.parse(new TextDecoder().decode(base64UrlDecode(segment))) as T;
+  } catch {
+    return null;
+  }
+}
+
+// 동시 요청이 한 번의 조회를 공유하도록 진행 중인 요청을 재사용
+async function loadJwks(): Promise<JwksCache | null> {
+  if (!jwksRequest) {
+    jwksRequest = (async () => {
+      try {
+        const response = await fetch(`${getSupabaseUrl()}/auth/v1/.well-known/jwks.json`, {
+          headers: { apikey: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY! },
+        });
+        if (!response.ok) {
+          throw new Error(`JWKS fetch failed: ${response.status}`);
+        }
+
+        const { keys } = (await response.json()) as { keys?: JsonWebKeyWithKid[] };
+        const next: JwksCache = { keys: new Map(), fetchedAt: Date.now() };
+        for (const key of keys ?? []) {
+          if (key.kid) next.keys.set(key.kid, key);
+        }
+
+        jwksCache = next;
+        importedKeys.clear();
+        return next;
+      } catch (error) {
+        console.error("JWKS fetch error:", error);
+        // 실패해도 기존 키는 유지하고, 재시도는 fetchedAt 기준 간격을 따른다
+        jwksCache = { keys: jwksCache?.keys ?? new Map(), fetchedAt: Date.now() };
+        return jwksCache;
+      } finally {
+        jwksRequest = null;
+      }
+    })();
+  }
+  return jwksRequest;
+}
+
+async function getSigningKey(kid: string): Promise<JsonWebKeyWithKid | null> {
+  const now = Date.now();
+  let cache = jwksCache;
+
+  if (!cache || now - cache.fetchedAt > JWKS_TTL_MS) {
+    cache = await loadJwks();
+  } else if (!cache.keys.has(kid) && now - cache.fetchedAt > JWKS_MIN_REFETCH_MS) {
+    // 캐시에 없는 kid → 서명 키가 교체되었을 수 있으므로 재조회
+    cache = await loadJwks();
+  }
+
+  return cache?.keys.get(kid) ?? null;
+}
+
+function importKey(kid: string, jwk: JsonWebKeyWithKid, alg: SupportedAlgorithm) {
+  const cacheKey = `${alg}:${kid}`;
+  let key = importedKeys.get(cacheKey);
+  if (!key) {
+    key = crypto.subtle.importKey("jwk", jwk, ALGORITHMS[alg].importParams, false, ["verify"]);
+    importedKeys.set(cacheKey, key);
+  }
+  return key;
+}
+
+// 서명, 발급자, 만료를 확인한 claims를 반환한다.
+// 로컬에서 확정할 수 없는 토큰(HS256 등 대칭 키, 알 수 없는 kid, 잘못된 서명)은 null
+// → 호출 측에서 supabase.auth.getUser()로 Auth 서버에 확인해야 한다.
+export async function verifySupabaseAccessToken(
+  token: string
+): Promise<SupabaseJwtClaims | null> {
+  const [encodedHeader, encodedPayload, encodedSignature] = token.split(".");
+  if (!encodedHeader || !encodedPayload || !encodedSignature) return null;
+
+  const header = decodeJson<{ alg?: string; kid?: string }>(encodedHeader);
+  if (!header?.kid || !header.alg || !(header.alg in ALGORITHMS)) return null;
+
+  const alg = header.alg as SupportedAlgorithm;
+  const jwk = await getSigningKey(header.kid);
+  if (!jwk || jwk.kty !== ALGORITHMS[alg].kty) return null;
+
+  try {
+    const key = await importKey(header.kid, jwk, alg);
+    const valid = await crypto.subtle.verify(
+      ALGORITHMS[alg].verifyParams,
+      key,
+      base64UrlDecode(encodedSignature),
+      new TextEncoder().encode(`${encodedHeader}.${encodedPayload}`)
+    );
+    if (!valid) return null;
+  } catch (error) {
+    console.error("JWT verify error:", error);
+    return null;
+  }
+
+  const claims = decodeJson<SupabaseJwtClaims>(encodedPayload);
+  if (!claims?.sub || typeof claims.exp !== "number") return null;
+  if (claims.iss && claims.iss !== `${getSupabaseUrl()}/auth/v1`) return null;
+  if (claims.exp * 1000 <= Date.now()) return null;
+
+  return claims;
+}
+
+// 현재 요청의 인증 사용자
+// local 모드: getSession()은 쿠키에서 세션을 읽고 만료가 임박한 경우에만 refresh token으로
+// 갱신 요청을 보낸다. 그 access token을 로컬에서 검증하고, 검증할 수 없는 경우
+// (대칭 키 프로젝트, 키 교체 직후 등)에만 getUser()로 Auth 서버에 확인한다.
+export async function resolveAuthUser(supabase: {
+  auth: SupabaseClient["auth"];
+}): Promise<VerifiedAuthUser | null> {
+  if (AUTH_VERIFY_MODE === "local") {
+    const {
+      data: { session },
+    } = await supabase.auth.getSession();
+
+    if (!session) return null;
+
+    const claims = await verifySupabaseAccessToken(session.access_token);
+    if (claims) {
+      return { id: claims.sub, email: claims.email ?? null, claims };
+    }
+  }
+
+  const {
+    data: { user },
+  } = await supabase.auth.getUser();
+
+  return user ? { id: user.id, email: user.email ?? null, claims: null } : null;
+}
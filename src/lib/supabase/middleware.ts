@@ -1,5 +1,6 @@
 import { createServerClient, type CookieOptions } from "@supabase/ssr";
 import { NextResponse, type NextRequest } from "next/server";
+import { resolveAuthUser } from "./jwt";
 
 export async function updateSession(request: NextRequest) {
   let supabaseResponse = NextResponse.next({
@@ -30,12 +31,11 @@ export async function updateSession(request: NextRequest) {
   );
 
   // IMPORTANT: Avoid writing any logic between createServerClient and
-  // supabase.auth.getUser(). A simple mistake could make it very hard to debug
+  // the auth check below. A simple mistake could make it very hard to debug
   // issues with users being randomly logged out.
 
-  const {
-    data: { user },
-  } = await supabase.auth.getUser();
+  // access token은 캐시된 JWKS로 로컬 검증 (요청마다 Auth 서버 왕복 없음, jwt.ts 참고)
+  const user = await resolveAuthUser(supabase);
 
   // 인증이 필요한 경로 확인
   const isAuthPage =
@@ -46,7 +46,9 @@ export async function updateSession(request: NextRequest) {
   const isCronApi =
     request.nextUrl.pathname.startsWith("/api/cron") ||
     request.nextUrl.pathname.startsWith("/api/papers/fetch");
-  const isPublicPath = isAuthPage || isPendingApprovalPage || isCronApi;
+  // 캘린더 구독 피드는 URL의 토큰으로 인증 (캘린더 앱에는 세션이 없음)
+  const isCalendarFeed = request.nextUrl.pathname.startsWith("/api/calendar/feed");
+  const isPublicPath = isAuthPage || isPendingApprovalPage || isCronApi || isCalendarFeed;
   const isProtectedPath = !isPublicPath;
 
   // 로그인하지 않은 사용자가 보호된 경로에 접근할 경우
@@ -404,6 +404,13 @@ export function calculateProjectStatus(
   return "on_track";
 }
 
+// 체크리스트 기반 마일스톤 진행률 계산
+export function calculateChecklistProgress(checklist: Array<{ is_completed: boolean }>): number {
+  if (checklist.length === 0) return 0;
+  const completed = checklist.filter((item) => item.is_completed).length;
+  return Math.round((completed / checklist.length) * 100);
+}
+
 // ===== 풀타임 멤버 간트차트 관련 타입 및 헬퍼 함수 =====
 
 export type GanttMemberStatus = "active" | "graduating_soon" | "graduated";
@@ -14,7 +14,8 @@ export const config = {
      * - favicon.ico (favicon file)
      * - public folder
      * - api/cron (cron job endpoints)
+     * - api/calendar/feed (token-authenticated ICS feeds)
      */
-    "/((?!_next/static|_next/image|favicon.ico|api/cron|api/papers/fetch|.*\\.(?:svg|png|jpg|jpeg|gif|webp|pdf)$).*)",
+    "/((?!_next/static|_next/image|favicon.ico|api/cron|api/papers/fetch|api/calendar/feed|.*\\.(?:svg|png|jpg|jpeg|gif|webp|pdf)$).*)",
   ],
 };
@@ -10,6 +10,7 @@ export type EventCategory = "meeting" | "deadline" | "seminar" | "holiday" | "pe
 export type FileEntityType = "project" | "mentoring" | "research_note";
 export type NotificationType = "deadline" | "comment" | "like" | "project_update" | "research_note_comment";
 export type PeerReviewStatus = "pending" | "processing" | "completed" | "error";
+export type PeerReviewCacheSource = "model" | "exact" | "delta";
 
 export interface Member {
   id: string;
@@ -93,11 +94,34 @@ export interface CalendarEvent {
   all_day: boolean;
   is_public: boolean;
   member_id: string | null;
+  rrule: string | null;
+  recurrence_end: string | null;
   created_by: string;
   created_at: string;
   updated_at: string;
 }
 
+// 반복 일정 회차 취소/변경 (00039)
+export interface CalendarEventException {
+  event_id: string;
+  original_start: string;
+  is_cancelled: boolean;
+  start_date: string | null;
+  end_date: string | null;
+  title: string | null;
+  description: string | null;
+  created_by: string | null;
+  created_at: string;
+}
+
+export interface CalendarFeed {
+  member_id: string;
+  token: string;
+  version: number;
+  changed_at: string;
+  created_at: string;
+}
+
 export interface MemberCourse {
   id: string;
   member_id: string;
@@ -114,6 +138,7 @@ export interface MentoringPost {
   professor_comment: string | null;
   next_steps: string[] | null;
   likes_count: number;
+  comments_count: number;
   created_at: string;
   updated_at: string;
 }
@@ -144,6 +169,10 @@ export interface FileRecord {
   entity_id: string;
   uploaded_by: string;
   created_at: string;
+  // 썸네일(파생 파일) 행이면 원본 id와 너비, 원본 행이면 생성 상태
+  parent_file_id: string | null;
+  derivative_width: number | null;
+  derivatives_status: "pending" | "processing" | "ready" | "failed" | null;
 }
 
 export interface Notification {
@@ -165,6 +194,12 @@ export interface PeerReview {
   content: string;
   review_result: string | null;
   review_status: PeerReviewStatus;
+  content_hash: string | null;
+  prompt_version: string | null;
+  cache_source: PeerReviewCacheSource;
+  source_review_id: string | null;
+  input_tokens: number | null;
+  output_tokens: number | null;
   created_at: string;
   updated_at: string;
 }
@@ -347,6 +382,8 @@ export interface Database {
           all_day?: boolean;
           is_public?: boolean;
           member_id?: string | null;
+          rrule?: string | null;
+          recurrence_end?: string | null;
           created_by: string;
           created_at?: string;
           updated_at?: string;
@@ -361,12 +398,58 @@ export interface Database {
           all_day?: boolean;
           is_public?: boolean;
           member_id?: string | null;
+          rrule?: string | null;
+          recurrence_end?: string | null;
           created_by?: string;
           created_at?: string;
           updated_at?: string;
         };
         Relationships: [];
       };
+      calendar_event_exceptions: {
+        Row: CalendarEventException;
+        Insert: {
+          event_id: string;
+          original_start: string;
+          is_cancelled?: boolean;
+          start_date?: string | null;
+          end_date?: string | null;
+          title?: string | null;
+          description?: string | null;
+          created_by?: string | null;
+          created_at?: string;
+        };
+        Update: {
+          event_id?: string;
+          original_start?: string;
+          is_cancelled?: boolean;
+          start_date?: string | null;
+          end_date?: string | null;
+          title?: string | null;
+          description?: string | null;
+          created_by?: string | null;
+          created_at?: string;
+        };
+        Relationships: [];
+      };
+      calendar_feeds: {
+        Row: CalendarFeed;
+        Insert: {
+          member_id: string;
+          token?: string;
+          version?: number;
+          changed_at?: string;
+          created_at?: string;
+        };
+        Update: {
+          member_id?: string;
+          token?: string;
+          version?: number;
+          changed_at?: string;
+          created_at?: string;
+        };
+        Relationships: [];
+      };
       member_courses: {
         Row: MemberCourse;
         Insert: {
@@ -459,6 +542,9 @@ export interface Database {
           entity_id: string;
           uploaded_by: string;
           created_at?: string;
+          parent_file_id?: string | null;
+          derivative_width?: number | null;
+          derivatives_status?: FileRecord["derivatives_status"];
         };
         Update: {
           id?: string;
@@ -470,6 +556,9 @@ export interface Database {
           entity_id?: string;
           uploaded_by?: string;
           created_at?: string;
+          parent_file_id?: string | null;
+          derivative_width?: number | null;
+          derivatives_status?: FileRecord["derivatives_status"];
         };
         Relationships: [];
       };
@@ -507,6 +596,12 @@ export interface Database {
           content: string;
           review_result?: string | null;
           review_status?: PeerReviewStatus;
+          content_hash?: string | null;
+          prompt_version?: string | null;
+          cache_source?: PeerReviewCacheSource;
+          source_review_id?: string | null;
+          input_tokens?: number | null;
+          output_tokens?: number | null;
           created_at?: string;
           updated_at?: string;
         };
@@ -518,6 +613,12 @@ export interface Database {
           content?: string;
           review_result?: string | null;
           review_status?: PeerReviewStatus;
+          content_hash?: string | null;
+          prompt_version?: string | null;
+          cache_source?: PeerReviewCacheSource;
+          source_review_id?: string | null;
+          input_tokens?: number | null;
+          output_tokens?: number | null;
           created_at?: string;
           updated_at?: string;
         };
@@ -761,6 +862,38 @@ export interface ProgressLogWithDetails extends ProgressLog {
   assignee?: { id: string; name: string } | null;
 }
 
+// get_progress_log_rollup() 결과 — 하위과제 × 기간 단위 × 유형 × 상태별 집계
+export type ProgressLogRollupPeriod = "week" | "month" | "quarter" | "range";
+
+export interface ProgressLogRollupItem {
+  id: string;
+  title: string;
+  log_date: string;
+  assignee_name: string | null;
+}
+
+export interface ProgressLogRollupCell {
+  sub_project_id: string | null;
+  period_start: string;
+  log_type: ProgressLogType;
+  status: ProgressLogStatus;
+  log_count: number;
+  hours_spent: number;
+  items: ProgressLogRollupItem[];
+}
+
+// get_progress_summary() 결과 — progress_rollups 기반 기간별 건수/투입 시간 (항목 목록 없음)
+export interface ProgressSummaryRow {
+  project_id: string;
+  sub_project_id: string | null;
+  assignee_id: string | null;
+  period_start: string;
+  log_type: ProgressLogType;
+  status: ProgressLogStatus;
+  log_count: number;
+  hours_spent: number;
+}
+
 export interface ReportWithDetails extends Report {
   template?: ReportTemplate;
   project?: Project | null;
@@ -58,6 +58,57 @@ export type Database = {
           },
         ]
       }
+      calendar_event_exceptions: {
+        Row: {
+          created_at: string
+          created_by: string | null
+          description: string | null
+          end_date: string | null
+          event_id: string
+          is_cancelled: boolean
+          original_start: string
+          start_date: string | null
+          title: string | null
+        }
+        Insert: {
+          created_at?: string
+          created_by?: string | null
+          description?: string | null
+          end_date?: string | null
+          event_id: string
+          is_cancelled?: boolean
+          original_start: string
+          start_date?: string | null
+          title?: string | null
+        }
+        Update: {
+          created_at?: string
+          created_by?: string | null
+          description?: string | null
+          end_date?: string | null
+          event_id?: string
+          is_cancelled?: boolean
+          original_start?: string
+          start_date?: string | null
+          title?: string | null
+        }
+        Relationships: [
+          {
+            foreignKeyName: "calendar_event_exceptions_created_by_fkey"
+            columns: ["created_by"]
+            isOneToOne: false
+            referencedRelation: "members"
+            referencedColumns: ["id"]
+          },
+          {
+            foreignKeyName: "calendar_event_exceptions_event_id_fkey"
+            columns: ["event_id"]
+            isOneToOne: false
+            referencedRelation: "calendar_events"
+            referencedColumns: ["id"]
+          },
+        ]
+      }
       calendar_events: {
         Row: {
           all_day: boolean
@@ -69,6 +120,9 @@ export type Database = {
           id: string
           is_public: boolean
           member_id: string | null
+          recurrence_end: string | null
+          rrule: string | null
+          series_range: unknown
           start_date: string
           title: string
           updated_at: string
@@ -83,6 +137,8 @@ export type Database = {
           id?: string
           is_public?: boolean
           member_id?: string | null
+          recurrence_end?: string | null
+          rrule?: string | null
           start_date: string
           title: string
           updated_at?: string
@@ -97,6 +153,8 @@ export type Database = {
           id?: string
           is_public?: boolean
           member_id?: string | null
+          recurrence_end?: string | null
+          rrule?: string | null
           start_date?: string
           title?: string
           updated_at?: string
@@ -118,6 +176,38 @@ export type Database = {
           },
         ]
       }
+      calendar_feeds: {
+        Row: {
+          changed_at: string
+          created_at: string
+          member_id: string
+          token: string
+          version: number
+        }
+        Insert: {
+          changed_at?: string
+          created_at?: string
+          member_id: string
+          token?: string
+          version?: number
+        }
+        Update: {
+          changed_at?: string
+          created_at?: string
+          member_id?: string
+          token?: string
+          version?: number
+        }
+        Relationships: [
+          {
+            foreignKeyName: "calendar_feeds_member_id_fkey"
+            columns: ["member_id"]
+            isOneToOne: true
+            referencedRelation: "members"
+            referencedColumns: ["id"]
+          },
+        ]
+      }
       checklist_items: {
         Row: {
           content: string
@@ -291,38 +381,54 @@ export type Database = {
       files: {
         Row: {
           created_at: string
+          derivative_width: number | null
+          derivatives_status: string | null
           entity_id: string
           entity_type: Database["public"]["Enums"]["file_entity_type"]
           id: string
           mime_type: string
           name: string
+          parent_file_id: string | null
           size: number
           storage_path: string
           uploaded_by: string
         }
         Insert: {
           created_at?: string
+          derivative_width?: number | null
+          derivatives_status?: string | null
           entity_id: string
           entity_type: Database["public"]["Enums"]["file_entity_type"]
           id?: string
           mime_type: string
           name: string
+          parent_file_id?: string | null
           size: number
           storage_path: string
           uploaded_by: string
         }
         Update: {
           created_at?: string
+          derivative_width?: number | null
+          derivatives_status?: string | null
           entity_id?: string
           entity_type?: Database["public"]["Enums"]["file_entity_type"]
           id?: string
           mime_type?: string
           name?: string
+          parent_file_id?: string | null
           size?: number
           storage_path?: string
           uploaded_by?: string
         }
         Relationships: [
+          {
+            foreignKeyName: "files_parent_file_id_fkey"
+            columns: ["parent_file_id"]
+            isOneToOne: false
+            referencedRelation: "files"
+            referencedColumns: ["id"]
+          },
           {
             foreignKeyName: "files_uploaded_by_fkey"
             columns: ["uploaded_by"]
@@ -499,6 +605,7 @@ export type Database = {
       mentoring_posts: {
         Row: {
           author_id: string
+          comments_count: number
           content: string
           created_at: string
           id: string
@@ -511,6 +618,7 @@ export type Database = {
         }
         Insert: {
           author_id: string
+          comments_count?: number
           content: string
           created_at?: string
           id?: string
@@ -523,6 +631,7 @@ export type Database = {
         }
         Update: {
           author_id?: string
+          comments_count?: number
           content?: string
           created_at?: string
           id?: string
@@ -787,37 +896,103 @@ export type Database = {
           },
         ]
       }
+      peer_review_usage: {
+        Row: {
+          cache_source: string
+          created_at: string
+          id: string
+          input_tokens: number
+          member_id: string | null
+          output_tokens: number
+          review_id: string | null
+          tokens_saved: number
+        }
+        Insert: {
+          cache_source: string
+          created_at?: string
+          id?: string
+          input_tokens?: number
+          member_id?: string | null
+          output_tokens?: number
+          review_id?: string | null
+          tokens_saved?: number
+        }
+        Update: {
+          cache_source?: string
+          created_at?: string
+          id?: string
+          input_tokens?: number
+          member_id?: string | null
+          output_tokens?: number
+          review_id?: string | null
+          tokens_saved?: number
+        }
+        Relationships: [
+          {
+            foreignKeyName: "peer_review_usage_member_id_fkey"
+            columns: ["member_id"]
+            isOneToOne: false
+            referencedRelation: "members"
+            referencedColumns: ["id"]
+          },
+          {
+            foreignKeyName: "peer_review_usage_review_id_fkey"
+            columns: ["review_id"]
+            isOneToOne: false
+            referencedRelation: "peer_reviews"
+            referencedColumns: ["id"]
+          },
+        ]
+      }
       peer_reviews: {
         Row: {
+          cache_source: string
           content: string
+          content_hash: string | null
           created_at: string | null
           id: string
+          input_tokens: number | null
           member_id: string
+          output_tokens: number | null
           project_id: string | null
+          prompt_version: string | null
           review_result: string | null
           review_status: string | null
+          source_review_id: string | null
           title: string
           updated_at: string | null
         }
         Insert: {
+          cache_source?: string
           content: string
+          content_hash?: string | null
           created_at?: string | null
           id?: string
+          input_tokens?: number | null
           member_id: string
+          output_tokens?: number | null
           project_id?: string | null
+          prompt_version?: string | null
           review_result?: string | null
           review_status?: string | null
+          source_review_id?: string | null
           title: string
           updated_at?: string | null
         }
         Update: {
+          cache_source?: string
           content?: string
+          content_hash?: string | null
           created_at?: string | null
           id?: string
+          input_tokens?: number | null
           member_id?: string
+          output_tokens?: number | null
           project_id?: string | null
+          prompt_version?: string | null
           review_result?: string | null
           review_status?: string | null
+          source_review_id?: string | null
           title?: string
           updated_at?: string | null
         }
@@ -829,6 +1004,13 @@ export type Database = {
             referencedRelation: "members"
             referencedColumns: ["id"]
           },
+          {
+            foreignKeyName: "peer_reviews_source_review_id_fkey"
+            columns: ["source_review_id"]
+            isOneToOne: false
+            referencedRelation: "peer_reviews"
+            referencedColumns: ["id"]
+          },
           {
             foreignKeyName: "peer_reviews_project_id_fkey"
             columns: ["project_id"]
@@ -966,6 +1148,45 @@ export type Database = {
           },
         ]
       }
+      progress_rollups: {
+        Row: {
+          assignee_id: string | null
+          hours_spent: number
+          log_count: number
+          log_type: Database["public"]["Enums"]["progress_log_type"]
+          month_start: string
+          project_id: string
+          status: Database["public"]["Enums"]["progress_log_status"]
+          sub_project_id: string | null
+          updated_at: string
+          week_start: string
+        }
+        Insert: {
+          assignee_id?: string | null
+          hours_spent?: number
+          log_count?: number
+          log_type: Database["public"]["Enums"]["progress_log_type"]
+          month_start: string
+          project_id: string
+          status: Database["public"]["Enums"]["progress_log_status"]
+          sub_project_id?: string | null
+          updated_at?: string
+          week_start: string
+        }
+        Update: {
+          assignee_id?: string | null
+          hours_spent?: number
+          log_count?: number
+          log_type?: Database["public"]["Enums"]["progress_log_type"]
+          month_start?: string
+          project_id?: string
+          status?: Database["public"]["Enums"]["progress_log_status"]
+          sub_project_id?: string | null
+          updated_at?: string
+          week_start?: string
+        }
+        Relationships: []
+      }
       project_authors: {
         Row: {
           created_at: string | null
@@ -1358,14 +1579,18 @@ export type Database = {
         Row: {
           author_id: string
           content: string
+          content_length: number | null
           created_at: string | null
+          excerpt: string | null
           id: string
           keywords: string[] | null
           milestone_id: string | null
           project_id: string
+          search_text: string | null
           stage: string
           title: string
           updated_at: string | null
+          word_count: number | null
         }
         Insert: {
           author_id: string
@@ -1618,7 +1843,74 @@ export type Database = {
       [_ in never]: never
     }
     Functions: {
+      get_peer_review_cache_stats: {
+        Args: { p_since?: string }
+        Returns: {
+          delta_hits: number
+          exact_hits: number
+          hit_rate: number
+          input_tokens: number
+          model_requests: number
+          output_tokens: number
+          tokens_saved: number
+          total_requests: number
+        }[]
+      }
+      get_paper_field_summaries: {
+        Args: never
+        Returns: {
+          field_id: string
+          field_name: string
+          map_node_id: string | null
+          paper_count: number
+          refreshed_at: string
+          top_journals: string[]
+          top_papers: Json
+          year_histogram: Json
+        }[]
+      }
+      refresh_paper_field_summaries: { Args: never; Returns: undefined }
+      get_progress_log_rollup: {
+        Args: {
+          p_end_date: string
+          p_period?: string
+          p_project_id: string
+          p_start_date: string
+        }
+        Returns: {
+          hours_spent: number
+          items: Json
+          log_count: number
+          log_type: Database["public"]["Enums"]["progress_log_type"]
+          period_start: string
+          status: Database["public"]["Enums"]["progress_log_status"]
+          sub_project_id: string | null
+        }[]
+      }
+      get_progress_summary: {
+        Args: {
+          p_assignee_id?: string
+          p_end_date: string
+          p_granularity?: string
+          p_project_id?: string
+          p_start_date: string
+        }
+        Returns: {
+          assignee_id: string | null
+          hours_spent: number
+          log_count: number
+          log_type: Database["public"]["Enums"]["progress_log_type"]
+          period_start: string
+          project_id: string
+          status: Database["public"]["Enums"]["progress_log_status"]
+          sub_project_id: string | null
+        }[]
+      }
       show_limit: { Args: never; Returns: number }
+      toggle_mentoring_like: {
+        Args: { p_post_id: string }
+        Returns: Json
+      }
       show_trgm: { Args: { "": string }; Returns: string[] }
       update_project_progress_by_milestone: {
         Args: { p_milestone_id: string }
@@ -0,0 +1,200 @@
+-- =============================================
+-- SDC Lab Dashboard - Dashboard Snapshot
+-- 대시보드용 연구실 전체 요약을 미리 계산해 두는 단일 행 테이블
+-- =============================================
+
+-- =============================================
+-- 1. dashboard_snapshot 테이블
+-- =============================================
+-- 대시보드는 요청마다 research_projects 전체와 weekly_goals + 멤버 조인을 다시 계산했음.
+-- 원본 테이블이 바뀔 때 트리거가 해당 섹션만 다시 계산하므로
+-- 대시보드는 PK 단일 행 조회 한 번으로 렌더링할 수 있다.
+CREATE TABLE dashboard_snapshot (
+    id TEXT PRIMARY KEY DEFAULT 'lab' CHECK (id = 'lab'),
+    -- 프로젝트 섹션
+    project_status_counts JSONB NOT NULL DEFAULT '{}',
+    total_projects INTEGER NOT NULL DEFAULT 0,
+    average_progress NUMERIC(5,1) NOT NULL DEFAULT 0,
+    submitted_projects JSONB NOT NULL DEFAULT '[]',
+    projects_refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    -- 주간 목표 섹션 (대표 저자 이름/아바타까지 해석된 상태로 저장)
+    goal_deadlines JSONB NOT NULL DEFAULT '[]',
+    goals_window_start DATE NOT NULL DEFAULT CURRENT_DATE,
+    goals_refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE dashboard_snapshot ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Dashboard snapshot is viewable by authenticated users"
+    ON dashboard_snapshot FOR SELECT
+    TO authenticated
+    USING (true);
+
+CREATE POLICY "Service role can manage dashboard snapshot"
+    ON dashboard_snapshot FOR ALL
+    TO service_role
+    USING (true);
+
+-- =============================================
+-- 2. 섹션별 갱신 함수
+-- =============================================
+
+-- 프로젝트 상태별 개수, 평균 진행률, 투고 중인 프로젝트 목록
+CREATE OR REPLACE FUNCTION refresh_dashboard_projects()
+RETURNS VOID AS $$
+BEGIN
+    INSERT INTO dashboard_snapshot (id) VALUES ('lab') ON CONFLICT (id) DO NOTHING;
+
+    UPDATE dashboard_snapshot
+    SET
+        project_status_counts = COALESCE((
+            SELECT jsonb_object_agg(status, cnt)
+            FROM (
+                SELECT status::TEXT AS status, COUNT(*) AS cnt
+                FROM research_projects
+                GROUP BY status
+            ) s
+        ), '{}'::jsonb),
+        total_projects = (SELECT COUNT(*) FROM research_projects),
+        average_progress = COALESCE((
+            SELECT ROUND(AVG(overall_progress)::NUMERIC, 1)
+            FROM research_projects
+            WHERE COALESCE(is_archived, FALSE) = FALSE
+        ), 0),
+        submitted_projects = COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'id', p.id,
+                    'title', p.title,
+                    'status', p.status,
+                    'overall_progress', p.overall_progress,
+                    'updated_at', p.updated_at,
+                    'submission_status', p.submission_status,
+                    'target_journal', p.target_journal,
+                    'is_archived', COALESCE(p.is_archived, FALSE)
+                )
+                ORDER BY p.updated_at DESC
+            )
+            FROM research_projects p
+            WHERE p.submission_status IS NOT NULL
+              AND p.submission_status <> 'not_submitted'
+        ), '[]'::jsonb),
+        projects_refreshed_at = NOW()
+    WHERE id = 'lab';
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- 최근 30일 이후 마감 주간 목표 (대시보드의 기존 조회 조건과 동일: 마감일 오름차순 50건)
+CREATE OR REPLACE FUNCTION refresh_dashboard_goals()
+RETURNS VOID AS $$
+DECLARE
+    v_window_start DATE := CURRENT_DATE - 30;
+BEGIN
+    INSERT INTO dashboard_snapshot (id) VALUES ('lab') ON CONFLICT (id) DO NOTHING;
+
+    UPDATE dashboard_snapshot
+    SET
+        goal_deadlines = COALESCE((
+            SELECT jsonb_agg(to_jsonb(g) ORDER BY g.deadline ASC)
+            FROM (
+                SELECT
+                    wg.id,
+                    wg.content,
+                    wg.deadline,
+                    wg.is_completed,
+                    rp.id AS project_id,
+                    rp.title AS project_title,
+                    author.name AS member_name,
+                    author.avatar_url AS member_avatar_url
+                FROM weekly_goals wg
+                JOIN research_projects rp ON rp.id = wg.project_id
+                LEFT JOIN LATERAL (
+                    -- first_author 우선, 없으면 첫 번째 멤버
+                    SELECT m.name, m.avatar_url
+                    FROM project_members pm
+                    JOIN members m ON m.id = pm.member_id
+                    WHERE pm.project_id = rp.id
+                    ORDER BY (pm.role = 'first_author') DESC, pm.created_at ASC
+                    LIMIT 1
+                ) author ON TRUE
+                WHERE wg.deadline >= v_window_start
+                ORDER BY wg.deadline ASC
+                LIMIT 50
+            ) g
+        ), '[]'::jsonb),
+        goals_window_start = v_window_start,
+        goals_refreshed_at = NOW()
+    WHERE id = 'lab';
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- 전체 갱신 (초기 적재 및 일일 cron에서 날짜 경계 이동 시 사용)
+CREATE OR REPLACE FUNCTION refresh_dashboard_snapshot()
+RETURNS VOID AS $$
+BEGIN
+    PERFORM refresh_dashboard_projects();
+    PERFORM refresh_dashboard_goals();
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =============================================
+-- 3. 원본 테이블 변경 시 트리거 (문장 단위)
+-- =============================================
+-- FOR EACH STATEMENT: 체크리스트 일괄 토글처럼 여러 행이 바뀌어도 갱신은 한 번만 수행
+
+CREATE OR REPLACE FUNCTION trigger_refresh_dashboard_projects()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_dashboard_projects();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE OR REPLACE FUNCTION trigger_refresh_dashboard_goals()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_dashboard_goals();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER trigger_dashboard_snapshot_projects
+    AFTER INSERT OR DELETE OR UPDATE OF status, overall_progress, submission_status, target_journal, is_archived
+    ON research_projects
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION trigger_refresh_dashboard_projects();
+
+-- 프로젝트 제목 변경/삭제는 목표 섹션(project_title)에도 반영
+CREATE TRIGGER trigger_dashboard_snapshot_project_goals
+    AFTER INSERT OR DELETE OR UPDATE OF title ON research_projects
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION trigger_refresh_dashboard_goals();
+
+CREATE TRIGGER trigger_dashboard_snapshot_goals
+    AFTER INSERT OR UPDATE OR DELETE ON weekly_goals
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION trigger_refresh_dashboard_goals();
+
+CREATE TRIGGER trigger_dashboard_snapshot_project_members
+    AFTER INSERT OR UPDATE OR DELETE ON project_members
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION trigger_refresh_dashboard_goals();
+
+CREATE TRIGGER trigger_dashboard_snapshot_members
+    AFTER UPDATE OF name, avatar_url ON members
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION trigger_refresh_dashboard_goals();
+
+-- 서비스 롤(일일 cron)에서 호출 가능하도록 권한 부여
+GRANT EXECUTE ON FUNCTION refresh_dashboard_snapshot() TO service_role;
+
+-- 초기 적재
+SELECT refresh_dashboard_snapshot();
+
+-- =============================================
+-- Comments
+-- =============================================
+COMMENT ON TABLE dashboard_snapshot IS '대시보드 연구실 요약 스냅샷 (트리거로 갱신되는 단일 행)';
+COMMENT ON COLUMN dashboard_snapshot.submitted_projects IS '투고 중인 프로젝트 (submission_status <> not_submitted)';
+COMMENT ON COLUMN dashboard_snapshot.goal_deadlines IS '마감일이 goals_window_start 이후인 주간 목표 (대표 저자 포함)';
+COMMENT ON COLUMN dashboard_snapshot.goals_window_start IS '목표 조회 기준일 (갱신 시점 - 30일), 일일 cron으로 이동';
@@ -0,0 +1,361 @@
+-- =============================================
+-- SDC Lab Dashboard - Member Performance Stats
+-- 연구원별 성과 지표를 미리 계산해 두는 테이블 + 성과 페이지용 RPC
+-- =============================================
+
+-- =============================================
+-- 1. member_performance_stats 테이블
+-- =============================================
+-- 성과 페이지는 members, project_members, project_authors, mentoring_posts, mentoring_comments를
+-- 순차 조회한 뒤 참여 연구 수, 평균 진행률, 완료 마일스톤, 일정 준수율을 JS로 계산했음.
+-- 지표는 원본 변경 시 해당 연구원만 다시 계산하고, 연구실 전체 순위에서도 그대로 재사용한다.
+CREATE TABLE member_performance_stats (
+    member_id UUID PRIMARY KEY REFERENCES members(id) ON DELETE CASCADE,
+    total_projects INTEGER NOT NULL DEFAULT 0,
+    avg_progress INTEGER NOT NULL DEFAULT 0,
+    total_milestones INTEGER NOT NULL DEFAULT 0,
+    completed_milestones INTEGER NOT NULL DEFAULT 0,
+    on_time_milestones INTEGER NOT NULL DEFAULT 0,
+    delayed_milestones INTEGER NOT NULL DEFAULT 0,
+    schedule_adherence INTEGER NOT NULL DEFAULT 100,
+    mentoring_posts_count INTEGER NOT NULL DEFAULT 0,
+    mentoring_comments_count INTEGER NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 순위 조회용 인덱스
+CREATE INDEX idx_member_performance_avg_progress ON member_performance_stats(avg_progress DESC);
+CREATE INDEX idx_member_performance_adherence ON member_performance_stats(schedule_adherence DESC);
+
+ALTER TABLE member_performance_stats ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Member performance stats are viewable by authenticated users"
+    ON member_performance_stats FOR SELECT
+    TO authenticated
+    USING (true);
+
+-- =============================================
+-- 2. 연구원 참여 프로젝트 (project_members + 이름 기반 project_authors)
+-- =============================================
+CREATE OR REPLACE FUNCTION member_project_ids(p_member_id UUID)
+RETURNS TABLE (project_id UUID, role TEXT) AS $$
+    SELECT DISTINCT ON (src.project_id) src.project_id, src.role
+    FROM (
+        SELECT pm.project_id, pm.role, 1 AS priority
+        FROM project_members pm
+        WHERE pm.member_id = p_member_id
+        UNION ALL
+        SELECT pa.project_id, pa.role, 2 AS priority
+        FROM project_authors pa
+        JOIN members m ON m.name = pa.name
+        WHERE m.id = p_member_id
+    ) src
+    ORDER BY src.project_id, src.priority;
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+-- =============================================
+-- 3. 연구원 1명의 지표 재계산
+-- =============================================
+CREATE OR REPLACE FUNCTION refresh_member_performance_stats(p_member_id UUID)
+RETURNS VOID AS $$
+DECLARE
+    v_total_projects INTEGER;
+    v_avg_progress INTEGER;
+    v_total_milestones INTEGER;
+    v_completed INTEGER;
+    v_on_time INTEGER;
+    v_delayed INTEGER;
+    v_posts INTEGER;
+    v_comments INTEGER;
+BEGIN
+    IF p_member_id IS NULL OR NOT EXISTS (SELECT 1 FROM members WHERE id = p_member_id) THEN
+        RETURN;
+    END IF;
+
+    SELECT COUNT(*), COALESCE(ROUND(AVG(rp.overall_progress)), 0)
+    INTO v_total_projects, v_avg_progress
+    FROM member_project_ids(p_member_id) mp
+    JOIN research_projects rp ON rp.id = mp.project_id;
+
+    -- 완료 마일스톤: 기한 또는 완료 시점이 없으면 정시 완료로 간주
+    SELECT
+        COUNT(*),
+        COUNT(*) FILTER (WHERE ms.progress = 100),
+        COUNT(*) FILTER (
+            WHERE ms.progress = 100
+              AND (ms.end_date IS NULL OR ms.completed_at IS NULL OR ms.completed_at::DATE <= ms.end_date)
+        ),
+        COUNT(*) FILTER (
+            WHERE ms.progress = 100
+              AND ms.end_date IS NOT NULL AND ms.completed_at IS NOT NULL
+              AND ms.completed_at::DATE > ms.end_date
+        )
+    INTO v_total_milestones, v_completed, v_on_time, v_delayed
+    FROM member_project_ids(p_member_id) mp
+    JOIN milestones ms ON ms.project_id = mp.project_id;
+
+    SELECT COUNT(*) INTO v_posts
+    FROM mentoring_posts
+    WHERE author_id = p_member_id OR target_member_id = p_member_id;
+
+    SELECT COUNT(*) INTO v_comments
+    FROM mentoring_comments
+    WHERE author_id = p_member_id;
+
+    INSERT INTO member_performance_stats (
+        member_id, total_projects, avg_progress, total_milestones, completed_milestones,
+        on_time_milestones, delayed_milestones, schedule_adherence,
+        mentoring_posts_count, mentoring_comments_count, refreshed_at
+    ) VALUES (
+        p_member_id, v_total_projects, v_avg_progress, v_total_milestones, v_completed,
+        v_on_time, v_delayed,
+        CASE WHEN v_on_time + v_delayed > 0
+             THEN ROUND(v_on_time::NUMERIC * 100 / (v_on_time + v_delayed))
+             ELSE 100 END,
+        v_posts, v_comments, NOW()
+    )
+    ON CONFLICT (member_id) DO UPDATE SET
+        total_projects = EXCLUDED.total_projects,
+        avg_progress = EXCLUDED.avg_progress,
+        total_milestones = EXCLUDED.total_milestones,
+        completed_milestones = EXCLUDED.completed_milestones,
+        on_time_milestones = EXCLUDED.on_time_milestones,
+        delayed_milestones = EXCLUDED.delayed_milestones,
+        schedule_adherence = EXCLUDED.schedule_adherence,
+        mentoring_posts_count = EXCLUDED.mentoring_posts_count,
+        mentoring_comments_count = EXCLUDED.mentoring_comments_count,
+        refreshed_at = EXCLUDED.refreshed_at;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- 프로젝트에 참여한 모든 연구원 재계산
+CREATE OR REPLACE FUNCTION refresh_project_member_performance(p_project_id UUID)
+RETURNS VOID AS $$
+DECLARE
+    v_member_id UUID;
+BEGIN
+    FOR v_member_id IN
+        SELECT pm.member_id FROM project_members pm WHERE pm.project_id = p_project_id
+        UNION
+        SELECT m.id FROM project_authors pa JOIN members m ON m.name = pa.name
+        WHERE pa.project_id = p_project_id
+    LOOP
+        PERFORM refresh_member_performance_stats(v_member_id);
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =============================================
+-- 4. 증분 갱신 트리거 (변경된 행과 관련된 연구원만)
+-- =============================================
+
+-- project_members 변경 → 해당 연구원
+CREATE OR REPLACE FUNCTION trigger_performance_project_members()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM refresh_member_performance_stats(OLD.member_id);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM refresh_member_performance_stats(NEW.member_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER trigger_member_performance_project_members
+    AFTER INSERT OR UPDATE OR DELETE ON project_members
+    FOR EACH ROW
+    EXECUTE FUNCTION trigger_performance_project_members();
+
+-- project_authors 변경 → 이름이 일치하는 연구원
+CREATE OR REPLACE FUNCTION trigger_performance_project_authors()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_member_id UUID;
+BEGIN
+    FOR v_member_id IN
+        SELECT id FROM members
+        WHERE (TG_OP <> 'INSERT' AND name = OLD.name)
+           OR (TG_OP <> 'DELETE' AND name = NEW.name)
+    LOOP
+        PERFORM refresh_member_performance_stats(v_member_id);
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER trigger_member_performance_project_authors
+    AFTER INSERT OR UPDATE OF name, project_id OR DELETE ON project_authors
+    FOR EACH ROW
+    EXECUTE FUNCTION trigger_performance_project_authors();
+
+-- 프로젝트 진행률 / 마일스톤 완료 변경 → 프로젝트 참여 연구원
+CREATE OR REPLACE FUNCTION trigger_performance_project_progress()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM refresh_project_member_performance(
+            CASE WHEN TG_TABLE_NAME = 'milestones' THEN OLD.project_id ELSE OLD.id END
+        );
+        RETURN OLD;
+    END IF;
+
+    PERFORM refresh_project_member_performance(
+        CASE WHEN TG_TABLE_NAME = 'milestones' THEN NEW.project_id ELSE NEW.id END
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER trigger_member_performance_project_progress
+    AFTER UPDATE OF overall_progress ON research_projects
+    FOR EACH ROW
+    WHEN (OLD.overall_progress IS DISTINCT FROM NEW.overall_progress)
+    EXECUTE FUNCTION trigger_performance_project_progress();
+
+CREATE TRIGGER trigger_member_performance_milestones
+    AFTER INSERT OR DELETE OR UPDATE OF progress, completed_at, end_date ON milestones
+    FOR EACH ROW
+    EXECUTE FUNCTION trigger_performance_project_progress();
+
+-- 멘토링 글/댓글 추가·삭제 → 작성자(및 대상 연구원)
+CREATE OR REPLACE FUNCTION trigger_performance_mentoring()
+RETURNS TRIGGER AS $$
+DECLARE
+    v_row RECORD;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        v_row := OLD;
+    ELSE
+        v_row := NEW;
+    END IF;
+
+    PERFORM refresh_member_performance_stats(v_row.author_id);
+    IF TG_TABLE_NAME = 'mentoring_posts' THEN
+        PERFORM refresh_member_performance_stats(v_row.target_member_id);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+CREATE TRIGGER trigger_member_performance_mentoring_posts
+    AFTER INSERT OR DELETE ON mentoring_posts
+    FOR EACH ROW
+    EXECUTE FUNCTION trigger_performance_mentoring();
+
+CREATE TRIGGER trigger_member_performance_mentoring_comments
+    AFTER INSERT OR DELETE ON mentoring_comments
+    FOR EACH ROW
+    EXECUTE FUNCTION trigger_performance_mentoring();
+
+-- =============================================
+-- 5. 성과 페이지 RPC (1회 왕복)
+-- =============================================
+-- 멤버 정보 + 미리 계산된 지표 + 프로젝트별 마일스톤 + 최근 활동 15건을 하나의 JSON으로 반환
+CREATE OR REPLACE FUNCTION get_member_performance(p_member_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    v_result JSONB;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM member_performance_stats WHERE member_id = p_member_id) THEN
+        PERFORM refresh_member_performance_stats(p_member_id);
+    END IF;
+
+    SELECT jsonb_build_object(
+        'member', (
+            SELECT jsonb_build_object(
+                'id', m.id,
+                'name', m.name,
+                'position', m.position,
+                'avatar_url', m.avatar_url,
+                'admission_date', m.admission_date,
+                'graduation_date', m.graduation_date
+            )
+            FROM members m WHERE m.id = p_member_id
+        ),
+        'stats', (
+            SELECT to_jsonb(s) - 'member_id'
+            FROM member_performance_stats s WHERE s.member_id = p_member_id
+        ),
+        'projects', COALESCE((
+            SELECT jsonb_agg(
+                jsonb_build_object(
+                    'id', rp.id,
+                    'title', rp.title,
+                    'status', rp.status,
+                    'overall_progress', rp.overall_progress,
+                    'role', mp.role,
+                    'milestones', COALESCE((
+                        SELECT jsonb_agg(
+                            jsonb_build_object(
+                                'id', ms.id,
+                                'stage', ms.title,
+                                'progress', ms.progress,
+                                'end_date', ms.end_date,
+                                'completed_at', ms.completed_at
+                            )
+                            ORDER BY ms.order_index
+                        )
+                        FROM milestones ms WHERE ms.project_id = rp.id
+                    ), '[]'::jsonb)
+                )
+                ORDER BY rp.created_at DESC
+            )
+            FROM member_project_ids(p_member_id) mp
+            JOIN research_projects rp ON rp.id = mp.project_id
+        ), '[]'::jsonb),
+        'recent_activities', COALESCE((
+            SELECT jsonb_agg(a ORDER BY a.date DESC)
+            FROM (
+                SELECT * FROM (
+                    -- 체크리스트 완료 (완료 시각 컬럼이 없으므로 updated_at 사용)
+                    SELECT 'checklist' AS type, ci.content AS description,
+                           ci.updated_at AS date, rp.title AS project_title
+                    FROM member_project_ids(p_member_id) mp
+                    JOIN research_projects rp ON rp.id = mp.project_id
+                    JOIN milestones ms ON ms.project_id = rp.id
+                    JOIN checklist_items ci ON ci.milestone_id = ms.id
+                    WHERE ci.is_completed = TRUE
+                    UNION ALL
+                    SELECT 'milestone', ms.title, ms.completed_at, rp.title
+                    FROM member_project_ids(p_member_id) mp
+                    JOIN research_projects rp ON rp.id = mp.project_id
+                    JOIN milestones ms ON ms.project_id = rp.id
+                    WHERE ms.completed_at IS NOT NULL
+                    UNION ALL
+                    SELECT 'mentoring',
+                           CASE WHEN LENGTH(mpo.content) > 50 THEN LEFT(mpo.content, 50) || '...' ELSE mpo.content END,
+                           mpo.created_at, NULL
+                    FROM mentoring_posts mpo
+                    WHERE mpo.author_id = p_member_id OR mpo.target_member_id = p_member_id
+                    UNION ALL
+                    SELECT 'comment',
+                           CASE WHEN LENGTH(mc.content) > 50 THEN LEFT(mc.content, 50) || '...' ELSE mc.content END,
+                           mc.created_at, NULL
+                    FROM mentoring_comments mc
+                    WHERE mc.author_id = p_member_id
+                ) all_activities
+                ORDER BY date DESC
+                LIMIT 15
+            ) a
+        ), '[]'::jsonb)
+    )
+    INTO v_result;
+
+    RETURN v_result;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+GRANT EXECUTE ON FUNCTION get_member_performance(UUID) TO authenticated;
+
+-- =============================================
+-- 6. 초기 적재
+-- =============================================
+SELECT refresh_member_performance_stats(id) FROM members;
+
+-- =============================================
+-- Comments
+-- =============================================
+COMMENT ON TABLE member_performance_stats IS '연구원별 성과 지표 (트리거로 증분 갱신, 연구실 순위에 재사용)';
+COMMENT ON FUNCTION get_member_performance IS '성과 페이지 데이터 (멤버, 지표, 프로젝트/마일스톤, 최근 활동)를 1회 왕복으로 반환';
@@ -0,0 +1,72 @@
+-- =============================================
+-- SDC Lab Dashboard - Research Notes Listing
+-- 연구노트 목록용 발췌/단어 수 컬럼 + keyset 페이지네이션 인덱스
+-- =============================================
+
+-- 목록 화면은 본문 전체(content) 대신 서버에서 계산된 발췌만 받고,
+-- 카드를 펼칠 때 본문과 댓글을 따로 조회한다.
+
+-- =============================================
+-- 1. 검색용 텍스트 (제목 + 키워드)
+-- =============================================
+-- array_to_string은 STABLE이라 생성 컬럼에 직접 쓸 수 없으므로 IMMUTABLE 래퍼를 둔다.
+CREATE OR REPLACE FUNCTION research_note_search_text(p_title TEXT, p_keywords TEXT[])
+RETURNS TEXT AS $$
+    SELECT LOWER(p_title || ' ' || COALESCE(array_to_string(p_keywords, ' '), ''));
+$$ LANGUAGE sql IMMUTABLE;
+
+-- =============================================
+-- 2. 생성 컬럼
+-- =============================================
+ALTER TABLE research_notes
+    ADD COLUMN IF NOT EXISTS excerpt TEXT
+        GENERATED ALWAYS AS (LEFT(content, 500)) STORED,
+    ADD COLUMN IF NOT EXISTS content_length INTEGER
+        GENERATED ALWAYS AS (char_length(content)) STORED,
+    ADD COLUMN IF NOT EXISTS word_count INTEGER
+        GENERATED ALWAYS AS (
+            CASE WHEN btrim(content) = '' THEN 0
+                 ELSE array_length(regexp_split_to_array(btrim(content), '\s+'), 1)
+            END
+        ) STORED,
+    ADD COLUMN IF NOT EXISTS search_text TEXT
+        GENERATED ALWAYS AS (research_note_search_text(title, keywords)) STORED;
+
+-- =============================================
+-- 3. keyset 페이지네이션 인덱스 (created_at DESC, id DESC)
+-- =============================================
+CREATE INDEX IF NOT EXISTS idx_research_notes_created_id
+    ON research_notes(created_at DESC, id DESC);
+
+-- 연구원별 목록 (기본 화면은 본인 노트만 조회)
+CREATE INDEX IF NOT EXISTS idx_research_notes_author_created_id
+    ON research_notes(author_id, created_at DESC, id DESC);
+
+-- =============================================
+-- 4. 단계별 노트 수 (통계 카드용, RLS 적용)
+-- =============================================
+CREATE OR REPLACE FUNCTION count_research_notes_by_stage(
+    p_author_id UUID DEFAULT NULL,
+    p_start TIMESTAMPTZ DEFAULT NULL,
+    p_end TIMESTAMPTZ DEFAULT NULL,
+    p_search TEXT DEFAULT NULL
+)
+RETURNS TABLE (stage TEXT, note_count BIGINT) AS $$
+    SELECT rn.stage, COUNT(*)
+    FROM research_notes rn
+    WHERE (p_author_id IS NULL OR rn.author_id = p_author_id)
+      AND (p_start IS NULL OR rn.created_at >= p_start)
+      AND (p_end IS NULL OR rn.created_at <= p_end)
+      AND (p_search IS NULL OR rn.search_text LIKE '%' || LOWER(p_search) || '%')
+    GROUP BY rn.stage;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION count_research_notes_by_stage(UUID, TIMESTAMPTZ, TIMESTAMPTZ, TEXT) TO authenticated;
+
+-- =============================================
+-- Comments
+-- =============================================
+COMMENT ON COLUMN research_notes.excerpt IS '목록용 본문 발췌 (앞 500자)';
+COMMENT ON COLUMN research_notes.word_count IS '본문 단어 수 (공백 기준)';
+COMMENT ON COLUMN research_notes.search_text IS '제목 + 키워드 검색용 소문자 텍스트';
+COMMENT ON FUNCTION count_research_notes_by_stage IS '필터 조건별 연구단계 노트 수 (목록 통계 카드)';
@@ -0,0 +1,155 @@
+-- =============================================
+-- SDC Lab Dashboard - Global Search
+-- 연구원, 프로젝트, 멘토링, 연구노트, 공지사항, 논문 통합 검색 RPC
+-- =============================================
+
+-- 기존 globalSearch()는 테이블별 ilike '%q%' 3회를 순차 실행했고(인덱스 미사용),
+-- 연구노트/공지/논문은 검색되지 않았으며 결과 순위도 없었다.
+-- pg_trgm GIN 인덱스로 부분 일치를 인덱스 스캔으로 처리하고, 유사도 기반 점수로
+-- 하나의 정렬된 목록을 1회 왕복에 반환한다.
+-- 한국어는 'simple' tsvector로는 형태소 단위 검색이 되지 않으므로 trigram만 사용한다.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =============================================
+-- 1. Trigram 인덱스 (papers.title은 00026에서 생성됨)
+-- =============================================
+CREATE INDEX IF NOT EXISTS idx_members_name_trgm
+    ON members USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_research_projects_title_trgm
+    ON research_projects USING gin (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_mentoring_posts_content_trgm
+    ON mentoring_posts USING gin (content gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_research_notes_title_trgm
+    ON research_notes USING gin (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_research_notes_content_trgm
+    ON research_notes USING gin (content gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_announcements_title_trgm
+    ON announcements USING gin (title gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_announcements_content_trgm
+    ON announcements USING gin (content gin_trgm_ops);
+
+-- =============================================
+-- 2. 통합 검색 RPC
+-- =============================================
+-- SECURITY INVOKER: 호출한 사용자의 RLS가 그대로 적용된다.
+-- 점수: 제목 일치는 유사도 + 접두 일치 가산점, 본문만 일치하면 0.6배.
+CREATE OR REPLACE FUNCTION global_search(p_query TEXT, p_limit INTEGER DEFAULT 20)
+RETURNS TABLE (
+    type TEXT,
+    id UUID,
+    title TEXT,
+    subtitle TEXT,
+    href TEXT,
+    rank REAL
+) AS $$
+    WITH q AS (
+        SELECT
+            LOWER(btrim(p_query)) AS term,
+            '%' || replace(replace(replace(LOWER(btrim(p_query)), '\', '\\'), '%', '\%'), '_', '\_') || '%' AS pattern
+    ),
+    results AS (
+        -- 연구원
+        (SELECT
+            'member'::TEXT, m.id, m.name, m.position::TEXT,
+            '/members/' || m.id,
+            (word_similarity(q.term, LOWER(m.name))
+                + CASE WHEN LOWER(m.name) LIKE q.term || '%' THEN 0.5 ELSE 0 END)::REAL AS score
+        FROM members m, q
+        WHERE m.status = 'active'
+          AND m.name ILIKE q.pattern
+        ORDER BY score DESC
+        LIMIT p_limit)
+
+        UNION ALL
+
+        -- 연구 프로젝트
+        (SELECT
+            'project'::TEXT, rp.id, rp.title, COALESCE(rp.target_journal, rp.status::TEXT),
+            '/research/' || rp.id,
+            (word_similarity(q.term, LOWER(rp.title))
+                + CASE WHEN LOWER(rp.title) LIKE q.term || '%' THEN 0.5 ELSE 0 END)::REAL AS score
+        FROM research_projects rp, q
+        WHERE rp.title ILIKE q.pattern
+        ORDER BY score DESC
+        LIMIT p_limit)
+
+        UNION ALL
+
+        -- 멘토링 (본문 검색)
+        (SELECT
+            'mentoring'::TEXT, mp.id, '멘토링 (' || mp.meeting_date || ')',
+            CASE WHEN LENGTH(mp.content) > 50 THEN LEFT(mp.content, 50) || '...' ELSE mp.content END,
+            '/mentoring/' || mp.id,
+            (0.6 * word_similarity(q.term, LOWER(mp.content)))::REAL AS score
+        FROM mentoring_posts mp, q
+        WHERE mp.content ILIKE q.pattern
+        ORDER BY score DESC, mp.meeting_date DESC
+        LIMIT p_limit)
+
+        UNION ALL
+
+        -- 연구노트 (제목 또는 본문)
+        (SELECT
+            'research_note'::TEXT, rn.id, rn.title, rp.title,
+            '/research/' || rn.project_id,
+            (CASE
+                WHEN rn.title ILIKE q.pattern THEN
+                    word_similarity(q.term, LOWER(rn.title))
+                    + CASE WHEN LOWER(rn.title) LIKE q.term || '%' THEN 0.5 ELSE 0 END
+                ELSE 0.6 * word_similarity(q.term, LOWER(rn.content))
+            END)::REAL AS score
+        FROM research_notes rn
+        JOIN research_projects rp ON rp.id = rn.project_id, q
+        WHERE rn.title ILIKE q.pattern OR rn.content ILIKE q.pattern
+        ORDER BY score DESC, rn.created_at DESC
+        LIMIT p_limit)
+
+        UNION ALL
+
+        -- 공지사항 (만료되지 않은 것만)
+        (SELECT
+            'announcement'::TEXT, a.id, a.title,
+            CASE WHEN LENGTH(a.content) > 50 THEN LEFT(a.content, 50) || '...' ELSE a.content END,
+            '/announcements/' || a.id,
+            (CASE
+                WHEN a.title ILIKE q.pattern THEN
+                    word_similarity(q.term, LOWER(a.title))
+                    + CASE WHEN LOWER(a.title) LIKE q.term || '%' THEN 0.5 ELSE 0 END
+                ELSE 0.6 * word_similarity(q.term, LOWER(a.content))
+            END)::REAL AS score
+        FROM announcements a, q
+        WHERE (a.expires_at IS NULL OR a.expires_at > NOW())
+          AND (a.title ILIKE q.pattern OR a.content ILIKE q.pattern)
+        ORDER BY score DESC, a.created_at DESC
+        LIMIT p_limit)
+
+        UNION ALL
+
+        -- 논문 (숨김 제외)
+        (SELECT
+            'paper'::TEXT, pa.id, pa.title,
+            CONCAT_WS(' · ', pa.journal, pa.publication_year::TEXT),
+            COALESCE(pa.url, 'https://doi.org/' || pa.doi, '/research-map'),
+            (word_similarity(q.term, LOWER(pa.title))
+                + CASE WHEN LOWER(pa.title) LIKE q.term || '%' THEN 0.5 ELSE 0 END)::REAL AS score
+        FROM papers pa, q
+        WHERE pa.is_hidden = false
+          AND pa.title ILIKE q.pattern
+        ORDER BY score DESC, pa.citation_count DESC
+        LIMIT p_limit)
+    )
+    SELECT * FROM results
+    ORDER BY 6 DESC
+    LIMIT p_limit;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION global_search(TEXT, INTEGER) TO authenticated;
+
+COMMENT ON FUNCTION global_search IS '통합 검색: trigram 인덱스 기반 부분 일치 + 유사도 순위 (RLS 적용)';
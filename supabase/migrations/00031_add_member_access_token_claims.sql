@@ -0,0 +1,60 @@
+-- =============================================
+-- SDC Lab Dashboard - Member Access Token Claims
+-- access token에 멤버 정보(member claim)를 추가하는 custom access token hook
+-- =============================================
+
+-- 서버 액션마다 auth.getUser() + members 조회를 반복하지 않도록
+-- 토큰 발급 시점의 멤버 id/이름/직위/상태를 claim으로 넣어 둔다.
+-- getCurrentMember()(src/lib/cache/current-member.ts)는 claim이 있으면 DB 조회를 생략한다.
+-- 직위/상태 변경은 다음 토큰 갱신 시 반영된다.
+--
+-- 활성화: Supabase Dashboard > Authentication > Hooks > Customize Access Token
+--         에서 public.custom_access_token_hook 선택
+--         (로컬: supabase/config.toml의 [auth.hook.custom_access_token])
+
+CREATE OR REPLACE FUNCTION public.custom_access_token_hook(event JSONB)
+RETURNS JSONB AS $$
+DECLARE
+    v_claims JSONB := event->'claims';
+    v_user_id UUID := (event->>'user_id')::UUID;
+    v_member RECORD;
+BEGIN
+    -- members.id = auth.users.id가 기본, 이전 가입자는 user_id 또는 email로 연결
+    SELECT m.id, m.name, m.position, m.status
+    INTO v_member
+    FROM members m
+    WHERE m.id = v_user_id
+       OR m.user_id = v_user_id
+       OR m.email = v_claims->>'email'
+    ORDER BY (m.id = v_user_id) DESC, (m.user_id = v_user_id) DESC NULLS LAST
+    LIMIT 1;
+
+    IF FOUND THEN
+        v_claims := jsonb_set(v_claims, '{member}', jsonb_build_object(
+            'id', v_member.id,
+            'name', v_member.name,
+            'position', v_member.position,
+            'status', v_member.status
+        ));
+    ELSE
+        v_claims := v_claims - 'member';
+    END IF;
+
+    RETURN jsonb_set(event, '{claims}', v_claims);
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+GRANT USAGE ON SCHEMA public TO supabase_auth_admin;
+GRANT EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) TO supabase_auth_admin;
+REVOKE EXECUTE ON FUNCTION public.custom_access_token_hook(JSONB) FROM authenticated, anon, public;
+
+-- hook은 supabase_auth_admin 권한으로 실행되므로 members 조회 정책이 필요하다.
+GRANT SELECT ON TABLE members TO supabase_auth_admin;
+
+DROP POLICY IF EXISTS "Auth admin can read members for token claims" ON members;
+CREATE POLICY "Auth admin can read members for token claims"
+    ON members FOR SELECT
+    TO supabase_auth_admin
+    USING (true);
+
+COMMENT ON FUNCTION public.custom_access_token_hook IS 'access token에 member claim(id, name, position, status) 추가';
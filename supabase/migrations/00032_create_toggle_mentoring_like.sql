@@ -0,0 +1,176 @@
+-- =============================================
+-- SDC Lab Dashboard - Mentoring Like Toggle
+-- 좋아요 토글 RPC + 좋아요/댓글 수 비정규화
+-- =============================================
+
+-- 기존 toggleLike()는 사용자 확인 → 멤버 조회 → 좋아요 조회 → 삭제/추가 →
+-- 게시물 조회 → 알림 추가까지 4~6회 순차 왕복했고, 피드는 게시물마다 댓글을
+-- 모두 불러와 개수를 셌다.
+-- toggle_mentoring_like()가 한 트랜잭션에서 토글과 알림을 처리하고,
+-- likes_count/comments_count는 트리거로 유지한다.
+
+-- =============================================
+-- 1. 댓글 수 컬럼 + 기존 데이터 보정
+-- =============================================
+ALTER TABLE mentoring_posts
+    ADD COLUMN IF NOT EXISTS comments_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE mentoring_posts mp
+SET likes_count = COALESCE(l.cnt, 0),
+    comments_count = COALESCE(c.cnt, 0)
+FROM mentoring_posts p
+LEFT JOIN (
+    SELECT post_id, COUNT(*)::INTEGER AS cnt FROM mentoring_likes GROUP BY post_id
+) l ON l.post_id = p.id
+LEFT JOIN (
+    SELECT post_id, COUNT(*)::INTEGER AS cnt FROM mentoring_comments GROUP BY post_id
+) c ON c.post_id = p.id
+WHERE mp.id = p.id;
+
+-- =============================================
+-- 2. 카운터 트리거 (00006의 좋아요 트리거를 다시 보장)
+-- =============================================
+CREATE OR REPLACE FUNCTION update_likes_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE mentoring_posts
+        SET likes_count = likes_count + 1
+        WHERE id = NEW.post_id;
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE mentoring_posts
+        SET likes_count = GREATEST(likes_count - 1, 0)
+        WHERE id = OLD.post_id;
+        RETURN OLD;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trigger_update_likes_count ON mentoring_likes;
+CREATE TRIGGER trigger_update_likes_count
+    AFTER INSERT OR DELETE ON mentoring_likes
+    FOR EACH ROW
+    EXECUTE FUNCTION update_likes_count();
+
+CREATE OR REPLACE FUNCTION update_comments_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE mentoring_posts
+        SET comments_count = comments_count + 1
+        WHERE id = NEW.post_id;
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE mentoring_posts
+        SET comments_count = GREATEST(comments_count - 1, 0)
+        WHERE id = OLD.post_id;
+        RETURN OLD;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trigger_update_comments_count ON mentoring_comments;
+CREATE TRIGGER trigger_update_comments_count
+    AFTER INSERT OR DELETE ON mentoring_comments
+    FOR EACH ROW
+    EXECUTE FUNCTION update_comments_count();
+
+-- 카운터 변경으로 updated_at이 바뀌지 않도록 내용 컬럼이 바뀔 때만 갱신
+DROP TRIGGER IF EXISTS update_mentoring_posts_updated_at ON mentoring_posts;
+CREATE TRIGGER update_mentoring_posts_updated_at
+    BEFORE UPDATE OF author_id, meeting_date, content, professor_comment, next_steps
+    ON mentoring_posts
+    FOR EACH ROW
+    EXECUTE FUNCTION update_updated_at_column();
+
+-- =============================================
+-- 3. 알림 트리거 정리
+-- =============================================
+-- 좋아요 알림은 toggle_mentoring_like()에서 생성한다. (트리거와 중복 방지)
+DROP TRIGGER IF EXISTS trigger_create_like_notification ON mentoring_likes;
+
+-- 댓글 알림은 00006 트리거가 담당 (서버 액션의 중복 INSERT 제거)
+DROP TRIGGER IF EXISTS trigger_create_comment_notification ON mentoring_comments;
+CREATE TRIGGER trigger_create_comment_notification
+    AFTER INSERT ON mentoring_comments
+    FOR EACH ROW
+    EXECUTE FUNCTION create_comment_notification();
+
+-- =============================================
+-- 4. 좋아요 토글 RPC
+-- =============================================
+-- SECURITY DEFINER: 호출자는 auth.uid()로만 식별되며, 항상 자신의 좋아요만 토글한다.
+-- 삭제를 먼저 시도하고 없으면 INSERT ... ON CONFLICT로 추가하므로
+-- 동시 클릭에도 UNIQUE(post_id, member_id)가 중복을 막는다.
+CREATE OR REPLACE FUNCTION toggle_mentoring_like(p_post_id UUID)
+RETURNS JSONB AS $$
+DECLARE
+    v_member_id UUID;
+    v_member_name TEXT;
+    v_author_id UUID;
+    v_liked BOOLEAN;
+    v_likes_count INTEGER;
+BEGIN
+    -- members.id = auth.uid()가 기본, 이전 가입자는 user_id로 연결
+    SELECT m.id, m.name
+    INTO v_member_id, v_member_name
+    FROM members m
+    WHERE m.id = auth.uid() OR m.user_id = auth.uid()
+    ORDER BY (m.id = auth.uid()) DESC
+    LIMIT 1;
+
+    IF v_member_id IS NULL THEN
+        RAISE EXCEPTION 'member not found' USING ERRCODE = '42501';
+    END IF;
+
+    SELECT author_id INTO v_author_id
+    FROM mentoring_posts
+    WHERE id = p_post_id;
+
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'post not found' USING ERRCODE = 'P0002';
+    END IF;
+
+    DELETE FROM mentoring_likes
+    WHERE post_id = p_post_id AND member_id = v_member_id;
+
+    IF FOUND THEN
+        v_liked := false;
+    ELSE
+        INSERT INTO mentoring_likes (post_id, member_id)
+        VALUES (p_post_id, v_member_id)
+        ON CONFLICT (post_id, member_id) DO NOTHING;
+
+        v_liked := true;
+
+        -- 새로 추가된 경우에만, 본인 게시물이 아니면 작성자에게 알림
+        IF FOUND AND v_author_id <> v_member_id THEN
+            INSERT INTO notifications (member_id, type, title, message, link, is_read)
+            VALUES (
+                v_author_id,
+                'like',
+                '좋아요',
+                v_member_name || '님이 회원님의 게시물을 좋아합니다.',
+                '/mentoring/' || p_post_id,
+                false
+            );
+        END IF;
+    END IF;
+
+    SELECT likes_count INTO v_likes_count
+    FROM mentoring_posts
+    WHERE id = p_post_id;
+
+    RETURN jsonb_build_object('liked', v_liked, 'likes_count', v_likes_count);
+END;
+$$ LANGUAGE plpgsql VOLATILE SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION toggle_mentoring_like(UUID) FROM public, anon;
+GRANT EXECUTE ON FUNCTION toggle_mentoring_like(UUID) TO authenticated;
+
+COMMENT ON COLUMN mentoring_posts.comments_count IS '댓글 수 (트리거로 자동 계산)';
+COMMENT ON FUNCTION update_comments_count IS '댓글 추가/삭제 시 카운트 자동 업데이트';
+COMMENT ON FUNCTION toggle_mentoring_like IS '멘토링 좋아요 토글 (1회 왕복, 작성자 알림 포함)';
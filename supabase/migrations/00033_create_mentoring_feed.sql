@@ -0,0 +1,91 @@
+-- =============================================
+-- SDC Lab Dashboard - Mentoring Feed
+-- (meeting_date, id) 키셋 페이지네이션 피드 RPC
+-- =============================================
+
+-- 기존 멘토링 목록은 모든 게시물을 댓글 전체와 함께 한 번에 불러오고,
+-- 게시물마다 좋아요 여부를 따로 조회했다(N+1).
+-- get_mentoring_feed()는 커서 이후 한 페이지만, 본문 미리보기와
+-- 비정규화된 카운트(00032), 최근 댓글 2개, 내 좋아요 여부를 1회 왕복으로 반환한다.
+
+-- 키셋 정렬 인덱스
+CREATE INDEX IF NOT EXISTS idx_mentoring_posts_feed
+    ON mentoring_posts (meeting_date DESC, id DESC);
+
+-- SECURITY INVOKER: 호출한 사용자의 RLS가 그대로 적용된다.
+-- 커서: 이전 페이지 마지막 게시물의 (meeting_date, id). 첫 페이지는 NULL.
+CREATE OR REPLACE FUNCTION get_mentoring_feed(
+    p_cursor_date DATE DEFAULT NULL,
+    p_cursor_id UUID DEFAULT NULL,
+    p_limit INTEGER DEFAULT 10,
+    p_search TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    meeting_date DATE,
+    content_preview TEXT,
+    next_steps TEXT[],
+    next_steps_count INTEGER,
+    likes_count INTEGER,
+    comments_count INTEGER,
+    user_liked BOOLEAN,
+    created_at TIMESTAMPTZ,
+    author JSONB,
+    recent_comments JSONB
+) AS $$
+    WITH page AS (
+        SELECT mp.*
+        FROM mentoring_posts mp
+        WHERE (
+                p_cursor_date IS NULL
+                OR (mp.meeting_date, mp.id) < (p_cursor_date, p_cursor_id)
+              )
+          AND (
+                p_search IS NULL OR btrim(p_search) = ''
+                OR mp.content ILIKE '%' || replace(replace(replace(btrim(p_search), '\', '\\'), '%', '\%'), '_', '\_') || '%'
+              )
+        ORDER BY mp.meeting_date DESC, mp.id DESC
+        LIMIT LEAST(GREATEST(p_limit, 1), 50)
+    )
+    SELECT
+        p.id,
+        p.meeting_date,
+        CASE WHEN LENGTH(p.content) > 400 THEN LEFT(p.content, 400) || '...' ELSE p.content END,
+        p.next_steps[1:3],
+        COALESCE(array_length(p.next_steps, 1), 0),
+        p.likes_count,
+        p.comments_count,
+        EXISTS (
+            SELECT 1 FROM mentoring_likes ml
+            WHERE ml.post_id = p.id AND ml.member_id = auth.uid()
+        ),
+        p.created_at,
+        jsonb_build_object(
+            'id', a.id,
+            'name', a.name,
+            'position', a.position,
+            'avatar_url', a.avatar_url
+        ),
+        COALESCE((
+            SELECT jsonb_agg(c ORDER BY c.created_at)
+            FROM (
+                SELECT
+                    mc.id,
+                    mc.content,
+                    mc.created_at,
+                    jsonb_build_object('id', ca.id, 'name', ca.name, 'avatar_url', ca.avatar_url) AS author
+                FROM mentoring_comments mc
+                LEFT JOIN members ca ON ca.id = mc.author_id
+                WHERE mc.post_id = p.id
+                ORDER BY mc.created_at
+                LIMIT 2
+            ) c
+        ), '[]'::jsonb)
+    FROM page p
+    LEFT JOIN members a ON a.id = p.author_id
+    ORDER BY p.meeting_date DESC, p.id DESC;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION get_mentoring_feed(DATE, UUID, INTEGER, TEXT) TO authenticated;
+
+COMMENT ON FUNCTION get_mentoring_feed IS '멘토링 피드: (meeting_date, id) 키셋 페이지네이션, 요약 + 카운트 + 내 좋아요 여부';
@@ -0,0 +1,96 @@
+-- =============================================
+-- SDC Lab Dashboard - Peer Review Cache
+-- 내용 해시 기반 리뷰 재사용 + 사용량(캐시 적중/절약 토큰) 기록
+-- =============================================
+
+-- 같은(또는 거의 같은) 원고를 다시 제출해도 매번 8192 토큰 호출을 했다.
+-- content_hash = sha256(프롬프트 버전 + 모델 + 정규화된 제목/내용)
+-- (src/lib/peer-review/cache.ts)로 완료된 리뷰를 찾아 즉시 재사용하고,
+-- 거의 같은 원고는 변경된 부분만 리뷰한다.
+
+-- =============================================
+-- 1. peer_reviews 캐시 컬럼
+-- =============================================
+ALTER TABLE peer_reviews
+    ADD COLUMN IF NOT EXISTS content_hash TEXT,
+    ADD COLUMN IF NOT EXISTS prompt_version TEXT,
+    ADD COLUMN IF NOT EXISTS cache_source TEXT NOT NULL DEFAULT 'model'
+        CHECK (cache_source IN ('model', 'exact', 'delta')),
+    ADD COLUMN IF NOT EXISTS source_review_id UUID REFERENCES peer_reviews(id) ON DELETE SET NULL,
+    ADD COLUMN IF NOT EXISTS input_tokens INTEGER,
+    ADD COLUMN IF NOT EXISTS output_tokens INTEGER;
+
+-- 본인의 완료된 리뷰 중 같은 해시 조회
+CREATE INDEX IF NOT EXISTS idx_peer_reviews_content_hash
+    ON peer_reviews (member_id, content_hash)
+    WHERE review_status = 'completed';
+
+-- =============================================
+-- 2. 사용량 기록
+-- =============================================
+-- peer_reviews는 매월 이전 기록이 삭제되므로 통계는 별도 테이블에 남긴다.
+CREATE TABLE IF NOT EXISTS peer_review_usage (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    review_id UUID REFERENCES peer_reviews(id) ON DELETE SET NULL,
+    member_id UUID REFERENCES members(id) ON DELETE SET NULL,
+    cache_source TEXT NOT NULL CHECK (cache_source IN ('model', 'exact', 'delta')),
+    input_tokens INTEGER NOT NULL DEFAULT 0,
+    output_tokens INTEGER NOT NULL DEFAULT 0,
+    tokens_saved INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_peer_review_usage_created_at
+    ON peer_review_usage (created_at DESC);
+
+ALTER TABLE peer_review_usage ENABLE ROW LEVEL SECURITY;
+
+-- 기록은 서버(service role)만 추가하고, 조회는 교수만 가능
+DROP POLICY IF EXISTS "Admins can view peer review usage" ON peer_review_usage;
+CREATE POLICY "Admins can view peer review usage"
+    ON peer_review_usage FOR SELECT
+    TO authenticated
+    USING (
+        EXISTS (
+            SELECT 1 FROM members
+            WHERE (id = auth.uid() OR user_id = auth.uid())
+              AND position = 'professor'
+        )
+    );
+
+-- =============================================
+-- 3. 관리자 통계 RPC
+-- =============================================
+-- SECURITY INVOKER: 교수가 아니면 RLS로 0건이 집계된다.
+CREATE OR REPLACE FUNCTION get_peer_review_cache_stats(p_since TIMESTAMPTZ DEFAULT NULL)
+RETURNS TABLE (
+    total_requests INTEGER,
+    model_requests INTEGER,
+    exact_hits INTEGER,
+    delta_hits INTEGER,
+    hit_rate NUMERIC,
+    input_tokens BIGINT,
+    output_tokens BIGINT,
+    tokens_saved BIGINT
+) AS $$
+    SELECT
+        COUNT(*)::INTEGER,
+        COUNT(*) FILTER (WHERE u.cache_source = 'model')::INTEGER,
+        COUNT(*) FILTER (WHERE u.cache_source = 'exact')::INTEGER,
+        COUNT(*) FILTER (WHERE u.cache_source = 'delta')::INTEGER,
+        CASE WHEN COUNT(*) = 0 THEN 0
+             ELSE ROUND(COUNT(*) FILTER (WHERE u.cache_source <> 'model')::NUMERIC / COUNT(*), 4)
+        END,
+        COALESCE(SUM(u.input_tokens), 0),
+        COALESCE(SUM(u.output_tokens), 0),
+        COALESCE(SUM(u.tokens_saved), 0)
+    FROM peer_review_usage u
+    WHERE p_since IS NULL OR u.created_at >= p_since;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION get_peer_review_cache_stats(TIMESTAMPTZ) TO authenticated;
+
+COMMENT ON COLUMN peer_reviews.content_hash IS '정규화된 제목+내용+프롬프트 버전의 sha256 (캐시 키)';
+COMMENT ON COLUMN peer_reviews.cache_source IS 'model: 전체 생성, exact: 동일 원고 재사용, delta: 변경 부분만 생성';
+COMMENT ON TABLE peer_review_usage IS 'AI 동료 심사 요청별 토큰 사용량/캐시 적중 기록 (월별 삭제 대상 아님)';
+COMMENT ON FUNCTION get_peer_review_cache_stats IS 'AI 동료 심사 캐시 적중률 및 절약 토큰 (교수 전용)';
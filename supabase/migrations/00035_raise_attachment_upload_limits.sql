@@ -0,0 +1,13 @@
+-- =============================================
+-- SDC Lab Dashboard - Attachment Upload Limits
+-- 연구노트/멘토링 첨부파일 버킷 크기 제한 상향 (10MB → 50MB)
+-- =============================================
+
+-- 첨부파일은 서버 액션 본문 대신 브라우저에서 Storage로 직접 업로드(TUS resumable)하므로
+-- Next.js 함수 본문 크기와 무관하게 버킷 제한만 맞추면 된다.
+-- src/lib/storage/upload-policy.ts의 MAX_ATTACHMENT_SIZE와 같은 값을 유지한다.
+-- (프로젝트 설정의 전역 업로드 제한도 50MB 이상이어야 한다)
+
+UPDATE storage.buckets
+SET file_size_limit = 52428800 -- 50MB
+WHERE id IN ('research-notes', 'mentoring-files');
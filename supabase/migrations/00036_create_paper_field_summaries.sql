@@ -0,0 +1,140 @@
+-- =============================================
+-- SDC Lab Dashboard - Paper Field Summaries
+-- 연구분야별 논문 요약 (연구 지도용 materialized view)
+-- =============================================
+
+-- 연구 지도는 분야별 요약 노드만 그리는데, 기존 usePapers()는 상위 500편 논문과
+-- paper_field_links를 모두 내려받아 브라우저에서 집계했다.
+-- 분야별 논문 수, 인용 상위 논문, 주요 저널, 연도별 분포를 미리 계산해 두고
+-- get_paper_field_summaries() 한 번으로 수 KB만 내려보낸다.
+-- 갱신 시점: 논문 자동 검색(/api/papers/fetch) 완료 후, 논문 숨김 여부 변경 시
+
+CREATE MATERIALIZED VIEW paper_field_summaries AS
+WITH visible_links AS (
+    SELECT pfl.field_id, p.*
+    FROM paper_field_links pfl
+    JOIN papers p ON p.id = pfl.paper_id
+    WHERE p.is_hidden = false
+)
+SELECT
+    rf.id AS field_id,
+    rf.name AS field_name,
+    rf.map_node_id,
+    (SELECT COUNT(*)::INTEGER FROM visible_links vl WHERE vl.field_id = rf.id) AS paper_count,
+    COALESCE((
+        SELECT jsonb_agg(
+            jsonb_build_object(
+                'title', t.title,
+                'journal', t.journal,
+                'publication_year', t.publication_year,
+                'citation_count', t.citation_count,
+                'doi', t.doi
+            )
+            ORDER BY t.citation_count DESC, t.id
+        )
+        FROM (
+            SELECT vl.id, vl.title, vl.journal, vl.publication_year, vl.citation_count, vl.doi
+            FROM visible_links vl
+            WHERE vl.field_id = rf.id
+            ORDER BY vl.citation_count DESC, vl.id
+            LIMIT 5
+        ) t
+    ), '[]'::jsonb) AS top_papers,
+    COALESCE((
+        SELECT array_agg(j.journal ORDER BY j.cnt DESC, j.journal)
+        FROM (
+            SELECT vl.journal, COUNT(*) AS cnt
+            FROM visible_links vl
+            WHERE vl.field_id = rf.id AND vl.journal IS NOT NULL
+            GROUP BY vl.journal
+            ORDER BY cnt DESC, vl.journal
+            LIMIT 3
+        ) j
+    ), '{}'::TEXT[]) AS top_journals,
+    COALESCE((
+        SELECT jsonb_object_agg(y.publication_year::TEXT, y.cnt ORDER BY y.publication_year)
+        FROM (
+            SELECT vl.publication_year, COUNT(*)::INTEGER AS cnt
+            FROM visible_links vl
+            WHERE vl.field_id = rf.id AND vl.publication_year IS NOT NULL
+            GROUP BY vl.publication_year
+        ) y
+    ), '{}'::jsonb) AS year_histogram,
+    now() AS refreshed_at
+FROM research_fields rf
+WHERE rf.is_active = true;
+
+-- REFRESH ... CONCURRENTLY에 필요한 유니크 인덱스
+CREATE UNIQUE INDEX idx_paper_field_summaries_field
+    ON paper_field_summaries (field_id);
+
+-- materialized view에는 RLS가 적용되지 않으므로 직접 조회는 막고 RPC로만 노출한다.
+REVOKE ALL ON paper_field_summaries FROM anon, authenticated;
+
+-- =============================================
+-- 조회 RPC
+-- =============================================
+-- 숨김 논문은 view 단계에서 제외되므로 RLS "Authenticated users can read visible papers"와 같은 범위다.
+CREATE OR REPLACE FUNCTION get_paper_field_summaries()
+RETURNS TABLE (
+    field_id UUID,
+    field_name TEXT,
+    map_node_id TEXT,
+    paper_count INTEGER,
+    top_papers JSONB,
+    top_journals TEXT[],
+    year_histogram JSONB,
+    refreshed_at TIMESTAMPTZ
+) AS $$
+    SELECT
+        s.field_id,
+        s.field_name,
+        s.map_node_id,
+        s.paper_count,
+        s.top_papers,
+        s.top_journals,
+        s.year_histogram,
+        s.refreshed_at
+    FROM paper_field_summaries s
+    WHERE s.paper_count > 0
+    ORDER BY s.paper_count DESC;
+$$ LANGUAGE sql STABLE SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION get_paper_field_summaries() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION get_paper_field_summaries() TO authenticated;
+
+COMMENT ON FUNCTION get_paper_field_summaries() IS
+    '연구분야별 논문 요약(논문 수, 인용 상위 5편, 주요 저널 3개, 연도별 분포)을 반환';
+
+-- =============================================
+-- 갱신
+-- =============================================
+-- CONCURRENTLY: 갱신 중에도 연구 지도 조회가 막히지 않는다.
+CREATE OR REPLACE FUNCTION refresh_paper_field_summaries()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY paper_field_summaries;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- 논문 자동 검색 라우트(서비스 롤)에서만 호출
+REVOKE EXECUTE ON FUNCTION refresh_paper_field_summaries() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_paper_field_summaries() TO service_role;
+
+COMMENT ON FUNCTION refresh_paper_field_summaries() IS
+    'paper_field_summaries 재계산 (논문 자동 검색 완료 후 호출)';
+
+-- 논문 숨김/표시 변경은 관리 화면과 /api/papers PATCH 양쪽에서 일어나므로 트리거로 갱신한다.
+-- 문장 단위 트리거라 여러 행을 한 번에 바꿔도 한 번만 갱신한다.
+-- 자동 검색의 upsert는 is_hidden을 SET하지 않으므로 이 트리거를 발생시키지 않는다.
+CREATE OR REPLACE FUNCTION refresh_paper_field_summaries_on_hide()
+RETURNS TRIGGER AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY paper_field_summaries;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+CREATE TRIGGER refresh_paper_field_summaries_on_hide
+    AFTER UPDATE OF is_hidden ON papers
+    FOR EACH STATEMENT EXECUTE FUNCTION refresh_paper_field_summaries_on_hide();
@@ -0,0 +1,61 @@
+-- =============================================
+-- SDC Lab Dashboard - Progress Log Rollup
+-- 보고서 자동 생성용 추진경과 집계 RPC
+-- =============================================
+
+-- 보고서 자동 생성 대화상자는 기간 내 progress_logs 전체(select *, 설명 포함)를 받아
+-- 브라우저에서 하위과제/열마다 다시 필터링했다.
+-- get_progress_log_rollup()은 하위과제 × 기간 단위 × 유형 × 상태별로
+-- 건수, 투입 시간 합계, 항목 목록(id/제목/날짜/담당자)만 돌려준다.
+-- 조회 범위는 기존 idx_progress_logs_project_date (project_id, log_date) 인덱스를 탄다.
+
+-- 기간 단위: 'week' (ISO 주, 월요일 시작) | 'month' | 'quarter' | 'range' (조회 기간 전체 한 칸)
+-- SECURITY INVOKER: progress_logs RLS가 그대로 적용된다.
+CREATE OR REPLACE FUNCTION get_progress_log_rollup(
+    p_project_id UUID,
+    p_start_date DATE,
+    p_end_date DATE,
+    p_period TEXT DEFAULT 'range'
+)
+RETURNS TABLE (
+    sub_project_id UUID,
+    period_start DATE,
+    log_type progress_log_type,
+    status progress_log_status,
+    log_count INTEGER,
+    hours_spent NUMERIC,
+    items JSONB
+) AS $$
+    SELECT
+        pl.sub_project_id,
+        CASE p_period
+            WHEN 'week' THEN date_trunc('week', pl.log_date)::DATE
+            WHEN 'month' THEN date_trunc('month', pl.log_date)::DATE
+            WHEN 'quarter' THEN date_trunc('quarter', pl.log_date)::DATE
+            ELSE p_start_date
+        END AS period_start,
+        pl.log_type,
+        pl.status,
+        COUNT(*)::INTEGER AS log_count,
+        COALESCE(SUM(pl.hours_spent), 0) AS hours_spent,
+        jsonb_agg(
+            jsonb_build_object(
+                'id', pl.id,
+                'title', pl.title,
+                'log_date', pl.log_date,
+                'assignee_name', COALESCE(m.name, pl.assignee_name)
+            )
+            ORDER BY pl.log_date, pl.created_at
+        ) AS items
+    FROM progress_logs pl
+    LEFT JOIN members m ON m.id = pl.assignee_id
+    WHERE pl.project_id = p_project_id
+      AND pl.log_date BETWEEN p_start_date AND p_end_date
+    GROUP BY 1, 2, 3, 4
+    ORDER BY 2, 1, 3, 4;
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION get_progress_log_rollup(UUID, DATE, DATE, TEXT) TO authenticated;
+
+COMMENT ON FUNCTION get_progress_log_rollup(UUID, DATE, DATE, TEXT) IS
+    '프로젝트 추진경과를 하위과제 × 기간 단위 × 유형 × 상태별로 집계 (보고서 자동 생성용)';
@@ -0,0 +1,213 @@
+-- =============================================
+-- SDC Lab Dashboard - Progress Rollups
+-- 추진경과 주간 집계 테이블 (트리거로 증분 유지)
+-- =============================================
+
+-- 보고서/추진경과 화면은 기간이 바뀔 때마다 progress_logs 원본을 다시 집계했다.
+-- 연간 보고서처럼 긴 기간은 전체 이력을 매번 훑는다.
+-- progress_rollups는 (프로젝트, 하위과제, 담당자, ISO 주) 단위 건수/투입 시간을
+-- progress_logs 변경 시 트리거로 더하고 빼서 유지한다.
+--
+-- 주가 두 달에 걸치는 경우 월/분기 합계가 정확하도록 행을 (주, 월)로 한 번 더 나눈다.
+-- 한 행은 "주 ∩ 월" 구간(GREATEST(week_start, month_start) ~ 주 끝/월 끝 중 이른 날)을 덮고,
+-- 주 합계는 week_start로, 월·분기 합계는 month_start로 묶어 구한다.
+
+CREATE TABLE progress_rollups (
+  project_id UUID NOT NULL,
+  sub_project_id UUID,
+  assignee_id UUID,
+  week_start DATE NOT NULL,             -- ISO 주 시작 (월요일)
+  month_start DATE NOT NULL,
+  log_type progress_log_type NOT NULL,
+  status progress_log_status NOT NULL,
+  log_count INTEGER NOT NULL DEFAULT 0,
+  hours_spent NUMERIC(8,1) NOT NULL DEFAULT 0,
+  updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+  CONSTRAINT progress_rollups_key UNIQUE NULLS NOT DISTINCT (
+    project_id, sub_project_id, assignee_id, week_start, month_start, log_type, status
+  )
+);
+
+-- 외래 키를 두지 않는다. 프로젝트 삭제(CASCADE)나 하위과제/담당자 삭제(SET NULL)도
+-- progress_logs의 DELETE/UPDATE로 나타나므로 아래 트리거가 집계를 옮기거나 지운다.
+
+ALTER TABLE progress_rollups ENABLE ROW LEVEL SECURITY;
+
+-- progress_logs와 같은 읽기 범위. 쓰기는 트리거(SECURITY DEFINER)만 한다.
+CREATE POLICY "Authenticated users can read progress_rollups"
+  ON progress_rollups FOR SELECT
+  TO authenticated
+  USING (true);
+
+CREATE INDEX idx_progress_rollups_project_week ON progress_rollups (project_id, week_start);
+CREATE INDEX idx_progress_rollups_assignee_week ON progress_rollups (assignee_id, week_start);
+
+-- =============================================
+-- 증분 반영
+-- =============================================
+CREATE OR REPLACE FUNCTION apply_progress_rollup(
+  p_log progress_logs,
+  p_sign INTEGER
+)
+RETURNS VOID AS $$
+BEGIN
+  INSERT INTO progress_rollups (
+    project_id, sub_project_id, assignee_id, week_start, month_start,
+    log_type, status, log_count, hours_spent
+  )
+  VALUES (
+    p_log.project_id,
+    p_log.sub_project_id,
+    p_log.assignee_id,
+    date_trunc('week', p_log.log_date)::DATE,
+    date_trunc('month', p_log.log_date)::DATE,
+    p_log.log_type,
+    p_log.status,
+    p_sign,
+    p_sign * COALESCE(p_log.hours_spent, 0)
+  )
+  ON CONFLICT ON CONSTRAINT progress_rollups_key DO UPDATE
+  SET log_count = progress_rollups.log_count + EXCLUDED.log_count,
+      hours_spent = progress_rollups.hours_spent + EXCLUDED.hours_spent,
+      updated_at = now();
+
+  IF p_sign < 0 THEN
+    DELETE FROM progress_rollups
+    WHERE log_count <= 0
+      AND project_id = p_log.project_id
+      AND sub_project_id IS NOT DISTINCT FROM p_log.sub_project_id
+      AND assignee_id IS NOT DISTINCT FROM p_log.assignee_id
+      AND week_start = date_trunc('week', p_log.log_date)::DATE
+      AND month_start = date_trunc('month', p_log.log_date)::DATE
+      AND log_type = p_log.log_type
+      AND status = p_log.status;
+  END IF;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION apply_progress_rollup(progress_logs, INTEGER) FROM PUBLIC;
+
+CREATE OR REPLACE FUNCTION sync_progress_rollups()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF TG_OP IN ('UPDATE', 'DELETE') THEN
+    PERFORM apply_progress_rollup(OLD, -1);
+  END IF;
+  IF TG_OP IN ('INSERT', 'UPDATE') THEN
+    PERFORM apply_progress_rollup(NEW, 1);
+  END IF;
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- 제목/설명만 바뀐 UPDATE는 집계에 영향이 없으므로 집계 키/시간 컬럼이 바뀔 때만 실행
+CREATE TRIGGER sync_progress_rollups_insert_delete
+  AFTER INSERT OR DELETE ON progress_logs
+  FOR EACH ROW EXECUTE FUNCTION sync_progress_rollups();
+
+CREATE TRIGGER sync_progress_rollups_update
+  AFTER UPDATE OF project_id, sub_project_id, assignee_id, log_date, log_type, status, hours_spent
+  ON progress_logs
+  FOR EACH ROW EXECUTE FUNCTION sync_progress_rollups();
+
+-- 기존 데이터 채우기
+INSERT INTO progress_rollups (
+  project_id, sub_project_id, assignee_id, week_start, month_start,
+  log_type, status, log_count, hours_spent
+)
+SELECT
+  project_id,
+  sub_project_id,
+  assignee_id,
+  date_trunc('week', log_date)::DATE,
+  date_trunc('month', log_date)::DATE,
+  log_type,
+  status,
+  COUNT(*),
+  COALESCE(SUM(hours_spent), 0)
+FROM progress_logs
+GROUP BY 1, 2, 3, 4, 5, 6, 7;
+
+-- =============================================
+-- 기간 집계 조회
+-- =============================================
+-- 기간에 완전히 포함된 (주 ∩ 월) 구간은 progress_rollups에서, 양 끝의 걸친 구간만
+-- progress_logs 원본에서 읽어 임의 기간도 정확하게 집계한다.
+-- p_granularity: 'week' | 'month' | 'quarter' | 'range' (period_start 기준으로 묶음)
+-- SECURITY INVOKER: 두 테이블의 RLS가 그대로 적용된다.
+CREATE OR REPLACE FUNCTION get_progress_summary(
+  p_start_date DATE,
+  p_end_date DATE,
+  p_granularity TEXT DEFAULT 'month',
+  p_project_id UUID DEFAULT NULL,
+  p_assignee_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+  project_id UUID,
+  sub_project_id UUID,
+  assignee_id UUID,
+  period_start DATE,
+  log_type progress_log_type,
+  status progress_log_status,
+  log_count INTEGER,
+  hours_spent NUMERIC
+) AS $$
+  WITH segments AS (
+    -- 기간 안에 완전히 들어가는 집계 구간
+    SELECT
+      r.project_id, r.sub_project_id, r.assignee_id,
+      r.week_start, r.month_start, r.log_type, r.status,
+      r.log_count, r.hours_spent
+    FROM progress_rollups r
+    WHERE (p_project_id IS NULL OR r.project_id = p_project_id)
+      AND (p_assignee_id IS NULL OR r.assignee_id = p_assignee_id)
+      AND r.week_start <= p_end_date
+      AND r.week_start + 6 >= p_start_date
+      AND GREATEST(r.week_start, r.month_start) >= p_start_date
+      AND LEAST(r.week_start + 6, (r.month_start + INTERVAL '1 month')::DATE - 1) <= p_end_date
+
+    UNION ALL
+
+    -- 기간 경계에 걸친 구간은 원본에서
+    SELECT
+      pl.project_id, pl.sub_project_id, pl.assignee_id,
+      date_trunc('week', pl.log_date)::DATE, date_trunc('month', pl.log_date)::DATE,
+      pl.log_type, pl.status,
+      1, COALESCE(pl.hours_spent, 0)
+    FROM progress_logs pl
+    WHERE (p_project_id IS NULL OR pl.project_id = p_project_id)
+      AND (p_assignee_id IS NULL OR pl.assignee_id = p_assignee_id)
+      AND pl.log_date BETWEEN p_start_date AND p_end_date
+      AND NOT (
+        GREATEST(date_trunc('week', pl.log_date)::DATE, date_trunc('month', pl.log_date)::DATE) >= p_start_date
+        AND LEAST(
+          date_trunc('week', pl.log_date)::DATE + 6,
+          (date_trunc('month', pl.log_date) + INTERVAL '1 month')::DATE - 1
+        ) <= p_end_date
+      )
+  )
+  SELECT
+    s.project_id,
+    s.sub_project_id,
+    s.assignee_id,
+    CASE p_granularity
+      WHEN 'week' THEN s.week_start
+      WHEN 'month' THEN s.month_start
+      WHEN 'quarter' THEN date_trunc('quarter', s.month_start)::DATE
+      ELSE p_start_date
+    END AS period_start,
+    s.log_type,
+    s.status,
+    SUM(s.log_count)::INTEGER AS log_count,
+    SUM(s.hours_spent) AS hours_spent
+  FROM segments s
+  GROUP BY 1, 2, 3, 4, 5, 6
+  ORDER BY 4, 1, 2, 3, 5, 6;
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION get_progress_summary(DATE, DATE, TEXT, UUID, UUID) TO authenticated;
+
+COMMENT ON TABLE progress_rollups IS
+  '추진경과 (프로젝트, 하위과제, 담당자, 주∩월, 유형, 상태)별 건수/투입 시간 — progress_logs 트리거로 유지';
+COMMENT ON FUNCTION get_progress_summary(DATE, DATE, TEXT, UUID, UUID) IS
+  '임의 기간의 추진경과 집계 (주/월/분기/전체). 내부 구간은 progress_rollups, 경계 구간만 원본 사용';
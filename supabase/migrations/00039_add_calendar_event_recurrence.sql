@@ -0,0 +1,93 @@
+-- =============================================
+-- SDC Lab Dashboard - Calendar Event Recurrence
+-- 반복 일정 (RRULE) 및 회차 예외
+-- =============================================
+
+-- 주간 랩 미팅/세미나를 회차마다 한 행씩 손으로 만들던 것을 시리즈 한 행으로 저장한다.
+-- 회차는 조회 구간에 대해서만 서버(src/lib/calendar/recurrence.ts)에서 전개한다.
+--
+-- rrule          : RFC 5545 RRULE 본문 (예: FREQ=WEEKLY;BYDAY=MO). NULL이면 단일 일정
+-- recurrence_end : 마지막 회차 종료 시각 (COUNT/UNTIL로 계산, 끝이 없으면 NULL) — 앱에서 저장 시 계산
+-- series_range   : 시리즈가 걸친 전체 구간. 조회 구간과 겹치는 시리즈만 GiST 인덱스로 찾는다
+
+ALTER TABLE calendar_events
+    ADD COLUMN rrule TEXT,
+    ADD COLUMN recurrence_end TIMESTAMPTZ;
+
+ALTER TABLE calendar_events
+    ADD COLUMN series_range TSTZRANGE GENERATED ALWAYS AS (
+        CASE WHEN rrule IS NOT NULL
+            THEN tstzrange(start_date, COALESCE(recurrence_end, 'infinity'::TIMESTAMPTZ), '[]')
+        END
+    ) STORED;
+
+CREATE INDEX idx_calendar_events_series_range
+    ON calendar_events USING GIST (series_range)
+    WHERE rrule IS NOT NULL;
+
+-- 단일 일정 구간 조회용 (기존 idx_calendar_events_dates는 반복 시리즈까지 포함)
+CREATE INDEX idx_calendar_events_single_start
+    ON calendar_events (start_date)
+    WHERE rrule IS NULL;
+
+-- =============================================
+-- calendar_event_exceptions (회차 취소/변경)
+-- =============================================
+-- original_start: 규칙상 원래 회차 시작 시각. 전개 시 이 값으로 회차를 찾는다.
+CREATE TABLE calendar_event_exceptions (
+    event_id UUID NOT NULL REFERENCES calendar_events(id) ON DELETE CASCADE,
+    original_start TIMESTAMPTZ NOT NULL,
+    is_cancelled BOOLEAN NOT NULL DEFAULT FALSE,
+    start_date TIMESTAMPTZ,
+    end_date TIMESTAMPTZ,
+    title TEXT,
+    description TEXT,
+    created_by UUID REFERENCES members(id) ON DELETE SET NULL,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (event_id, original_start)
+);
+
+ALTER TABLE calendar_event_exceptions ENABLE ROW LEVEL SECURITY;
+
+-- 시리즈를 볼 수 있으면 예외도 볼 수 있다 (calendar_events RLS를 그대로 따름)
+CREATE POLICY "Users can view exceptions of visible events"
+    ON calendar_event_exceptions FOR SELECT
+    TO authenticated
+    USING (
+        EXISTS (SELECT 1 FROM calendar_events ce WHERE ce.id = event_id)
+    );
+
+-- 시리즈 작성자 또는 교수만 회차를 취소/변경
+CREATE POLICY "Users can manage exceptions of their own events"
+    ON calendar_event_exceptions FOR ALL
+    TO authenticated
+    USING (
+        EXISTS (
+            SELECT 1 FROM calendar_events ce
+            WHERE ce.id = event_id
+              AND (
+                  ce.created_by = auth.uid()
+                  OR EXISTS (
+                      SELECT 1 FROM members
+                      WHERE id = auth.uid() AND position = 'professor'
+                  )
+              )
+        )
+    )
+    WITH CHECK (
+        EXISTS (
+            SELECT 1 FROM calendar_events ce
+            WHERE ce.id = event_id
+              AND (
+                  ce.created_by = auth.uid()
+                  OR EXISTS (
+                      SELECT 1 FROM members
+                      WHERE id = auth.uid() AND position = 'professor'
+                  )
+              )
+        )
+    );
+
+COMMENT ON COLUMN calendar_events.rrule IS 'RFC 5545 RRULE 본문 (FREQ/INTERVAL/COUNT/UNTIL/BYDAY). NULL이면 단일 일정';
+COMMENT ON COLUMN calendar_events.series_range IS '반복 시리즈 전체 구간 (GiST 인덱스로 조회 구간과 겹치는 시리즈 검색)';
+COMMENT ON TABLE calendar_event_exceptions IS '반복 일정 회차별 취소/변경';
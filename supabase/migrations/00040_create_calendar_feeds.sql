@@ -0,0 +1,190 @@
+-- =============================================
+-- SDC Lab Dashboard - Calendar Feeds
+-- 멤버별 ICS 구독 피드 (변경 카운터)
+-- =============================================
+
+-- 캘린더 앱은 구독 URL을 수 분~수 시간마다 다시 받아 간다.
+-- 멤버마다 피드 버전(version)을 두고, 피드에 들어가는 행
+-- (calendar_events, 회차 예외, 참여 프로젝트 target_date, weekly_goals deadline)이
+-- 바뀔 때만 트리거로 올린다. /api/calendar/feed/[token]은 이 버전으로
+-- ETag/Last-Modified를 만들어 대부분의 폴링에 304를 돌려주고,
+-- ICS 본문은 (멤버, 버전) 단위로 캐시한다.
+
+CREATE TABLE calendar_feeds (
+    member_id UUID PRIMARY KEY REFERENCES members(id) ON DELETE CASCADE,
+    token TEXT NOT NULL UNIQUE DEFAULT replace(gen_random_uuid()::TEXT || gen_random_uuid()::TEXT, '-', ''),
+    version BIGINT NOT NULL DEFAULT 1,
+    changed_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+ALTER TABLE calendar_feeds ENABLE ROW LEVEL SECURITY;
+
+-- 본인 피드만 조회/생성/토큰 재발급. 버전은 트리거(SECURITY DEFINER)만 올린다.
+CREATE POLICY "Users can view their own calendar feed"
+    ON calendar_feeds FOR SELECT
+    TO authenticated
+    USING (member_id = auth.uid());
+
+CREATE POLICY "Users can create their own calendar feed"
+    ON calendar_feeds FOR INSERT
+    TO authenticated
+    WITH CHECK (member_id = auth.uid());
+
+CREATE POLICY "Users can rotate their own calendar feed token"
+    ON calendar_feeds FOR UPDATE
+    TO authenticated
+    USING (member_id = auth.uid())
+    WITH CHECK (member_id = auth.uid());
+
+-- =============================================
+-- 버전 올리기
+-- =============================================
+-- p_member_ids가 NULL이면 모든 피드 (공용 일정 변경)
+CREATE OR REPLACE FUNCTION bump_calendar_feeds(p_member_ids UUID[])
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    UPDATE calendar_feeds
+    SET version = version + 1,
+        changed_at = NOW()
+    WHERE p_member_ids IS NULL OR member_id = ANY(p_member_ids);
+$$;
+
+-- 프로젝트 참여 멤버 피드
+CREATE OR REPLACE FUNCTION bump_project_calendar_feeds(p_project_id UUID)
+RETURNS VOID
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT bump_calendar_feeds(
+        ARRAY(SELECT member_id FROM project_members WHERE project_id = p_project_id)
+    );
+$$;
+
+-- calendar_events: 공용 일정이면 전체, 개인 일정이면 대상/작성자 피드만
+CREATE OR REPLACE FUNCTION bump_feeds_for_calendar_event()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF (TG_OP <> 'INSERT' AND OLD.is_public) OR (TG_OP <> 'DELETE' AND NEW.is_public) THEN
+        PERFORM bump_calendar_feeds(NULL);
+    ELSE
+        PERFORM bump_calendar_feeds(ARRAY_REMOVE(ARRAY[
+            CASE WHEN TG_OP <> 'INSERT' THEN OLD.member_id END,
+            CASE WHEN TG_OP <> 'INSERT' THEN OLD.created_by END,
+            CASE WHEN TG_OP <> 'DELETE' THEN NEW.member_id END,
+            CASE WHEN TG_OP <> 'DELETE' THEN NEW.created_by END
+        ], NULL));
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER calendar_events_bump_feeds
+    AFTER INSERT OR UPDATE OR DELETE ON calendar_events
+    FOR EACH ROW EXECUTE FUNCTION bump_feeds_for_calendar_event();
+
+-- calendar_event_exceptions: 부모 일정의 공개 범위를 따른다
+-- (부모 삭제로 CASCADE된 경우 부모 트리거가 이미 올렸으므로 건너뜀)
+CREATE OR REPLACE FUNCTION bump_feeds_for_calendar_exception()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_event calendar_events%ROWTYPE;
+BEGIN
+    SELECT * INTO v_event
+    FROM calendar_events
+    WHERE id = COALESCE(NEW.event_id, OLD.event_id);
+
+    IF FOUND THEN
+        IF v_event.is_public THEN
+            PERFORM bump_calendar_feeds(NULL);
+        ELSE
+            PERFORM bump_calendar_feeds(ARRAY_REMOVE(ARRAY[v_event.member_id, v_event.created_by], NULL));
+        END IF;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER calendar_event_exceptions_bump_feeds
+    AFTER INSERT OR UPDATE OR DELETE ON calendar_event_exceptions
+    FOR EACH ROW EXECUTE FUNCTION bump_feeds_for_calendar_exception();
+
+-- research_projects: 피드에 들어가는 제목(목표 설명 포함)/마감일/보관 여부가 바뀔 때만
+CREATE OR REPLACE FUNCTION bump_feeds_for_project()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        PERFORM bump_project_calendar_feeds(OLD.id);
+    ELSIF NEW.target_date IS DISTINCT FROM OLD.target_date
+        OR NEW.title IS DISTINCT FROM OLD.title
+        OR NEW.is_archived IS DISTINCT FROM OLD.is_archived THEN
+        PERFORM bump_project_calendar_feeds(NEW.id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER research_projects_bump_feeds
+    AFTER UPDATE OF title, target_date, is_archived OR DELETE ON research_projects
+    FOR EACH ROW EXECUTE FUNCTION bump_feeds_for_project();
+
+-- project_members: 참여/탈퇴한 멤버의 피드
+CREATE OR REPLACE FUNCTION bump_feeds_for_project_member()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    PERFORM bump_calendar_feeds(ARRAY_REMOVE(ARRAY[
+        CASE WHEN TG_OP <> 'INSERT' THEN OLD.member_id END,
+        CASE WHEN TG_OP <> 'DELETE' THEN NEW.member_id END
+    ], NULL));
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER project_members_bump_feeds
+    AFTER INSERT OR UPDATE OF member_id, project_id OR DELETE ON project_members
+    FOR EACH ROW EXECUTE FUNCTION bump_feeds_for_project_member();
+
+-- weekly_goals: 내용/마감일/완료 여부 (완료된 목표는 피드에서 빠짐)
+CREATE OR REPLACE FUNCTION bump_feeds_for_weekly_goal()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM bump_project_calendar_feeds(OLD.project_id);
+    END IF;
+    IF TG_OP <> 'DELETE' AND (TG_OP = 'INSERT' OR NEW.project_id IS DISTINCT FROM OLD.project_id) THEN
+        PERFORM bump_project_calendar_feeds(NEW.project_id);
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER weekly_goals_bump_feeds
+    AFTER INSERT OR UPDATE OF content, deadline, is_completed, project_id OR DELETE ON weekly_goals
+    FOR EACH ROW EXECUTE FUNCTION bump_feeds_for_weekly_goal();
+
+COMMENT ON TABLE calendar_feeds IS '멤버별 ICS 구독 피드 (token으로 인증, version은 피드 내용 변경 카운터)';
+COMMENT ON COLUMN calendar_feeds.version IS '피드에 포함된 행이 바뀔 때마다 트리거로 증가. ETag 및 ICS 본문 캐시 키';
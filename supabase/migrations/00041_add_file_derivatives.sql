@@ -0,0 +1,68 @@
+-- =============================================
+-- SDC Lab Dashboard - File Derivatives
+-- 첨부 이미지/PDF 썸네일 (파생 파일)
+-- =============================================
+
+-- 연구노트/멘토링 첨부는 목록 미리보기에서도 원본을 받아 왔다.
+-- 이미지와 PDF 첫 페이지의 축소본(WebP)을 로컬 워커
+-- (scripts/generate-file-derivatives.py)가 만들어 같은 버킷의 고정 키
+--   derivatives/{원본 files.id}/w{너비}.webp
+-- 에 올리고, files에 parent_file_id가 있는 행으로 기록한다.
+--
+-- derivatives_status (원본 행에만 사용)
+--   pending    : 워커 대기 (이미지/PDF 업로드 시 트리거가 설정)
+--   processing : 워커가 가져감
+--   ready      : 모든 너비 생성 완료 → 화면은 키를 계산해 바로 요청
+--   failed     : 생성 실패 (워커 --retry로 다시 시도)
+
+ALTER TABLE files
+    ADD COLUMN parent_file_id UUID REFERENCES files(id) ON DELETE CASCADE,
+    ADD COLUMN derivative_width INTEGER,
+    ADD COLUMN derivatives_status TEXT
+        CHECK (derivatives_status IN ('pending', 'processing', 'ready', 'failed'));
+
+-- 워커 upsert 키 (원본당 너비별 한 행). 원본은 둘 다 NULL이라 서로 충돌하지 않는다.
+-- PostgREST on_conflict가 쓸 수 있도록 부분 인덱스가 아닌 제약으로 둔다.
+ALTER TABLE files
+    ADD CONSTRAINT files_derivative_key UNIQUE (parent_file_id, derivative_width);
+
+-- 워커 대기열 조회용
+CREATE INDEX idx_files_derivatives_pending
+    ON files (created_at)
+    WHERE derivatives_status = 'pending';
+
+-- 이미지/PDF 원본은 업로드 시 대기열에 넣는다 (업로드 액션은 그대로)
+CREATE OR REPLACE FUNCTION queue_file_derivatives()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF NEW.parent_file_id IS NULL
+        AND NEW.derivatives_status IS NULL
+        AND (NEW.mime_type LIKE 'image/%' OR NEW.mime_type = 'application/pdf') THEN
+        NEW.derivatives_status := 'pending';
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER files_queue_derivatives
+    BEFORE INSERT ON files
+    FOR EACH ROW EXECUTE FUNCTION queue_file_derivatives();
+
+-- 기존 첨부 백필
+UPDATE files
+SET derivatives_status = 'pending'
+WHERE parent_file_id IS NULL
+  AND (mime_type LIKE 'image/%' OR mime_type = 'application/pdf');
+
+-- 버킷에 MIME 제한이 걸려 있으면 WebP를 허용
+UPDATE storage.buckets
+SET allowed_mime_types = array_append(allowed_mime_types, 'image/webp')
+WHERE id IN ('research-notes', 'mentoring-files')
+  AND allowed_mime_types IS NOT NULL
+  AND NOT ('image/webp' = ANY(allowed_mime_types));
+
+COMMENT ON COLUMN files.parent_file_id IS '파생 파일(썸네일)의 원본 files.id. NULL이면 원본';
+COMMENT ON COLUMN files.derivative_width IS '파생 파일의 최대 너비(px)';
+COMMENT ON COLUMN files.derivatives_status IS '원본의 썸네일 생성 상태 (pending/processing/ready/failed)';
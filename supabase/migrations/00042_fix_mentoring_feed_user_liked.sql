@@ -0,0 +1,92 @@
+-- =============================================
+-- SDC Lab Dashboard - Mentoring Feed Like Fix
+-- 피드의 내 좋아요 여부를 user_id로 연결된 멤버에도 적용
+-- =============================================
+
+-- get_mentoring_feed()(00033)는 user_liked를 member_id = auth.uid()로만 확인했다.
+-- toggle_mentoring_like()(00032)는 members.user_id로 연결된 이전 가입자도
+-- 자신의 멤버 id로 좋아요를 저장하므로, 그런 계정은 피드에서 항상 false로 보였다.
+-- 호출자 멤버 id를 토글과 같은 방식으로 찾아 비교한다. 나머지는 00033과 같다.
+
+CREATE OR REPLACE FUNCTION get_mentoring_feed(
+    p_cursor_date DATE DEFAULT NULL,
+    p_cursor_id UUID DEFAULT NULL,
+    p_limit INTEGER DEFAULT 10,
+    p_search TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    meeting_date DATE,
+    content_preview TEXT,
+    next_steps TEXT[],
+    next_steps_count INTEGER,
+    likes_count INTEGER,
+    comments_count INTEGER,
+    user_liked BOOLEAN,
+    created_at TIMESTAMPTZ,
+    author JSONB,
+    recent_comments JSONB
+) AS $$
+    -- 호출자 멤버 (toggle_mentoring_like와 같은 규칙: members.id = auth.uid()가 기본,
+    -- 이전 가입자는 user_id로 연결)
+    WITH me AS (
+        SELECT m.id
+        FROM members m
+        WHERE m.id = auth.uid() OR m.user_id = auth.uid()
+        ORDER BY (m.id = auth.uid()) DESC
+        LIMIT 1
+    ),
+    page AS (
+        SELECT mp.*
+        FROM mentoring_posts mp
+        WHERE (
+                p_cursor_date IS NULL
+                OR (mp.meeting_date, mp.id) < (p_cursor_date, p_cursor_id)
+              )
+          AND (
+                p_search IS NULL OR btrim(p_search) = ''
+                OR mp.content ILIKE '%' || replace(replace(replace(btrim(p_search), '\', '\\'), '%', '\%'), '_', '\_') || '%'
+              )
+        ORDER BY mp.meeting_date DESC, mp.id DESC
+        LIMIT LEAST(GREATEST(p_limit, 1), 50)
+    )
+    SELECT
+        p.id,
+        p.meeting_date,
+        CASE WHEN LENGTH(p.content) > 400 THEN LEFT(p.content, 400) || '...' ELSE p.content END,
+        p.next_steps[1:3],
+        COALESCE(array_length(p.next_steps, 1), 0),
+        p.likes_count,
+        p.comments_count,
+        EXISTS (
+            SELECT 1 FROM mentoring_likes ml
+            WHERE ml.post_id = p.id AND ml.member_id = (SELECT me.id FROM me)
+        ),
+        p.created_at,
+        jsonb_build_object(
+            'id', a.id,
+            'name', a.name,
+            'position', a.position,
+            'avatar_url', a.avatar_url
+        ),
+        COALESCE((
+            SELECT jsonb_agg(c ORDER BY c.created_at)
+            FROM (
+                SELECT
+                    mc.id,
+                    mc.content,
+                    mc.created_at,
+                    jsonb_build_object('id', ca.id, 'name', ca.name, 'avatar_url', ca.avatar_url) AS author
+                FROM mentoring_comments mc
+                LEFT JOIN members ca ON ca.id = mc.author_id
+                WHERE mc.post_id = p.id
+                ORDER BY mc.created_at
+                LIMIT 2
+            ) c
+        ), '[]'::jsonb)
+    FROM page p
+    LEFT JOIN members a ON a.id = p.author_id
+    ORDER BY p.meeting_date DESC, p.id DESC;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION get_mentoring_feed(DATE, UUID, INTEGER, TEXT) TO authenticated;
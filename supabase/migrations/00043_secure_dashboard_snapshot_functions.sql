@@ -0,0 +1,24 @@
+-- =============================================
+-- SDC Lab Dashboard - Dashboard Snapshot Function Security
+-- 스냅샷 갱신 함수의 search_path 고정과 실행 권한 제한
+-- =============================================
+
+-- 00027의 갱신/트리거 함수는 SECURITY DEFINER인데 search_path를 고정하지 않았고,
+-- 기본 PUBLIC EXECUTE 권한이 남아 있어 로그인한 사용자 누구나
+-- rpc('refresh_dashboard_snapshot')로 전체 재계산을 반복 호출할 수 있었다.
+-- 00036/00038과 같이 search_path를 고정하고 PUBLIC 권한을 회수한다.
+
+ALTER FUNCTION refresh_dashboard_projects() SET search_path = public;
+ALTER FUNCTION refresh_dashboard_goals() SET search_path = public;
+ALTER FUNCTION refresh_dashboard_snapshot() SET search_path = public;
+ALTER FUNCTION trigger_refresh_dashboard_projects() SET search_path = public;
+ALTER FUNCTION trigger_refresh_dashboard_goals() SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION refresh_dashboard_projects() FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION refresh_dashboard_goals() FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION refresh_dashboard_snapshot() FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION trigger_refresh_dashboard_projects() FROM PUBLIC;
+REVOKE EXECUTE ON FUNCTION trigger_refresh_dashboard_goals() FROM PUBLIC;
+
+-- 일일 cron(서비스 롤)만 직접 호출한다. 트리거 함수는 권한과 무관하게 실행된다.
+GRANT EXECUTE ON FUNCTION refresh_dashboard_snapshot() TO service_role;
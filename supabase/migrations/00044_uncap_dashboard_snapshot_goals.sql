@@ -0,0 +1,56 @@
+-- =============================================
+-- SDC Lab Dashboard - Dashboard Snapshot Goals Window
+-- 스냅샷의 주간 목표 50건 상한 제거
+-- =============================================
+
+-- 00027은 갱신 시점 기준 창(오늘 - 30일)으로 50건을 잘라 저장했고, 대시보드는
+-- 읽는 시점 기준으로 창을 다시 적용했다. 갱신 사이에 날짜가 바뀌면 앞쪽 목표가
+-- 걸러져 50건보다 적게 보였다. 스냅샷에는 창 안의 목표를 모두 저장하고,
+-- 상한은 대시보드에서 창을 적용한 뒤에 둔다.
+
+CREATE OR REPLACE FUNCTION refresh_dashboard_goals()
+RETURNS VOID AS $$
+DECLARE
+    v_window_start DATE := CURRENT_DATE - 30;
+BEGIN
+    INSERT INTO dashboard_snapshot (id) VALUES ('lab') ON CONFLICT (id) DO NOTHING;
+
+    UPDATE dashboard_snapshot
+    SET
+        goal_deadlines = COALESCE((
+            SELECT jsonb_agg(to_jsonb(g) ORDER BY g.deadline ASC)
+            FROM (
+                SELECT
+                    wg.id,
+                    wg.content,
+                    wg.deadline,
+                    wg.is_completed,
+                    rp.id AS project_id,
+                    rp.title AS project_title,
+                    author.name AS member_name,
+                    author.avatar_url AS member_avatar_url
+                FROM weekly_goals wg
+                JOIN research_projects rp ON rp.id = wg.project_id
+                LEFT JOIN LATERAL (
+                    -- first_author 우선, 없으면 첫 번째 멤버
+                    SELECT m.name, m.avatar_url
+                    FROM project_members pm
+                    JOIN members m ON m.id = pm.member_id
+                    WHERE pm.project_id = rp.id
+                    ORDER BY (pm.role = 'first_author') DESC, pm.created_at ASC
+                    LIMIT 1
+                ) author ON TRUE
+                WHERE wg.deadline >= v_window_start
+            ) g
+        ), '[]'::jsonb),
+        goals_window_start = v_window_start,
+        goals_refreshed_at = NOW()
+    WHERE id = 'lab';
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION refresh_dashboard_goals() FROM PUBLIC;
+
+SELECT refresh_dashboard_goals();
+
+COMMENT ON COLUMN dashboard_snapshot.goal_deadlines IS '마감일이 goals_window_start 이후인 주간 목표 전체 (대표 저자 포함)';
@@ -0,0 +1,129 @@
+-- =============================================
+-- SDC Lab Dashboard - Deferred Dashboard Snapshot Refresh
+-- 스냅샷 재계산을 쓰기 트랜잭션 밖(조회 시점)으로 옮김
+-- =============================================
+
+-- 00027의 트리거는 research_projects / weekly_goals / project_members / members에
+-- 대한 모든 문장마다 전체 테이블을 다시 집계해 단일 행 dashboard_snapshot을 덮어썼다.
+-- 서로 무관한 쓰기도 그 행의 잠금을 기다렸다.
+--
+-- 이제 트리거는 바뀐 섹션을 dashboard_snapshot_dirty에 표시만 하고
+-- (이미 표시돼 있으면 아무것도 쓰지 않는다), 재계산은 대시보드가 스냅샷을 읽을 때
+-- refresh_dirty_dashboard_snapshot()이 표시된 섹션만 수행한다.
+-- 대시보드 조회는 공유 캐시(getCachedDashboardSnapshot)를 거치므로
+-- 재계산은 캐시가 비었을 때 한 번만 일어난다.
+-- 주간 목표는 대시보드 창(오늘 - 30일 이후) 안의 행이 바뀔 때만 표시한다.
+
+-- =============================================
+-- 1. 변경 표시 테이블
+-- =============================================
+CREATE TABLE dashboard_snapshot_dirty (
+    section TEXT PRIMARY KEY CHECK (section IN ('projects', 'goals')),
+    marked_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+-- 정책 없음: 아래 SECURITY DEFINER 함수만 접근한다
+ALTER TABLE dashboard_snapshot_dirty ENABLE ROW LEVEL SECURITY;
+
+-- 트리거 인자(TG_ARGV[0])로 섹션 이름을 받는다
+CREATE OR REPLACE FUNCTION mark_dashboard_snapshot_dirty()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO dashboard_snapshot_dirty (section)
+    VALUES (TG_ARGV[0])
+    ON CONFLICT (section) DO NOTHING;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION mark_dashboard_snapshot_dirty() FROM PUBLIC;
+
+-- =============================================
+-- 2. 트리거 교체
+-- =============================================
+DROP TRIGGER IF EXISTS trigger_dashboard_snapshot_projects ON research_projects;
+DROP TRIGGER IF EXISTS trigger_dashboard_snapshot_project_goals ON research_projects;
+DROP TRIGGER IF EXISTS trigger_dashboard_snapshot_goals ON weekly_goals;
+DROP TRIGGER IF EXISTS trigger_dashboard_snapshot_project_members ON project_members;
+DROP TRIGGER IF EXISTS trigger_dashboard_snapshot_members ON members;
+
+DROP FUNCTION IF EXISTS trigger_refresh_dashboard_projects();
+DROP FUNCTION IF EXISTS trigger_refresh_dashboard_goals();
+
+CREATE TRIGGER trigger_dashboard_snapshot_projects
+    AFTER INSERT OR DELETE OR UPDATE OF status, overall_progress, submission_status, target_journal, is_archived
+    ON research_projects
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION mark_dashboard_snapshot_dirty('projects');
+
+-- 프로젝트 제목 변경/삭제는 목표 섹션(project_title)에도 반영
+CREATE TRIGGER trigger_dashboard_snapshot_project_goals
+    AFTER INSERT OR DELETE OR UPDATE OF title ON research_projects
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION mark_dashboard_snapshot_dirty('goals');
+
+-- 창 밖(31일 이전 마감)의 목표 변경은 스냅샷에 영향이 없다.
+-- 창 기준일이 하루 늦게 이동할 수 있으므로 하루 여유를 둔다.
+CREATE TRIGGER trigger_dashboard_snapshot_goals_insert
+    AFTER INSERT ON weekly_goals
+    FOR EACH ROW
+    WHEN (NEW.deadline >= CURRENT_DATE - 31)
+    EXECUTE FUNCTION mark_dashboard_snapshot_dirty('goals');
+
+CREATE TRIGGER trigger_dashboard_snapshot_goals_update
+    AFTER UPDATE ON weekly_goals
+    FOR EACH ROW
+    WHEN (OLD.deadline >= CURRENT_DATE - 31 OR NEW.deadline >= CURRENT_DATE - 31)
+    EXECUTE FUNCTION mark_dashboard_snapshot_dirty('goals');
+
+CREATE TRIGGER trigger_dashboard_snapshot_goals_delete
+    AFTER DELETE ON weekly_goals
+    FOR EACH ROW
+    WHEN (OLD.deadline >= CURRENT_DATE - 31)
+    EXECUTE FUNCTION mark_dashboard_snapshot_dirty('goals');
+
+CREATE TRIGGER trigger_dashboard_snapshot_project_members
+    AFTER INSERT OR UPDATE OR DELETE ON project_members
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION mark_dashboard_snapshot_dirty('goals');
+
+CREATE TRIGGER trigger_dashboard_snapshot_members
+    AFTER UPDATE OF name, avatar_url ON members
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION mark_dashboard_snapshot_dirty('goals');
+
+-- =============================================
+-- 3. 조회 시점 재계산
+-- =============================================
+-- 표시를 먼저 지우고 재계산한다. 재계산 중 들어온 변경은 이 트랜잭션이 끝난 뒤
+-- 다시 표시되므로 놓치지 않는다. 날짜가 바뀌어 목표 창이 밀린 경우도 재계산한다.
+CREATE OR REPLACE FUNCTION refresh_dirty_dashboard_snapshot()
+RETURNS VOID AS $$
+DECLARE
+    v_sections TEXT[];
+BEGIN
+    WITH cleared AS (
+        DELETE FROM dashboard_snapshot_dirty RETURNING section
+    )
+    SELECT COALESCE(array_agg(section), '{}') INTO v_sections FROM cleared;
+
+    IF 'projects' = ANY(v_sections) THEN
+        PERFORM refresh_dashboard_projects();
+    END IF;
+
+    IF 'goals' = ANY(v_sections) OR NOT EXISTS (
+        SELECT 1 FROM dashboard_snapshot
+        WHERE id = 'lab' AND goals_window_start = CURRENT_DATE - 30
+    ) THEN
+        PERFORM refresh_dashboard_goals();
+    END IF;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+-- 대시보드 스냅샷 캐시(서비스 롤)에서만 호출
+REVOKE EXECUTE ON FUNCTION refresh_dirty_dashboard_snapshot() FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION refresh_dirty_dashboard_snapshot() TO service_role;
+
+COMMENT ON TABLE dashboard_snapshot_dirty IS '재계산이 필요한 대시보드 스냅샷 섹션 (트리거가 표시, 조회 시 재계산)';
+COMMENT ON FUNCTION refresh_dirty_dashboard_snapshot() IS
+    '표시된 섹션(과 날짜가 지난 목표 창)만 재계산 (대시보드 스냅샷 조회 전 호출)';
@@ -0,0 +1,16 @@
+-- =============================================
+-- SDC Lab Dashboard - Paper Field Summaries Refresh
+-- 숨김 변경 시 분야 요약 갱신을 트리거에서 API 응답 이후로 이동
+-- =============================================
+
+-- 00036의 문장 트리거는 is_hidden이 바뀔 때마다 사용자 트랜잭션 안에서
+-- REFRESH MATERIALIZED VIEW CONCURRENTLY로 뷰 전체를 다시 만들었고,
+-- 동시에 들어온 토글은 갱신의 EXCLUSIVE 잠금을 기다렸다.
+-- 이제 PATCH /api/papers가 응답을 보낸 뒤(after()) 서비스 롤로
+-- refresh_paper_field_summaries()를 호출한다. 자동 검색 라우트의 갱신은 그대로다.
+
+DROP TRIGGER IF EXISTS refresh_paper_field_summaries_on_hide ON papers;
+DROP FUNCTION IF EXISTS refresh_paper_field_summaries_on_hide();
+
+COMMENT ON FUNCTION refresh_paper_field_summaries() IS
+    'paper_field_summaries 재계산 (논문 자동 검색 완료 후, 숨김 변경 API 응답 후 호출)';
@@ -0,0 +1,29 @@
+-- =============================================
+-- SDC Lab Dashboard - Research Note Search Escaping
+-- 노트 검색어의 LIKE 특수문자 이스케이프
+-- =============================================
+
+-- 00029의 count_research_notes_by_stage()는 검색어를 그대로 '%' || p_search || '%'로
+-- 감싸 사용자가 입력한 %, _, \가 와일드카드로 동작했다 (목록 조회도 같은 문제였음).
+-- 00033의 멘토링 검색과 같이 이스케이프한 뒤 감싼다.
+
+CREATE OR REPLACE FUNCTION count_research_notes_by_stage(
+    p_author_id UUID DEFAULT NULL,
+    p_start TIMESTAMPTZ DEFAULT NULL,
+    p_end TIMESTAMPTZ DEFAULT NULL,
+    p_search TEXT DEFAULT NULL
+)
+RETURNS TABLE (stage TEXT, note_count BIGINT) AS $$
+    SELECT rn.stage, COUNT(*)
+    FROM research_notes rn
+    WHERE (p_author_id IS NULL OR rn.author_id = p_author_id)
+      AND (p_start IS NULL OR rn.created_at >= p_start)
+      AND (p_end IS NULL OR rn.created_at <= p_end)
+      AND (
+            p_search IS NULL
+            OR rn.search_text LIKE '%' || replace(replace(replace(LOWER(p_search), '\', '\\'), '%', '\%'), '_', '\_') || '%'
+          )
+    GROUP BY rn.stage;
+$$ LANGUAGE sql STABLE SECURITY INVOKER;
+
+GRANT EXECUTE ON FUNCTION count_research_notes_by_stage(UUID, TIMESTAMPTZ, TIMESTAMPTZ, TEXT) TO authenticated;
@@ -0,0 +1,25 @@
+-- =============================================
+-- SDC Lab Dashboard - Member Performance on Rename
+-- 연구원 이름 변경 시 성과 지표 재계산
+-- =============================================
+
+-- 논문 저자(project_authors)는 이름으로 연구원과 연결된다 (00028 member_project_ids).
+-- project_authors 변경에는 트리거가 있었지만 members.name 변경에는 없어서,
+-- 이름을 바꾼 연구원은 다른 변경이 지표를 다시 계산할 때까지
+-- 이전 이름 기준의 참여 연구/순위가 남아 있었다.
+
+CREATE OR REPLACE FUNCTION trigger_performance_member_rename()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_member_performance_stats(NEW.id);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION trigger_performance_member_rename() FROM PUBLIC;
+
+CREATE TRIGGER trigger_member_performance_rename
+    AFTER UPDATE OF name ON members
+    FOR EACH ROW
+    WHEN (OLD.name IS DISTINCT FROM NEW.name)
+    EXECUTE FUNCTION trigger_performance_member_rename();